@@ -37,6 +37,47 @@ class Settings(BaseSettings):
     aws_region: str = Field(default="us-east-1")
     s3_bucket_name: Union[str, None] = Field(default=None)
 
+    # In-process caches
+    movie_detail_cache_ttl_seconds: int = Field(default=300)
+    movie_detail_cache_max_entries: int = Field(default=2000)
+    movie_batch_max_ids: int = Field(default=300)
+    quiz_definition_cache_ttl_seconds: int = Field(default=3600)
+    quiz_definition_cache_max_entries: int = Field(default=500)
+    award_ceremony_cache_ttl_seconds: int = Field(default=300)
+    person_summary_cache_ttl_seconds: int = Field(default=900)
+    person_summary_cache_max_entries: int = Field(default=5000)
+    release_calendar_cache_ttl_seconds: int = Field(default=600)
+    release_calendar_cache_max_entries: int = Field(default=500)
+    movie_id_cache_ttl_seconds: int = Field(default=3600)
+    movie_id_cache_max_entries: int = Field(default=20000)
+
+    # Review comment threads
+    review_comment_max_depth: int = Field(default=3)
+    review_comment_replies_per_thread: int = Field(default=3)
+
+    # Follow suggestions
+    user_suggestions_ttl_seconds: int = Field(default=6 * 3600)
+    user_suggestions_max_candidates: int = Field(default=50)
+
+    # In-memory follow graph (per worker; reloaded to pick up other workers' writes)
+    follow_graph_enabled: bool = Field(default=True)
+    follow_graph_reload_seconds: int = Field(default=600)
+
+    # Daily activity stats (write-behind buffer per worker, flushed in batches)
+    user_stats_flush_seconds: int = Field(default=10)
+    user_stats_cache_ttl_seconds: int = Field(default=300)
+
+    # Quiz leaderboards (hot boards in memory per worker, best results flushed in batches)
+    quiz_leaderboard_flush_seconds: int = Field(default=15)
+    quiz_leaderboard_cache_ttl_seconds: int = Field(default=300)
+    quiz_leaderboard_max_boards: int = Field(default=200)
+
+    # Watch progress heartbeats (latest per user and movie buffered per worker, flushed in batches)
+    watch_progress_flush_seconds: int = Field(default=5)
+
+    # Genre page statistics (genre_stats; imports refresh touched genres, this refreshes all)
+    genre_stats_refresh_seconds: int = Field(default=3600)
+
     # Pydantic v2: load .env from backend app folder regardless of cwd
     model_config = SettingsConfigDict(
         env_file=str(Path(__file__).resolve().parent.parent / ".env"),
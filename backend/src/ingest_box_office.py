@@ -0,0 +1,36 @@
+"""
+Load daily box office grosses from a CSV or NDJSON file.
+
+    python -m src.ingest_box_office grosses.csv
+    python -m src.ingest_box_office grosses.ndjson --format ndjson --batch-size 10000
+
+Each row needs a date, gross_usd and one of tmdb_id, external_id or title
+(optionally with year); region defaults to "global" and studio is optional.
+"""
+import argparse
+import asyncio
+import json
+
+from . import db as dbmod
+from .services.box_office_ingest import BATCH_SIZE, FORMATS, ingest_box_office
+
+
+async def main(path: str, fmt: str, batch_size: int) -> None:
+    await dbmod.init_db()
+    if dbmod.SessionLocal is None:
+        print("SessionLocal is None; set DATABASE_URL in apps/backend/.env and restart.")
+        return
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        async with dbmod.SessionLocal() as session:
+            report = await ingest_box_office(session, f, fmt, batch_size=batch_size)
+    print(json.dumps(report.to_dict(), indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load daily box office grosses")
+    parser.add_argument("path")
+    parser.add_argument("--format", choices=FORMATS, help="defaults to the file extension")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    args = parser.parse_args()
+    fmt = args.format or ("ndjson" if args.path.endswith((".ndjson", ".jsonl")) else "csv")
+    asyncio.run(main(args.path, fmt, args.batch_size))
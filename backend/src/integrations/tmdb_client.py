@@ -29,6 +29,16 @@ TMDB_IMAGE_BASE_URL = "https://image.tmdb.org/t/p"
 POSTER_SIZE = "w500"  # 500px width for posters
 BACKDROP_SIZE = "original"  # Original size for backdrops
 
+# TMDB release_dates "type" -> our release type
+RELEASE_TYPES = {
+    1: "premiere",
+    2: "limited",
+    3: "theatrical",
+    4: "digital",
+    5: "physical",
+    6: "tv",
+}
+
 
 class TMDBError(Exception):
     """Base exception for TMDB API errors"""
@@ -239,6 +249,27 @@ def _transform_tmdb_response(data: Dict[str, Any]) -> Dict[str, Any]:
                     "url": region_data.get("link"),
                 })
     
+    # Extract regional release dates (earliest date per region and release type)
+    release_dates: Dict[tuple, Dict[str, Any]] = {}
+    for region_data in (data.get("release_dates", {}).get("results") or []):
+        region = region_data.get("iso_3166_1")
+        for rd in (region_data.get("release_dates") or []):
+            kind = RELEASE_TYPES.get(rd.get("type"))
+            try:
+                day = datetime.strptime((rd.get("release_date") or "")[:10], "%Y-%m-%d").date()
+            except ValueError:
+                continue
+            if not region or not kind:
+                continue
+            key = (region, kind)
+            if key not in release_dates or day < release_dates[key]["date"]:
+                release_dates[key] = {
+                    "region": region,
+                    "type": kind,
+                    "date": day,
+                    "certification": rd.get("certification") or None,
+                }
+
     # Build transformed response
     transformed = {
         "external_id": f"tmdb-{data.get('id')}",
@@ -275,6 +306,7 @@ def _transform_tmdb_response(data: Dict[str, Any]) -> Dict[str, Any]:
         "producers": producers,
         "cast": cast,
         "streaming": streaming,
+        "release_dates": list(release_dates.values()),
     }
     
     return transformed
@@ -31,6 +31,7 @@ import os  # Operating system utilities (not used here, but commonly needed)
 from contextlib import asynccontextmanager  # For managing async context (startup/shutdown)
 from pathlib import Path  # Modern way to handle file paths
 import json  # For exporting OpenAPI schema
+import asyncio  # For long-running background tasks started at startup
 
 # FastAPI core imports
 from fastapi import FastAPI, APIRouter  # Main framework and router for organizing endpoints
@@ -40,6 +41,11 @@ from fastapi.middleware.cors import CORSMiddleware  # Middleware for handling CO
 from .config import settings  # Application configuration (loaded from .env file)
 from .logging_config import setup_logging, log  # Structured logging setup
 from .db import init_db  # Database initialization function
+from .services.follow_graph import load_follow_graphs, reload_follow_graphs_forever  # In-memory follow graph
+from .services.daily_stats import flush_daily_stats, flush_daily_stats_forever  # Write-behind daily stats
+from .services.quiz_leaderboard import flush_quiz_leaderboards, flush_quiz_leaderboards_forever  # Quiz leaderboards
+from .services.watch_progress import flush_watch_progress, flush_watch_progress_forever  # Player heartbeats
+from .services.genre_stats import refresh_genre_stats_forever  # Genre page statistics
 
 # Import all API routers (each router handles a specific domain)
 # These are organized by feature/domain for better code organization
@@ -48,6 +54,7 @@ from .routers import genres as genres_router  # Movie genres (Action, Drama, etc
 from .routers import movies as movies_router  # Movie catalog and details
 from .routers import people as people_router  # Actors, directors, writers
 from .routers import search as search_router  # Search functionality
+from .routers import streaming as streaming_router  # Availability by streaming platform and region
 from .routers import reviews as reviews_router  # User reviews and ratings
 from .routers import collections as collections_router  # User-created movie collections
 from .routers import watchlist as watchlist_router  # User watchlist
@@ -109,7 +116,27 @@ async def lifespan(app: FastAPI):
     # Step 2: Initialize database connection pool
     await init_db()
 
-    # Step 3: Export OpenAPI schema (optional, for development)
+    # Step 3: Load the in-memory follow graph (following feed, "is following" on pulses)
+    # and keep reloading it so writes from other workers show up
+    graph_reloader = None
+    if settings.follow_graph_enabled:
+        try:
+            await load_follow_graphs()
+            if settings.follow_graph_reload_seconds > 0:
+                graph_reloader = asyncio.create_task(reload_follow_graphs_forever())
+        except Exception as e:
+            log.warning("follow_graph_load_failed", error=str(e))
+
+    # Step 4: Start flushing write-behind buffers (daily activity stats, quiz leaderboard bests,
+    # watch progress) and the periodic genre stats refresh
+    flushers = [
+        asyncio.create_task(flush_daily_stats_forever()),
+        asyncio.create_task(flush_quiz_leaderboards_forever()),
+        asyncio.create_task(flush_watch_progress_forever()),
+    ]
+    genre_stats_refresher = asyncio.create_task(refresh_genre_stats_forever())
+
+    # Step 5: Export OpenAPI schema (optional, for development)
     if settings.export_openapi_on_startup:
         here = Path(__file__).resolve()
         root = None
@@ -140,6 +167,23 @@ async def lifespan(app: FastAPI):
 
     # ========== SHUTDOWN PHASE ==========
     log.info("stopping_app")
+    if graph_reloader is not None:
+        graph_reloader.cancel()
+    genre_stats_refresher.cancel()
+    for task in flushers:
+        task.cancel()
+    # A flush cancelled mid-write puts its rows back; wait for that before the final drain
+    await asyncio.gather(*flushers, return_exceptions=True)
+    # Drain whatever is still buffered so a restart loses nothing
+    for name, flush in (
+        ("daily_stats", flush_daily_stats),
+        ("quiz_leaderboards", flush_quiz_leaderboards),
+        ("watch_progress", flush_watch_progress),
+    ):
+        try:
+            await flush()
+        except Exception as e:
+            log.warning("buffer_flush_failed", buffer=name, error=str(e))
 
 
 """
@@ -248,6 +292,7 @@ api.include_router(genres_router.router)  # GET /api/v1/genres - Movie genres
 api.include_router(movies_router.router)  # GET /api/v1/movies - Movie catalog
 api.include_router(people_router.router)  # GET /api/v1/people - Actors, directors
 api.include_router(search_router.router)  # GET /api/v1/search - Search functionality
+api.include_router(streaming_router.router)  # GET /api/v1/streaming/{platform}/{region} - What's on a platform
 
 # User Features
 api.include_router(reviews_router.router)  # POST /api/v1/reviews - User reviews
@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import List
 from datetime import datetime
 from enum import Enum as PyEnum
-from sqlalchemy import String, ForeignKey, Integer, Table, Column, Text, Float, Boolean, DateTime, UniqueConstraint, TIMESTAMP, func, Date
+from sqlalchemy import String, ForeignKey, Integer, Table, Column, Text, Float, Boolean, DateTime, UniqueConstraint, TIMESTAMP, func, Date, Index, text, case, cast, literal_column
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .db import Base
@@ -53,11 +53,16 @@ movie_people = Table(
     Column("character_name", String(100), nullable=True),
 )
 
+# Filmography pages read a person's credits by role
+Index("ix_movie_people_person_role", movie_people.c.person_id, movie_people.c.role)
+
 collection_movies = Table(
     "collection_movies",
     Base.metadata,
     Column("collection_id", ForeignKey("collections.id"), primary_key=True),
     Column("movie_id", ForeignKey("movies.id"), primary_key=True),
+    Column("position", Integer, nullable=False, default=0),  # order within the collection
+    Index("ix_collection_movies_collection_position", "collection_id", "position"),
 )
 
 collection_likes = Table(
@@ -97,11 +102,11 @@ class Movie(Base):
     title: Mapped[str] = mapped_column(String(200))
     tagline: Mapped[str | None] = mapped_column(String(500), nullable=True)
     year: Mapped[str | None] = mapped_column(String(4), nullable=True)
-    release_date: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    release_date: Mapped[datetime | None] = mapped_column(DateTime, nullable=True, index=True)
     runtime: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
     # Ratings and scores
-    siddu_score: Mapped[float | None] = mapped_column(Float, nullable=True)
+    siddu_score: Mapped[float | None] = mapped_column(Float, nullable=True, index=True)
     critics_score: Mapped[float | None] = mapped_column(Float, nullable=True)
     imdb_rating: Mapped[float | None] = mapped_column(Float, nullable=True)
     rotten_tomatoes_score: Mapped[int | None] = mapped_column(Integer, nullable=True)
@@ -128,32 +133,8 @@ class Movie(Base):
     # Status
     status: Mapped[str | None] = mapped_column(String(20), nullable=True, default="released")  # released, upcoming, in-production
 
-    # Rich content (admin-only authoring) - Published
-    trivia: Mapped[list | None] = mapped_column(JSONB, nullable=True)
-    timeline: Mapped[list | None] = mapped_column(JSONB, nullable=True)
-    awards: Mapped[list | None] = mapped_column(JSONB, nullable=True)
-
-    # Rich content - Draft versions for draft/publish workflow
-    trivia_draft: Mapped[list | None] = mapped_column(JSONB, nullable=True)
-    trivia_status: Mapped[str | None] = mapped_column(String(20), nullable=True, default="draft")
-
-    timeline_draft: Mapped[list | None] = mapped_column(JSONB, nullable=True)
-    timeline_status: Mapped[str | None] = mapped_column(String(20), nullable=True, default="draft")
-
-    awards_draft: Mapped[list | None] = mapped_column(JSONB, nullable=True)
-    awards_status: Mapped[str | None] = mapped_column(String(20), nullable=True, default="draft")
-
-    cast_crew_draft: Mapped[list | None] = mapped_column(JSONB, nullable=True)
-    cast_crew_status: Mapped[str | None] = mapped_column(String(20), nullable=True, default="draft")
-
-    media_draft: Mapped[list | None] = mapped_column(JSONB, nullable=True)
-    media_status: Mapped[str | None] = mapped_column(String(20), nullable=True, default="draft")
-
-    streaming_draft: Mapped[list | None] = mapped_column(JSONB, nullable=True)
-    streaming_status: Mapped[str | None] = mapped_column(String(20), nullable=True, default="draft")
-
-    basic_info_draft: Mapped[list | None] = mapped_column(JSONB, nullable=True)
-    basic_info_status: Mapped[str | None] = mapped_column(String(20), nullable=True, default="draft")
+    # Rich content (trivia, timeline, awards) and the draft/publish workflow
+    # for every curation category live in movie_content_versions.
 
     # Curation fields (Phase 2)
     curation_status: Mapped[str | None] = mapped_column(String(20), nullable=True, default="draft")
@@ -179,6 +160,83 @@ class Movie(Base):
     )
 
 
+# movies.year is free-form text; this is it as an integer when it is a plain
+# four-digit year. Queries must use this exact expression (the pattern is
+# inlined, not bound) for ix_movies_year_number to serve them.
+MOVIE_YEAR_NUMBER = case(
+    (Movie.year.regexp_match(literal_column("'^[0-9]{4}$'")), cast(Movie.year, Integer))
+)
+Index("ix_movies_year_number", MOVIE_YEAR_NUMBER)
+
+
+class MovieContentVersion(Base):
+    """
+    Append-only versions of a movie's curated content, one stream per category
+    (trivia, timeline, awards, cast_crew, media, streaming, basic_info).
+
+    Saving a draft appends a row; publishing flips the latest draft to
+    "published" and the previous published row to "archived". At most one row
+    per (movie, category) is published, and public reads join only that row.
+    """
+    __tablename__ = "movie_content_versions"
+    __table_args__ = (
+        UniqueConstraint("movie_id", "category", "version", name="uq_movie_content_version"),
+        Index(
+            "uq_movie_content_published",
+            "movie_id",
+            "category",
+            unique=True,
+            postgresql_where=text("status = 'published'"),
+            sqlite_where=text("status = 'published'"),
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    movie_id: Mapped[int] = mapped_column(ForeignKey("movies.id", ondelete="CASCADE"), index=True)
+    category: Mapped[str] = mapped_column(String(20))
+    version: Mapped[int] = mapped_column(Integer)
+    payload: Mapped[list | dict | None] = mapped_column(JSONB, nullable=True)
+    status: Mapped[str] = mapped_column(String(20), default="draft")  # draft, published, archived, discarded
+    created_by_id: Mapped[int | None] = mapped_column(ForeignKey("users.id"), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    published_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+
+class MovieRatingStats(Base):
+    """
+    Per-movie rating aggregates, updated in the same transaction as review
+    writes (see RatingStatsRepository). `histogram` has one bucket per whole
+    rating 0..10.
+    """
+    __tablename__ = "movie_rating_stats"
+
+    movie_id: Mapped[int] = mapped_column(ForeignKey("movies.id", ondelete="CASCADE"), primary_key=True)
+    review_count: Mapped[int] = mapped_column(Integer, default=0)
+    rating_sum: Mapped[float] = mapped_column(Float, default=0.0)
+    average_rating: Mapped[float | None] = mapped_column(Float, nullable=True, index=True)
+    histogram: Mapped[list[int]] = mapped_column(ARRAY(Integer), default=list)
+    critic_review_count: Mapped[int] = mapped_column(Integer, default=0)
+    critic_rating_sum: Mapped[float] = mapped_column(Float, default=0.0)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+
+class GenreStats(Base):
+    """
+    Precomputed statistics for a genre page, refreshed in the background from
+    movie_genres, movie_people and movie_rating_stats (see
+    GenreRepository.refresh_stats). `statistics` holds the page's
+    "statistics" object; `related_genres` the slugs most often paired with it.
+    """
+    __tablename__ = "genre_stats"
+
+    genre_id: Mapped[int] = mapped_column(ForeignKey("genres.id", ondelete="CASCADE"), primary_key=True)
+    total_movies: Mapped[int] = mapped_column(Integer, default=0)
+    average_rating: Mapped[float | None] = mapped_column(Float, nullable=True)
+    statistics: Mapped[dict] = mapped_column(JSONB, default=dict)
+    related_genres: Mapped[list] = mapped_column(JSONB, default=list)
+    refreshed_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+
 class Person(Base):
     __tablename__ = "people"
 
@@ -262,6 +320,44 @@ class User(Base):
     notifications: Mapped[List["UserNotification"]] = relationship("UserNotification", foreign_keys="UserNotification.user_id", back_populates="user", lazy="selectin", cascade="all, delete-orphan")
 
 
+class UserCounters(Base):
+    """
+    Denormalized per-user counts, bumped in the same transaction as the
+    writes they count (see UserCountersRepository). `favorites` counts movie
+    favorites only, matching the profile stats.
+    """
+    __tablename__ = "user_counters"
+
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    reviews: Mapped[int] = mapped_column(Integer, default=0)
+    followers: Mapped[int] = mapped_column(Integer, default=0)
+    following: Mapped[int] = mapped_column(Integer, default=0)
+    watchlist: Mapped[int] = mapped_column(Integer, default=0)
+    favorites: Mapped[int] = mapped_column(Integer, default=0)
+    collections: Mapped[int] = mapped_column(Integer, default=0)
+    pulses: Mapped[int] = mapped_column(Integer, default=0)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+
+class UserSuggestion(Base):
+    """
+    Precomputed "who to follow" candidates for a user, ranked by `score`
+    (see UserSuggestionRepository.refresh). `mutual_count` is how many of the
+    user's followees already follow the candidate.
+    """
+    __tablename__ = "user_suggestions"
+    __table_args__ = (
+        Index("ix_user_suggestions_user_score", "user_id", "score"),
+    )
+
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    candidate_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    score: Mapped[float] = mapped_column(Float, default=0.0)
+    mutual_count: Mapped[int] = mapped_column(Integer, default=0)
+    reason: Mapped[str] = mapped_column(String(30))  # mutual_follows, co_reviewer, genre_affinity
+    computed_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+
 class UserRoleProfile(Base):
     """
     Multi-role profile system: allows users to have separate profiles for different roles.
@@ -356,6 +452,10 @@ class Review(Base):
     unhelpful_votes: Mapped[int] = mapped_column(Integer, default=0)
     comment_count: Mapped[int] = mapped_column(Integer, default=0)
     engagement_score: Mapped[int] = mapped_column(Integer, default=0)
+    # Wilson lower bound over helpful/unhelpful votes blended with comments and
+    # recency; kept current by services.ranking.refresh_review_rank and, for
+    # votes, by ReviewVoteRepository.reconcile
+    rank_score: Mapped[float] = mapped_column(Float, default=0.0, server_default="0")
     media_urls: Mapped[str | None] = mapped_column(Text, nullable=True)  # JSON array as text
     gif_url: Mapped[str | None] = mapped_column(String(500), nullable=True)  # GIF URL from Tenor/Giphy
 
@@ -366,6 +466,10 @@ class Review(Base):
     movie: Mapped["Movie"] = relationship(lazy="selectin")
 
 
+# A movie's top reviews come straight off this index
+Index("ix_reviews_movie_rank_score", Review.movie_id, Review.rank_score.desc())
+
+
 class ReviewVote(Base):
     """
     Tracks individual user votes on reviews (helpful/unhelpful).
@@ -392,8 +496,14 @@ class ReviewVote(Base):
 class ReviewComment(Base):
     """
     Comments on user reviews. Supports nested replies via self-referential parent_id.
+    Threads are read with a recursive CTE (ReviewCommentRepository.list_comments),
+    so `parent`/`replies` only load on access.
     """
     __tablename__ = "review_comments"
+    __table_args__ = (
+        Index("ix_review_comments_review_parent_created", "review_id", "parent_id", "created_at", "id"),
+        Index("ix_review_comments_parent_created", "parent_id", "created_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     external_id: Mapped[str] = mapped_column(String(50), unique=True, index=True)
@@ -411,8 +521,8 @@ class ReviewComment(Base):
     # Relationships
     user: Mapped["User"] = relationship(lazy="selectin")
     review: Mapped["Review"] = relationship(lazy="selectin")
-    parent: Mapped["ReviewComment | None"] = relationship(remote_side=[id], lazy="selectin")
-    replies: Mapped[List["ReviewComment"]] = relationship(back_populates="parent", cascade="all, delete-orphan", lazy="selectin")
+    parent: Mapped["ReviewComment | None"] = relationship(remote_side=[id], lazy="select")
+    replies: Mapped[List["ReviewComment"]] = relationship(back_populates="parent", cascade="all, delete-orphan", lazy="select")
 
 
 class ReviewCommentLike(Base):
@@ -447,11 +557,18 @@ class Collection(Base):
     tags: Mapped[str | None] = mapped_column(Text, nullable=True)  # JSON array as text
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
     updated_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True, onupdate=datetime.utcnow)
+    # Maintained by CollectionRepository on every membership change so list
+    # pages never load member movies
+    movie_count: Mapped[int] = mapped_column(Integer, default=0)
+    preview_posters: Mapped[list] = mapped_column(JSONB, default=list)  # first poster urls by position
 
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
 
     creator: Mapped["User"] = relationship(lazy="selectin")
-    movies: Mapped[List["Movie"]] = relationship(secondary=collection_movies, lazy="selectin")
+    # Members are paged through CollectionRepository.movies, never loaded wholesale
+    movies: Mapped[List["Movie"]] = relationship(
+        secondary=collection_movies, lazy="noload", order_by=collection_movies.c.position
+    )
 
 
 class Watchlist(Base):
@@ -585,59 +702,50 @@ class AwardNomination(Base):
 
 
 # Box Office domain models
-class BoxOfficeWeekendEntry(Base):
-    __tablename__ = "box_office_weekend_entries"
-
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    region: Mapped[str] = mapped_column(String(50), index=True, default="global")
-    period_start: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
-    period_end: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
-    rank: Mapped[int] = mapped_column(Integer)
-
-    movie_id: Mapped[int | None] = mapped_column(ForeignKey("movies.id"), nullable=True)
-    movie: Mapped["Movie | None"] = relationship(lazy="selectin")
-
-    weekend_gross_usd: Mapped[float] = mapped_column(Float)
-    total_gross_usd: Mapped[float] = mapped_column(Float)
-    change_percent: Mapped[float | None] = mapped_column(Float, nullable=True)
-    is_positive: Mapped[bool] = mapped_column(Boolean, default=True)
-    weeks_in_release: Mapped[int | None] = mapped_column(Integer, nullable=True)
-    poster_url: Mapped[str | None] = mapped_column(String(255), nullable=True)
-
-
-class BoxOfficeTrendPoint(Base):
-    __tablename__ = "box_office_trends"
-
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    region: Mapped[str] = mapped_column(String(50), index=True, default="global")
-    date: Mapped[datetime] = mapped_column(DateTime)
-    gross_millions_usd: Mapped[float] = mapped_column(Float)
-
-
-class BoxOfficeYTD(Base):
-    __tablename__ = "box_office_ytd"
-
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    region: Mapped[str] = mapped_column(String(50), index=True, default="global")
-    year: Mapped[int] = mapped_column(Integer, index=True)
-    total_gross_usd: Mapped[float] = mapped_column(Float)
-    change_percent: Mapped[float] = mapped_column(Float)
-    is_positive: Mapped[bool] = mapped_column(Boolean, default=True)
-    previous_year: Mapped[int] = mapped_column(Integer)
-    previous_total_gross_usd: Mapped[float] = mapped_column(Float)
+class BoxOfficeDailyGross(Base):
+    """
+    Reported gross for one movie in one region on one day; the source of
+    truth for every box office page. Rows are upserted on ingest and each
+    change is applied as a delta to `box_office_rollups`.
+    """
+    __tablename__ = "box_office_daily_gross"
 
-    top_movies: Mapped[List["BoxOfficeYTDTopMovie"]] = relationship(back_populates="ytd", lazy="selectin")
+    movie_id: Mapped[int] = mapped_column(ForeignKey("movies.id", ondelete="CASCADE"), primary_key=True)
+    region: Mapped[str] = mapped_column(String(50), primary_key=True)
+    date: Mapped[datetime] = mapped_column(Date, primary_key=True)
+    gross_usd: Mapped[float] = mapped_column(Float)
+    studio: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
 
 
-class BoxOfficeYTDTopMovie(Base):
-    __tablename__ = "box_office_ytd_top_movies"
+Index("ix_box_office_daily_gross_region_date", BoxOfficeDailyGross.region, BoxOfficeDailyGross.date)
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    ytd_id: Mapped[int] = mapped_column(ForeignKey("box_office_ytd.id"))
-    title: Mapped[str] = mapped_column(String(200))
-    gross_usd: Mapped[float] = mapped_column(Float)
 
-    ytd: Mapped["BoxOfficeYTD"] = relationship(back_populates="top_movies", lazy="selectin")
+class BoxOfficeRollup(Base):
+    """
+    Gross summed over a period (`grain`: day, weekend, month, year, lifetime)
+    and a dimension (total, movie, studio, genre) for a region. `key` is ''
+    for totals, the movie external_id, the studio or the genre name.
+    Maintained incrementally by BoxOfficeRepository.ingest_daily.
+    """
+    __tablename__ = "box_office_rollups"
+
+    region: Mapped[str] = mapped_column(String(50), primary_key=True)
+    grain: Mapped[str] = mapped_column(String(10), primary_key=True)
+    dimension: Mapped[str] = mapped_column(String(10), primary_key=True)
+    period_start: Mapped[datetime] = mapped_column(Date, primary_key=True)
+    key: Mapped[str] = mapped_column(String(100), primary_key=True)
+    gross_usd: Mapped[float] = mapped_column(Float, default=0)
+
+
+Index(
+    "ix_box_office_rollups_rank",
+    BoxOfficeRollup.region,
+    BoxOfficeRollup.grain,
+    BoxOfficeRollup.dimension,
+    BoxOfficeRollup.period_start,
+    BoxOfficeRollup.gross_usd.desc(),
+)
 
 
 class BoxOfficeRecord(Base):
@@ -652,34 +760,6 @@ class BoxOfficeRecord(Base):
     poster_url: Mapped[str | None] = mapped_column(String(255), nullable=True)
 
 
-class BoxOfficePerformanceGenre(Base):
-    __tablename__ = "box_office_perf_genre"
-
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    region: Mapped[str] = mapped_column(String(50), index=True, default="global")
-    name: Mapped[str] = mapped_column(String(100))
-    percent: Mapped[int] = mapped_column(Integer)
-    color: Mapped[str] = mapped_column(String(20))
-
-
-class BoxOfficePerformanceStudio(Base):
-    __tablename__ = "box_office_perf_studio"
-
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    region: Mapped[str] = mapped_column(String(50), index=True, default="global")
-    studio: Mapped[str] = mapped_column(String(100))
-    gross_millions_usd: Mapped[float] = mapped_column(Float)
-
-
-class BoxOfficePerformanceMonthly(Base):
-    __tablename__ = "box_office_perf_monthly"
-
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    region: Mapped[str] = mapped_column(String(50), index=True, default="global")
-    month: Mapped[str] = mapped_column(String(10))
-    gross_millions_usd: Mapped[float] = mapped_column(Float)
-
-
 
 # Festivals domain models
 class Festival(Base):
@@ -775,6 +855,28 @@ class FestivalWinner(Base):
     category: Mapped["FestivalWinnerCategory"] = relationship(back_populates="winners", lazy="selectin")
 
 
+class PageSnapshot(Base):
+    """
+    Prebuilt public payloads for read-mostly pages assembled from many small
+    rows: award ceremony years and festival edition programs/winners.
+
+    Keyed by (kind, key); `scope` is the owning ceremony or festival
+    external_id so one admin write can drop every snapshot it affects.
+    `version` increases on every rebuild. See PageSnapshotRepository.
+    """
+    __tablename__ = "page_snapshots"
+    __table_args__ = (
+        Index("ix_page_snapshots_scope", "kind", "scope"),
+    )
+
+    kind: Mapped[str] = mapped_column(String(30), primary_key=True)  # award_year | festival_program | festival_winners
+    key: Mapped[str] = mapped_column(String(120), primary_key=True)
+    scope: Mapped[str] = mapped_column(String(80))
+    version: Mapped[int] = mapped_column(Integer, default=1)
+    payload: Mapped[list | dict] = mapped_column(JSONB)
+    built_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+
 
 # Visual Treats domain models
 visual_treat_tags = Table(
@@ -826,6 +928,16 @@ class VisualTreat(Base):
     )
 
 
+# Substring search on the visual treats browse page (pg_trgm); the film title
+# is matched through movies.title
+Index("ix_visual_treats_title_trgm", VisualTreat.title, postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"})
+Index("ix_visual_treats_description_trgm", VisualTreat.description, postgresql_using="gin", postgresql_ops={"description": "gin_trgm_ops"})
+Index("ix_visual_treats_director_trgm", VisualTreat.director, postgresql_using="gin", postgresql_ops={"director": "gin_trgm_ops"})
+Index("ix_movies_title_trgm", Movie.title, postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"})
+Index("ix_visual_treats_category", VisualTreat.category)
+Index("ix_visual_treats_likes", VisualTreat.likes.desc())
+
+
 
 # Pulse domain models
 class UserFollow(Base):
@@ -1033,7 +1145,11 @@ class QuizAnswer(Base):
 
 
 class QuizLeaderboardEntry(Base):
+    """Best attempt per (quiz, user); kept by services.quiz_leaderboard."""
     __tablename__ = "quiz_leaderboard_entries"
+    __table_args__ = (
+        UniqueConstraint("quiz_id", "user_id", name="uq_quiz_leaderboard_user"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
 
@@ -1045,6 +1161,16 @@ class QuizLeaderboardEntry(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
 
 
+# Ranking order; covers top-N and board loads without touching the heap
+Index(
+    "ix_quiz_leaderboard_rank",
+    QuizLeaderboardEntry.quiz_id,
+    QuizLeaderboardEntry.score_percent.desc(),
+    QuizLeaderboardEntry.completion_time_seconds,
+    QuizLeaderboardEntry.user_id,
+)
+
+
 
 # Talent Hub domain models
 from sqlalchemy.dialects.postgresql import JSONB
@@ -1246,11 +1372,16 @@ class StreamingPlatform(Base):
 
 class MovieStreamingOption(Base):
     __tablename__ = "movie_streaming_options"
+    __table_args__ = (
+        # Availability browse: "free on Netflix in IN", "new on Prime in US"
+        Index("ix_movie_streaming_options_platform_region_type", "platform_id", "region", "type", "movie_id"),
+        Index("ix_movie_streaming_options_platform_region_added", "platform_id", "region", "added_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     external_id: Mapped[str] = mapped_column(String(80), unique=True, index=True)
 
-    movie_id: Mapped[int] = mapped_column(ForeignKey("movies.id"))
+    movie_id: Mapped[int] = mapped_column(ForeignKey("movies.id"), index=True)
     platform_id: Mapped[int] = mapped_column(ForeignKey("streaming_platforms.id"))
 
     region: Mapped[str] = mapped_column(String(10), index=True)  # US, UK, IN, AU, etc.
@@ -1259,11 +1390,30 @@ class MovieStreamingOption(Base):
     quality: Mapped[str | None] = mapped_column(String(10), nullable=True)  # HD, 4K, SD
     url: Mapped[str | None] = mapped_column(String(500), nullable=True)
     verified: Mapped[bool] = mapped_column(Boolean, default=False)
+    # When the offer first appeared; kept across re-imports of the same offer
+    added_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
 
     movie: Mapped["Movie"] = relationship(lazy="selectin")
     platform: Mapped["StreamingPlatform"] = relationship(back_populates="streaming_options", lazy="selectin")
 
 
+class MovieReleaseDate(Base):
+    """
+    Release date of a movie in one region for one kind of release (TMDB
+    `release_dates`); the regional release calendar reads these.
+    """
+    __tablename__ = "movie_release_dates"
+    __table_args__ = (
+        Index("ix_movie_release_dates_region_date", "region", "release_date"),
+    )
+
+    movie_id: Mapped[int] = mapped_column(ForeignKey("movies.id", ondelete="CASCADE"), primary_key=True)
+    region: Mapped[str] = mapped_column(String(10), primary_key=True)  # US, IN, GB, etc.
+    type: Mapped[str] = mapped_column(String(20), primary_key=True)  # premiere, limited, theatrical, digital, physical, tv
+    release_date: Mapped[datetime] = mapped_column(Date)
+    certification: Mapped[str | None] = mapped_column(String(20), nullable=True)
+
+
 # --- Settings domain models ---
 class UserSettings(Base):
     __tablename__ = "user_settings"
@@ -1400,6 +1550,9 @@ class CriticReviewComment(Base):
 
 class CriticFollower(Base):
     __tablename__ = "critic_followers"
+    __table_args__ = (
+        UniqueConstraint("critic_id", "user_id", name="uq_critic_follower_critic_user"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     critic_id: Mapped[int] = mapped_column(ForeignKey("critic_profiles.id", ondelete="CASCADE"), index=True)
@@ -388,7 +388,7 @@ class AdminRepository:
         )
 
 
-def calculate_quality_score(movie: Movie) -> int:
+def calculate_quality_score(movie: Movie, content: Optional[Dict[str, Any]] = None) -> int:
     """
     Calculate quality score (0-100) based on movie data completeness.
 
@@ -411,6 +411,8 @@ def calculate_quality_score(movie: Movie) -> int:
 
     Args:
         movie: Movie model instance
+        content: Published content payloads by category, as returned by
+            MovieContentRepository.published() for this movie
 
     Returns:
         Quality score (0-100)
@@ -445,17 +447,20 @@ def calculate_quality_score(movie: Movie) -> int:
         score += min(10, len(movie.genres) * 3)  # Max 10 points
 
     # Rich Content (30 points)
+    trivia = (content or {}).get("trivia")
+    timeline = (content or {}).get("timeline")
+
     # Trivia: 15 points
-    if movie.trivia and len(movie.trivia) >= 3:
+    if trivia and len(trivia) >= 3:
         score += 15
-    elif movie.trivia and len(movie.trivia) >= 1:
-        score += min(15, len(movie.trivia) * 5)
+    elif trivia and len(trivia) >= 1:
+        score += min(15, len(trivia) * 5)
 
     # Timeline: 15 points
-    if movie.timeline and len(movie.timeline) >= 3:
+    if timeline and len(timeline) >= 3:
         score += 15
-    elif movie.timeline and len(movie.timeline) >= 1:
-        score += min(15, len(movie.timeline) * 5)
+    elif timeline and len(timeline) >= 1:
+        score += min(15, len(timeline) * 5)
 
     # Rating Scores (20 points)
     rating_points = 0
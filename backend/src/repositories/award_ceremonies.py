@@ -10,11 +10,73 @@ Date: 2025-11-03
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
-from sqlalchemy import select, func, desc
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import select, func, desc, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import noload
 
+from ..config import settings
 from ..models import AwardCeremony
+from ..services.cache import TTLCache
+
+# List pages and statistics. create/update/delete below clear the whole cache,
+# as does the admin movie import after it creates ceremonies; the TTL covers
+# other workers and any other writer.
+award_ceremony_cache = TTLCache(ttl_seconds=settings.award_ceremony_cache_ttl_seconds, max_entries=256)
+
+_STAT_COLUMNS = (
+    AwardCeremony.country,
+    AwardCeremony.language,
+    AwardCeremony.category_type,
+    AwardCeremony.prestige_level,
+)
+# GROUPING() bitmask -> breakdown; the first column is the most significant bit
+_STAT_BREAKDOWNS = {
+    0b0111: ("by_country", 0),
+    0b1011: ("by_language", 1),
+    0b1101: ("by_category_type", 2),
+    0b1110: ("by_prestige_level", 3),
+}
+
+
+def statistics_from_rows(rows: List[Any]) -> Dict[str, Any]:
+    """Fold GROUPING SETS rows (country, language, category_type, prestige_level, grouping, count) into the stats shape."""
+    stats: Dict[str, Any] = {
+        "total_ceremonies": 0,
+        "by_country": {},
+        "by_language": {},
+        "by_category_type": {},
+        "by_prestige_level": {},
+    }
+    for row in rows:
+        grouping, count = row[4], row[5]
+        if grouping == 0b1111:
+            stats["total_ceremonies"] = count
+            continue
+        key, index = _STAT_BREAKDOWNS[grouping]
+        stats[key][row[index] or "Unknown"] = count
+    return stats
+
+
+def _to_dict(ceremony: AwardCeremony) -> Dict[str, Any]:
+    return {
+        "id": ceremony.id,
+        "external_id": ceremony.external_id,
+        "name": ceremony.name,
+        "short_name": ceremony.short_name,
+        "description": ceremony.description,
+        "logo_url": ceremony.logo_url,
+        "background_image_url": ceremony.background_image_url,
+        "current_year": ceremony.current_year,
+        "next_ceremony_date": ceremony.next_ceremony_date.isoformat() if ceremony.next_ceremony_date else None,
+        "country": ceremony.country,
+        "language": ceremony.language,
+        "category_type": ceremony.category_type,
+        "prestige_level": ceremony.prestige_level,
+        "established_year": ceremony.established_year,
+        "is_active": ceremony.is_active,
+        "display_order": ceremony.display_order,
+    }
 
 
 class AwardCeremoniesRepository:
@@ -23,7 +85,28 @@ class AwardCeremoniesRepository:
     def __init__(self, session: AsyncSession | None) -> None:
         self.session = session
 
-    async def list(
+    @staticmethod
+    def _filters(
+        country: Optional[str] = None,
+        language: Optional[str] = None,
+        category_type: Optional[str] = None,
+        prestige_level: Optional[str] = None,
+        is_active: Optional[bool] = None,
+    ) -> List[Any]:
+        where: List[Any] = []
+        if country:
+            where.append(AwardCeremony.country == country)
+        if language:
+            where.append(AwardCeremony.language == language)
+        if category_type:
+            where.append(AwardCeremony.category_type == category_type)
+        if prestige_level:
+            where.append(AwardCeremony.prestige_level == prestige_level)
+        if is_active is not None:
+            where.append(AwardCeremony.is_active == is_active)
+        return where
+
+    async def list_page(
         self,
         *,
         country: Optional[str] = None,
@@ -33,9 +116,10 @@ class AwardCeremoniesRepository:
         is_active: Optional[bool] = None,
         limit: int = 50,
         offset: int = 0,
-    ) -> List[Dict[str, Any]]:
+    ) -> Tuple[List[Dict[str, Any]], int]:
         """
-        List award ceremonies with optional filtering.
+        One page of ceremonies and the total matching the filters, from one
+        query (count(*) OVER ()). Pages are cached until the next admin write.
         
         Args:
             country: Filter by country (e.g., "India", "USA", "International")
@@ -47,55 +131,43 @@ class AwardCeremoniesRepository:
             offset: Number of results to skip (for pagination)
             
         Returns:
-            List of award ceremony dictionaries
+            (list of award ceremony dictionaries, total count)
         """
         if not self.session:
-            return []
+            return [], 0
 
-        # Build query with filters
-        query = select(AwardCeremony)
-        
-        if country:
-            query = query.where(AwardCeremony.country == country)
-        if language:
-            query = query.where(AwardCeremony.language == language)
-        if category_type:
-            query = query.where(AwardCeremony.category_type == category_type)
-        if prestige_level:
-            query = query.where(AwardCeremony.prestige_level == prestige_level)
-        if is_active is not None:
-            query = query.where(AwardCeremony.is_active == is_active)
-        
-        # Order by display_order, then by name
-        query = query.order_by(AwardCeremony.display_order, AwardCeremony.name)
-        
-        # Apply pagination
-        query = query.limit(limit).offset(offset)
-        
-        result = await self.session.execute(query)
-        ceremonies = result.scalars().all()
-        
-        return [
-            {
-                "id": c.id,
-                "external_id": c.external_id,
-                "name": c.name,
-                "short_name": c.short_name,
-                "description": c.description,
-                "logo_url": c.logo_url,
-                "background_image_url": c.background_image_url,
-                "current_year": c.current_year,
-                "next_ceremony_date": c.next_ceremony_date.isoformat() if c.next_ceremony_date else None,
-                "country": c.country,
-                "language": c.language,
-                "category_type": c.category_type,
-                "prestige_level": c.prestige_level,
-                "established_year": c.established_year,
-                "is_active": c.is_active,
-                "display_order": c.display_order,
-            }
-            for c in ceremonies
-        ]
+        cache_key = ("list", country, language, category_type, prestige_level, is_active, limit, offset)
+        cached = award_ceremony_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        where = self._filters(country, language, category_type, prestige_level, is_active)
+        # noload: AwardCeremony.years would selectin-load every year, category and nomination
+        query = (
+            select(AwardCeremony, func.count().over().label("total"))
+            .where(*where)
+            .order_by(AwardCeremony.display_order, AwardCeremony.name)
+            .limit(limit)
+            .offset(offset)
+            .options(noload("*"))
+        )
+        rows = (await self.session.execute(query)).all()
+        if rows:
+            total = rows[0].total
+        elif offset:
+            # Past the last page: no row to carry the window count
+            total = (await self.session.execute(select(func.count(AwardCeremony.id)).where(*where))).scalar_one()
+        else:
+            total = 0
+
+        result = ([_to_dict(c) for c, _ in rows], total)
+        award_ceremony_cache.set(cache_key, result)
+        return result
+
+    async def list(self, **kwargs: Any) -> List[Dict[str, Any]]:
+        """List award ceremonies with optional filtering (see list_page)."""
+        items, _ = await self.list_page(**kwargs)
+        return items
 
     async def count(
         self,
@@ -118,19 +190,9 @@ class AwardCeremoniesRepository:
         if not self.session:
             return 0
 
-        query = select(func.count(AwardCeremony.id))
-        
-        if country:
-            query = query.where(AwardCeremony.country == country)
-        if language:
-            query = query.where(AwardCeremony.language == language)
-        if category_type:
-            query = query.where(AwardCeremony.category_type == category_type)
-        if prestige_level:
-            query = query.where(AwardCeremony.prestige_level == prestige_level)
-        if is_active is not None:
-            query = query.where(AwardCeremony.is_active == is_active)
-        
+        query = select(func.count(AwardCeremony.id)).where(
+            *self._filters(country, language, category_type, prestige_level, is_active)
+        )
         result = await self.session.execute(query)
         return result.scalar_one()
 
@@ -154,24 +216,7 @@ class AwardCeremoniesRepository:
         if not ceremony:
             return None
         
-        return {
-            "id": ceremony.id,
-            "external_id": ceremony.external_id,
-            "name": ceremony.name,
-            "short_name": ceremony.short_name,
-            "description": ceremony.description,
-            "logo_url": ceremony.logo_url,
-            "background_image_url": ceremony.background_image_url,
-            "current_year": ceremony.current_year,
-            "next_ceremony_date": ceremony.next_ceremony_date.isoformat() if ceremony.next_ceremony_date else None,
-            "country": ceremony.country,
-            "language": ceremony.language,
-            "category_type": ceremony.category_type,
-            "prestige_level": ceremony.prestige_level,
-            "established_year": ceremony.established_year,
-            "is_active": ceremony.is_active,
-            "display_order": ceremony.display_order,
-        }
+        return _to_dict(ceremony)
 
     async def create(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -189,26 +234,10 @@ class AwardCeremoniesRepository:
         ceremony = AwardCeremony(**data)
         self.session.add(ceremony)
         await self.session.commit()
+        award_ceremony_cache.clear()
         await self.session.refresh(ceremony)
         
-        return {
-            "id": ceremony.id,
-            "external_id": ceremony.external_id,
-            "name": ceremony.name,
-            "short_name": ceremony.short_name,
-            "description": ceremony.description,
-            "logo_url": ceremony.logo_url,
-            "background_image_url": ceremony.background_image_url,
-            "current_year": ceremony.current_year,
-            "next_ceremony_date": ceremony.next_ceremony_date.isoformat() if ceremony.next_ceremony_date else None,
-            "country": ceremony.country,
-            "language": ceremony.language,
-            "category_type": ceremony.category_type,
-            "prestige_level": ceremony.prestige_level,
-            "established_year": ceremony.established_year,
-            "is_active": ceremony.is_active,
-            "display_order": ceremony.display_order,
-        }
+        return _to_dict(ceremony)
 
     async def update(self, external_id: str, data: Dict[str, Any]) -> Dict[str, Any] | None:
         """
@@ -237,26 +266,10 @@ class AwardCeremoniesRepository:
                 setattr(ceremony, key, value)
         
         await self.session.commit()
+        award_ceremony_cache.clear()
         await self.session.refresh(ceremony)
         
-        return {
-            "id": ceremony.id,
-            "external_id": ceremony.external_id,
-            "name": ceremony.name,
-            "short_name": ceremony.short_name,
-            "description": ceremony.description,
-            "logo_url": ceremony.logo_url,
-            "background_image_url": ceremony.background_image_url,
-            "current_year": ceremony.current_year,
-            "next_ceremony_date": ceremony.next_ceremony_date.isoformat() if ceremony.next_ceremony_date else None,
-            "country": ceremony.country,
-            "language": ceremony.language,
-            "category_type": ceremony.category_type,
-            "prestige_level": ceremony.prestige_level,
-            "established_year": ceremony.established_year,
-            "is_active": ceremony.is_active,
-            "display_order": ceremony.display_order,
-        }
+        return _to_dict(ceremony)
 
     async def delete(self, external_id: str) -> bool:
         """
@@ -280,6 +293,7 @@ class AwardCeremoniesRepository:
         
         await self.session.delete(ceremony)
         await self.session.commit()
+        award_ceremony_cache.clear()
         
         return True
 
@@ -287,60 +301,35 @@ class AwardCeremoniesRepository:
         """
         Get statistics about award ceremonies.
         
+        All four breakdowns and the total come from one GROUPING SETS query;
+        the result is cached until the next create/update/delete.
+        
         Returns:
             Dictionary containing statistics grouped by country, language, category_type, and prestige_level
         """
         if not self.session:
-            return {
-                "total_ceremonies": 0,
-                "by_country": {},
-                "by_language": {},
-                "by_category_type": {},
-                "by_prestige_level": {},
-            }
-
-        # Total count
-        total_query = select(func.count(AwardCeremony.id))
-        total_result = await self.session.execute(total_query)
-        total = total_result.scalar_one()
-
-        # Group by country
-        country_query = select(
-            AwardCeremony.country,
-            func.count(AwardCeremony.id)
-        ).group_by(AwardCeremony.country)
-        country_result = await self.session.execute(country_query)
-        by_country = {row[0] or "Unknown": row[1] for row in country_result.all()}
-
-        # Group by language
-        language_query = select(
-            AwardCeremony.language,
-            func.count(AwardCeremony.id)
-        ).group_by(AwardCeremony.language)
-        language_result = await self.session.execute(language_query)
-        by_language = {row[0] or "Unknown": row[1] for row in language_result.all()}
-
-        # Group by category_type
-        category_query = select(
-            AwardCeremony.category_type,
-            func.count(AwardCeremony.id)
-        ).group_by(AwardCeremony.category_type)
-        category_result = await self.session.execute(category_query)
-        by_category_type = {row[0] or "Unknown": row[1] for row in category_result.all()}
-
-        # Group by prestige_level
-        prestige_query = select(
-            AwardCeremony.prestige_level,
-            func.count(AwardCeremony.id)
-        ).group_by(AwardCeremony.prestige_level)
-        prestige_result = await self.session.execute(prestige_query)
-        by_prestige_level = {row[0] or "Unknown": row[1] for row in prestige_result.all()}
+            return statistics_from_rows([])
+
+        cached = award_ceremony_cache.get(("stats",))
+        if cached is not None:
+            return cached
 
+        query = (
+            select(*_STAT_COLUMNS, func.grouping(*_STAT_COLUMNS).label("grouping_id"), func.count())
+            .group_by(func.grouping_sets(*[tuple_(c) for c in _STAT_COLUMNS], tuple_()))
+        )
+        result = await self.session.execute(query)
+        stats = statistics_from_rows(result.all())
+        award_ceremony_cache.set(("stats",), stats)
+        return stats
+
+    async def dashboard(self, *, limit: int = 50, offset: int = 0) -> Dict[str, Any]:
+        """Admin awards dashboard: statistics plus the first page of ceremonies."""
+        ceremonies, total = await self.list_page(limit=limit, offset=offset)
         return {
-            "total_ceremonies": total,
-            "by_country": by_country,
-            "by_language": by_language,
-            "by_category_type": by_category_type,
-            "by_prestige_level": by_prestige_level,
+            "stats": await self.get_statistics(),
+            "ceremonies": ceremonies,
+            "total": total,
+            "limit": limit,
+            "offset": offset,
         }
-
@@ -3,9 +3,10 @@ from __future__ import annotations
 from typing import Any, List
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import noload
 
 from ..models import AwardCeremony, AwardCeremonyYear, AwardCategory, AwardNomination
+from .page_snapshots import AWARD_YEAR, PageSnapshotRepository
 
 
 class AwardsRepository:
@@ -15,12 +16,17 @@ class AwardsRepository:
     async def list_ceremonies(self) -> List[dict[str, Any]]:
         if not self.session:
             return []
-        # Load ceremonies and their years
-        res = await self.session.execute(select(AwardCeremony))
-        ceremonies = res.scalars().all()
+        # Ceremonies and their years as plain columns; the relationships would
+        # selectin-load every category and nomination underneath.
+        ceremonies = (await self.session.execute(select(AwardCeremony).options(noload("*")))).scalars().all()
+        years_by_ceremony: dict[int, List[int]] = {}
+        for ceremony_id, year in (
+            await self.session.execute(select(AwardCeremonyYear.ceremony_id, AwardCeremonyYear.year))
+        ).all():
+            years_by_ceremony.setdefault(ceremony_id, []).append(year)
         result: List[dict[str, Any]] = []
         for c in ceremonies:
-            years_available = sorted([y.year for y in c.years], reverse=True)
+            years_available = sorted(years_by_ceremony.get(c.id, []), reverse=True)
             result.append(
                 {
                     "id": c.external_id,
@@ -37,59 +43,112 @@ class AwardsRepository:
         return result
 
     async def get_award_details(self, ceremony_year_external_id: str) -> dict[str, Any] | None:
+        """Ceremony-year page, served from its snapshot (built and stored on a miss). The caller commits."""
         if not self.session:
             return None
-        res = await self.session.execute(
-            select(AwardCeremonyYear)
-            .options(
-                selectinload(AwardCeremonyYear.ceremony).selectinload(AwardCeremony.years),
-                selectinload(AwardCeremonyYear.categories).selectinload(AwardCategory.nominations),
+        snapshots = PageSnapshotRepository(self.session)
+        payload = await snapshots.get(AWARD_YEAR, ceremony_year_external_id)
+        if payload is not None:
+            return payload
+        built = await self.build_award_details(ceremony_year_external_id)
+        if built is None:
+            return None
+        scope, payload = built
+        await snapshots.put(AWARD_YEAR, ceremony_year_external_id, scope, payload)
+        return payload
+
+    async def build_award_details(self, ceremony_year_external_id: str) -> tuple[str, dict[str, Any]] | None:
+        """
+        Render a ceremony-year page from three projection queries (year header,
+        categories with nominations, sibling years). Returns (ceremony
+        external_id, payload), or None if the year does not exist.
+        """
+        year = (
+            await self.session.execute(
+                select(
+                    AwardCeremonyYear.id,
+                    AwardCeremonyYear.external_id,
+                    AwardCeremonyYear.year,
+                    AwardCeremonyYear.date,
+                    AwardCeremonyYear.location,
+                    AwardCeremonyYear.hosted_by,
+                    AwardCeremonyYear.background_image_url,
+                    AwardCeremonyYear.logo_url,
+                    AwardCeremonyYear.description,
+                    AwardCeremonyYear.highlights,
+                    AwardCeremonyYear.ceremony_id,
+                    AwardCeremony.external_id.label("ceremony_external_id"),
+                    AwardCeremony.name.label("ceremony_name"),
+                    AwardCeremony.logo_url.label("ceremony_logo_url"),
+                )
+                .join(AwardCeremony, AwardCeremony.id == AwardCeremonyYear.ceremony_id)
+                .where(AwardCeremonyYear.external_id == ceremony_year_external_id)
             )
-            .where(AwardCeremonyYear.external_id == ceremony_year_external_id)
-        )
-        year = res.scalar_one_or_none()
+        ).first()
         if not year:
             return None
+
+        rows = await self.session.execute(
+            select(
+                AwardCategory.external_id,
+                AwardCategory.name,
+                AwardNomination.external_id,
+                AwardNomination.nominee_name,
+                AwardNomination.nominee_type,
+                AwardNomination.image_url,
+                AwardNomination.entity_url,
+                AwardNomination.is_winner,
+                AwardNomination.details,
+            )
+            .outerjoin(AwardNomination, AwardNomination.category_id == AwardCategory.id)
+            .where(AwardCategory.ceremony_year_id == year.id)
+            .order_by(AwardCategory.id, AwardNomination.id)
+        )
         categories: List[dict[str, Any]] = []
-        for cat in year.categories:
-            nominations = []
-            for n in cat.nominations:
-                nominations.append(
+        by_ext: dict[str, dict[str, Any]] = {}
+        for cat_ext, cat_name, nom_ext, name, nominee_type, image_url, entity_url, is_winner, details in rows.all():
+            cat = by_ext.get(cat_ext)
+            if cat is None:
+                cat = by_ext[cat_ext] = {"id": cat_ext, "name": cat_name, "nominees": []}
+                categories.append(cat)
+            if nom_ext is not None:
+                cat["nominees"].append(
                     {
-                        "id": n.external_id,
-                        "name": n.nominee_name,
-                        "type": n.nominee_type,
-                        "imageUrl": n.image_url,
-                        "entityUrl": n.entity_url,
-                        "isWinner": n.is_winner,
-                        "details": n.details,
+                        "id": nom_ext,
+                        "name": name,
+                        "type": nominee_type,
+                        "imageUrl": image_url,
+                        "entityUrl": entity_url,
+                        "isWinner": is_winner,
+                        "details": details,
                     }
                 )
-            categories.append({"id": cat.external_id, "name": cat.name, "nominees": nominations})
 
-        # Build relatedCeremonies as neighbors for same ceremony without triggering lazy-loads
-        siblings_res = await self.session.execute(
-            select(AwardCeremonyYear).where(AwardCeremonyYear.ceremony_id == year.ceremony_id)
+        siblings = await self.session.execute(
+            select(AwardCeremonyYear.external_id, AwardCeremonyYear.year)
+            .where(
+                AwardCeremonyYear.ceremony_id == year.ceremony_id,
+                AwardCeremonyYear.external_id != year.external_id,
+            )
+            .order_by(AwardCeremonyYear.year.desc())
+            .limit(5)
         )
-        siblings = siblings_res.scalars().all()
         related = [
-            {"id": y.external_id, "name": f"{year.ceremony.name if year.ceremony else ''} {y.year}", "year": y.year}
-            for y in sorted(siblings, key=lambda x: x.year, reverse=True)
-            if y.external_id != year.external_id
-        ][:5]
+            {"id": ext, "name": f"{year.ceremony_name or ''} {y}", "year": y}
+            for ext, y in siblings.all()
+        ]
 
-        return {
+        return year.ceremony_external_id, {
             "id": year.external_id,
-            "ceremonyName": f"The {year.year} {year.ceremony.name}",
+            "ceremonyName": f"The {year.year} {year.ceremony_name}",
             "year": year.year,
             "date": year.date.isoformat() if year.date else "",
             "location": year.location or None,
             "hostedBy": [] if not year.hosted_by else [h.strip() for h in year.hosted_by.split(",")],
             "backgroundImageUrl": year.background_image_url or None,
-            "logoUrl": year.logo_url or (year.ceremony.logo_url or None),
+            "logoUrl": year.logo_url or (year.ceremony_logo_url or None),
             "description": year.description or None,
             "highlights": [] if not year.highlights else [h.strip() for h in year.highlights.split("|")],
             "categories": categories,
             "relatedCeremonies": related,
         }
-
@@ -1,22 +1,51 @@
 from __future__ import annotations
 
-from typing import Any, List
-from datetime import datetime
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Any, Iterable, List, Optional
 
-from sqlalchemy import select
+from sqlalchemy import Date, DateTime, and_, cast, delete, func, literal, or_, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from ..models import (
-    BoxOfficeWeekendEntry,
-    BoxOfficeTrendPoint,
-    BoxOfficeYTD,
-    BoxOfficeYTDTopMovie,
+    BoxOfficeDailyGross,
     BoxOfficeRecord,
-    BoxOfficePerformanceGenre,
-    BoxOfficePerformanceStudio,
-    BoxOfficePerformanceMonthly,
+    BoxOfficeRollup,
+    Genre,
+    Movie,
+    movie_genres,
 )
 
+# Rollup grains and dimensions (box_office_rollups.grain / .dimension)
+DAY = "day"
+WEEKEND = "weekend"
+MONTH = "month"
+YEAR = "year"
+LIFETIME = "lifetime"
+TOTAL = "total"
+MOVIE = "movie"
+STUDIO = "studio"
+GENRE = "genre"
+
+LIFETIME_START = date(1900, 1, 1)
+UPSERT_BATCH_SIZE = 1000
+# First key of the pg_advisory_xact_lock(int, int) pair taken per region
+REGION_LOCK_NAMESPACE = 0x424F
+YTD_TOP_MOVIES = 5
+DEFAULT_MAX_POINTS = 90
+
+GENRE_COLORS = {
+    "Action": "#00BFFF",
+    "Drama": "#FF6B6B",
+    "Comedy": "#4ECDC4",
+    "Sci-Fi": "#45B7D1",
+    "Science Fiction": "#45B7D1",
+    "Horror": "#96CEB4",
+}
+_OTHER_COLORS = ("#FFD166", "#A78BFA", "#F472B6", "#34D399", "#F59E0B")
+
 
 def _fmt_money(amount_usd: float) -> str:
     # Format amounts like $4.87B, $189.4M
@@ -34,98 +63,441 @@ def _fmt_change(percent: float | None, is_positive: bool | None) -> str:
     return f"{sign}{abs(percent):.1f}%"
 
 
+def _change(current: float, previous: float | None) -> tuple[float | None, bool]:
+    if not previous:
+        return None, True
+    return (current - previous) / previous * 100, current >= previous
+
+
+def weekend_start(day: date) -> Optional[date]:
+    """The Friday opening the weekend `day` belongs to, or None on Monday-Thursday."""
+    weekday = day.weekday()
+    return day - timedelta(days=weekday - 4) if weekday >= 4 else None
+
+
+def rollup_keys(
+    movie: str, region: str, day: date, studio: Optional[str], genres: Iterable[str]
+) -> list[tuple[str, str, str, date, str]]:
+    """Every (region, grain, dimension, period_start, key) a daily gross counts towards."""
+    month, year = day.replace(day=1), day.replace(month=1, day=1)
+    keys = [
+        (region, DAY, TOTAL, day, ""),
+        (region, MONTH, TOTAL, month, ""),
+        (region, YEAR, TOTAL, year, ""),
+        (region, YEAR, MOVIE, year, movie),
+        (region, LIFETIME, MOVIE, LIFETIME_START, movie),
+    ]
+    friday = weekend_start(day)
+    if friday is not None:
+        keys.append((region, WEEKEND, MOVIE, friday, movie))
+    if studio:
+        keys.append((region, YEAR, STUDIO, year, studio))
+    keys.extend((region, YEAR, GENRE, year, g) for g in genres)
+    return keys
+
+
+def rollup_deltas(changes: Iterable[tuple[Optional[tuple], Optional[tuple]]]) -> dict[tuple, float]:
+    """
+    Net rollup changes for replacing facts. Each change is (old, new), either
+    side None, with facts as (movie, region, day, gross_usd, studio, genres).
+    """
+    deltas: dict[tuple, float] = defaultdict(float)
+    for old, new in changes:
+        if old is not None:
+            movie, region, day, gross, studio, genres = old
+            for key in rollup_keys(movie, region, day, studio, genres):
+                deltas[key] -= gross
+        if new is not None:
+            movie, region, day, gross, studio, genres = new
+            for key in rollup_keys(movie, region, day, studio, genres):
+                deltas[key] += gross
+    return {k: v for k, v in deltas.items() if abs(v) > 1e-6}
+
+
+def choose_bucket(start: date, end: date, max_points: int) -> str:
+    """The finest of day/week/month that keeps the series within `max_points`."""
+    days = (end - start).days + 1
+    if days <= max_points:
+        return "day"
+    if days / 7 <= max_points:
+        return "week"
+    return "month"
+
+
+def _parse_day(value: Any) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+
 class BoxOfficeRepository:
+    """
+    Box office pages read `box_office_rollups`, one query per endpoint.
+    `ingest_daily` upserts `box_office_daily_gross` and applies the change in
+    each fact to its rollups, so no page ever aggregates raw facts except the
+    range series, which sums daily totals. Writers of a region hold its
+    advisory lock until they commit. The caller commits.
+    """
+
     def __init__(self, session: AsyncSession | None) -> None:
         self.session = session
 
+    # -- ingest ---------------------------------------------------------------
+
+    async def ingest_daily(self, rows: Iterable[dict[str, Any]]) -> dict[str, Any]:
+        """
+        Upsert daily grosses given as dicts with movie_external_id, region,
+        date, gross_usd and optional studio. Later rows win within a batch.
+        """
+        latest: dict[tuple[str, str, date], tuple[float, Optional[str]]] = {}
+        for r in rows:
+            key = (r["movie_external_id"], r.get("region") or "global", _parse_day(r["date"]))
+            latest[key] = (float(r["gross_usd"]), r.get("studio") or None)
+        if not self.session or not latest:
+            return {"ingested": 0, "unknownMovies": []}
+
+        movies = await self._movies({k[0] for k in latest})
+        unknown = sorted({k[0] for k in latest if k[0] not in movies})
+        facts = {
+            (movies[ext][0], region, day): (ext, value)
+            for (ext, region, day), value in latest.items()
+            if ext in movies
+        }
+        if not facts:
+            return {"ingested": 0, "unknownMovies": unknown}
+
+        # Deltas are computed from the rows read below, so two ingests of the
+        # same region must not interleave (FOR UPDATE cannot lock a fact that
+        # does not exist yet)
+        await self._lock_regions({region for _, region, _ in facts})
+        # Chunked like the upserts: each key binds three parameters
+        keys = list(facts)
+        old: dict[tuple[int, str, date], tuple[float, Optional[str]]] = {}
+        for i in range(0, len(keys), UPSERT_BATCH_SIZE):
+            existing = await self.session.execute(
+                select(
+                    BoxOfficeDailyGross.movie_id,
+                    BoxOfficeDailyGross.region,
+                    BoxOfficeDailyGross.date,
+                    BoxOfficeDailyGross.gross_usd,
+                    BoxOfficeDailyGross.studio,
+                )
+                .where(
+                    tuple_(BoxOfficeDailyGross.movie_id, BoxOfficeDailyGross.region, BoxOfficeDailyGross.date)
+                    .in_(keys[i:i + UPSERT_BATCH_SIZE])
+                )
+            )
+            old.update({(m, r, d): (g, s) for m, r, d, g, s in existing.tuples()})
+
+        changes = []
+        for (movie_id, region, day), (ext, (gross, studio)) in facts.items():
+            genres = movies[ext][1]
+            before = old.get((movie_id, region, day))
+            changes.append((
+                None if before is None else (ext, region, day, before[0], before[1], genres),
+                (ext, region, day, gross, studio, genres),
+            ))
+
+        now = datetime.utcnow()
+        fact_rows = [
+            {"movie_id": m, "region": r, "date": d, "gross_usd": g, "studio": s, "updated_at": now}
+            for (m, r, d), (_, (g, s)) in facts.items()
+        ]
+        for i in range(0, len(fact_rows), UPSERT_BATCH_SIZE):
+            stmt = pg_insert(BoxOfficeDailyGross).values(fact_rows[i:i + UPSERT_BATCH_SIZE])
+            await self.session.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[BoxOfficeDailyGross.movie_id, BoxOfficeDailyGross.region, BoxOfficeDailyGross.date],
+                    set_={
+                        "gross_usd": stmt.excluded.gross_usd,
+                        "studio": stmt.excluded.studio,
+                        "updated_at": stmt.excluded.updated_at,
+                    },
+                )
+            )
+        await self._apply_deltas(rollup_deltas(changes))
+        return {"ingested": len(fact_rows), "unknownMovies": unknown}
+
+    async def rebuild_rollups(self, region: str) -> int:
+        """Recompute a region's rollups from its facts (e.g. after genres were edited)."""
+        if not self.session:
+            return 0
+        await self._lock_regions({region})
+        await self.session.execute(delete(BoxOfficeRollup).where(BoxOfficeRollup.region == region))
+        res = await self.session.execute(
+            select(Movie.external_id, BoxOfficeDailyGross.date, BoxOfficeDailyGross.gross_usd, BoxOfficeDailyGross.studio)
+            .join(Movie, Movie.id == BoxOfficeDailyGross.movie_id)
+            .where(BoxOfficeDailyGross.region == region)
+        )
+        facts = res.all()
+        movies = await self._movies({ext for ext, *_ in facts})
+        deltas = rollup_deltas(
+            (None, (ext, region, day, gross, studio, movies[ext][1])) for ext, day, gross, studio in facts
+        )
+        await self._apply_deltas(deltas)
+        return len(deltas)
+
+    async def _lock_regions(self, regions: set[str]) -> None:
+        """Take each region's transaction-scoped advisory lock, in a fixed order."""
+        for region in sorted(regions):
+            await self.session.execute(
+                select(func.pg_advisory_xact_lock(REGION_LOCK_NAMESPACE, func.hashtext(region)))
+            )
+
+    async def _movies(self, external_ids: set[str]) -> dict[str, tuple[int, list[str]]]:
+        """external_id -> (id, genre names) in one query."""
+        if not external_ids:
+            return {}
+        res = await self.session.execute(
+            select(Movie.id, Movie.external_id, Genre.name)
+            .outerjoin(movie_genres, movie_genres.c.movie_id == Movie.id)
+            .outerjoin(Genre, Genre.id == movie_genres.c.genre_id)
+            .where(Movie.external_id.in_(sorted(external_ids)))
+        )
+        out: dict[str, tuple[int, list[str]]] = {}
+        for movie_id, ext, genre in res.tuples():
+            entry = out.setdefault(ext, (movie_id, []))
+            if genre:
+                entry[1].append(genre)
+        return out
+
+    async def _apply_deltas(self, deltas: dict[tuple, float]) -> None:
+        rows = [
+            {"region": r, "grain": g, "dimension": dim, "period_start": p, "key": k, "gross_usd": v}
+            for (r, g, dim, p, k), v in sorted(deltas.items())
+        ]
+        for i in range(0, len(rows), UPSERT_BATCH_SIZE):
+            stmt = pg_insert(BoxOfficeRollup).values(rows[i:i + UPSERT_BATCH_SIZE])
+            await self.session.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[
+                        BoxOfficeRollup.region,
+                        BoxOfficeRollup.grain,
+                        BoxOfficeRollup.dimension,
+                        BoxOfficeRollup.period_start,
+                        BoxOfficeRollup.key,
+                    ],
+                    set_={"gross_usd": BoxOfficeRollup.gross_usd + stmt.excluded.gross_usd},
+                )
+            )
+
+    # -- pages ----------------------------------------------------------------
+
     async def weekend(self, region: str = "global", limit: int = 10) -> List[dict[str, Any]]:
+        """Top movies of the latest weekend with their running total and change on the previous weekend."""
         if not self.session:
             return []
+        cur, prev, life = aliased(BoxOfficeRollup), aliased(BoxOfficeRollup), aliased(BoxOfficeRollup)
+        latest = (
+            select(func.max(BoxOfficeRollup.period_start))
+            .where(
+                BoxOfficeRollup.region == region,
+                BoxOfficeRollup.grain == WEEKEND,
+                BoxOfficeRollup.dimension == MOVIE,
+            )
+            .scalar_subquery()
+        )
         res = await self.session.execute(
-            select(BoxOfficeWeekendEntry)
-            .where(BoxOfficeWeekendEntry.region == region)
-            .order_by(BoxOfficeWeekendEntry.rank.asc())
+            select(cur.gross_usd, prev.gross_usd, life.gross_usd, Movie.title, Movie.poster_url)
+            .join(Movie, Movie.external_id == cur.key)
+            .outerjoin(
+                prev,
+                and_(
+                    prev.region == cur.region,
+                    prev.grain == WEEKEND,
+                    prev.dimension == MOVIE,
+                    prev.period_start == cur.period_start - 7,
+                    prev.key == cur.key,
+                ),
+            )
+            .outerjoin(
+                life,
+                and_(
+                    life.region == cur.region,
+                    life.grain == LIFETIME,
+                    life.dimension == MOVIE,
+                    life.period_start == LIFETIME_START,
+                    life.key == cur.key,
+                ),
+            )
+            .where(
+                cur.region == region,
+                cur.grain == WEEKEND,
+                cur.dimension == MOVIE,
+                cur.period_start == latest,
+            )
+            .order_by(cur.gross_usd.desc(), Movie.title)
+            .limit(limit)
         )
-        rows = res.scalars().all()
-        rows = rows[:limit]
         out: List[dict[str, Any]] = []
-        for r in rows:
+        for rank, (gross, prev_gross, total, title, poster) in enumerate(res.tuples(), start=1):
+            percent, positive = _change(gross, prev_gross)
             out.append(
                 {
-                    "rank": r.rank,
-                    "title": r.movie.title if r.movie else "",
-                    "weekend": _fmt_money(r.weekend_gross_usd),
-                    "total": _fmt_money(r.total_gross_usd),
-                    "change": _fmt_change(r.change_percent, r.is_positive),
-                    "isPositive": bool(r.is_positive),
-                    "poster": r.poster_url or (r.movie.poster_url if r.movie else None),
+                    "rank": rank,
+                    "title": title,
+                    "weekend": _fmt_money(gross),
+                    "total": _fmt_money(total),
+                    "change": _fmt_change(percent, positive),
+                    "isPositive": positive,
+                    "poster": poster,
                 }
             )
         return out
 
-    async def trends(self, region: str = "global") -> List[dict[str, Any]]:
+    async def series(
+        self,
+        region: str,
+        start: date,
+        end: date,
+        bucket: Optional[str] = None,
+        max_points: int = DEFAULT_MAX_POINTS,
+    ) -> dict[str, Any]:
+        """
+        Total daily gross between `start` and `end`, summed per day, week or
+        month. Without `bucket` the finest one within `max_points` is used.
+        """
+        bucket = bucket or choose_bucket(start, end, max_points)
+        out: dict[str, Any] = {
+            "region": region,
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "bucket": bucket,
+            "points": [],
+        }
         if not self.session:
-            return []
+            return out
+        day = BoxOfficeRollup.period_start
+        period = day if bucket == "day" else cast(func.date_trunc(bucket, cast(day, DateTime)), Date)
         res = await self.session.execute(
-            select(BoxOfficeTrendPoint)
-            .where(BoxOfficeTrendPoint.region == region)
-            .order_by(BoxOfficeTrendPoint.date.asc())
+            select(period.label("period"), func.sum(BoxOfficeRollup.gross_usd))
+            .where(
+                BoxOfficeRollup.region == region,
+                BoxOfficeRollup.grain == DAY,
+                BoxOfficeRollup.dimension == TOTAL,
+                day.between(start, end),
+            )
+            .group_by(period)
+            .order_by(period)
         )
-        rows = res.scalars().all()
-        return [{"date": r.date.strftime("%b %d"), "gross": float(r.gross_millions_usd)} for r in rows]
+        out["points"] = [{"date": p.isoformat(), "grossUsd": float(g)} for p, g in res.tuples()]
+        return out
+
+    async def trends(self, region: str = "global", weeks: int = 12) -> List[dict[str, Any]]:
+        """Weekly gross (in millions) for the last `weeks` weeks."""
+        end = date.today()
+        series = await self.series(region, end - timedelta(weeks=weeks) + timedelta(days=1), end, bucket="week")
+        return [
+            {"date": date.fromisoformat(p["date"]).strftime("%b %d"), "gross": round(p["grossUsd"] / 1_000_000, 1)}
+            for p in series["points"]
+        ]
+
+    def _year_of_interest(self, region: str, year: int | None):
+        """`year`, or the latest year with any gross in `region`, as an SQL expression."""
+        if year is not None:
+            return literal(year)
+        latest = (
+            select(func.max(BoxOfficeRollup.period_start))
+            .where(BoxOfficeRollup.region == region, BoxOfficeRollup.grain == YEAR, BoxOfficeRollup.dimension == TOTAL)
+            .scalar_subquery()
+        )
+        return func.extract("year", latest)
 
     async def ytd(self, region: str = "global", year: int | None = None) -> dict[str, Any] | None:
         if not self.session:
             return None
-        stmt = select(BoxOfficeYTD).where(BoxOfficeYTD.region == region)
-        if year is not None:
-            stmt = stmt.where(BoxOfficeYTD.year == year)
-        else:
-            # pick latest year
-            stmt = stmt.order_by(BoxOfficeYTD.year.desc())
-        res = await self.session.execute(stmt)
-        row = res.scalars().first()
-        if not row:
-            return None
-        # top movies
-        tm_res = await self.session.execute(
-            select(BoxOfficeYTDTopMovie).where(BoxOfficeYTDTopMovie.ytd_id == row.id)
+        target = self._year_of_interest(region, year)
+        ranked = (
+            select(
+                BoxOfficeRollup.period_start,
+                BoxOfficeRollup.dimension,
+                BoxOfficeRollup.key,
+                BoxOfficeRollup.gross_usd,
+                func.row_number()
+                .over(
+                    partition_by=(BoxOfficeRollup.period_start, BoxOfficeRollup.dimension),
+                    order_by=BoxOfficeRollup.gross_usd.desc(),
+                )
+                .label("rn"),
+            )
+            .where(
+                BoxOfficeRollup.region == region,
+                BoxOfficeRollup.grain == YEAR,
+                BoxOfficeRollup.dimension.in_((TOTAL, MOVIE)),
+                func.extract("year", BoxOfficeRollup.period_start).between(target - 1, target),
+            )
+            .subquery()
+        )
+        res = await self.session.execute(
+            select(ranked.c.period_start, ranked.c.dimension, ranked.c.gross_usd, Movie.title)
+            .outerjoin(Movie, and_(ranked.c.dimension == MOVIE, Movie.external_id == ranked.c.key))
+            .where(ranked.c.rn <= YTD_TOP_MOVIES)
+            .order_by(ranked.c.period_start.desc(), ranked.c.gross_usd.desc())
         )
-        top = tm_res.scalars().all()
+        totals: dict[int, float] = {}
+        top: dict[int, list[dict[str, Any]]] = defaultdict(list)
+        for period_start, dimension, gross, title in res.tuples():
+            if dimension == TOTAL:
+                totals[period_start.year] = gross
+            else:
+                top[period_start.year].append({"title": title or "", "gross": _fmt_money(gross)})
+        if not totals:
+            return None
+        current = year if year is not None else max(totals)
+        if current not in totals:
+            return None
+        previous = totals.get(current - 1)
+        percent, positive = _change(totals[current], previous)
         return {
             "current": {
-                "year": row.year,
-                "total": _fmt_money(row.total_gross_usd),
-                "change": _fmt_change(row.change_percent, row.is_positive),
-                "isPositive": bool(row.is_positive),
+                "year": current,
+                "total": _fmt_money(totals[current]),
+                "change": _fmt_change(percent, positive),
+                "isPositive": positive,
             },
-            "previous": {"year": row.previous_year, "total": _fmt_money(row.previous_total_gross_usd)},
-            "topMovies": [{"title": t.title, "gross": _fmt_money(t.gross_usd)} for t in top],
+            "previous": {"year": current - 1, "total": _fmt_money(previous or 0)},
+            "topMovies": top[current],
         }
 
-    async def performance(self, region: str = "global") -> dict[str, Any]:
+    async def performance(self, region: str = "global", year: int | None = None) -> dict[str, Any]:
+        """Genre share, studio gross and monthly gross for `year` (default: the latest)."""
+        out: dict[str, Any] = {"genreData": [], "studioData": [], "monthlyData": []}
         if not self.session:
-            return {"genreData": [], "studioData": [], "monthlyData": []}
-        # genre
-        g_res = await self.session.execute(
-            select(BoxOfficePerformanceGenre).where(BoxOfficePerformanceGenre.region == region)
-        )
-        genres = g_res.scalars().all()
-        # studio
-        s_res = await self.session.execute(
-            select(BoxOfficePerformanceStudio).where(BoxOfficePerformanceStudio.region == region)
-        )
-        studios = s_res.scalars().all()
-        # monthly
-        m_res = await self.session.execute(
-            select(BoxOfficePerformanceMonthly).where(BoxOfficePerformanceMonthly.region == region)
+            return out
+        target = self._year_of_interest(region, year)
+        res = await self.session.execute(
+            select(BoxOfficeRollup.dimension, BoxOfficeRollup.period_start, BoxOfficeRollup.key, BoxOfficeRollup.gross_usd)
+            .where(
+                BoxOfficeRollup.region == region,
+                or_(
+                    and_(BoxOfficeRollup.grain == YEAR, BoxOfficeRollup.dimension.in_((GENRE, STUDIO))),
+                    and_(BoxOfficeRollup.grain == MONTH, BoxOfficeRollup.dimension == TOTAL),
+                ),
+                func.extract("year", BoxOfficeRollup.period_start) == target,
+            )
+            .order_by(BoxOfficeRollup.period_start, BoxOfficeRollup.gross_usd.desc())
         )
-        monthly = m_res.scalars().all()
-        return {
-            "genreData": [{"name": g.name, "value": g.percent, "color": g.color} for g in genres],
-            "studioData": [{"studio": s.studio, "gross": float(s.gross_millions_usd)} for s in studios],
-            "monthlyData": [{"month": m.month, "gross": float(m.gross_millions_usd)} for m in monthly],
-        }
+        genres: list[tuple[str, float]] = []
+        for dimension, period_start, key, gross in res.tuples():
+            if dimension == GENRE:
+                genres.append((key, gross))
+            elif dimension == STUDIO:
+                out["studioData"].append({"studio": key, "gross": round(gross / 1_000_000, 1)})
+            else:
+                out["monthlyData"].append({"month": period_start.strftime("%b"), "gross": round(gross / 1_000_000, 1)})
+        genre_total = sum(g for _, g in genres)
+        others = iter(_OTHER_COLORS * (len(genres) // len(_OTHER_COLORS) + 1))
+        out["genreData"] = [
+            {
+                "name": name,
+                "value": round(gross / genre_total * 100) if genre_total else 0,
+                "color": GENRE_COLORS.get(name) or next(others),
+            }
+            for name, gross in genres
+        ]
+        return out
 
     async def records(self, region: str = "global") -> List[dict[str, Any]]:
         if not self.session:
@@ -144,4 +516,3 @@ class BoxOfficeRepository:
             }
             for r in rows
         ]
-
@@ -1,12 +1,97 @@
 from __future__ import annotations
 
-from typing import Any, List
-from sqlalchemy import select, desc, delete, insert, and_
+from typing import Any, List, Optional
+from sqlalchemy import select, desc, delete, insert, and_, func, literal, literal_column, or_, update
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import noload, selectinload
 from datetime import datetime
 import uuid
 
-from ..models import Collection, User, Movie, collection_movies, collection_likes
+from ..models import Collection, Genre, User, Movie, collection_movies, collection_likes, movie_genres
+from .fieldsets import FieldSet
+from .user_counters import UserCountersRepository
+
+PREVIEW_POSTERS = 4
+MOVIES_PAGE_SIZE = 50
+
+cm = collection_movies.c
+
+# Field group -> (loader options when requested, when not requested).
+_LIST_LOADERS = {
+    "creator": ((selectinload(Collection.creator).noload("*"),), (noload(Collection.creator),)),
+}
+
+_LIST_COLUMNS = {
+    "title": [Collection.title],
+    "description": [Collection.description],
+    "movieCount": [Collection.movie_count],
+    "followers": [Collection.followers],
+    "posterImages": [Collection.preview_posters],
+    "isPublic": [Collection.is_public],
+    "createdAt": [Collection.created_at],
+    "updatedAt": [Collection.updated_at],
+    "tags": [Collection.tags],
+}
+
+_LIST_FIELDS = {
+    "id": lambda c: c.external_id,
+    "title": lambda c: c.title,
+    "description": lambda c: c.description,
+    "creator": lambda c: c.creator.name,
+    "movieCount": lambda c: c.movie_count,
+    "followers": lambda c: c.followers,
+    "posterImages": lambda c: c.preview_posters or [],
+    "isPublic": lambda c: c.is_public,
+    "createdAt": lambda c: c.created_at.isoformat(),
+    "updatedAt": lambda c: c.updated_at.isoformat() if c.updated_at else None,
+    "tags": lambda c: c.tags.split(",") if c.tags else [],
+}
+
+
+def _list_options(fields: FieldSet) -> list:
+    options = fields.loader_options(_LIST_LOADERS)
+    options += fields.load_only([Collection.id, Collection.external_id], _LIST_COLUMNS)
+    return options
+
+
+def movie_page_cursor(position: int, movie_id: int) -> str:
+    return f"{position}.{movie_id}"
+
+
+def parse_movie_page_cursor(cursor: str) -> tuple[int, int]:
+    """(position, movie id) of a `nextCursor`; ValueError if it is not one."""
+    position, _, movie_id = cursor.partition(".")
+    return int(position), int(movie_id)
+
+
+def refresh_previews_statement(movie_id: int):
+    """
+    Recompute the stored preview posters of every collection holding
+    `movie_id`, for when that movie's poster changed.
+    """
+    first = (
+        select(Movie.poster_url, cm.position, cm.movie_id)
+        .join(collection_movies, cm.movie_id == Movie.id)
+        .where(cm.collection_id == Collection.id, Movie.poster_url.isnot(None))
+        .order_by(cm.position, cm.movie_id)
+        .limit(PREVIEW_POSTERS)
+        .correlate(Collection)
+        .subquery()
+    )
+    posters = select(
+        func.jsonb_agg(aggregate_order_by(first.c.poster_url, first.c.position, first.c.movie_id))
+    ).scalar_subquery()
+    return (
+        update(Collection)
+        .where(Collection.id.in_(select(cm.collection_id).where(cm.movie_id == movie_id)))
+        # A poster swap is not an edit of the collection, so updated_at stays put
+        .values(
+            preview_posters=func.coalesce(posters, literal_column("'[]'::jsonb")),
+            updated_at=Collection.updated_at,
+        )
+        .execution_options(synchronize_session=False)
+    )
 
 
 class CollectionRepository:
@@ -20,10 +105,12 @@ class CollectionRepository:
         limit: int = 20,
         user_id: str | None = None,
         is_public: bool | None = None,
+        fields: FieldSet | None = None,
     ) -> List[dict[str, Any]]:
         if not self.session:
             return []
-        q = select(Collection)
+        fields = fields or FieldSet()
+        q = select(Collection).options(*_list_options(fields))
         if user_id:
             q = q.join(Collection.creator).where(User.external_id == user_id)
         if is_public is not None:
@@ -31,24 +118,10 @@ class CollectionRepository:
         q = q.order_by(desc(Collection.created_at)).limit(limit).offset((page - 1) * limit)
         res = await self.session.execute(q)
         collections = res.scalars().all()
-        return [
-            {
-                "id": c.external_id,
-                "title": c.title,
-                "description": c.description,
-                "creator": c.creator.name,
-                "movieCount": len(c.movies),
-                "followers": c.followers,
-                "posterImages": [m.poster_url for m in c.movies[:4] if m.poster_url],
-                "isPublic": c.is_public,
-                "createdAt": c.created_at.isoformat(),
-                "updatedAt": c.updated_at.isoformat() if c.updated_at else None,
-                "tags": c.tags.split(",") if c.tags else [],
-            }
-            for c in collections
-        ]
-
-    async def get(self, external_id: str) -> dict[str, Any] | None:
+        return [fields.build(c, _LIST_FIELDS) for c in collections]
+
+    async def get(self, external_id: str, *, limit: int = MOVIES_PAGE_SIZE) -> dict[str, Any] | None:
+        """Collection details with the first `limit` movies; `movies()` pages through the rest."""
         if not self.session:
             return None
         q = select(Collection).where(Collection.external_id == external_id)
@@ -56,31 +129,108 @@ class CollectionRepository:
         c = res.scalar_one_or_none()
         if not c:
             return None
+        page = await self._movie_page(c.id, None, limit)
         return {
             "id": c.external_id,
             "title": c.title,
             "description": c.description,
             "creator": c.creator.name,
-            "movieCount": len(c.movies),
+            "movieCount": c.movie_count,
             "followers": c.followers,
-            "posterImages": [m.poster_url for m in c.movies[:4] if m.poster_url],
+            "posterImages": c.preview_posters or [],
             "isPublic": c.is_public,
             "createdAt": c.created_at.isoformat(),
             "updatedAt": c.updated_at.isoformat() if c.updated_at else None,
             "tags": c.tags.split(",") if c.tags else [],
-            "movies": [
+            "movies": page["items"],
+            "nextCursor": page["nextCursor"],
+        }
+
+    async def movies(
+        self, external_id: str, *, cursor: Optional[str] = None, limit: int = MOVIES_PAGE_SIZE
+    ) -> dict[str, Any] | None:
+        """
+        One page of a collection's movies in collection order. `cursor` is the
+        `nextCursor` of the previous page; it stays valid if that page's last
+        movie is removed in the meantime. Raises ValueError for a malformed
+        cursor.
+        """
+        if not self.session:
+            return None
+        collection_id = (
+            await self.session.execute(select(Collection.id).where(Collection.external_id == external_id))
+        ).scalar_one_or_none()
+        if collection_id is None:
+            return None
+        after = parse_movie_page_cursor(cursor) if cursor else None
+        return await self._movie_page(collection_id, after, limit)
+
+    async def _movie_page(
+        self, collection_id: int, after: Optional[tuple[int, int]], limit: int
+    ) -> dict[str, Any]:
+        q = (
+            select(
+                Movie.id,
+                Movie.external_id,
+                Movie.title,
+                Movie.year,
+                Movie.poster_url,
+                Movie.siddu_score,
+                cm.position,
+            )
+            .join(collection_movies, cm.movie_id == Movie.id)
+            .where(cm.collection_id == collection_id)
+        )
+        if after:
+            after_position, after_movie = after
+            q = q.where(
+                or_(
+                    cm.position > after_position,
+                    and_(cm.position == after_position, cm.movie_id > after_movie),
+                )
+            )
+        rows = (await self.session.execute(q.order_by(cm.position, cm.movie_id).limit(limit + 1))).all()
+        page = rows[:limit]
+
+        genres: dict[int, list[str]] = {r.id: [] for r in page}
+        if page:
+            res = await self.session.execute(
+                select(movie_genres.c.movie_id, Genre.name)
+                .join(Genre, Genre.id == movie_genres.c.genre_id)
+                .where(movie_genres.c.movie_id.in_(genres))
+            )
+            for movie_id, name in res.tuples():
+                genres[movie_id].append(name)
+        return {
+            "items": [
                 {
-                    "id": m.external_id,
-                    "title": m.title,
-                    "year": int(m.year) if m.year else None,
-                    "poster": m.poster_url,
-                    "rating": m.siddu_score,
-                    "genres": [g.name for g in m.genres],
+                    "id": r.external_id,
+                    "title": r.title,
+                    "year": int(r.year) if r.year else None,
+                    "poster": r.poster_url,
+                    "rating": r.siddu_score,
+                    "genres": genres[r.id],
                 }
-                for m in c.movies
+                for r in page
             ],
+            "nextCursor": movie_page_cursor(page[-1].position, page[-1].id) if len(rows) > limit else None,
         }
 
+    async def refresh_previews(self, movie_id: int) -> None:
+        """Recompute stored preview posters after `movie_id`'s poster changed. The caller commits."""
+        await self.session.execute(refresh_previews_statement(movie_id))
+
+    async def _preview_posters(self, collection_id: int) -> list[str]:
+        """Poster urls of the first movies in collection order (served by the position index)."""
+        res = await self.session.execute(
+            select(Movie.poster_url)
+            .join(collection_movies, cm.movie_id == Movie.id)
+            .where(cm.collection_id == collection_id, Movie.poster_url.isnot(None))
+            .order_by(cm.position, cm.movie_id)
+            .limit(PREVIEW_POSTERS)
+        )
+        return list(res.scalars().all())
+
     async def create(
         self,
         user_id: int,
@@ -99,10 +249,13 @@ class CollectionRepository:
             description=description,
             is_public=is_public,
             followers=0,
+            movie_count=0,
+            preview_posters=[],
             created_at=datetime.utcnow(),
         )
         self.session.add(collection)
         await self.session.flush()
+        await UserCountersRepository(self.session).bump(user_id, collections=1)
         await self.session.refresh(collection, ["creator"])
 
         return {
@@ -151,16 +304,16 @@ class CollectionRepository:
 
         collection.updated_at = datetime.utcnow()
         await self.session.flush()
-        await self.session.refresh(collection, ["creator", "movies"])
+        await self.session.refresh(collection, ["creator"])
 
         return {
             "id": collection.external_id,
             "title": collection.title,
             "description": collection.description,
             "creator": collection.creator.name,
-            "movieCount": len(collection.movies),
+            "movieCount": collection.movie_count,
             "followers": collection.followers,
-            "posterImages": [m.poster_url for m in collection.movies[:4] if m.poster_url],
+            "posterImages": collection.preview_posters or [],
             "isPublic": collection.is_public,
             "createdAt": collection.created_at.isoformat(),
             "updatedAt": collection.updated_at.isoformat() if collection.updated_at else None,
@@ -173,9 +326,10 @@ class CollectionRepository:
         if not self.session:
             return False
 
-        # Get collection
+        # Get collection, locked so concurrent adds and removes update its count,
+        # previews and member positions one after the other
         coll_res = await self.session.execute(
-            select(Collection).where(Collection.external_id == collection_id)
+            select(Collection).where(Collection.external_id == collection_id).with_for_update()
         )
         collection = coll_res.scalar_one_or_none()
         if not collection:
@@ -187,9 +341,9 @@ class CollectionRepository:
 
         # Get movie
         movie_res = await self.session.execute(
-            select(Movie).where(Movie.external_id == movie_id)
+            select(Movie.id, Movie.poster_url).where(Movie.external_id == movie_id)
         )
-        movie = movie_res.scalar_one_or_none()
+        movie = movie_res.one_or_none()
         if not movie:
             raise ValueError(f"Movie {movie_id} not found")
 
@@ -203,13 +357,20 @@ class CollectionRepository:
         if existing.first():
             return True  # Already exists, return success
 
-        # Add to collection
+        # Append to the end of the collection
         await self.session.execute(
-            insert(collection_movies).values(
-                collection_id=collection.id,
-                movie_id=movie.id,
+            insert(collection_movies).from_select(
+                ["collection_id", "movie_id", "position"],
+                select(
+                    literal(collection.id),
+                    literal(movie.id),
+                    func.coalesce(func.max(cm.position) + 1, 0),
+                ).where(cm.collection_id == collection.id),
             )
         )
+        collection.movie_count = (collection.movie_count or 0) + 1
+        if movie.poster_url and len(collection.preview_posters or []) < PREVIEW_POSTERS:
+            collection.preview_posters = [*(collection.preview_posters or []), movie.poster_url]
         collection.updated_at = datetime.utcnow()
         await self.session.flush()
         return True
@@ -221,9 +382,10 @@ class CollectionRepository:
         if not self.session:
             return False
 
-        # Get collection
+        # Get collection, locked so concurrent adds and removes update its count,
+        # previews and member positions one after the other
         coll_res = await self.session.execute(
-            select(Collection).where(Collection.external_id == collection_id)
+            select(Collection).where(Collection.external_id == collection_id).with_for_update()
         )
         collection = coll_res.scalar_one_or_none()
         if not collection:
@@ -235,19 +397,23 @@ class CollectionRepository:
 
         # Get movie
         movie_res = await self.session.execute(
-            select(Movie).where(Movie.external_id == movie_id)
+            select(Movie.id, Movie.poster_url).where(Movie.external_id == movie_id)
         )
-        movie = movie_res.scalar_one_or_none()
+        movie = movie_res.one_or_none()
         if not movie:
             return False
 
         # Delete from collection
-        await self.session.execute(
+        removed = await self.session.execute(
             delete(collection_movies).where(
                 collection_movies.c.collection_id == collection.id,
                 collection_movies.c.movie_id == movie.id,
             )
         )
+        if removed.rowcount:
+            collection.movie_count = max((collection.movie_count or 0) - 1, 0)
+            if movie.poster_url and movie.poster_url in (collection.preview_posters or []):
+                collection.preview_posters = await self._preview_posters(collection.id)
         collection.updated_at = datetime.utcnow()
         await self.session.flush()
         return True
@@ -279,6 +445,7 @@ class CollectionRepository:
         # Delete collection
         await self.session.delete(collection)
         await self.session.flush()
+        await UserCountersRepository(self.session).bump(user_id, collections=-1)
         return True
 
     async def toggle_like(self, collection_id: str, user_id: int) -> bool | None:
@@ -359,30 +526,34 @@ class CollectionRepository:
             is_public=False,  # Imported collections are private by default
             followers=0,
             tags=source_collection.tags,
+            movie_count=source_collection.movie_count,
+            preview_posters=list(source_collection.preview_posters or []),
             created_at=datetime.utcnow(),
         )
         self.session.add(new_collection)
         await self.session.flush()
+        await UserCountersRepository(self.session).bump(user_id, collections=1)
 
-        # Copy all movies from the source collection
-        for movie in source_collection.movies:
-            await self.session.execute(
-                insert(collection_movies).values(
-                    collection_id=new_collection.id,
-                    movie_id=movie.id,
-                )
+        # Copy all movies from the source collection in one statement, keeping their order
+        await self.session.execute(
+            insert(collection_movies).from_select(
+                ["collection_id", "movie_id", "position"],
+                select(literal(new_collection.id), cm.movie_id, cm.position).where(
+                    cm.collection_id == source_collection.id
+                ),
             )
+        )
         await self.session.flush()
-        await self.session.refresh(new_collection, ["creator", "movies"])
+        await self.session.refresh(new_collection, ["creator"])
 
         return {
             "id": new_collection.external_id,
             "title": new_collection.title,
             "description": new_collection.description,
             "creator": new_collection.creator.name,
-            "movieCount": len(new_collection.movies),
+            "movieCount": new_collection.movie_count,
             "followers": new_collection.followers,
-            "posterImages": [m.poster_url for m in new_collection.movies[:4] if m.poster_url],
+            "posterImages": new_collection.preview_posters or [],
             "isPublic": new_collection.is_public,
             "createdAt": new_collection.created_at.isoformat(),
         }
@@ -8,6 +8,7 @@ import uuid
 import re
 
 from ..models import CriticReview, CriticReviewComment, CriticReviewLike, CriticProfile, Movie, User
+from .rating_stats import RatingStatsRepository
 
 
 class CriticReviewRepository:
@@ -86,6 +87,7 @@ class CriticReviewRepository:
                 .where(CriticProfile.id == critic_id)
                 .values(total_reviews=CriticProfile.total_reviews + 1)
             )
+            await RatingStatsRepository(self.db).apply_critic_review(movie_id, new=numeric_rating)
         
         await self.db.commit()
         await self.db.refresh(review)
@@ -124,12 +126,24 @@ class CriticReviewRepository:
 
     async def update_review(self, review_id: int, **kwargs) -> Optional[CriticReview]:
         """Update a review"""
+        before = (await self.db.execute(
+            select(CriticReview.movie_id, CriticReview.is_draft, CriticReview.numeric_rating)
+            .where(CriticReview.id == review_id)
+        )).first()
         kwargs['updated_at'] = datetime.utcnow()
         await self.db.execute(
             update(CriticReview)
             .where(CriticReview.id == review_id)
             .values(**kwargs)
         )
+        if before is not None:
+            is_draft = kwargs.get("is_draft", before.is_draft)
+            rating = kwargs.get("numeric_rating", before.numeric_rating)
+            await RatingStatsRepository(self.db).apply_critic_review(
+                before.movie_id,
+                old=None if before.is_draft else before.numeric_rating,
+                new=None if is_draft else rating,
+            )
         await self.db.commit()
         return await self.get_review_by_id(review_id)
 
@@ -147,6 +161,7 @@ class CriticReviewRepository:
                 .where(CriticProfile.id == review.critic_id)
                 .values(total_reviews=CriticProfile.total_reviews - 1)
             )
+            await RatingStatsRepository(self.db).apply_critic_review(review.movie_id, old=review.numeric_rating)
         
         result = await self.db.execute(
             delete(CriticReview).where(CriticReview.id == review_id)
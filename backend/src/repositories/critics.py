@@ -1,6 +1,7 @@
 """Critic Hub - Critics Repository"""
 from typing import List, Optional
 from sqlalchemy import select, update, delete, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
 import uuid
@@ -163,24 +164,26 @@ class CriticRepository:
         await self.db.commit()
         return result.rowcount > 0
 
-    async def follow_critic(self, critic_id: int, user_id: int) -> CriticFollower:
-        """Follow a critic"""
-        follower = CriticFollower(
-            critic_id=critic_id,
-            user_id=user_id
+    async def follow_critic(self, critic_id: int, user_id: int) -> bool:
+        """Follow a critic. Returns False if the user already follows them."""
+        result = await self.db.execute(
+            pg_insert(CriticFollower)
+            .values(critic_id=critic_id, user_id=user_id, followed_at=datetime.utcnow())
+            .on_conflict_do_nothing(constraint="uq_critic_follower_critic_user")
+            .returning(CriticFollower.id)
         )
-        self.db.add(follower)
-        
+        if result.scalar_one_or_none() is None:
+            return False
+
         # Increment follower count
         await self.db.execute(
             update(CriticProfile)
             .where(CriticProfile.id == critic_id)
             .values(follower_count=CriticProfile.follower_count + 1)
         )
-        
+
         await self.db.commit()
-        await self.db.refresh(follower)
-        return follower
+        return True
 
     async def unfollow_critic(self, critic_id: int, user_id: int) -> bool:
         """Unfollow a critic"""
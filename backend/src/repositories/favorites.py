@@ -7,6 +7,7 @@ from datetime import datetime
 import uuid
 
 from ..models import Favorite, User, Movie, Person
+from .user_counters import UserCountersRepository
 
 
 class FavoriteRepository:
@@ -140,6 +141,8 @@ class FavoriteRepository:
         )
         self.session.add(favorite)
         await self.session.flush()
+        if fav_type == "movie":
+            await UserCountersRepository(self.session).bump(user_id, favorites=1)
 
         return {
             "id": favorite.external_id,
@@ -165,5 +168,7 @@ class FavoriteRepository:
 
         await self.session.delete(favorite)
         await self.session.flush()
+        if favorite.type == "movie":
+            await UserCountersRepository(self.session).bump(user_id, favorites=-1)
         return True
 
@@ -13,6 +13,7 @@ from ..models import (
     FestivalWinnerCategory,
     FestivalWinner,
 )
+from .page_snapshots import FESTIVAL_PROGRAM, FESTIVAL_WINNERS, PageSnapshotRepository, festival_key
 
 
 class FestivalsRepository:
@@ -79,69 +80,105 @@ class FestivalsRepository:
             "description": f.description,
         }
 
+    async def _snapshot(self, kind: str, festival_id: str, year: int, build) -> Any:
+        """Stored payload for a festival edition page; built and stored on a miss. The caller commits."""
+        snapshots = PageSnapshotRepository(self.session)
+        key = festival_key(festival_id, year)
+        payload = await snapshots.get(kind, key)
+        if payload is not None:
+            return payload
+        payload = await build(festival_id, year)
+        if payload is not None:
+            await snapshots.put(kind, key, festival_id, payload)
+        return payload
+
     async def get_program(self, festival_id: str, year: int) -> dict[str, List[dict[str, Any]]] | None:
-        ed = (
+        return await self._snapshot(FESTIVAL_PROGRAM, festival_id, year, self.build_program)
+
+    async def get_winners(self, festival_id: str, year: int) -> List[dict[str, Any]] | None:
+        return await self._snapshot(FESTIVAL_WINNERS, festival_id, year, self.build_winners)
+
+    async def _edition_id(self, festival_id: str, year: int) -> int | None:
+        return (
             await self.session.execute(
-                _select(FestivalEdition)
-                .join(Festival)
+                _select(FestivalEdition.id)
+                .join(Festival, Festival.id == FestivalEdition.festival_id)
                 .where(Festival.external_id == festival_id, FestivalEdition.year == year)
-                .options(
-                    selectinload(FestivalEdition.program_sections).selectinload(FestivalProgramSection.entries)
-                )
+                .limit(1)
             )
-        ).scalars().first()
-        if not ed:
+        ).scalar_one_or_none()
+
+    async def build_program(self, festival_id: str, year: int) -> dict[str, List[dict[str, Any]]] | None:
+        edition_id = await self._edition_id(festival_id, year)
+        if edition_id is None:
             return None
+        rows = await self.session.execute(
+            _select(
+                FestivalProgramSection.name,
+                FestivalProgramEntry.id,
+                FestivalProgramEntry.title,
+                FestivalProgramEntry.director,
+                FestivalProgramEntry.country,
+                FestivalProgramEntry.premiere,
+                FestivalProgramEntry.image_url,
+            )
+            .outerjoin(FestivalProgramEntry, FestivalProgramEntry.section_id == FestivalProgramSection.id)
+            .where(FestivalProgramSection.edition_id == edition_id)
+            .order_by(FestivalProgramSection.id, FestivalProgramEntry.id)
+        )
         out: Dict[str, List[Dict[str, Any]]] = {"competition": [], "outOfCompetition": [], "specialScreenings": []}
-        for sec in ed.program_sections:
-            key = sec.name
-            if key not in out:
-                out[key] = []
-            for e in sec.entries:
-                out[key].append(
+        for section, entry_id, title, director, country, premiere, image_url in rows.all():
+            entries = out.setdefault(section, [])
+            if entry_id is not None:
+                entries.append(
                     {
-                        "title": e.title,
-                        "director": e.director,
-                        "country": e.country,
-                        "premiere": e.premiere,
-                        "image": e.image_url,
+                        "title": title,
+                        "director": director,
+                        "country": country,
+                        "premiere": premiere,
+                        "image": image_url,
                     }
                 )
         return out
 
-    async def get_winners(self, festival_id: str, year: int) -> List[dict[str, Any]] | None:
-        ed = (
-            await self.session.execute(
-                _select(FestivalEdition)
-                .join(Festival)
-                .where(Festival.external_id == festival_id, FestivalEdition.year == year)
-                .options(
-                    selectinload(FestivalEdition.winner_categories).selectinload(FestivalWinnerCategory.winners)
-                )
-            )
-        ).scalars().first()
-        if not ed:
+    async def build_winners(self, festival_id: str, year: int) -> List[dict[str, Any]] | None:
+        edition_id = await self._edition_id(festival_id, year)
+        if edition_id is None:
             return None
-        results: List[dict[str, Any]] = []
-        for cat in ed.winner_categories:
-            results.append(
-                {
-                    "id": cat.external_id,
-                    "categoryName": cat.name,
-                    "winners": [
-                        {
-                            "id": str(w.id),
-                            "movieId": None,
-                            "movieTitle": w.movie_title,
-                            "moviePoster": w.movie_poster_url,
-                            "recipient": w.recipient,
-                            "director": w.director,
-                            "citation": w.citation,
-                            "rating": w.rating,
-                        }
-                        for w in cat.winners
-                    ],
-                }
+        rows = await self.session.execute(
+            _select(
+                FestivalWinnerCategory.external_id,
+                FestivalWinnerCategory.name,
+                FestivalWinner.id,
+                FestivalWinner.movie_title,
+                FestivalWinner.movie_poster_url,
+                FestivalWinner.recipient,
+                FestivalWinner.director,
+                FestivalWinner.citation,
+                FestivalWinner.rating,
             )
+            .outerjoin(FestivalWinner, FestivalWinner.category_id == FestivalWinnerCategory.id)
+            .where(FestivalWinnerCategory.edition_id == edition_id)
+            .order_by(FestivalWinnerCategory.id, FestivalWinner.id)
+        )
+        results: List[dict[str, Any]] = []
+        by_ext: Dict[str, Dict[str, Any]] = {}
+        for cat_ext, cat_name, winner_id, movie_title, poster, recipient, director, citation, rating in rows.all():
+            cat = by_ext.get(cat_ext)
+            if cat is None:
+                cat = by_ext[cat_ext] = {"id": cat_ext, "categoryName": cat_name, "winners": []}
+                results.append(cat)
+            if winner_id is not None:
+                cat["winners"].append(
+                    {
+                        "id": str(winner_id),
+                        "movieId": None,
+                        "movieTitle": movie_title,
+                        "moviePoster": poster,
+                        "recipient": recipient,
+                        "director": director,
+                        "citation": citation,
+                        "rating": rating,
+                    }
+                )
         return results
-
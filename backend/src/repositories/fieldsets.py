@@ -0,0 +1,108 @@
+"""
+Sparse fieldsets for list and detail endpoints.
+
+Endpoints accept `fields=id,title,movie.title,movie.posterUrl`. A `FieldSet`
+answers which DTO keys were asked for; repositories use it to
+
+- build only the requested keys (`build` with per-key getters),
+- pick loader options per field group (`loader_options`), and
+- restrict the columns selected (`load_only`).
+
+An empty selection means "everything", so existing clients are unaffected.
+`id` is always included at every nesting level.
+"""
+from __future__ import annotations
+
+from typing import Any, Callable, Iterable, Mapping, Sequence
+
+from sqlalchemy.orm import load_only
+
+
+class Nested:
+    """Getter for a nested DTO object: `source` picks the child, `getters` build it."""
+
+    def __init__(self, source: Callable[[Any], Any], getters: Mapping[str, Any]) -> None:
+        self.source = source
+        self.getters = getters
+
+
+class FieldSet:
+    def __init__(self, fields: Iterable[str] | None = None) -> None:
+        self.fields = frozenset(f.strip() for f in (fields or ()) if f and f.strip())
+
+    @classmethod
+    def parse(cls, raw: str | None) -> "FieldSet":
+        return cls(raw.split(",") if raw else None)
+
+    @property
+    def all(self) -> bool:
+        return not self.fields
+
+    def wants(self, name: str) -> bool:
+        """True if `name` (dotted for nested keys) is requested in full or in part."""
+        if self.all or name == "id" or name in self.fields:
+            return True
+        parts = name.split(".")
+        if parts[-1] == "id":
+            return self.wants(".".join(parts[:-1]))
+        for i in range(1, len(parts)):
+            if ".".join(parts[:i]) in self.fields:
+                return True
+        prefix = name + "."
+        return any(f.startswith(prefix) for f in self.fields)
+
+    def wants_any(self, *names: str) -> bool:
+        return any(self.wants(n) for n in names)
+
+    def sub(self, name: str) -> "FieldSet":
+        """Selection inside nested object `name`."""
+        if self.all or name in self.fields:
+            return FieldSet()
+        prefix = name + "."
+        return FieldSet(f[len(prefix):] for f in self.fields if f.startswith(prefix))
+
+    def build(self, obj: Any, getters: Mapping[str, Any]) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        for key, getter in getters.items():
+            if not self.wants(key):
+                continue
+            if isinstance(getter, Nested):
+                child = getter.source(obj)
+                out[key] = self.sub(key).build(child, getter.getters) if child is not None else None
+            else:
+                out[key] = getter(obj)
+        return out
+
+    def prune(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Prune an already-built DTO (e.g. one served from a cache)."""
+        if self.all:
+            return data
+        out: dict[str, Any] = {}
+        for key, value in data.items():
+            if not self.wants(key):
+                continue
+            if isinstance(value, dict) and key not in self.fields:
+                out[key] = self.sub(key).prune(value)
+            else:
+                out[key] = value
+        return out
+
+    def loader_options(self, loaders: Mapping[str, tuple[Sequence[Any], Sequence[Any]]]) -> list[Any]:
+        """
+        `loaders` maps a field group to (options when wanted, options when not).
+        Groups may be dotted, e.g. "movie.genres".
+        """
+        options: list[Any] = []
+        for group, (wanted, absent) in loaders.items():
+            options.extend(wanted if self.wants(group) else absent)
+        return options
+
+    def load_only(self, always: Sequence[Any], columns: Mapping[str, Sequence[Any]]) -> list[Any]:
+        """`load_only` option for the requested column groups, or nothing for a full selection."""
+        if self.all:
+            return []
+        cols = list(always)
+        for group, group_cols in columns.items():
+            if self.wants(group):
+                cols.extend(c for c in group_cols if not any(c is x for x in cols))
+        return [load_only(*cols)]
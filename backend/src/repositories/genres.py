@@ -1,10 +1,113 @@
 from __future__ import annotations
 
-from typing import Any, List
-from sqlalchemy import select
+from collections import Counter
+from datetime import datetime
+from typing import Any, Iterable, List, Optional
+from sqlalchemy import and_, func, or_, select, true, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..models import Genre, Movie
+from ..models import Genre, GenreStats, Movie, MovieRatingStats, Person, movie_genres, movie_people
+
+TOP_DIRECTORS = 5
+TOP_ACTORS = 10
+TOP_MOVIES = 3
+RELATED_GENRES = 5
+FACET_VALUES = 20
+
+# GROUPING(year, country, language) -> facet of a row in the facet query
+_FACETS = {0b011: "year", 0b101: "country", 0b110: "language"}
+
+
+def empty_statistics() -> dict[str, Any]:
+    return {
+        "totalMovies": 0,
+        "averageRating": 0,
+        "topDirectors": [],
+        "peakDecade": "",
+        "top3MoviesBySidduScoreInGenre": [],
+        "availableCountries": [],
+        "availableLanguages": [],
+        "popularityTrend": [],
+        "ratingDistribution": [],
+        "subgenreBreakdown": [],
+        "topActorsInGenre": [],
+        "releaseFrequencyByYear": [],
+    }
+
+
+def peak_decade(year_counts: dict[str, int]) -> str:
+    """The decade with the most releases, e.g. "1990s" ('' when no years are known)."""
+    decades: Counter[int] = Counter()
+    for year, count in year_counts.items():
+        if year and year.isdigit():
+            decades[int(year) // 10 * 10] += count
+    if not decades:
+        return ""
+    decade = max(decades, key=lambda d: (decades[d], d))
+    return f"{decade}s"
+
+
+def assemble_genre_stats(
+    genre_ids: Iterable[int],
+    totals: Iterable[tuple],
+    facets: Iterable[tuple],
+    histogram: Iterable[tuple],
+    people: Iterable[tuple],
+    top_movies: Iterable[tuple],
+    related: Iterable[tuple],
+) -> dict[int, dict[str, Any]]:
+    """
+    Fold the rows of the refresh queries into genre_stats rows. Each argument
+    is the row list of the matching query in GenreRepository.refresh_stats.
+    """
+    out: dict[int, dict[str, Any]] = {}
+    facet_values: dict[int, dict[str, dict[str, int]]] = {}
+    for genre_id in genre_ids:
+        out[genre_id] = {"genre_id": genre_id, "total_movies": 0, "average_rating": None,
+                         "statistics": empty_statistics(), "related_genres": []}
+        facet_values[genre_id] = {"year": {}, "country": {}, "language": {}}
+
+    for genre_id, count, average in totals:
+        row = out[genre_id]
+        row["total_movies"] = count
+        row["average_rating"] = round(float(average), 2) if average is not None else None
+        row["statistics"]["totalMovies"] = count
+        row["statistics"]["averageRating"] = row["average_rating"] or 0
+
+    for genre_id, year, country, language, grouping, count in facets:
+        facet = _FACETS[grouping]
+        value = {"year": year, "country": country, "language": language}[facet]
+        if value:
+            facet_values[genre_id][facet][value] = count
+
+    for genre_id, index, count in histogram:
+        out[genre_id]["statistics"]["ratingDistribution"].append({"rating": index - 1, "count": int(count or 0)})
+
+    for genre_id, role, external_id, name, image_url, count in people:
+        key = "topDirectors" if role == "director" else "topActorsInGenre"
+        out[genre_id]["statistics"][key].append(
+            {"id": external_id, "name": name, "image": image_url, "movieCount": count}
+        )
+
+    for genre_id, external_id, title, score, poster_url, year in top_movies:
+        out[genre_id]["statistics"]["top3MoviesBySidduScoreInGenre"].append(
+            {"id": external_id, "title": title, "sidduScore": score, "posterUrl": poster_url, "year": year}
+        )
+
+    for genre_id, slug in related:
+        out[genre_id]["related_genres"].append(slug)
+
+    for genre_id, values in facet_values.items():
+        stats = out[genre_id]["statistics"]
+        years = values["year"]
+        stats["releaseFrequencyByYear"] = [{"year": y, "count": years[y]} for y in sorted(years)]
+        stats["peakDecade"] = peak_decade(years)
+        for facet, key in (("country", "availableCountries"), ("language", "availableLanguages")):
+            ranked = sorted(values[facet].items(), key=lambda kv: (-kv[1], kv[0]))
+            stats[key] = [v for v, _ in ranked[:FACET_VALUES]]
+        stats["ratingDistribution"].sort(key=lambda d: d["rating"])
+    return out
 
 
 class GenreRepository:
@@ -12,7 +115,6 @@ class GenreRepository:
         self.session = session
 
     async def get_details(self, genre_slug: str) -> dict[str, Any] | None:
-        # Minimal placeholder; expand with real aggregates later
         if not self.session:
             # Return stub to enable vertical slice
             return {
@@ -21,57 +123,163 @@ class GenreRepository:
                 "description": "",
                 "backgroundImage": "",
                 "subgenres": [],
-                "statistics": {
-                    "totalMovies": 0,
-                    "averageRating": 0,
-                    "topDirectors": [],
-                    "peakDecade": "",
-                    "top3MoviesBySidduScoreInGenre": [],
-                    "availableCountries": [],
-                    "availableLanguages": [],
-                    "popularityTrend": [],
-                    "ratingDistribution": [],
-                    "subgenreBreakdown": [],
-                    "topActorsInGenre": [],
-                    "releaseFrequencyByYear": [],
-                },
+                "statistics": empty_statistics(),
                 "relatedGenres": [],
                 "curatedCollections": [],
                 "notableFigures": [],
                 "evolutionTimeline": [],
             }
-        # DB-backed (simplified)
-        q = select(Genre).where(Genre.slug == genre_slug)
-        res = await self.session.execute(q)
-        g = res.scalar_one_or_none()
-        if not g:
+        # One read of genres by its unique slug plus the precomputed stats row
+        res = await self.session.execute(
+            select(Genre.id, Genre.slug, Genre.name, GenreStats.statistics, GenreStats.related_genres)
+            .outerjoin(GenreStats, GenreStats.genre_id == Genre.id)
+            .where(Genre.slug == genre_slug)
+        )
+        row = res.one_or_none()
+        if not row:
             return None
+        genre_id, slug, name, statistics, related = row
+        if statistics is None:
+            # Never refreshed yet: build it now; the caller commits
+            built = (await self.refresh_stats([genre_id]))[genre_id]
+            statistics, related = built["statistics"], built["related_genres"]
         return {
-            "id": g.slug,
-            "name": g.name,
+            "id": slug,
+            "name": name,
             "description": "",
             "backgroundImage": "",
             "subgenres": [],
-            "statistics": {
-                "totalMovies": len(g.movies),
-                "averageRating": 0,
-                "topDirectors": [],
-                "peakDecade": "",
-                "top3MoviesBySidduScoreInGenre": [],
-                "availableCountries": [],
-                "availableLanguages": [],
-                "popularityTrend": [],
-                "ratingDistribution": [],
-                "subgenreBreakdown": [],
-                "topActorsInGenre": [],
-                "releaseFrequencyByYear": [],
-            },
-            "relatedGenres": [],
+            "statistics": statistics,
+            "relatedGenres": related,
             "curatedCollections": [],
             "notableFigures": [],
             "evolutionTimeline": [],
         }
 
+    async def refresh_stats(self, genre_ids: Optional[Iterable[int]] = None) -> dict[int, dict[str, Any]]:
+        """
+        Recompute genre_stats for `genre_ids` (all genres if None) with one
+        set-based query per statistic and upsert the rows. The caller commits.
+        """
+        if genre_ids is None:
+            ids = list((await self.session.execute(select(Genre.id))).scalars().all())
+        else:
+            ids = sorted(set(genre_ids))
+        if not ids:
+            return {}
+        mg, mp = movie_genres.c, movie_people.c
+        in_scope = mg.genre_id.in_(ids)
+
+        totals = await self.session.execute(
+            select(mg.genre_id, func.count(mg.movie_id), func.avg(MovieRatingStats.average_rating))
+            .outerjoin(MovieRatingStats, MovieRatingStats.movie_id == mg.movie_id)
+            .where(in_scope)
+            .group_by(mg.genre_id)
+        )
+
+        facet_cols = (Movie.year, Movie.country, Movie.language)
+        facets = await self.session.execute(
+            select(mg.genre_id, *facet_cols, func.grouping(*facet_cols), func.count())
+            .join(Movie, Movie.id == mg.movie_id)
+            .where(in_scope)
+            .group_by(mg.genre_id, func.grouping_sets(*[tuple_(c) for c in facet_cols]))
+        )
+
+        buckets = func.unnest(MovieRatingStats.histogram).table_valued("n", with_ordinality="idx").render_derived()
+        histogram = await self.session.execute(
+            select(mg.genre_id, buckets.c.idx, func.sum(buckets.c.n))
+            .join(MovieRatingStats, MovieRatingStats.movie_id == mg.movie_id)
+            .join(buckets, true())
+            .where(in_scope)
+            .group_by(mg.genre_id, buckets.c.idx)
+        )
+
+        credits = (
+            select(
+                mg.genre_id,
+                mp.role,
+                mp.person_id,
+                func.count().label("n"),
+                func.row_number()
+                .over(partition_by=(mg.genre_id, mp.role), order_by=(func.count().desc(), mp.person_id))
+                .label("rn"),
+            )
+            .join(movie_people, mp.movie_id == mg.movie_id)
+            .where(in_scope, mp.role.in_(("director", "actor")))
+            .group_by(mg.genre_id, mp.role, mp.person_id)
+            .subquery()
+        )
+        people = await self.session.execute(
+            select(credits.c.genre_id, credits.c.role, Person.external_id, Person.name, Person.image_url, credits.c.n)
+            .join(Person, Person.id == credits.c.person_id)
+            .where(
+                or_(
+                    and_(credits.c.role == "director", credits.c.rn <= TOP_DIRECTORS),
+                    and_(credits.c.role == "actor", credits.c.rn <= TOP_ACTORS),
+                )
+            )
+            .order_by(credits.c.genre_id, credits.c.role, credits.c.rn)
+        )
+
+        scored = (
+            select(
+                mg.genre_id,
+                mg.movie_id,
+                func.row_number()
+                .over(partition_by=mg.genre_id, order_by=(Movie.siddu_score.desc(), Movie.id))
+                .label("rn"),
+            )
+            .join(Movie, Movie.id == mg.movie_id)
+            .where(in_scope, Movie.siddu_score.isnot(None))
+            .subquery()
+        )
+        top_movies = await self.session.execute(
+            select(scored.c.genre_id, Movie.external_id, Movie.title, Movie.siddu_score, Movie.poster_url, Movie.year)
+            .join(Movie, Movie.id == scored.c.movie_id)
+            .where(scored.c.rn <= TOP_MOVIES)
+            .order_by(scored.c.genre_id, scored.c.rn)
+        )
+
+        other = movie_genres.alias("other_genres")
+        pairs = (
+            select(
+                mg.genre_id,
+                other.c.genre_id.label("related_id"),
+                func.row_number()
+                .over(partition_by=mg.genre_id, order_by=(func.count().desc(), other.c.genre_id))
+                .label("rn"),
+            )
+            .join(other, and_(other.c.movie_id == mg.movie_id, other.c.genre_id != mg.genre_id))
+            .where(in_scope)
+            .group_by(mg.genre_id, other.c.genre_id)
+            .subquery()
+        )
+        related = await self.session.execute(
+            select(pairs.c.genre_id, Genre.slug)
+            .join(Genre, Genre.id == pairs.c.related_id)
+            .where(pairs.c.rn <= RELATED_GENRES)
+            .order_by(pairs.c.genre_id, pairs.c.rn)
+        )
+
+        built = assemble_genre_stats(
+            ids, totals.all(), facets.all(), histogram.all(), people.all(), top_movies.all(), related.all()
+        )
+        now = datetime.utcnow()
+        stmt = pg_insert(GenreStats).values([{**row, "refreshed_at": now} for row in built.values()])
+        await self.session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[GenreStats.genre_id],
+                set_={
+                    "total_movies": stmt.excluded.total_movies,
+                    "average_rating": stmt.excluded.average_rating,
+                    "statistics": stmt.excluded.statistics,
+                    "related_genres": stmt.excluded.related_genres,
+                    "refreshed_at": stmt.excluded.refreshed_at,
+                },
+            )
+        )
+        return built
+
     async def get_movies(self, genre_slug: str, limit: int = 20, offset: int = 0) -> List[dict[str, Any]]:
         if not self.session:
             return []
@@ -85,4 +293,3 @@ class GenreRepository:
         res = await self.session.execute(q)
         movies = res.scalars().all()
         return [{"id": m.external_id, "title": m.title} for m in movies]
-
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Iterable
+
+from sqlalchemy import select, update, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import MovieContentVersion
+
+CONTENT_CATEGORIES = ("trivia", "timeline", "awards", "cast_crew", "media", "streaming", "basic_info")
+
+
+class MovieContentRepository:
+    """
+    Draft/publish workflow over `movie_content_versions`.
+
+    Every save appends a version, so admin editing never rewrites the `movies`
+    row. Publishing archives the current published version and promotes the
+    latest draft; readers only ever see the published row.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def _append(
+        self, movie_id: int, category: str, payload: Any, status: str, user_id: int | None
+    ) -> MovieContentVersion:
+        res = await self.session.execute(
+            select(func.coalesce(func.max(MovieContentVersion.version), 0)).where(
+                MovieContentVersion.movie_id == movie_id,
+                MovieContentVersion.category == category,
+            )
+        )
+        row = MovieContentVersion(
+            movie_id=movie_id,
+            category=category,
+            version=res.scalar_one() + 1,
+            payload=payload,
+            status=status,
+            created_by_id=user_id,
+            published_at=datetime.utcnow() if status == "published" else None,
+        )
+        self.session.add(row)
+        await self.session.flush()
+        return row
+
+    async def save_draft(
+        self, movie_id: int, category: str, payload: Any, user_id: int | None = None
+    ) -> MovieContentVersion:
+        return await self._append(movie_id, category, payload, "draft", user_id)
+
+    async def latest_draft(self, movie_id: int, category: str) -> MovieContentVersion | None:
+        res = await self.session.execute(
+            select(MovieContentVersion)
+            .where(
+                MovieContentVersion.movie_id == movie_id,
+                MovieContentVersion.category == category,
+                MovieContentVersion.status == "draft",
+            )
+            .order_by(MovieContentVersion.version.desc())
+            .limit(1)
+        )
+        return res.scalar_one_or_none()
+
+    async def _archive_current(self, movie_id: int, category: str) -> None:
+        """Retire the published version and any older drafts it supersedes."""
+        await self.session.execute(
+            update(MovieContentVersion)
+            .where(
+                MovieContentVersion.movie_id == movie_id,
+                MovieContentVersion.category == category,
+                MovieContentVersion.status.in_(("published", "draft")),
+            )
+            .values(status="archived")
+        )
+
+    async def publish(self, draft: MovieContentVersion) -> MovieContentVersion:
+        """Promote `draft` (usually `latest_draft`) to the published version."""
+        await self._archive_current(draft.movie_id, draft.category)
+        await self.session.execute(
+            update(MovieContentVersion)
+            .where(MovieContentVersion.id == draft.id)
+            .values(status="published", published_at=datetime.utcnow())
+        )
+        return draft
+
+    async def publish_payload(
+        self, movie_id: int, category: str, payload: Any, user_id: int | None = None
+    ) -> MovieContentVersion:
+        """Append `payload` as the published version directly (bulk imports skip review)."""
+        await self._archive_current(movie_id, category)
+        return await self._append(movie_id, category, payload, "published", user_id)
+
+    async def discard(self, movie_id: int, category: str) -> int:
+        """Discard pending drafts; returns how many were discarded."""
+        res = await self.session.execute(
+            update(MovieContentVersion)
+            .where(
+                MovieContentVersion.movie_id == movie_id,
+                MovieContentVersion.category == category,
+                MovieContentVersion.status == "draft",
+            )
+            .values(status="discarded")
+        )
+        return res.rowcount or 0
+
+    async def published(
+        self, movie_ids: Iterable[int], categories: Iterable[str] = CONTENT_CATEGORIES
+    ) -> dict[int, dict[str, Any]]:
+        """Published payloads as {movie_id: {category: payload}} in one query."""
+        movie_ids, categories = list(movie_ids), list(categories)
+        if not movie_ids or not categories:
+            return {}
+        res = await self.session.execute(
+            select(MovieContentVersion.movie_id, MovieContentVersion.category, MovieContentVersion.payload).where(
+                MovieContentVersion.movie_id.in_(movie_ids),
+                MovieContentVersion.category.in_(categories),
+                MovieContentVersion.status == "published",
+            )
+        )
+        out: dict[int, dict[str, Any]] = {}
+        for movie_id, category, payload in res.all():
+            out.setdefault(movie_id, {})[category] = payload
+        return out
+
+    async def status(self, movie_id: int) -> dict[str, dict[str, Any]]:
+        """Per-category draft/publish status for the admin editor."""
+        res = await self.session.execute(
+            select(
+                MovieContentVersion.category,
+                MovieContentVersion.status,
+                func.max(MovieContentVersion.version),
+            )
+            .where(
+                MovieContentVersion.movie_id == movie_id,
+                MovieContentVersion.status.in_(("draft", "published")),
+            )
+            .group_by(MovieContentVersion.category, MovieContentVersion.status)
+        )
+        latest: dict[str, dict[str, int]] = {}
+        for category, status, version in res.all():
+            latest.setdefault(category, {})[status] = version
+        out: dict[str, dict[str, Any]] = {}
+        for category in CONTENT_CATEGORIES:
+            versions = latest.get(category, {})
+            has_draft = "draft" in versions
+            has_published = "published" in versions
+            out[category] = {
+                "status": "published" if has_published and not has_draft else "draft",
+                "has_draft": has_draft,
+                "has_published": has_published,
+            }
+        return out
@@ -1,10 +1,81 @@
 from __future__ import annotations
 
 from typing import Any, List, Optional
-from sqlalchemy import select, desc, asc, or_, func
+from sqlalchemy import select, desc, asc, or_, and_, func, any_, literal, String
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import noload, selectinload
 
-from ..models import Movie, Genre, Review, Scene, MovieStreamingOption, StreamingPlatform
+from ..config import settings
+from ..models import Movie, MovieContentVersion, MovieRatingStats, Genre, Person, Review, Scene, MovieStreamingOption, StreamingPlatform, User, movie_people
+from ..services.cache import TTLCache
+from .fieldsets import FieldSet
+from .movie_content import MovieContentRepository
+from .rating_stats import RatingStatsRepository
+
+# Detail payloads keyed by movie external_id, without the _LIVE_KEYS. Admin
+# writes to a movie call `movie_detail_cache.invalidate(external_id)`; the TTL
+# covers everything else.
+movie_detail_cache = TTLCache(
+    ttl_seconds=settings.movie_detail_cache_ttl_seconds,
+    max_entries=settings.movie_detail_cache_max_entries,
+)
+
+# Card and detail payloads only need genre names; skip the selectin cascade
+# through Genre.movies, Movie.people and Movie.curated_by.
+_CARD_LOAD_OPTIONS = (
+    noload(Movie.people),
+    noload(Movie.curated_by),
+)
+
+# Field group -> (loader options when requested, when not requested)
+_CARD_LOADERS = {
+    "genres": ((selectinload(Movie.genres).noload(Genre.movies),), (noload(Movie.genres),)),
+}
+
+_CARD_COLUMNS = {
+    "title": [Movie.title],
+    "year": [Movie.year],
+    "releaseDate": [Movie.release_date],
+    "posterUrl": [Movie.poster_url],
+    "sidduScore": [Movie.siddu_score],
+    "language": [Movie.language],
+    "country": [Movie.country],
+    "runtime": [Movie.runtime],
+}
+
+_CARD_FIELDS = {
+    "id": lambda m: m.external_id,
+    "title": lambda m: m.title,
+    "year": lambda m: m.year,
+    "releaseDate": lambda m: m.release_date.isoformat() if m.release_date else None,
+    "posterUrl": lambda m: m.poster_url,
+    "genres": lambda m: [g.name for g in m.genres],
+    "sidduScore": lambda m: m.siddu_score,
+    "language": lambda m: m.language,
+    "country": lambda m: m.country,
+    "runtime": lambda m: m.runtime,
+}
+
+
+# Detail keys served from the published movie_content_versions row of the same category
+_CONTENT_KEYS = ("trivia", "timeline", "awards")
+
+# Detail keys that move with every review, vote and critic review. They are
+# never cached and are read fresh on top of cached payloads.
+_LIVE_KEYS = ("sidduScore", "criticsScore", "ratingStats", "reviews")
+
+
+def _card_options(fields: FieldSet) -> list[Any]:
+    return [
+        *_CARD_LOAD_OPTIONS,
+        *fields.loader_options(_CARD_LOADERS),
+        *fields.load_only([Movie.id, Movie.external_id], _CARD_COLUMNS),
+    ]
+
+
+def _movie_card(m: Movie, fields: FieldSet | None = None) -> dict[str, Any]:
+    return (fields or FieldSet()).build(m, _CARD_FIELDS)
 
 
 class MovieRepository:
@@ -24,10 +95,12 @@ class MovieRepository:
         rating_min: Optional[float] = None,
         rating_max: Optional[float] = None,
         sort_by: Optional[str] = None,
+        fields: FieldSet | None = None,
     ) -> List[dict[str, Any]]:
         if not self.session:
             return []
-        q = select(Movie)
+        fields = fields or FieldSet()
+        q = select(Movie).options(*_card_options(fields))
         if genre_slug:
             q = q.join(Movie.genres).where(Genre.slug == genre_slug)
         if year_min is not None:
@@ -45,7 +118,13 @@ class MovieRepository:
         # sorting
         if sort_by == "latest":
             q = q.order_by(desc(Movie.year))
-        elif sort_by in ("score", "rating"):
+        elif sort_by == "rating":
+            q = q.outerjoin(MovieRatingStats, MovieRatingStats.movie_id == Movie.id).order_by(
+                MovieRatingStats.average_rating.desc().nulls_last(),
+                desc(MovieRatingStats.review_count),
+                desc(Movie.siddu_score),
+            )
+        elif sort_by == "score":
             q = q.order_by(desc(Movie.siddu_score))
         elif sort_by == "popular":
             q = q.order_by(desc(Movie.siddu_score))
@@ -56,157 +135,304 @@ class MovieRepository:
         q = q.limit(limit).offset((page - 1) * limit)
         res = await self.session.execute(q)
         movies = res.scalars().all()
-        return [
-            {
-                "id": m.external_id,
-                "title": m.title,
-                "year": m.year,
-                "releaseDate": m.release_date.isoformat() if m.release_date else None,
-                "posterUrl": m.poster_url,
-                "genres": [g.name for g in m.genres],
-                "sidduScore": m.siddu_score,
-                "language": m.language,
-                "country": m.country,
-                "runtime": m.runtime,
-            }
-            for m in movies
-        ]
+        return [_movie_card(m, fields) for m in movies]
 
-    async def get(self, external_id: str) -> dict[str, Any] | None:
+    async def get(self, external_id: str, fields: FieldSet | None = None) -> dict[str, Any] | None:
         if not self.session:
             return None
-        q = select(Movie).where(Movie.external_id == external_id)
-        res = await self.session.execute(q)
-        m = res.scalar_one_or_none()
-        if not m:
-            return None
+        fields = fields or FieldSet()
+        cached = movie_detail_cache.get(external_id)
+        if cached is not None:
+            live = await self._live_details([external_id], fields)
+            return fields.prune({**cached, **live.get(external_id, {})})
+        details = await self._load_details([external_id], fields)
+        return details.get(external_id)
 
-        # Get directors, writers, producers from people relationship
-        directors = []
-        writers = []
-        producers = []
-        cast = []
+    async def get_content(self, external_id: str, key: str) -> tuple[bool, Any]:
+        """
+        Load one rich-content section ("trivia", "timeline" or "awards") on its own.
 
-        from sqlalchemy import select as _select
-        from ..models import movie_people, Person
+        Returns `(found, value)`; `found` is False for an unknown movie. Only the
+        published version's payload is read.
+        """
+        if not self.session:
+            return False, None
+        cached = movie_detail_cache.get(external_id)
+        if cached is not None:
+            return True, cached.get(key)
+        res = await self.session.execute(
+            select(Movie.id, MovieContentVersion.payload)
+            .outerjoin(
+                MovieContentVersion,
+                and_(
+                    MovieContentVersion.movie_id == Movie.id,
+                    MovieContentVersion.category == key,
+                    MovieContentVersion.status == "published",
+                ),
+            )
+            .where(Movie.external_id == external_id)
+        )
+        row = res.first()
+        if row is None:
+            return False, None
+        return True, row.payload
 
-        # Query movie_people association table
-        people_query = _select(Person, movie_people.c.role, movie_people.c.character_name).join(
-            movie_people, Person.id == movie_people.c.person_id
-        ).where(movie_people.c.movie_id == m.id)
+    async def get_many(
+        self,
+        external_ids: List[str],
+        *,
+        view: str = "card",
+        fields: FieldSet | None = None,
+    ) -> List[dict[str, Any]]:
+        """
+        Resolve many movies by external id in one round trip.
+
+        Returns movies in the order of `external_ids`, skipping unknown ids.
+        The "detail" view serves warm entries from the detail cache and loads
+        only the misses, batching every relation query across them.
+        """
+        if not self.session or not external_ids:
+            return []
+        fields = fields or FieldSet()
+        ids = list(dict.fromkeys(external_ids))
+
+        if view == "detail":
+            cached = movie_detail_cache.get_many(ids)
+            live = await self._live_details(list(cached), fields) if cached else {}
+            found = {k: fields.prune({**v, **live.get(k, {})}) for k, v in cached.items()}
+            missing = [i for i in ids if i not in found]
+            if missing:
+                found.update(await self._load_details(missing, fields))
+        else:
+            q = (
+                select(Movie)
+                .where(Movie.external_id == any_(literal(ids, ARRAY(String))))
+                .options(*_card_options(fields))
+            )
+            res = await self.session.execute(q)
+            found = {m.external_id: _movie_card(m, fields) for m in res.scalars().all()}
 
-        people_result = await self.session.execute(people_query)
-        for person, role, character_name in people_result:
+        return [found[i] for i in ids if i in found]
+
+    async def _load_details(
+        self, external_ids: List[str], fields: FieldSet | None = None
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Build detail payloads for `external_ids` with one query per relation.
+
+        Relation queries the field selection does not ask for are skipped. Only
+        full payloads are written to the detail cache.
+        """
+        fields = fields or FieldSet()
+        want_genres = fields.wants_any("genres", "genreSlugs")
+        genre_loaders = _CARD_LOADERS["genres"][0 if want_genres else 1]
+        q = (
+            select(Movie)
+            .where(Movie.external_id == any_(literal(external_ids, ARRAY(String))))
+            .options(*_CARD_LOAD_OPTIONS, *genre_loaders)
+        )
+        res = await self.session.execute(q)
+        movies = res.scalars().all()
+        if not movies:
+            return {}
+        movie_ids = [m.id for m in movies]
+
+        content = await MovieContentRepository(self.session).published(
+            movie_ids, [k for k in _CONTENT_KEYS if fields.wants(k)]
+        )
+        rating_stats = (
+            await RatingStatsRepository(self.session).get_many(movie_ids) if fields.wants("ratingStats") else {}
+        )
+
+        # Cast and crew, projected from the movie_people association table
+        credits: dict[int, dict[str, list]] = {
+            mid: {"director": [], "writer": [], "producer": [], "actor": []} for mid in movie_ids
+        }
+        people_query = (
+            select(
+                movie_people.c.movie_id,
+                movie_people.c.role,
+                movie_people.c.character_name,
+                Person.external_id,
+                Person.name,
+                Person.image_url,
+            )
+            .join(Person, Person.id == movie_people.c.person_id)
+            .where(movie_people.c.movie_id.in_(movie_ids))
+        )
+        people_rows = []
+        if fields.wants_any("directors", "writers", "producers", "cast"):
+            people_rows = await self.session.execute(people_query)
+        for movie_id, role, character_name, person_id, name, image_url in people_rows:
+            if role not in credits[movie_id]:
+                continue
             person_dict = {
-                "id": person.external_id,
-                "name": person.name,
+                "id": person_id,
+                "name": name,
                 "role": role,
-                "profileUrl": person.image_url,
+                "profileUrl": image_url,
             }
-
-            if role == "director":
-                directors.append(person_dict)
-            elif role == "writer":
-                writers.append(person_dict)
-            elif role == "producer":
-                producers.append(person_dict)
-            elif role == "actor":
+            if role == "actor":
                 person_dict["character"] = character_name
-                cast.append(person_dict)
-
-        # Get reviews
-        reviews_query = select(Review).where(Review.movie_id == m.id).limit(10)
-        reviews_result = await self.session.execute(reviews_query)
-        reviews_list = []
-        for review in reviews_result.scalars():
-            reviews_list.append({
-                "id": review.external_id,
-                "userId": review.author.external_id if review.author else None,
-                "username": review.author.name if review.author else "Anonymous",
-                "avatarUrl": review.author.avatar_url if review.author else None,
-                "rating": review.rating,
-                "title": review.title,
-                "content": review.content,
-                "verified": review.is_verified,
-                "containsSpoilers": review.has_spoilers,
-                "helpfulCount": review.helpful_votes,
-                "createdAt": review.date.isoformat() if review.date else None,
-            })
+            credits[movie_id][role].append(person_dict)
 
-        # Get scenes
-        scenes_query = select(Scene).where(Scene.movie_id == m.id).limit(20)
-        scenes_result = await self.session.execute(scenes_query)
-        scenes_list = []
-        for scene in scenes_result.scalars():
-            scenes_list.append({
-                "id": scene.external_id,
-                "title": scene.title,
-                "description": scene.description,
-                "thumbnailUrl": scene.thumbnail_url,
-                "timestamp": scene.duration_str,
-                "type": scene.scene_type,
+        reviews_by_movie = await self._top_reviews(movie_ids) if fields.wants("reviews") else {}
+
+        # First 20 scenes per movie
+        scene_rank = (
+            select(
+                Scene.id,
+                func.row_number().over(partition_by=Scene.movie_id, order_by=Scene.id).label("rn"),
+            )
+            .where(Scene.movie_id.in_(movie_ids))
+            .subquery()
+        )
+        scenes_query = (
+            select(Scene.__table__)
+            .join(scene_rank, scene_rank.c.id == Scene.id)
+            .where(scene_rank.c.rn <= 20)
+            .order_by(Scene.movie_id, Scene.id)
+        )
+        scenes_by_movie: dict[int, list] = {mid: [] for mid in movie_ids}
+        scene_rows = (await self.session.execute(scenes_query)).mappings() if fields.wants("scenes") else []
+        for row in scene_rows:
+            scenes_by_movie[row["movie_id"]].append({
+                "id": row["external_id"],
+                "title": row["title"],
+                "description": row["description"],
+                "thumbnailUrl": row["thumbnail_url"],
+                "timestamp": row["duration_str"],
+                "type": row["scene_type"],
             })
 
-        # Get streaming options grouped by region
-        streaming_query = select(MovieStreamingOption, StreamingPlatform).join(
-            StreamingPlatform, MovieStreamingOption.platform_id == StreamingPlatform.id
-        ).where(MovieStreamingOption.movie_id == m.id)
-        streaming_result = await self.session.execute(streaming_query)
-
-        streaming_by_region = {}
-        for stream_opt, platform in streaming_result:
-            region = stream_opt.region
-            if region not in streaming_by_region:
-                streaming_by_region[region] = []
-
-            streaming_by_region[region].append({
-                "provider": platform.name,
-                "logoUrl": platform.logo_url,
-                "type": stream_opt.type,
-                "price": stream_opt.price,
-                "quality": stream_opt.quality,
-                "url": stream_opt.url,
-                "verified": stream_opt.verified,
+        # Streaming options grouped by region
+        streaming_query = (
+            select(MovieStreamingOption.__table__, StreamingPlatform.name.label("provider"), StreamingPlatform.logo_url.label("logo_url"))
+            .join(StreamingPlatform, MovieStreamingOption.platform_id == StreamingPlatform.id)
+            .where(MovieStreamingOption.movie_id.in_(movie_ids))
+        )
+        streaming_by_movie: dict[int, dict[str, list]] = {mid: {} for mid in movie_ids}
+        streaming_rows = (
+            (await self.session.execute(streaming_query)).mappings() if fields.wants("streamingOptions") else []
+        )
+        for row in streaming_rows:
+            streaming_by_movie[row["movie_id"]].setdefault(row["region"], []).append({
+                "provider": row["provider"],
+                "logoUrl": row["logo_url"],
+                "type": row["type"],
+                "price": row["price"],
+                "quality": row["quality"],
+                "url": row["url"],
+                "verified": row["verified"],
             })
 
+        details: dict[str, dict[str, Any]] = {}
+        for m in movies:
+            data = {
+                "id": m.external_id,
+                "title": m.title,
+                "tagline": m.tagline,
+                "year": m.year,
+                "releaseDate": m.release_date.isoformat() if m.release_date else None,
+                "runtime": m.runtime,
+                "rating": m.rating,
+                "posterUrl": m.poster_url,
+                "backdropUrl": m.backdrop_url,
+                "genres": [g.name for g in m.genres] if want_genres else [],
+                "genreSlugs": [g.slug for g in m.genres] if want_genres else [],
+                "sidduScore": m.siddu_score,
+                "criticsScore": m.critics_score,
+                "ratingStats": rating_stats.get(m.id),
+                "imdbRating": m.imdb_rating,
+                "rottenTomatoesScore": m.rotten_tomatoes_score,
+                "language": m.language,
+                "country": m.country,
+                "synopsis": m.overview,
+                "budget": m.budget,
+                "revenue": m.revenue,
+                "status": m.status,
+                "trivia": content.get(m.id, {}).get("trivia"),
+                "timeline": content.get(m.id, {}).get("timeline"),
+                "awards": content.get(m.id, {}).get("awards"),
+                "directors": credits[m.id]["director"],
+                "writers": credits[m.id]["writer"],
+                "producers": credits[m.id]["producer"],
+                "cast": credits[m.id]["actor"],
+                "reviews": reviews_by_movie.get(m.id, []),
+                "scenes": scenes_by_movie[m.id],
+                "streamingOptions": streaming_by_movie[m.id],
+                "videoUrl": m.video_url,
+                "videoSource": m.video_source,
+                "isFree": m.is_free,
+            }
+            if fields.all:
+                movie_detail_cache.set(m.external_id, {k: v for k, v in data.items() if k not in _LIVE_KEYS})
+            details[m.external_id] = fields.prune(data)
+        return details
+
+    async def _live_details(
+        self, external_ids: List[str], fields: FieldSet | None = None
+    ) -> dict[str, dict[str, Any]]:
+        """The requested _LIVE_KEYS for `external_ids`, read fresh for cache hits."""
+        fields = fields or FieldSet()
+        if not fields.wants_any(*_LIVE_KEYS):
+            return {}
+        res = await self.session.execute(
+            select(Movie.id, Movie.external_id, Movie.siddu_score, Movie.critics_score)
+            .where(Movie.external_id == any_(literal(external_ids, ARRAY(String))))
+        )
+        movies = res.all()
+        movie_ids = [m.id for m in movies]
+        rating_stats = (
+            await RatingStatsRepository(self.session).get_many(movie_ids) if fields.wants("ratingStats") else {}
+        )
+        reviews_by_movie = await self._top_reviews(movie_ids) if fields.wants("reviews") else {}
         return {
-            "id": m.external_id,
-            "title": m.title,
-            "tagline": m.tagline,
-            "year": m.year,
-            "releaseDate": m.release_date.isoformat() if m.release_date else None,
-            "runtime": m.runtime,
-            "rating": m.rating,
-            "posterUrl": m.poster_url,
-            "backdropUrl": m.backdrop_url,
-            "genres": [g.name for g in m.genres],
-            "genreSlugs": [g.slug for g in m.genres],
-            "sidduScore": m.siddu_score,
-            "criticsScore": m.critics_score,
-            "imdbRating": m.imdb_rating,
-            "rottenTomatoesScore": m.rotten_tomatoes_score,
-            "language": m.language,
-            "country": m.country,
-            "synopsis": m.overview,
-            "budget": m.budget,
-            "revenue": m.revenue,
-            "status": m.status,
-            # Return published data OR draft data (prefer draft for admin editing)
-            "trivia": m.trivia_draft if m.trivia_draft else m.trivia,
-            "timeline": m.timeline_draft if m.timeline_draft else m.timeline,
-            "awards": m.awards_draft if m.awards_draft else m.awards,
-            "directors": directors,
-            "writers": writers,
-            "producers": producers,
-            "cast": cast,
-            "reviews": reviews_list,
-            "scenes": scenes_list,
-            "streamingOptions": streaming_by_region,
-            "videoUrl": m.video_url,
-            "videoSource": m.video_source,
-            "isFree": m.is_free,
+            m.external_id: {
+                "sidduScore": m.siddu_score,
+                "criticsScore": m.critics_score,
+                "ratingStats": rating_stats.get(m.id),
+                "reviews": reviews_by_movie.get(m.id, []),
+            }
+            for m in movies
         }
 
+    async def _top_reviews(self, movie_ids: List[int]) -> dict[int, list[dict[str, Any]]]:
+        """Top 10 reviews per movie by rank_score."""
+        review_rank = (
+            select(
+                Review.id,
+                func.row_number().over(
+                    partition_by=Review.movie_id, order_by=(Review.rank_score.desc(), Review.id)
+                ).label("rn"),
+            )
+            .where(Review.movie_id.in_(movie_ids))
+            .subquery()
+        )
+        reviews_query = (
+            select(Review.__table__, User.external_id.label("author_external_id"), User.name.label("author_name"), User.avatar_url.label("author_avatar_url"))
+            .join(review_rank, review_rank.c.id == Review.id)
+            .outerjoin(User, User.id == Review.user_id)
+            .where(review_rank.c.rn <= 10)
+            .order_by(Review.movie_id, review_rank.c.rn)
+        )
+        reviews_by_movie: dict[int, list] = {mid: [] for mid in movie_ids}
+        for row in (await self.session.execute(reviews_query)).mappings():
+            reviews_by_movie[row["movie_id"]].append({
+                "id": row["external_id"],
+                "userId": row["author_external_id"],
+                "username": row["author_name"] or "Anonymous",
+                "avatarUrl": row["author_avatar_url"],
+                "rating": row["rating"],
+                "title": row["title"],
+                "content": row["content"],
+                "verified": row["is_verified"],
+                "containsSpoilers": row["has_spoilers"],
+                "helpfulCount": row["helpful_votes"],
+                "createdAt": row["date"].isoformat() if row["date"] else None,
+            })
+        return reviews_by_movie
+
     async def search(
         self,
         query: str,
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Iterable, Optional
+
+from sqlalchemy import select, delete
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import PageSnapshot
+
+AWARD_YEAR = "award_year"
+FESTIVAL_PROGRAM = "festival_program"
+FESTIVAL_WINNERS = "festival_winners"
+SNAPSHOT_KINDS = (AWARD_YEAR, FESTIVAL_PROGRAM, FESTIVAL_WINNERS)
+
+AWARD_KINDS = (AWARD_YEAR,)
+FESTIVAL_KINDS = (FESTIVAL_PROGRAM, FESTIVAL_WINNERS)
+
+
+def festival_key(festival_external_id: str, year: int) -> str:
+    return f"{festival_external_id}:{year}"
+
+
+class PageSnapshotRepository:
+    """
+    Stored JSON payloads for award and festival pages (`page_snapshots`).
+
+    Public reads return the stored payload as is. A missing snapshot is built
+    by the owning repository on first read and stored with `put`; admin writes
+    call `invalidate` for the ceremony or festival they touched so the next
+    read rebuilds it. The caller commits.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def get(self, kind: str, key: str) -> Optional[Any]:
+        res = await self.session.execute(
+            select(PageSnapshot.payload).where(PageSnapshot.kind == kind, PageSnapshot.key == key)
+        )
+        return res.scalar_one_or_none()
+
+    async def put(self, kind: str, key: str, scope: str, payload: Any) -> None:
+        stmt = pg_insert(PageSnapshot).values(
+            kind=kind, key=key, scope=scope, version=1, payload=payload, built_at=datetime.utcnow()
+        )
+        await self.session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[PageSnapshot.kind, PageSnapshot.key],
+                set_={
+                    "scope": stmt.excluded.scope,
+                    "payload": stmt.excluded.payload,
+                    "built_at": stmt.excluded.built_at,
+                    "version": PageSnapshot.version + 1,
+                },
+            )
+        )
+
+    async def invalidate(self, kinds: Iterable[str], scopes: Iterable[str] | None = None) -> int:
+        """Drop snapshots of `kinds`, limited to `scopes` if given. Returns how many were dropped."""
+        q = delete(PageSnapshot).where(PageSnapshot.kind.in_(list(kinds)))
+        if scopes is not None:
+            scopes = list(scopes)
+            if not scopes:
+                return 0
+            q = q.where(PageSnapshot.scope.in_(scopes))
+        res = await self.session.execute(q)
+        return res.rowcount or 0
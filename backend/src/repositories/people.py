@@ -1,10 +1,44 @@
 from __future__ import annotations
 
-from typing import Any, List
-from sqlalchemy import select
+from typing import Any, List, Optional
+from sqlalchemy import and_, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
-from ..models import Person, Movie, movie_people
+from ..config import settings
+from ..models import Genre, Person, Movie, movie_genres, movie_people
+from ..services.cache import TTLCache
+
+FILMOGRAPHY_PAGE_SIZE = 20
+TOP_GENRES = 5
+# Roles listed first on a person page; any other role follows alphabetically
+ROLE_ORDER = ("actor", "director", "writer", "producer")
+
+# Per-person aggregates (credit counts, years active, top genres), keyed by
+# Person.id. Catalog imports clear it; the TTL covers everything else.
+person_summary_cache = TTLCache(
+    ttl_seconds=settings.person_summary_cache_ttl_seconds,
+    max_entries=settings.person_summary_cache_max_entries,
+)
+
+mp = movie_people.c
+# Unknown years sort after every known one in a newest-first listing
+_year_key = func.coalesce(Movie.year, "")
+
+
+def _role_rank(role: str) -> tuple[int, str]:
+    return (ROLE_ORDER.index(role) if role in ROLE_ORDER else len(ROLE_ORDER), role)
+
+
+def _credit(row: Any) -> dict[str, Any]:
+    return {
+        "id": row.external_id,
+        "title": row.title,
+        "year": row.year,
+        "posterUrl": row.poster_url,
+        "role": row.role,
+        "character": row.character_name,
+    }
 
 
 class PeopleRepository:
@@ -14,41 +48,156 @@ class PeopleRepository:
     async def list(self, *, page: int = 1, limit: int = 20) -> List[dict[str, Any]]:
         if not self.session:
             return []
-        q = select(Person).limit(limit).offset((page - 1) * limit)
+        q = (
+            select(Person.external_id, Person.name, Person.image_url)
+            .order_by(Person.id)
+            .limit(limit)
+            .offset((page - 1) * limit)
+        )
         res = await self.session.execute(q)
-        people = res.scalars().all()
         return [
             {
-                "id": p.external_id,
-                "name": p.name,
-                "imageUrl": p.image_url,
+                "id": external_id,
+                "name": name,
+                "imageUrl": image_url,
             }
-            for p in people
+            for external_id, name, image_url in res.tuples()
         ]
 
-    async def get(self, external_id: str) -> dict[str, Any] | None:
+    async def get(self, external_id: str, *, limit: int = FILMOGRAPHY_PAGE_SIZE) -> dict[str, Any] | None:
+        """
+        Person page: profile, cached summary and the first `limit` credits of
+        every role (newest first). `filmographyCursors` holds, per role, the
+        cursor for `filmography()` when that role has more credits.
+        """
         if not self.session:
             return None
-        q = select(Person).where(Person.external_id == external_id)
-        res = await self.session.execute(q)
-        p = res.scalar_one_or_none()
+        res = await self.session.execute(
+            select(Person.id, Person.external_id, Person.name, Person.bio, Person.image_url)
+            .where(Person.external_id == external_id)
+        )
+        p = res.one_or_none()
         if not p:
             return None
-        # naive filmography (roles omitted for now)
-        filmography = [
-            {
-                "id": m.external_id,
-                "title": m.title,
-                "year": m.year,
-                "posterUrl": m.poster_url,
-            }
-            for m in p.movies
-        ]
+
+        numbered = (
+            select(
+                mp.role,
+                mp.character_name,
+                Movie.external_id,
+                Movie.title,
+                Movie.year,
+                Movie.poster_url,
+                func.row_number()
+                .over(partition_by=mp.role, order_by=(_year_key.desc(), Movie.id.desc()))
+                .label("rn"),
+            )
+            .join(Movie, Movie.id == mp.movie_id)
+            .where(mp.person_id == p.id)
+            .subquery()
+        )
+        credits = await self.session.execute(
+            select(numbered).where(numbered.c.rn <= limit + 1).order_by(numbered.c.role, numbered.c.rn)
+        )
+        by_role: dict[str, list[dict[str, Any]]] = {}
+        for row in credits.all():
+            by_role.setdefault(row.role, []).append(_credit(row))
+
+        filmography: list[dict[str, Any]] = []
+        cursors: dict[str, Optional[str]] = {}
+        for role in sorted(by_role, key=_role_rank):
+            items = by_role[role]
+            cursors[role] = items[limit - 1]["id"] if len(items) > limit else None
+            filmography.extend(items[:limit])
+
         return {
             "id": p.external_id,
             "name": p.name,
             "bio": p.bio,
             "imageUrl": p.image_url,
+            "summary": await self._summary(p.id),
             "filmography": filmography,
+            "filmographyCursors": cursors,
+        }
+
+    async def filmography(
+        self,
+        external_id: str,
+        role: str,
+        *,
+        cursor: Optional[str] = None,
+        limit: int = FILMOGRAPHY_PAGE_SIZE,
+    ) -> dict[str, Any] | None:
+        """
+        One page of a person's credits in `role`, newest first. `cursor` is the
+        id of the last movie already shown.
+        """
+        if not self.session:
+            return None
+        person_id = (
+            await self.session.execute(select(Person.id).where(Person.external_id == external_id))
+        ).scalar_one_or_none()
+        if person_id is None:
+            return None
+
+        q = (
+            select(mp.role, mp.character_name, Movie.external_id, Movie.title, Movie.year, Movie.poster_url)
+            .join(Movie, Movie.id == mp.movie_id)
+            .where(mp.person_id == person_id, mp.role == role)
+        )
+        if cursor:
+            after = aliased(Movie)
+            after_year = select(func.coalesce(after.year, "")).where(after.external_id == cursor).scalar_subquery()
+            after_id = select(after.id).where(after.external_id == cursor).scalar_subquery()
+            q = q.where(
+                or_(
+                    _year_key < after_year,
+                    and_(_year_key == after_year, Movie.id < after_id),
+                )
+            )
+        res = await self.session.execute(q.order_by(_year_key.desc(), Movie.id.desc()).limit(limit + 1))
+        items = [_credit(row) for row in res.all()]
+        return {
+            "items": items[:limit],
+            "nextCursor": items[limit - 1]["id"] if len(items) > limit else None,
         }
 
+    async def _summary(self, person_id: int) -> dict[str, Any]:
+        cached = person_summary_cache.get(person_id)
+        if cached is not None:
+            return cached
+
+        roles = await self.session.execute(
+            select(mp.role, func.count(), func.min(Movie.year), func.max(Movie.year))
+            .join(Movie, Movie.id == mp.movie_id)
+            .where(mp.person_id == person_id)
+            .group_by(mp.role)
+        )
+        credit_counts: dict[str, int] = {}
+        first_year: Optional[str] = None
+        last_year: Optional[str] = None
+        for role, count, low, high in roles.tuples():
+            credit_counts[role] = count
+            if low and (first_year is None or low < first_year):
+                first_year = low
+            if high and (last_year is None or high > last_year):
+                last_year = high
+
+        genres = await self.session.execute(
+            select(Genre.slug, Genre.name, func.count(func.distinct(mp.movie_id)).label("n"))
+            .select_from(movie_people)
+            .join(movie_genres, movie_genres.c.movie_id == mp.movie_id)
+            .join(Genre, Genre.id == movie_genres.c.genre_id)
+            .where(mp.person_id == person_id)
+            .group_by(Genre.id, Genre.slug, Genre.name)
+            .order_by(func.count(func.distinct(mp.movie_id)).desc(), Genre.name)
+            .limit(TOP_GENRES)
+        )
+        summary = {
+            "creditCount": sum(credit_counts.values()),
+            "creditsByRole": {r: credit_counts[r] for r in sorted(credit_counts, key=_role_rank)},
+            "yearsActive": {"from": first_year, "to": last_year},
+            "topGenres": [{"id": slug, "name": name, "movieCount": n} for slug, name, n in genres.tuples()],
+        }
+        person_summary_cache.set(person_id, summary)
+        return summary
@@ -10,6 +10,10 @@ from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..models import Pulse, User, UserFollow, Movie, UserSettings, PulseReaction, PulseComment
+from .fieldsets import FieldSet
+from .user_counters import UserCountersRepository
+from .user_stats import UserStatsRepository
+from ..services.follow_graph import user_follow_graph, record_follow_change
 
 
 def _slugify_username(name: str | None) -> str:
@@ -46,12 +50,23 @@ class PulseRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
 
-    def _base_query(self):
+    def _base_query(self, fields: FieldSet | None = None):
+        fields = fields or FieldSet()
+        # Authors and linked movies are only loaded when the DTO asks for them,
+        # and never with their own selectin relationships.
+        if fields.wants_any("userId", "userInfo"):
+            user_option = selectinload(Pulse.user).noload("*")
+        else:
+            user_option = noload(Pulse.user)
+        if fields.wants("content.linkedContent"):
+            linked_option = selectinload(Pulse.linked_movie).noload("*")
+        else:
+            linked_option = noload(Pulse.linked_movie)
         return (
             select(Pulse)
             .options(
-                selectinload(Pulse.user),
-                selectinload(Pulse.linked_movie),
+                user_option,
+                linked_option,
                 noload(Pulse.reactions),  # Don't load reactions - we use aggregated counts
                 noload(Pulse.comments)   # Don't load comments - we use aggregated counts
             )
@@ -68,8 +83,10 @@ class PulseRepository:
         linked_movie_id: Optional[str] = None,
         linked_type: Optional[str] = None,
         target_user_external_id: Optional[str] = None,
+        fields: FieldSet | None = None,
     ) -> List[Dict[str, Any]]:
-        q = self._base_query()
+        fields = fields or FieldSet()
+        q = self._base_query(fields)
 
         # Join UserSettings to check privacy
         # Use outer join because if no settings exist, default is public
@@ -148,9 +165,12 @@ class PulseRepository:
             q = q.where(Pulse.created_at >= (now - delta)).order_by(desc(Pulse.reactions_total + Pulse.comments_count + Pulse.shares_count))
         elif filter_type == "following":
             if viewer_id:
-                following_rows = (
-                    await self.session.execute(select(UserFollow.following_id).where(UserFollow.follower_id == viewer_id))
-                ).scalars().all()
+                if user_follow_graph.loaded:
+                    following_rows = list(user_follow_graph.following(viewer_id))
+                else:
+                    following_rows = (
+                        await self.session.execute(select(UserFollow.following_id).where(UserFollow.follower_id == viewer_id))
+                    ).scalars().all()
                 if following_rows:
                     q = q.where(Pulse.user_id.in_(following_rows)).order_by(desc(Pulse.created_at))
                 else:
@@ -170,7 +190,7 @@ class PulseRepository:
 
         # Fetch user reactions if viewer is logged in
         user_reactions = {}
-        if viewer_id and rows:
+        if viewer_id and rows and fields.wants("engagement.userReaction"):
             pulse_ids = [p.id for p in rows]
             q_reactions = select(PulseReaction).where(
                 PulseReaction.user_id == viewer_id,
@@ -180,7 +200,12 @@ class PulseRepository:
             for r in reactions_rows:
                 user_reactions[r.pulse_id] = r.type
 
-        return [self._to_dto(p, user_reactions.get(p.id)) for p in rows]
+        dtos = [self._to_dto(p, user_reactions.get(p.id)) for p in rows]
+        if viewer_id and rows and user_follow_graph.loaded and fields.wants("userInfo.isFollowing"):
+            relations = user_follow_graph.relations(viewer_id, {p.user_id for p in rows})
+            for p, dto in zip(rows, dtos):
+                dto["userInfo"]["isFollowing"] = relations[p.user_id]["isFollowing"]
+        return [fields.prune(dto) for dto in dtos]
 
     async def trending_topics(self, window: str = "7d", limit: int = 10) -> List[Dict[str, Any]]:
         now = datetime.utcnow()
@@ -248,13 +273,14 @@ class PulseRepository:
 
         return {
             "id": p.external_id,
-            "userId": user.external_id,
+            "userId": user.external_id if user is not None else None,
             "userInfo": {
                 "username": username,
                 "displayName": display_name,
                 "avatarUrl": avatar_url,
                 "isVerified": is_verified,
                 "role": p.posted_as_role,  # 'critic', 'industry_pro', 'talent_pro', or None
+                "isFollowing": False,  # filled in for logged-in viewers by list()
             },
             "content": {
                 "text": p.content_text,
@@ -357,6 +383,8 @@ class PulseRepository:
         )
         self.session.add(pulse)
         await self.session.flush()
+        await UserCountersRepository(self.session).bump(user_id, pulses=1)
+        await UserStatsRepository(self.session).increment_pulses_posted(user_id)
         await self.session.refresh(pulse, ["user", "linked_movie"])
 
         return self._to_dto(pulse)
@@ -376,6 +404,7 @@ class PulseRepository:
 
         await self.session.delete(pulse)
         await self.session.flush()
+        await UserCountersRepository(self.session).bump(user_id, pulses=-1)
         return True
 
 
@@ -417,6 +446,8 @@ class PulseRepository:
             reactions_map[reaction_type] = reactions_map.get(reaction_type, 0) + 1
             pulse.reactions_total += 1
             user_reaction = reaction_type
+            if pulse.user_id != user_id:
+                await UserStatsRepository(self.session).increment_likes_received(pulse.user_id)
 
         pulse.reactions_json = json.dumps(reactions_map)
         await self.session.flush()
@@ -452,6 +483,8 @@ class PulseRepository:
         pulse.comments_count += 1
         
         await self.session.flush()
+        if pulse.user_id != user_id:
+            await UserStatsRepository(self.session).increment_comments_received(pulse.user_id)
         await self.session.refresh(comment, ["user"])
 
         return {
@@ -526,6 +559,11 @@ class PulseRepository:
         follow = UserFollow(follower_id=follower_id, following_id=following_id)
         self.session.add(follow)
         await self.session.flush()
+        counters = UserCountersRepository(self.session)
+        await counters.bump(follower_id, following=1)
+        await counters.bump(following_id, followers=1)
+        await UserStatsRepository(self.session).increment_new_followers(following_id)
+        record_follow_change(self.session, user_follow_graph, follower_id, following_id, followed=True)
         return True
 
     async def unfollow_user(self, follower_id: int, following_id: int) -> bool:
@@ -540,6 +578,10 @@ class PulseRepository:
 
         await self.session.delete(existing)
         await self.session.flush()
+        counters = UserCountersRepository(self.session)
+        await counters.bump(follower_id, following=-1)
+        await counters.bump(following_id, followers=-1)
+        record_follow_change(self.session, user_follow_graph, follower_id, following_id, followed=False)
         return True
 
     async def is_following(self, follower_id: int, following_id: int) -> bool:
@@ -553,13 +595,11 @@ class PulseRepository:
 
     async def get_follower_count(self, user_id: int) -> int:
         """Get number of followers"""
-        q = select(func.count(UserFollow.id)).where(UserFollow.following_id == user_id)
-        return (await self.session.execute(q)).scalar() or 0
+        return (await UserCountersRepository(self.session).get(user_id))["followers"]
 
     async def get_following_count(self, user_id: int) -> int:
         """Get number of following"""
-        q = select(func.count(UserFollow.id)).where(UserFollow.follower_id == user_id)
-        return (await self.session.execute(q)).scalar() or 0
+        return (await UserCountersRepository(self.session).get(user_id))["following"]
 
     async def bookmark_pulse(self, user_id: int, pulse_id: str) -> bool:
         """Bookmark a pulse"""
@@ -10,6 +10,7 @@ from datetime import datetime
 import uuid
 
 from ..models import PulseComment, User, Pulse
+from .user_stats import UserStatsRepository
 
 
 class PulseCommentRepository:
@@ -48,6 +49,8 @@ class PulseCommentRepository:
         )
         self.session.add(comment)
         await self.session.flush()
+        if pulse.user_id != user_id:
+            await UserStatsRepository(self.session).increment_comments_received(pulse.user_id)
         await self.session.refresh(comment, ["user"])
 
         return self._to_dto(comment)
@@ -4,21 +4,76 @@ import json
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
-from sqlalchemy import func, select, asc, desc
+from sqlalchemy import func, select, asc, desc, insert, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from ..config import settings
+from ..services.cache import TTLCache
+from ..services.quiz_leaderboard import load_leaderboard, record_quiz_result
 from ..models import (
     Movie,
     Quiz,
     QuizAnswer,
     QuizAttempt,
-    QuizLeaderboardEntry,
     QuizQuestion,
     QuizQuestionOption,
     User,
 )
 
+# Compiled grading definitions keyed by quiz external_id. Each entry carries
+# the quiz's `version` (updated_at, else created_at) it was compiled from and
+# is only used while the quiz row still has that version, so writers of
+# questions or options must bump `Quiz.updated_at`.
+quiz_definition_cache = TTLCache(
+    ttl_seconds=settings.quiz_definition_cache_ttl_seconds,
+    max_entries=settings.quiz_definition_cache_max_entries,
+)
+
+
+def grade_answers(definition: Dict[str, Any], answers: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Grade submitted answers against a compiled definition. Returns the score,
+    pass flag, answer DTOs and `quiz_answers` rows (without attempt_id) for
+    answers that name a known question.
+    """
+    questions = definition["questions"]
+    correct_count = 0
+    rows: List[Dict[str, Any]] = []
+    dtos: List[Dict[str, Any]] = []
+    for ans in answers:
+        qid = ans.get("questionId")
+        selected: List[str] = ans.get("selectedOptionIds") or []
+        time_spent = ans.get("timeSpent")
+        question_id, correct_ids = questions.get(qid, (None, frozenset()))
+        is_correct = set(selected) == correct_ids
+        if is_correct:
+            correct_count += 1
+        if question_id is not None:
+            rows.append(
+                {
+                    "question_id": question_id,
+                    "selected_option_ids": json.dumps(selected),
+                    "is_correct": is_correct,
+                    "time_spent_seconds": time_spent,
+                }
+            )
+        dtos.append(
+            {
+                "questionId": qid,
+                "selectedOptionIds": selected,
+                "isCorrect": is_correct,
+                **({"timeSpent": time_spent} if time_spent is not None else {}),
+            }
+        )
+    score = int(round((correct_count / definition["total"]) * 100))
+    return {
+        "score": score,
+        "passed": score >= definition["passScore"],
+        "rows": rows,
+        "answers": dtos,
+    }
+
 
 class QuizRepository:
     def __init__(self, session: AsyncSession):
@@ -170,6 +225,55 @@ class QuizRepository:
             "timeLimit": quiz.time_limit_seconds if quiz else None,
         }
 
+    async def _compiled_definition(self, quiz_external_id: str) -> Dict[str, Any]:
+        """
+        Grading definition for a quiz. The quiz row is read on every call; the
+        answer key is re-read only when the cached definition's version is stale.
+        """
+        quiz = (
+            await self.session.execute(
+                select(Quiz.id, Quiz.pass_score, Quiz.number_of_questions, Quiz.created_at, Quiz.updated_at)
+                .where(Quiz.external_id == quiz_external_id)
+            )
+        ).first()
+        if not quiz:
+            quiz_definition_cache.invalidate(quiz_external_id)
+            raise ValueError("quiz_not_found")
+        version = quiz.updated_at or quiz.created_at
+        definition = quiz_definition_cache.get(quiz_external_id)
+        if definition is not None and definition["id"] == quiz.id and definition["version"] == version:
+            return definition
+
+        rows = (
+            await self.session.execute(
+                select(QuizQuestion.id, QuizQuestion.external_id, QuizQuestionOption.external_id)
+                .outerjoin(
+                    QuizQuestionOption,
+                    (QuizQuestionOption.question_id == QuizQuestion.id) & QuizQuestionOption.is_correct.is_(True),
+                )
+                .where(QuizQuestion.quiz_id == quiz.id)
+                .order_by(QuizQuestion.id, QuizQuestionOption.order_index)
+            )
+        ).all()
+        internal_ids: Dict[str, int] = {}
+        correct: Dict[str, List[str]] = {}
+        for question_id, question_ext, option_ext in rows:
+            internal_ids[question_ext] = question_id
+            ids = correct.setdefault(question_ext, [])
+            if option_ext is not None:
+                ids.append(option_ext)
+
+        definition = {
+            "id": quiz.id,
+            "version": version,
+            "passScore": quiz.pass_score or 70,
+            "total": min(len(internal_ids), quiz.number_of_questions or len(internal_ids)) or 1,
+            "questions": {ext: (internal_ids[ext], frozenset(ids)) for ext, ids in correct.items()},
+            "correctOptionIds": correct,
+        }
+        quiz_definition_cache.set(quiz_external_id, definition)
+        return definition
+
     async def submit_answers(
         self,
         user_external_id: str,
@@ -178,132 +282,113 @@ class QuizRepository:
         answers: List[Dict[str, Any]],
         started_at: Optional[str] = None,
     ) -> Dict[str, Any]:
-        # Load quiz with questions and options
-        quiz_q = self._base_quiz_query().where(Quiz.external_id == quiz_external_id)
-        quiz = (await self.session.execute(quiz_q)).scalars().first()
-        if not quiz:
-            raise ValueError("quiz_not_found")
+        definition = await self._compiled_definition(quiz_external_id)
 
         # Attempt
-        att_q = select(QuizAttempt).where(QuizAttempt.external_id == attempt_external_id)
-        attempt = (await self.session.execute(att_q)).scalars().first()
+        att_q = select(
+            QuizAttempt.id, QuizAttempt.user_id, QuizAttempt.attempt_number, QuizAttempt.started_at
+        ).where(QuizAttempt.external_id == attempt_external_id)
+        attempt = (await self.session.execute(att_q)).first()
         if not attempt:
             raise ValueError("attempt_not_found")
 
-        # Build correct answers map
-        correct_by_q: Dict[str, List[str]] = {}
-        q_by_ext: Dict[str, QuizQuestion] = {q.external_id: q for q in quiz.questions}
-        for q in quiz.questions:
-            correct_by_q[q.external_id] = [o.external_id for o in q.options if o.is_correct]
-
-        # Grade
-        total = min(len(quiz.questions), quiz.number_of_questions or len(quiz.questions)) or 1
-        correct_count = 0
-        answer_rows: List[QuizAnswer] = []
-        answer_dtos: List[Dict[str, Any]] = []
-        for ans in answers:
-            qid = ans.get("questionId")
-            selected: List[str] = ans.get("selectedOptionIds") or []
-            time_spent = ans.get("timeSpent")
-            correct_ids = set(correct_by_q.get(qid, []))
-            is_correct = set(selected) == correct_ids
-            if is_correct:
-                correct_count += 1
-
-            q_model = q_by_ext.get(qid)
-            if q_model:
-                row = QuizAnswer(
-                    attempt_id=attempt.id,
-                    question_id=q_model.id,
-                    selected_option_ids=json.dumps(selected),
-                    is_correct=is_correct,
-                    time_spent_seconds=time_spent,
-                )
-                answer_rows.append(row)
+        graded = grade_answers(definition, answers)
+        score = graded["score"]
+        completed_at = datetime.utcnow()
+        time_spent = int((completed_at - attempt.started_at).total_seconds()) if attempt.started_at else None
 
-            answer_dtos.append(
-                {
-                    "questionId": qid,
-                    "selectedOptionIds": selected,
-                    "isCorrect": is_correct,
-                    **({"timeSpent": time_spent} if time_spent is not None else {}),
-                }
+        # Persist answers (one multi-row insert) and finalize the attempt in the same transaction
+        if graded["rows"]:
+            await self.session.execute(
+                insert(QuizAnswer), [{"attempt_id": attempt.id, **r} for r in graded["rows"]]
+            )
+        await self.session.execute(
+            update(QuizAttempt)
+            .where(QuizAttempt.id == attempt.id)
+            .values(
+                completed_at=completed_at,
+                time_spent_seconds=time_spent,
+                score_percent=score,
+                passed=graded["passed"],
             )
-
-        # Persist answers
-        for r in answer_rows:
-            self.session.add(r)
-
-        # Finalize attempt
-        attempt.completed_at = datetime.utcnow()
-        attempt.time_spent_seconds = (
-            int((attempt.completed_at - attempt.started_at).total_seconds()) if attempt.started_at else None
         )
-        score = int(round((correct_count / total) * 100))
-        attempt.score_percent = score
-        attempt.passed = score >= (quiz.pass_score or 70)
-        await self.session.flush()
 
-        # Leaderboard entry
-        lb = QuizLeaderboardEntry(
-            quiz_id=quiz.id,
-            user_id=attempt.user_id,
-            score_percent=score,
-            completion_time_seconds=attempt.time_spent_seconds,
-        )
-        self.session.add(lb)
-        await self.session.flush()
+        # Leaderboard: best result per user, persisted by the leaderboard flusher
+        record_quiz_result(self.session, definition["id"], attempt.user_id, score, time_spent)
         await self.session.commit()
 
         # Response
         attempt_dto = {
-            "id": attempt.external_id,
-            "quizId": quiz.external_id,
+            "id": attempt_external_id,
+            "quizId": quiz_external_id,
             "userId": user_external_id,
             "attemptNumber": attempt.attempt_number,
             "startedAt": attempt.started_at.isoformat() + "Z",
-            "completedAt": attempt.completed_at.isoformat() + "Z" if attempt.completed_at else None,
+            "completedAt": completed_at.isoformat() + "Z",
             "score": score,
-            "passed": attempt.passed,
-            "answers": answer_dtos,
+            "passed": graded["passed"],
+            "answers": graded["answers"],
         }
 
         return {
             "attempt": attempt_dto,
-            "correctOptionIdsByQuestion": correct_by_q,
+            "correctOptionIdsByQuestion": definition["correctOptionIds"],
         }
 
     # --------------------------- Leaderboard & history ---------------------------
-    async def leaderboard(self, quiz_external_id: str, limit: int = 20) -> List[Dict[str, Any]]:
-        quiz_id = (
+    async def _quiz_id(self, quiz_external_id: str) -> Optional[int]:
+        definition = quiz_definition_cache.get(quiz_external_id)
+        if definition is not None:
+            return definition["id"]
+        return (
             await self.session.execute(select(Quiz.id).where(Quiz.external_id == quiz_external_id))
         ).scalar_one_or_none()
-        if not quiz_id:
-            return []
 
-        q = (
-            select(QuizLeaderboardEntry, User)
-            .join(User, User.id == QuizLeaderboardEntry.user_id)
-            .where(QuizLeaderboardEntry.quiz_id == quiz_id)
-            .order_by(desc(QuizLeaderboardEntry.score_percent), asc(QuizLeaderboardEntry.completion_time_seconds))
-            .limit(limit)
-        )
-        rows = (await self.session.execute(q)).all()
+    async def _with_users(self, entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Swap internal user ids on board entries for external ids and names."""
+        if not entries:
+            return entries
+        users = {
+            row.id: row
+            for row in (
+                await self.session.execute(
+                    select(User.id, User.external_id, User.name).where(User.id.in_({e["userId"] for e in entries}))
+                )
+            ).all()
+        }
         out = []
-        rank = 1
-        for lb, user in rows:
-            out.append(
-                {
-                    "rank": rank,
-                    "userId": user.external_id,
-                    "username": user.name,
-                    "score": lb.score_percent,
-                    "completionTime": lb.completion_time_seconds,
-                }
-            )
-            rank += 1
+        for e in entries:
+            user = users.get(e["userId"])
+            if user is None:
+                continue
+            out.append({**e, "userId": user.external_id, "username": user.name})
         return out
 
+    async def leaderboard(self, quiz_external_id: str, limit: int = 20) -> List[Dict[str, Any]]:
+        quiz_id = await self._quiz_id(quiz_external_id)
+        if not quiz_id:
+            return []
+        board = await load_leaderboard(self.session, quiz_id)
+        return await self._with_users(board.top(limit))
+
+    async def user_rank(self, quiz_external_id: str, user_external_id: str, window: int = 5) -> Optional[Dict[str, Any]]:
+        """The user's rank on a quiz with up to `window` entries either side; None if the quiz is unknown."""
+        quiz_id = await self._quiz_id(quiz_external_id)
+        if not quiz_id:
+            return None
+        user_id = (
+            await self.session.execute(select(User.id).where(User.external_id == user_external_id))
+        ).scalar_one_or_none()
+        board = await load_leaderboard(self.session, quiz_id)
+        rank = board.rank(user_id) if user_id else None
+        return {
+            "quizId": quiz_external_id,
+            "userId": user_external_id,
+            "rank": rank,
+            "totalEntries": len(board),
+            "around": await self._with_users(board.around(user_id, window)) if rank else [],
+        }
+
     async def user_attempt_history(
         self, user_external_id: str, quiz_external_id: Optional[str] = None, page: int = 1, limit: int = 20
     ) -> List[Dict[str, Any]]:
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Iterable, Optional
+
+from sqlalchemy import select, update, delete, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import Movie, MovieRatingStats, Review, CriticReview
+
+HISTOGRAM_BUCKETS = 11  # whole ratings 0..10
+
+
+def rating_bucket(rating: float) -> int:
+    return min(HISTOGRAM_BUCKETS - 1, max(0, int(rating + 0.5)))
+
+
+def _average(total: float, count: int) -> float | None:
+    return round(total / count, 2) if count else None
+
+
+def _score(total: float, count: int) -> float | None:
+    return round(total / count, 1) if count else None
+
+
+def stats_dto(stats: MovieRatingStats | None) -> dict[str, Any]:
+    if stats is None:
+        return {
+            "reviewCount": 0,
+            "averageRating": None,
+            "ratingDistribution": [0] * HISTOGRAM_BUCKETS,
+            "criticReviewCount": 0,
+            "criticAverageRating": None,
+        }
+    return {
+        "reviewCount": stats.review_count,
+        "averageRating": stats.average_rating,
+        "ratingDistribution": list(stats.histogram or [0] * HISTOGRAM_BUCKETS),
+        "criticReviewCount": stats.critic_review_count,
+        "criticAverageRating": _average(stats.critic_rating_sum, stats.critic_review_count),
+    }
+
+
+class RatingStatsRepository:
+    """
+    Maintains `movie_rating_stats` and the derived `Movie.siddu_score` /
+    `Movie.critics_score`.
+
+    Review repositories call `apply_review` / `apply_critic_review` with the
+    rating leaving and entering the aggregate (None for "not counted") before
+    they commit, so the aggregate moves in the same transaction as the review.
+    `recompute` rebuilds rows from scratch for backfills and repairs.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def _locked(self, movie_id: int) -> MovieRatingStats:
+        # FOR UPDATE on a missing row locks nothing, so create it first; two
+        # concurrent first reviews then queue on the same row
+        await self.session.execute(
+            pg_insert(MovieRatingStats)
+            .values(
+                movie_id=movie_id,
+                review_count=0,
+                rating_sum=0.0,
+                histogram=[0] * HISTOGRAM_BUCKETS,
+                critic_review_count=0,
+                critic_rating_sum=0.0,
+                updated_at=datetime.utcnow(),
+            )
+            .on_conflict_do_nothing(index_elements=[MovieRatingStats.movie_id])
+        )
+        res = await self.session.execute(
+            select(MovieRatingStats).where(MovieRatingStats.movie_id == movie_id).with_for_update()
+        )
+        return res.scalar_one()
+
+    async def apply_review(
+        self, movie_id: int, *, old: Optional[float] = None, new: Optional[float] = None
+    ) -> None:
+        """Move a user review's rating out of (`old`) and/or into (`new`) the aggregate."""
+        if old == new:
+            return
+        stats = await self._locked(movie_id)
+        histogram = list(stats.histogram or [0] * HISTOGRAM_BUCKETS)
+        if old is not None:
+            stats.review_count -= 1
+            stats.rating_sum -= old
+            histogram[rating_bucket(old)] -= 1
+        if new is not None:
+            stats.review_count += 1
+            stats.rating_sum += new
+            histogram[rating_bucket(new)] += 1
+        if stats.review_count <= 0:
+            stats.review_count, stats.rating_sum = 0, 0.0
+        stats.histogram = histogram
+        await self._sync_scores(stats, user=True)
+
+    async def apply_critic_review(
+        self, movie_id: int, *, old: Optional[float] = None, new: Optional[float] = None
+    ) -> None:
+        """Same as `apply_review` for published critic reviews with a numeric rating."""
+        if old == new:
+            return
+        stats = await self._locked(movie_id)
+        if old is not None:
+            stats.critic_review_count -= 1
+            stats.critic_rating_sum -= old
+        if new is not None:
+            stats.critic_review_count += 1
+            stats.critic_rating_sum += new
+        if stats.critic_review_count <= 0:
+            stats.critic_review_count, stats.critic_rating_sum = 0, 0.0
+        await self._sync_scores(stats, critic=True)
+
+    async def _sync_scores(self, stats: MovieRatingStats, *, user: bool = False, critic: bool = False) -> None:
+        """
+        Write the score of each side (`user`, `critic`) whose aggregate moved.
+        Movies never reviewed keep their imported scores; once the last review
+        of a side is gone its score is cleared, as the imported one was
+        overwritten by the first review.
+        """
+        stats.average_rating = _average(stats.rating_sum, stats.review_count)
+        stats.updated_at = datetime.utcnow()
+        values: dict[str, Any] = {}
+        if user:
+            values["siddu_score"] = _score(stats.rating_sum, stats.review_count)
+        if critic:
+            values["critics_score"] = _score(stats.critic_rating_sum, stats.critic_review_count)
+        if values:
+            await self.session.execute(update(Movie).where(Movie.id == stats.movie_id).values(**values))
+        await self.session.flush()
+
+    async def get_many(self, movie_ids: Iterable[int]) -> dict[int, dict[str, Any]]:
+        movie_ids = list(movie_ids)
+        if not movie_ids:
+            return {}
+        res = await self.session.execute(
+            select(MovieRatingStats).where(MovieRatingStats.movie_id.in_(movie_ids))
+        )
+        found = {s.movie_id: s for s in res.scalars().all()}
+        return {mid: stats_dto(found.get(mid)) for mid in movie_ids}
+
+    async def recompute(self, movie_ids: Optional[Iterable[int]] = None) -> int:
+        """
+        Rebuild stats rows (and siddu/critics scores) from `reviews` and
+        `critic_reviews` for `movie_ids`, or for every movie. Returns the number
+        of stats rows written. The caller commits.
+        """
+        scope = list(movie_ids) if movie_ids is not None else None
+
+        bucket = func.floor(Review.rating + 0.5)
+        user_q = select(Review.movie_id, bucket, func.count(), func.sum(Review.rating)).group_by(Review.movie_id, bucket)
+        critic_q = (
+            select(CriticReview.movie_id, func.count(), func.sum(CriticReview.numeric_rating))
+            .where(CriticReview.is_draft == False, CriticReview.numeric_rating.is_not(None))  # noqa: E712
+            .group_by(CriticReview.movie_id)
+        )
+        if scope is not None:
+            user_q = user_q.where(Review.movie_id.in_(scope))
+            critic_q = critic_q.where(CriticReview.movie_id.in_(scope))
+
+        rows: dict[int, dict[str, Any]] = {}
+
+        def row_for(movie_id: int) -> dict[str, Any]:
+            return rows.setdefault(movie_id, {
+                "movie_id": movie_id,
+                "review_count": 0,
+                "rating_sum": 0.0,
+                "histogram": [0] * HISTOGRAM_BUCKETS,
+                "critic_review_count": 0,
+                "critic_rating_sum": 0.0,
+            })
+
+        for movie_id, b, count, total in (await self.session.execute(user_q)).all():
+            row = row_for(movie_id)
+            row["review_count"] += count
+            row["rating_sum"] += float(total or 0)
+            row["histogram"][min(HISTOGRAM_BUCKETS - 1, max(0, int(b or 0)))] += count
+        for movie_id, count, total in (await self.session.execute(critic_q)).all():
+            row = row_for(movie_id)
+            row["critic_review_count"] = count
+            row["critic_rating_sum"] = float(total or 0)
+
+        now = datetime.utcnow()
+        score_updates = []
+        for row in rows.values():
+            row["average_rating"] = _average(row["rating_sum"], row["review_count"])
+            row["updated_at"] = now
+            scores: dict[str, Any] = {}
+            if row["review_count"]:
+                scores["siddu_score"] = _score(row["rating_sum"], row["review_count"])
+            if row["critic_review_count"]:
+                scores["critics_score"] = _score(row["critic_rating_sum"], row["critic_review_count"])
+            if scores:
+                score_updates.append({"id": row["movie_id"], **scores})
+
+        clear = delete(MovieRatingStats)
+        if scope is not None:
+            clear = clear.where(MovieRatingStats.movie_id.in_(scope))
+        await self.session.execute(clear)
+        if rows:
+            await self.session.execute(MovieRatingStats.__table__.insert(), list(rows.values()))
+        # Executemany per distinct key set (some movies only have one of the two scores)
+        for keys in {tuple(sorted(u)) for u in score_updates}:
+            await self.session.execute(update(Movie), [u for u in score_updates if tuple(sorted(u)) == keys])
+        await self.session.flush()
+        return len(rows)
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+from typing import Any, Iterable, Optional
+from sqlalchemy import delete, insert, null, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..config import settings
+from ..models import Movie, MovieReleaseDate
+from ..services.cache import TTLCache
+
+CALENDAR_MAX_DAYS = 92
+
+# Calendar entries of one month, keyed by (region or None, year, month).
+# Writers of release dates clear it; the TTL covers everything else.
+release_calendar_cache = TTLCache(
+    ttl_seconds=settings.release_calendar_cache_ttl_seconds,
+    max_entries=settings.release_calendar_cache_max_entries,
+)
+
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def next_month(day: date) -> date:
+    return (day.replace(day=1) + timedelta(days=32)).replace(day=1)
+
+
+def months_between(start: date, end: date) -> list[date]:
+    """First day of every month overlapping [start, end]."""
+    months = []
+    current = month_start(start)
+    while current <= end:
+        months.append(current)
+        current = next_month(current)
+    return months
+
+
+def bucket_start(day: date, bucket: str) -> date:
+    """The day itself, or the Monday of its week."""
+    return day - timedelta(days=day.weekday()) if bucket == "week" else day
+
+
+def bucket_releases(
+    entries: Iterable[dict[str, Any]], start: date, end: date, bucket: str, types: Optional[list[str]] = None
+) -> list[dict[str, Any]]:
+    """Group calendar entries dated within [start, end] by day or week, oldest first."""
+    buckets: dict[date, list[dict[str, Any]]] = {}
+    for entry in entries:
+        day = entry["releaseDate"]
+        if not start <= day <= end:
+            continue
+        if types and entry["releaseType"] not in types:
+            continue
+        buckets.setdefault(bucket_start(day, bucket), []).append({**entry, "releaseDate": day.isoformat()})
+    return [{"date": d.isoformat(), "releases": buckets[d]} for d in sorted(buckets)]
+
+
+class ReleaseRepository:
+    def __init__(self, session: AsyncSession | None) -> None:
+        self.session = session
+
+    async def replace_release_dates(self, movie_id: int, rows: Iterable[dict[str, Any]]) -> int:
+        """
+        Store a movie's regional release dates (dicts with region, type, date
+        and certification), replacing what was there. The caller commits.
+        """
+        rows = list(rows)
+        await self.session.execute(delete(MovieReleaseDate).where(MovieReleaseDate.movie_id == movie_id))
+        if rows:
+            await self.session.execute(
+                insert(MovieReleaseDate),
+                [
+                    {
+                        "movie_id": movie_id,
+                        "region": r["region"],
+                        "type": r["type"],
+                        "release_date": r["date"],
+                        "certification": r.get("certification"),
+                    }
+                    for r in rows
+                ],
+            )
+        release_calendar_cache.clear()
+        return len(rows)
+
+    async def calendar(
+        self,
+        start: date,
+        end: date,
+        *,
+        region: Optional[str] = None,
+        bucket: str = "day",
+        types: Optional[list[str]] = None,
+    ) -> dict[str, Any]:
+        """
+        Releases dated within [start, end], bucketed by day or week. Without a
+        region the movie's own release_date is used; with one, its regional
+        release dates (optionally only `types`). Whole months are read at a
+        time and cached.
+        """
+        region = region.upper() if region else None
+        months = months_between(start, end)
+        by_month = {m: release_calendar_cache.get((region, m.year, m.month)) for m in months}
+        missing = [m for m, entries in by_month.items() if entries is None]
+        if missing and self.session:
+            fetched = await self._entries(missing[0], next_month(missing[-1]), region)
+            for m in missing:
+                by_month[m] = fetched.get(m, [])
+                release_calendar_cache.set((region, m.year, m.month), by_month[m])
+
+        entries = [e for m in months for e in (by_month[m] or [])]
+        return {
+            "from": start.isoformat(),
+            "to": end.isoformat(),
+            "region": region,
+            "bucket": bucket,
+            "buckets": bucket_releases(entries, start, end, bucket, types if region else None),
+        }
+
+    async def _entries(self, start: date, stop: date, region: Optional[str]) -> dict[date, list[dict[str, Any]]]:
+        """Calendar entries dated in [start, stop), grouped by month."""
+        if region is None:
+            # Served by ix_movies_release_date
+            res = await self.session.execute(
+                select(Movie.external_id, Movie.title, Movie.poster_url, Movie.release_date, null())
+                .where(
+                    Movie.release_date >= datetime.combine(start, datetime.min.time()),
+                    Movie.release_date < datetime.combine(stop, datetime.min.time()),
+                )
+                .order_by(Movie.release_date, Movie.id)
+            )
+        else:
+            # Served by ix_movie_release_dates_region_date
+            res = await self.session.execute(
+                select(
+                    Movie.external_id,
+                    Movie.title,
+                    Movie.poster_url,
+                    MovieReleaseDate.release_date,
+                    MovieReleaseDate.type,
+                )
+                .join(Movie, Movie.id == MovieReleaseDate.movie_id)
+                .where(
+                    MovieReleaseDate.region == region,
+                    MovieReleaseDate.release_date >= start,
+                    MovieReleaseDate.release_date < stop,
+                )
+                .order_by(MovieReleaseDate.release_date, Movie.id, MovieReleaseDate.type)
+            )
+        out: dict[date, list[dict[str, Any]]] = {}
+        for external_id, title, poster_url, released, release_type in res.tuples():
+            day = released.date() if isinstance(released, datetime) else released
+            out.setdefault(month_start(day), []).append({
+                "id": external_id,
+                "title": title,
+                "posterUrl": poster_url,
+                "releaseDate": day,
+                "releaseType": release_type,
+            })
+        return out
@@ -4,13 +4,70 @@ Handles creating, listing, and liking comments on user reviews.
 """
 
 from __future__ import annotations
-from sqlalchemy.orm import selectinload
-from typing import Any, Optional, List
-from sqlalchemy import select, update, and_
+from sqlalchemy.orm import aliased
+from typing import Any, Iterable, Optional, List
+from sqlalchemy import select, update, and_, or_, func, literal, null, true
 from sqlalchemy.ext.asyncio import AsyncSession
+from ..config import settings
 from ..models import ReviewComment, ReviewCommentLike, Review, User
+from ..services.ranking import refresh_review_rank
 import uuid
 
+# Columns carried through the thread CTE
+_THREAD_COLUMNS = (
+    ReviewComment.id,
+    ReviewComment.external_id,
+    ReviewComment.parent_id,
+    ReviewComment.user_id,
+    ReviewComment.content,
+    ReviewComment.created_at,
+    ReviewComment.edited_at,
+    ReviewComment.likes_count,
+)
+
+
+def build_comment_tree(rows: Iterable[Any], limit: int) -> list[dict[str, Any]]:
+    """
+    Assemble thread rows (ordered by depth, then created_at, id) into nested
+    comment dicts in one pass. Only the first `limit` depth-0 rows are kept;
+    rows whose parent was not kept are dropped.
+    """
+    nodes: dict[int, dict[str, Any]] = {}
+    roots: list[dict[str, Any]] = []
+    for row in rows:
+        if row.depth == 0:
+            if len(roots) >= limit:
+                continue
+            siblings = roots
+        else:
+            parent = nodes.get(row.parent_id)
+            if parent is None:
+                continue
+            siblings = parent["replies"]
+        node = {
+            "id": row.external_id,
+            "content": row.content,
+            "createdAt": row.created_at.isoformat() if row.created_at else None,
+            "editedAt": row.edited_at.isoformat() if row.edited_at else None,
+            "author": {
+                "id": row.author_id or "",
+                "username": (row.author_username or row.author_name) if row.author_id else "Unknown",
+                "avatarUrl": row.author_avatar_url or "",
+            },
+            "likes": row.likes_count,
+            "userHasLiked": False,
+            "replyCount": row.reply_count,
+            "replies": [],
+        }
+        siblings.append(node)
+        nodes[row.id] = node
+    for node in nodes.values():
+        replies = node["replies"]
+        node["hasMoreReplies"] = node["replyCount"] > len(replies)
+        # "Load more replies" continues after the last reply shown
+        node["nextReplyCursor"] = replies[-1]["id"] if node["hasMoreReplies"] and replies else None
+    return roots
+
 
 class ReviewCommentRepository:
     def __init__(self, session: AsyncSession):
@@ -56,6 +113,7 @@ class ReviewCommentRepository:
 
             # Update review comment count
             review.comment_count += 1
+            refresh_review_rank(review)
 
             # Flush to persist the comment
             await self.session.flush()
@@ -63,7 +121,7 @@ class ReviewCommentRepository:
             # Refresh with explicit user loading
             await self.session.refresh(comment, attribute_names=['user'])
 
-            return self._format_comment(comment)
+            return self._format_comment(comment, include_replies=False)
         except Exception as e:
             import traceback
             print(f"Error creating comment: {str(e)}")
@@ -76,57 +134,141 @@ class ReviewCommentRepository:
         parent_id: Optional[str] = None,
         page: int = 1,
         limit: int = 50,
+        cursor: Optional[str] = None,
+        viewer_id: Optional[int] = None,
+        max_depth: Optional[int] = None,
+        replies_per_thread: Optional[int] = None,
     ) -> dict[str, Any]:
-        """List comments for a review. If parent_id is None, returns top-level comments."""
-        # Get review
-        review_result = await self.session.execute(
-            select(Review).where(Review.external_id == review_id)
-        )
-        review = review_result.scalar_one_or_none()
-        if not review:
-            raise ValueError(f"Review {review_id} not found")
-
-        # Build query
-        query = select(ReviewComment).where(
-            and_(
-                ReviewComment.review_id == review.id,
-                ReviewComment.is_deleted == False
-            )
-        )
-
+        """
+        List comment threads for a review. If parent_id is None, pages through
+        top-level comments; otherwise through replies to that comment ("load
+        more replies"). `cursor` is the id of the last comment already shown
+        and takes precedence over `page`.
+
+        Each listed comment comes with up to `replies_per_thread` replies per
+        comment, `max_depth` levels deep, fetched with one recursive CTE.
+        """
+        max_depth = settings.review_comment_max_depth if max_depth is None else max_depth
+        per_thread = settings.review_comment_replies_per_thread if replies_per_thread is None else replies_per_thread
+
+        # Resolve the level being paged and its real size in one query
+        level_count = aliased(ReviewComment)
         if parent_id is None:
-            # Top-level comments only
-            query = query.where(ReviewComment.parent_id.is_(None))
+            scope = await self.session.execute(
+                select(
+                    Review.id,
+                    null(),
+                    select(func.count())
+                    .where(
+                        level_count.review_id == Review.id,
+                        level_count.parent_id.is_(None),
+                        level_count.is_deleted == False,
+                    )
+                    .scalar_subquery(),
+                ).where(Review.external_id == review_id)
+            )
+            row = scope.one_or_none()
+            if not row:
+                raise ValueError(f"Review {review_id} not found")
         else:
-            # Replies to a specific comment
-            parent_result = await self.session.execute(
-                select(ReviewComment).where(ReviewComment.external_id == parent_id)
+            scope = await self.session.execute(
+                select(
+                    ReviewComment.review_id,
+                    ReviewComment.id,
+                    select(func.count())
+                    .where(level_count.parent_id == ReviewComment.id, level_count.is_deleted == False)
+                    .scalar_subquery(),
+                ).where(ReviewComment.external_id == parent_id)
             )
-            parent_comment = parent_result.scalar_one_or_none()
-            if not parent_comment:
+            row = scope.one_or_none()
+            if not row:
                 raise ValueError(f"Parent comment {parent_id} not found")
-            query = query.where(ReviewComment.parent_id == parent_comment.id)
-
-        # Order by creation date (oldest first for threading)
-        query = query.order_by(ReviewComment.created_at.asc())
-        query = query.limit(limit).offset((page - 1) * limit)
-        
-        # Explicitly load replies and their authors
-        query = query.options(
-            selectinload(ReviewComment.replies).selectinload(ReviewComment.user),
-            selectinload(ReviewComment.user)
+        review_pk, parent_pk, total = row
+
+        # Page of comments at this level; one extra row tells whether there is more
+        level = select(*_THREAD_COLUMNS, literal(0).label("depth")).where(
+            ReviewComment.review_id == review_pk,
+            ReviewComment.is_deleted == False,
+            ReviewComment.parent_id.is_(None) if parent_pk is None else ReviewComment.parent_id == parent_pk,
+        )
+        if cursor:
+            after = aliased(ReviewComment)
+            after_created = select(after.created_at).where(after.external_id == cursor).scalar_subquery()
+            after_id = select(after.id).where(after.external_id == cursor).scalar_subquery()
+            level = level.where(
+                or_(
+                    ReviewComment.created_at > after_created,
+                    and_(ReviewComment.created_at == after_created, ReviewComment.id > after_id),
+                )
+            )
+        else:
+            level = level.offset((page - 1) * limit)
+        level = level.order_by(ReviewComment.created_at.asc(), ReviewComment.id.asc()).limit(limit + 1).cte("level")
+
+        # Replies: each step takes the first `per_thread` children of every node
+        tree = select(level).cte("thread", recursive=True)
+        children = (
+            select(*_THREAD_COLUMNS)
+            .where(ReviewComment.parent_id == tree.c.id, ReviewComment.is_deleted == False)
+            .order_by(ReviewComment.created_at.asc(), ReviewComment.id.asc())
+            .limit(per_thread)
+            .lateral("child")
+        )
+        tree = tree.union_all(
+            select(*children.c, (tree.c.depth + 1).label("depth"))
+            .select_from(tree)
+            .join(children, true())
+            .where(tree.c.depth < max_depth)
         )
 
-        result = await self.session.execute(query)
-        comments = result.scalars().all()
+        reply_count = aliased(ReviewComment)
+        result = await self.session.execute(
+            select(
+                tree,
+                User.external_id.label("author_id"),
+                User.username.label("author_username"),
+                User.name.label("author_name"),
+                User.avatar_url.label("author_avatar_url"),
+                select(func.count())
+                .where(reply_count.parent_id == tree.c.id, reply_count.is_deleted == False)
+                .scalar_subquery()
+                .label("reply_count"),
+            )
+            .outerjoin(User, User.id == tree.c.user_id)
+            .order_by(tree.c.depth, tree.c.created_at, tree.c.id)
+        )
+        rows = result.all()
+        comments = build_comment_tree(rows, limit)
+
+        has_more = sum(1 for r in rows if r.depth == 0) > limit
+        if viewer_id is not None and rows:
+            liked = await self.liked_comment_ids(viewer_id, [r.id for r in rows])
+            by_external = {r.external_id for r in rows if r.id in liked}
+            stack = list(comments)
+            while stack:
+                node = stack.pop()
+                node["userHasLiked"] = node["id"] in by_external
+                stack.extend(node["replies"])
 
         return {
-            "comments": [self._format_comment(c) for c in comments],
-            "total": len(comments),
+            "comments": comments,
+            "total": total,
             "page": page,
             "limit": limit,
+            "hasMore": has_more,
+            "nextCursor": comments[-1]["id"] if has_more and comments else None,
         }
 
+    async def liked_comment_ids(self, user_id: int, comment_ids: List[int]) -> set[int]:
+        """Internal ids among `comment_ids` that `user_id` has liked."""
+        result = await self.session.execute(
+            select(ReviewCommentLike.comment_id).where(
+                ReviewCommentLike.user_id == user_id,
+                ReviewCommentLike.comment_id.in_(comment_ids),
+            )
+        )
+        return set(result.scalars().all())
+
     async def like_comment(self, comment_id: str, user_id: int) -> dict[str, Any]:
         """Like a comment."""
         # Get comment
@@ -1,15 +1,104 @@
 """
 Repository for review vote operations.
 Handles voting on reviews with automatic count updates.
+
+A vote write is a single statement: the vote upsert/delete runs in a CTE and
+the review counters move by a relative delta in the same UPDATE, so concurrent
+voters never lose increments. `rank_score` and any counter drift are fixed up
+afterwards by `reconcile` (run as a background task, see
+services.vote_reconciliation).
 """
 
 from __future__ import annotations
-from typing import Any, Optional
-from sqlalchemy import select, delete
+from datetime import datetime
+from typing import Any, Iterable, Optional
+from sqlalchemy import Boolean, select, delete, update, func, case, literal, literal_column
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from ..models import ReviewVote, Review
+from ..services.ranking import review_rank_score
 import uuid
 
+VOTE_TYPES = ("helpful", "unhelpful")
+
+
+def vote_delta(column: str, vote_type, inserted):
+    """
+    Change to the `column` ("helpful"/"unhelpful") counter for a vote that was
+    just written: +1 for its own type, -1 for the type it switched away from,
+    0 for the other type of a brand-new vote.
+    """
+    return case(
+        (vote_type == column, 1),
+        (inserted, 0),
+        else_=-1,
+    )
+
+
+def retract_delta(column: str, vote_type):
+    """Change to the `column` counter for a deleted vote of `vote_type`."""
+    return case((vote_type == column, -1), else_=0)
+
+
+def vote_statement(review_id: str, user_id: int, vote_type: str, now: datetime):
+    """The single-statement vote write described in `ReviewVoteRepository.create_or_update_vote`."""
+    source = select(
+        literal(str(uuid.uuid4())),
+        literal(user_id),
+        Review.id,
+        literal(vote_type),
+        literal(now),
+    ).where(Review.external_id == review_id)
+    upsert = pg_insert(ReviewVote).from_select(
+        ["external_id", "user_id", "review_id", "vote_type", "created_at"], source
+    )
+    vote = upsert.on_conflict_do_update(
+        constraint="uq_review_vote_user_review",
+        set_={"vote_type": upsert.excluded.vote_type, "updated_at": now},
+        where=ReviewVote.vote_type != upsert.excluded.vote_type,
+    ).returning(
+        ReviewVote.review_id,
+        ReviewVote.external_id,
+        ReviewVote.vote_type,
+        literal_column("xmax = 0", Boolean).label("inserted"),
+    ).cte("vote")
+    return (
+        update(Review)
+        .where(Review.id == vote.c.review_id)
+        .values(
+            helpful_votes=func.greatest(
+                Review.helpful_votes + vote_delta("helpful", vote.c.vote_type, vote.c.inserted), 0
+            ),
+            unhelpful_votes=func.greatest(
+                Review.unhelpful_votes + vote_delta("unhelpful", vote.c.vote_type, vote.c.inserted), 0
+            ),
+        )
+        .returning(vote.c.external_id, vote.c.vote_type)
+    )
+
+
+def retract_statement(review_id: str, user_id: int):
+    """Same shape as `vote_statement`, with DELETE ... RETURNING in the CTE."""
+    gone = (
+        delete(ReviewVote)
+        .where(
+            ReviewVote.review_id == Review.id,
+            Review.external_id == review_id,
+            ReviewVote.user_id == user_id,
+        )
+        .returning(ReviewVote.review_id, ReviewVote.vote_type)
+        .cte("gone")
+    )
+    return (
+        update(Review)
+        .where(Review.id == gone.c.review_id)
+        .values(
+            helpful_votes=func.greatest(Review.helpful_votes + retract_delta("helpful", gone.c.vote_type), 0),
+            unhelpful_votes=func.greatest(Review.unhelpful_votes + retract_delta("unhelpful", gone.c.vote_type), 0),
+        )
+        .returning(Review.id)
+    )
+
 
 class ReviewVoteRepository:
     def __init__(self, session: AsyncSession):
@@ -17,26 +106,16 @@ class ReviewVoteRepository:
 
     async def get_user_vote(self, review_id: str, user_id: int) -> Optional[dict[str, Any]]:
         """Get a user's vote on a specific review."""
-        # Get review internal ID
-        review_result = await self.session.execute(
-            select(Review).where(Review.external_id == review_id)
-        )
-        review = review_result.scalar_one_or_none()
-        if not review:
-            return None
-
-        # Get vote
         result = await self.session.execute(
-            select(ReviewVote).where(
-                ReviewVote.review_id == review.id,
-                ReviewVote.user_id == user_id
-            )
+            select(ReviewVote.external_id, ReviewVote.vote_type, ReviewVote.created_at)
+            .join(Review, Review.id == ReviewVote.review_id)
+            .where(Review.external_id == review_id, ReviewVote.user_id == user_id)
         )
-        vote = result.scalar_one_or_none()
-        
+        vote = result.one_or_none()
+
         if not vote:
             return None
-            
+
         return {
             "id": vote.external_id,
             "voteType": vote.vote_type,
@@ -49,110 +128,70 @@ class ReviewVoteRepository:
         """
         Create or update a user's vote on a review.
         Automatically updates review vote counts.
+
+        One round trip when the vote changes:
+
+            WITH vote AS (INSERT ... ON CONFLICT (user_id, review_id) DO UPDATE
+                          SET vote_type = ... WHERE vote_type <> excluded.vote_type
+                          RETURNING ..., xmax = 0 AS inserted)
+            UPDATE reviews SET helpful_votes = helpful_votes + delta, ... FROM vote ...
+
+        With only two vote types, "inserted" vs "switched" fully determines the
+        delta. Re-sending the same vote matches no row and falls back to a read.
         """
-        if vote_type not in ["helpful", "unhelpful"]:
+        if vote_type not in VOTE_TYPES:
             raise ValueError("vote_type must be 'helpful' or 'unhelpful'")
 
-        # Get review
-        review_result = await self.session.execute(
-            select(Review).where(Review.external_id == review_id)
-        )
-        review = review_result.scalar_one_or_none()
-        if not review:
-            raise ValueError(f"Review {review_id} not found")
+        stmt = vote_statement(review_id, user_id, vote_type, datetime.utcnow())
+        changed = (await self.session.execute(stmt)).one_or_none()
+        if changed:
+            return {"id": changed.external_id, "voteType": changed.vote_type, "changed": True}
 
-        # Check for existing vote
-        existing_vote_result = await self.session.execute(
-            select(ReviewVote).where(
-                ReviewVote.review_id == review.id,
-                ReviewVote.user_id == user_id
-            )
-        )
-        existing_vote = existing_vote_result.scalar_one_or_none()
-
-        if existing_vote:
-            # Update existing vote
-            old_vote_type = existing_vote.vote_type
-            
-            if old_vote_type == vote_type:
-                # Same vote type - no change needed
-                return {
-                    "id": existing_vote.external_id,
-                    "voteType": existing_vote.vote_type,
-                    "changed": False,
-                }
-            
-            # Different vote type - update counts
-            if old_vote_type == "helpful":
-                review.helpful_votes = max(0, review.helpful_votes - 1)
-                review.unhelpful_votes += 1
-            else:
-                review.unhelpful_votes = max(0, review.unhelpful_votes - 1)
-                review.helpful_votes += 1
-            
-            existing_vote.vote_type = vote_type
-            
-            return {
-                "id": existing_vote.external_id,
-                "voteType": existing_vote.vote_type,
-                "changed": True,
-            }
-        else:
-            # Create new vote
-            vote = ReviewVote(
-                external_id=str(uuid.uuid4()),
-                user_id=user_id,
-                review_id=review.id,
-                vote_type=vote_type,
-            )
-            self.session.add(vote)
-            
-            # Update counts
-            if vote_type == "helpful":
-                review.helpful_votes += 1
-            else:
-                review.unhelpful_votes += 1
-            
-            return {
-                "id": vote.external_id,
-                "voteType": vote.vote_type,
-                "changed": True,
-            }
+        existing = await self.get_user_vote(review_id, user_id)
+        if not existing:
+            raise ValueError(f"Review {review_id} not found")
+        return {"id": existing["id"], "voteType": existing["voteType"], "changed": False}
 
     async def delete_vote(self, review_id: str, user_id: int) -> bool:
         """
         Remove a user's vote from a review.
-        Automatically updates review vote counts.
+        Automatically updates review vote counts (same single-statement shape
+        as `create_or_update_vote`, with DELETE ... RETURNING in the CTE).
         """
-        # Get review
-        review_result = await self.session.execute(
-            select(Review).where(Review.external_id == review_id)
-        )
-        review = review_result.scalar_one_or_none()
-        if not review:
-            return False
-
-        # Get existing vote
-        existing_vote_result = await self.session.execute(
-            select(ReviewVote).where(
-                ReviewVote.review_id == review.id,
-                ReviewVote.user_id == user_id
+        stmt = retract_statement(review_id, user_id)
+        return (await self.session.execute(stmt)).first() is not None
+
+    async def reconcile(self, review_ids: Iterable[str]) -> int:
+        """
+        Recount helpful/unhelpful votes from `review_votes` for the given
+        reviews (external ids) and refresh `rank_score` / `engagement_score`.
+        Returns the number of reviews updated. The caller commits.
+        """
+        review_ids = list(review_ids)
+        if not review_ids:
+            return 0
+
+        def count(vote_type: str):
+            return (
+                select(func.count())
+                .where(ReviewVote.review_id == Review.id, ReviewVote.vote_type == vote_type)
+                .scalar_subquery()
             )
+
+        res = await self.session.execute(
+            update(Review)
+            .where(Review.external_id.in_(review_ids))
+            .values(helpful_votes=count("helpful"), unhelpful_votes=count("unhelpful"))
+            .returning(Review.id, Review.helpful_votes, Review.unhelpful_votes, Review.comment_count, Review.date)
         )
-        existing_vote = existing_vote_result.scalar_one_or_none()
-        
-        if not existing_vote:
-            return False
-        
-        # Update counts
-        if existing_vote.vote_type == "helpful":
-            review.helpful_votes = max(0, review.helpful_votes - 1)
-        else:
-            review.unhelpful_votes = max(0, review.unhelpful_votes - 1)
-        
-        # Delete vote
-        await self.session.execute(
-            delete(ReviewVote).where(ReviewVote.id == existing_vote.id)
-        )
-        
-        return True
+        ranks = [
+            {
+                "id": rid,
+                "rank_score": review_rank_score(helpful, unhelpful, comments or 0, date),
+                "engagement_score": helpful + unhelpful + (comments or 0),
+            }
+            for rid, helpful, unhelpful, comments, date in res.all()
+        ]
+        if ranks:
+            await self.session.execute(update(Review), ranks)
+        return len(ranks)
@@ -3,10 +3,76 @@ from __future__ import annotations
 from typing import Any, List, Optional
 from sqlalchemy import select, desc
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defaultload, noload, selectinload
 from datetime import datetime
 import uuid
 
-from ..models import Review, User, Movie
+from ..models import Review, User, Movie, Genre
+from .fieldsets import FieldSet, Nested
+from .rating_stats import RatingStatsRepository
+from .user_counters import UserCountersRepository
+from ..services.ranking import refresh_review_rank
+
+# Field group -> (loader options when requested, when not requested).
+# Authors and movies are loaded without their own selectin relationships.
+_LIST_LOADERS = {
+    "author": ((selectinload(Review.author).noload("*"),), (noload(Review.author),)),
+    "movie": (
+        (selectinload(Review.movie).noload(Movie.people), defaultload(Review.movie).noload(Movie.curated_by)),
+        (noload(Review.movie),),
+    ),
+    "movie.genres": (
+        (defaultload(Review.movie).selectinload(Movie.genres).noload(Genre.movies),),
+        (defaultload(Review.movie).noload(Movie.genres),),
+    ),
+}
+
+_LIST_COLUMNS = {
+    "title": [Review.title],
+    "content": [Review.content],
+    "rating": [Review.rating],
+    "date": [Review.date],
+    "hasSpoilers": [Review.has_spoilers],
+    "isVerified": [Review.is_verified],
+    "helpfulVotes": [Review.helpful_votes],
+    "unhelpfulVotes": [Review.unhelpful_votes],
+    "commentCount": [Review.comment_count],
+    "engagementScore": [Review.engagement_score],
+    "mediaUrls": [Review.media_urls],
+    "gifUrl": [Review.gif_url],
+    "author": [Review.user_id],
+    "movie": [Review.movie_id],
+}
+
+_LIST_FIELDS = {
+    "id": lambda r: r.external_id,
+    "title": lambda r: r.title,
+    "content": lambda r: r.content,
+    "rating": lambda r: r.rating,
+    "date": lambda r: r.date.isoformat(),
+    "hasSpoilers": lambda r: r.has_spoilers,
+    "isVerified": lambda r: r.is_verified,
+    "helpfulVotes": lambda r: r.helpful_votes,
+    "unhelpfulVotes": lambda r: r.unhelpful_votes,
+    "commentCount": lambda r: r.comment_count,
+    "engagementScore": lambda r: r.engagement_score,
+    "mediaUrls": lambda r: r.media_urls.split(",") if r.media_urls else [],
+    "gifUrl": lambda r: r.gif_url,
+    "author": Nested(lambda r: r.author, {
+        "id": lambda u: u.external_id,
+        "name": lambda u: u.name,
+        "avatarUrl": lambda u: u.avatar_url,
+    }),
+    "movie": Nested(lambda r: r.movie, {
+        "id": lambda m: m.external_id,
+        "title": lambda m: m.title,
+        "posterUrl": lambda m: m.poster_url,
+        "year": lambda m: int(m.year) if m.year else None,
+        "genres": lambda m: [g.name for g in m.genres],
+        "country": lambda m: m.country,
+        "language": lambda m: m.language,
+    }),
+}
 
 
 class ReviewRepository:
@@ -21,10 +87,15 @@ class ReviewRepository:
         movie_id: str | None = None,
         user_id: str | None = None,
         sort_by: str = "date_desc",
+        fields: FieldSet | None = None,
     ) -> List[dict[str, Any]]:
         if not self.session:
             return []
-        q = select(Review)
+        fields = fields or FieldSet()
+        q = select(Review).options(
+            *fields.loader_options(_LIST_LOADERS),
+            *fields.load_only([Review.id, Review.external_id], _LIST_COLUMNS),
+        )
         if movie_id:
             q = q.join(Review.movie).where(Movie.external_id == movie_id)
         if user_id:
@@ -39,60 +110,29 @@ class ReviewRepository:
         elif sort_by == "rating_asc":
             q = q.order_by(Review.rating)
         elif sort_by == "helpful_desc":
-            q = q.order_by(desc(Review.helpful_votes))
+            q = q.order_by(desc(Review.rank_score), desc(Review.id))
 
         q = q.limit(limit).offset((page - 1) * limit)
         res = await self.session.execute(q)
         reviews = res.scalars().all()
-        return [
-            {
-                "id": r.external_id,
-                "title": r.title,
-                "content": r.content,
-                "rating": r.rating,
-                "date": r.date.isoformat(),
-                "hasSpoilers": r.has_spoilers,
-                "isVerified": r.is_verified,
-                "helpfulVotes": r.helpful_votes,
-                "unhelpfulVotes": r.unhelpful_votes,
-                "commentCount": r.comment_count,
-                "engagementScore": r.engagement_score,
-                "mediaUrls": r.media_urls.split(",") if r.media_urls else [],
-                "gifUrl": r.gif_url,
-                "author": {
-                    "id": r.author.external_id,
-                    "name": r.author.name,
-                    "avatarUrl": r.author.avatar_url,
-                },
-                "movie": {
-                    "id": r.movie.external_id,
-                    "title": r.movie.title,
-                    "posterUrl": r.movie.poster_url,
-                    "year": int(r.movie.year) if r.movie.year else None,
-                    "genres": [g.name for g in r.movie.genres],
-                    "country": r.movie.country,
-                    "language": r.movie.language,
-                },
-            }
-            for r in reviews
-        ]
+        return [fields.build(r, _LIST_FIELDS) for r in reviews]
 
-    async def get(self, external_id: str) -> dict[str, Any] | None:
+    async def get(self, external_id: str, fields: FieldSet | None = None) -> dict[str, Any] | None:
         if not self.session:
             return None
+        fields = fields or FieldSet()
         q = select(Review).where(Review.external_id == external_id)
         res = await self.session.execute(q)
         r = res.scalar_one_or_none()
         if not r:
             return None
 
-        # Get reviewer stats
-        reviewer_reviews_count = await self.session.execute(
-            select(Review).where(Review.user_id == r.user_id)
-        )
-        total_reviews = len(reviewer_reviews_count.scalars().all())
+        # Reviewer stats come from the denormalized counters row
+        counters = {"reviews": 0, "followers": 0}
+        if fields.wants_any("reviewer.totalReviews", "reviewer.followerCount"):
+            counters = await UserCountersRepository(self.session).get(r.user_id)
 
-        return {
+        return fields.prune({
             "id": r.external_id,
             "title": r.title,
             "content": r.content,
@@ -111,8 +151,8 @@ class ReviewRepository:
                 "username": r.author.name,
                 "avatarUrl": r.author.avatar_url,
                 "isVerifiedReviewer": r.is_verified,
-                "totalReviews": total_reviews,
-                "followerCount": 0,  # TODO: Implement followers system
+                "totalReviews": counters["reviews"],
+                "followerCount": counters["followers"],
             },
             "movie": {
                 "id": r.movie.external_id,
@@ -131,7 +171,7 @@ class ReviewRepository:
                 "userHasLiked": False,  # TODO: Implement user-specific like tracking
             },
             "comments": [],  # TODO: Implement comments system
-        }
+        })
 
     async def create(
         self,
@@ -179,8 +219,11 @@ class ReviewRepository:
             engagement_score=0,
             gif_url=gif_url,
         )
+        refresh_review_rank(review)
         self.session.add(review)
         await self.session.flush()
+        await RatingStatsRepository(self.session).apply_review(movie.id, new=review.rating)
+        await UserCountersRepository(self.session).bump(user.id, reviews=1)
 
         return {
             "id": review.external_id,
@@ -226,6 +269,8 @@ class ReviewRepository:
         if review.user_id != user_id:
             raise ValueError("User does not own this review")
 
+        old_rating = review.rating
+
         # Update fields
         if title is not None:
             review.title = title
@@ -241,6 +286,7 @@ class ReviewRepository:
             review.gif_url = gif_url
 
         await self.session.flush()
+        await RatingStatsRepository(self.session).apply_review(review.movie_id, old=old_rating, new=review.rating)
 
         return {
             "id": review.external_id,
@@ -270,5 +316,7 @@ class ReviewRepository:
 
         await self.session.delete(review)
         await self.session.flush()
+        await RatingStatsRepository(self.session).apply_review(review.movie_id, old=review.rating)
+        await UserCountersRepository(self.session).bump(review.user_id, reviews=-1)
         return True
 
@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Iterable, Optional
+from sqlalchemy import and_, delete, func, insert, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from ..models import Genre, Movie, MovieStreamingOption, StreamingPlatform, movie_genres
+
+BROWSE_PAGE_SIZE = 24
+
+so = MovieStreamingOption
+
+
+def plan_option_changes(
+    existing: Iterable[tuple[int, tuple]], wanted: dict[tuple, dict[str, Any]]
+) -> tuple[list[int], list[tuple[int, tuple]], list[tuple]]:
+    """
+    Diff a movie's stored offers, as (row id, key) pairs, against the wanted
+    offers by (platform_id, region, type, quality) key. Returns (row ids to
+    delete, (row id, key) pairs to update, keys to insert).
+    """
+    stale: list[int] = []
+    kept: list[tuple[int, tuple]] = []
+    seen: set[tuple] = set()
+    for row_id, key in existing:
+        if key in wanted and key not in seen:
+            kept.append((row_id, key))
+            seen.add(key)
+        else:
+            stale.append(row_id)
+    return stale, kept, [k for k in wanted if k not in seen]
+
+
+class StreamingRepository:
+    def __init__(self, session: AsyncSession | None) -> None:
+        self.session = session
+
+    async def platforms(self, names: Iterable[str]) -> dict[str, StreamingPlatform]:
+        """Platforms by case-insensitive name, creating the missing ones."""
+        wanted = {n.lower(): n for n in names}
+        if not wanted:
+            return {}
+        res = await self.session.execute(
+            select(StreamingPlatform).where(func.lower(StreamingPlatform.name).in_(wanted))
+        )
+        found = {p.name.lower(): p for p in res.scalars()}
+        for key, name in wanted.items():
+            if key not in found:
+                plat = StreamingPlatform(external_id=key, name=name, logo_url=None, website_url=None)
+                self.session.add(plat)
+                found[key] = plat
+        await self.session.flush()
+        return found
+
+    async def replace_options(self, movie: Movie, options: Iterable[dict[str, Any]]) -> dict[str, int]:
+        """
+        Make `options` (dicts with platform, region, type, price, quality, url)
+        the movie's streaming offers, one per platform, region, type and
+        quality (e.g. buy HD and buy 4K are separate offers). Offers that are
+        still listed keep their row and `added_at`, so "new on" browsing only
+        sees real additions. The caller commits.
+        """
+        options = list(options)
+        plats = await self.platforms((o.get("platform") or "unknown") for o in options)
+        wanted: dict[tuple, dict[str, Any]] = {}
+        for o in options:
+            plat = plats[(o.get("platform") or "unknown").lower()]
+            key = (plat.id, o.get("region") or "XX", o.get("type") or "subscription", o.get("quality") or None)
+            wanted[key] = {
+                "price": str(o["price"]) if o.get("price") is not None else None,
+                "url": o.get("url"),
+                "verified": True,
+            }
+
+        res = await self.session.execute(
+            select(so.id, so.platform_id, so.region, so.type, so.quality).where(so.movie_id == movie.id)
+        )
+        existing = [(row_id, (p, r, t, q)) for row_id, p, r, t, q in res.tuples()]
+        stale, kept, new = plan_option_changes(existing, wanted)
+
+        if stale:
+            await self.session.execute(delete(so).where(so.id.in_(stale)))
+        if kept:
+            await self.session.execute(update(so), [{"id": row_id, **wanted[key]} for row_id, key in kept])
+        if new:
+            platform_ext = {p.id: p.external_id for p in plats.values()}
+            now = datetime.utcnow()
+            await self.session.execute(
+                insert(so),
+                [
+                    {
+                        "external_id": f"{movie.external_id}-{platform_ext[key[0]]}-{key[1]}-{key[2]}-{key[3] or 'any'}",
+                        "movie_id": movie.id,
+                        "platform_id": key[0],
+                        "region": key[1],
+                        "type": key[2],
+                        "quality": key[3],
+                        "added_at": now,
+                        **wanted[key],
+                    }
+                    for key in new
+                ],
+            )
+        return {"added": len(new), "updated": len(kept), "removed": len(stale)}
+
+    async def browse(
+        self,
+        platform: str,
+        region: str,
+        *,
+        types: Optional[list[str]] = None,
+        genre: Optional[str] = None,
+        language: Optional[str] = None,
+        sort: str = "new",
+        cursor: Optional[str] = None,
+        limit: int = BROWSE_PAGE_SIZE,
+    ) -> dict[str, Any] | None:
+        """
+        Movies available on `platform` (external id) in `region`, optionally
+        narrowed to offer `types` and catalog filters. sort="new" lists the
+        most recently added offers first, "title" is alphabetical. `cursor` is
+        the id of the last movie already shown.
+        """
+        if not self.session:
+            return None
+        res = await self.session.execute(
+            select(StreamingPlatform.id, StreamingPlatform.external_id, StreamingPlatform.name, StreamingPlatform.logo_url)
+            .where(StreamingPlatform.external_id == platform)
+        )
+        plat = res.one_or_none()
+        if not plat:
+            return None
+        region = region.upper()
+
+        def on_platform(opt):
+            conds = [opt.platform_id == plat.id, opt.region == region]
+            if types:
+                conds.append(opt.type.in_(types))
+            return conds
+
+        # One row per movie, served by the (platform_id, region, type, movie_id) index
+        offers = (
+            select(so.movie_id, func.max(so.added_at).label("added_at"))
+            .where(*on_platform(so))
+            .group_by(so.movie_id)
+            .subquery()
+        )
+        q = select(
+            Movie.id, Movie.external_id, Movie.title, Movie.year, Movie.poster_url, offers.c.added_at
+        ).join(offers, offers.c.movie_id == Movie.id)
+        if genre:
+            q = q.where(
+                Movie.id.in_(
+                    select(movie_genres.c.movie_id)
+                    .join(Genre, Genre.id == movie_genres.c.genre_id)
+                    .where(Genre.slug == genre)
+                )
+            )
+        if language:
+            q = q.where(Movie.language == language)
+
+        if cursor:
+            after = aliased(Movie)
+            after_id = select(after.id).where(after.external_id == cursor).scalar_subquery()
+            if sort == "title":
+                after_title = select(after.title).where(after.external_id == cursor).scalar_subquery()
+                q = q.where(or_(Movie.title > after_title, and_(Movie.title == after_title, Movie.id > after_id)))
+            else:
+                cur = aliased(MovieStreamingOption)
+                after_added = (
+                    select(func.max(cur.added_at)).where(cur.movie_id == after_id, *on_platform(cur)).scalar_subquery()
+                )
+                q = q.where(
+                    or_(
+                        offers.c.added_at < after_added,
+                        and_(offers.c.added_at == after_added, Movie.id < after_id),
+                    )
+                )
+        if sort == "title":
+            q = q.order_by(Movie.title.asc(), Movie.id.asc())
+        else:
+            q = q.order_by(offers.c.added_at.desc(), Movie.id.desc())
+        rows = (await self.session.execute(q.limit(limit + 1))).all()
+        page = rows[:limit]
+
+        details: dict[int, list[dict[str, Any]]] = {r.id: [] for r in page}
+        if page:
+            res = await self.session.execute(
+                select(so.movie_id, so.type, so.price, so.quality, so.url)
+                .where(so.movie_id.in_(details), *on_platform(so))
+                .order_by(so.movie_id, so.type, so.quality)
+            )
+            for movie_id, type_, price, quality, url in res.tuples():
+                details[movie_id].append({"type": type_, "price": price, "quality": quality, "url": url})
+
+        return {
+            "platform": {"id": plat.external_id, "name": plat.name, "logoUrl": plat.logo_url},
+            "region": region,
+            "items": [
+                {
+                    "id": r.external_id,
+                    "title": r.title,
+                    "year": r.year,
+                    "posterUrl": r.poster_url,
+                    "addedAt": r.added_at.isoformat() if r.added_at else None,
+                    "offers": details[r.id],
+                }
+                for r in page
+            ],
+            "nextCursor": page[-1].external_id if len(rows) > limit else None,
+        }
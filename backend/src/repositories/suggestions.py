@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import math
+from datetime import datetime, timedelta
+from typing import Any, Optional
+
+from sqlalchemy import select, delete, func, union_all, exists
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased, noload
+
+from ..config import settings
+from ..models import User, UserCounters, UserFollow, UserSettings, UserSuggestion, Review, Watchlist, movie_genres
+from .user_counters import counters_dto
+
+# Signal weights, applied to log1p of each raw count so one very strong
+# signal cannot drown the others.
+MUTUAL_WEIGHT = 3.0
+CO_REVIEW_WEIGHT = 2.0
+GENRE_WEIGHT = 1.0
+TOP_GENRES = 3
+
+_REASONS = {
+    "mutual": "mutual_follows",
+    "co_review": "co_reviewer",
+    "genre": "genre_affinity",
+}
+_WEIGHTS = {"mutual": MUTUAL_WEIGHT, "co_review": CO_REVIEW_WEIGHT, "genre": GENRE_WEIGHT}
+
+
+def rank_candidates(signals: dict[int, dict[str, int]], limit: int) -> list[dict[str, Any]]:
+    """
+    Score raw per-candidate signal counts ({candidate_id: {"mutual": n,
+    "co_review": n, "genre": n}}) and return the best `limit`, each with the
+    strongest signal as its reason.
+    """
+    ranked = []
+    for candidate_id, counts in signals.items():
+        parts = {k: w * math.log1p(counts.get(k, 0)) for k, w in _WEIGHTS.items()}
+        score = sum(parts.values())
+        if score <= 0:
+            continue
+        ranked.append({
+            "candidate_id": candidate_id,
+            "score": round(score, 6),
+            "mutual_count": counts.get("mutual", 0),
+            "reason": _REASONS[max(parts, key=parts.get)],
+        })
+    ranked.sort(key=lambda c: (-c["score"], c["candidate_id"]))
+    return ranked[:limit]
+
+
+def suggestion_dto(user: User, counters: UserCounters | None, mutual_count: int = 0, reason: str | None = None) -> dict[str, Any]:
+    username = user.username
+    if not username:
+        username = user.email.split("@")[0] if "@" in user.email else user.email
+    return {
+        "id": user.external_id,
+        "username": username,
+        "name": user.name,
+        "bio": user.bio,
+        "avatarUrl": user.avatar_url,
+        "bannerUrl": user.banner_url,
+        "joinedDate": user.created_at.strftime("%B %Y"),
+        "location": user.location,
+        "website": user.website,
+        "stats": counters_dto(counters),
+        "isVerified": False,
+        "mutualCount": mutual_count,
+        "reason": reason,
+    }
+
+
+class UserSuggestionRepository:
+    """
+    "Who to follow" candidates stored in `user_suggestions`.
+
+    `refresh` rebuilds a user's candidates from friends-of-friends
+    (`user_follows`), co-reviewers (same movies reviewed) and genre affinity
+    (top genres across the user's reviews and watchlist). It runs off the
+    request path (services.suggestions); `list` only reads the stored ranking
+    and hydrates profiles and counters for the whole page in one query.
+    Users with a private profile are never suggested.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    def _not_followed_by(self, user_id: int, candidate_col):
+        return ~exists().where(UserFollow.follower_id == user_id, UserFollow.following_id == candidate_col)
+
+    def _not_private(self, candidate_col):
+        # Users without settings (or without the key) are public
+        return ~exists().where(
+            UserSettings.user_id == candidate_col,
+            func.jsonb_extract_path_text(UserSettings.privacy, "profileVisibility") == "private",
+        )
+
+    async def list(self, user_id: int, limit: int) -> tuple[list[dict[str, Any]], bool]:
+        """Stored suggestions still worth showing, and whether they need a refresh."""
+        res = await self.session.execute(
+            select(UserSuggestion, User, UserCounters)
+            .join(User, User.id == UserSuggestion.candidate_id)
+            .outerjoin(UserCounters, UserCounters.user_id == UserSuggestion.candidate_id)
+            .where(
+                UserSuggestion.user_id == user_id,
+                self._not_followed_by(user_id, UserSuggestion.candidate_id),
+                self._not_private(UserSuggestion.candidate_id),
+            )
+            .order_by(UserSuggestion.score.desc(), UserSuggestion.candidate_id)
+            .limit(limit)
+            .options(noload("*"))
+        )
+        rows = res.all()
+        cutoff = datetime.utcnow() - timedelta(seconds=settings.user_suggestions_ttl_seconds)
+        stale = not rows or any(s.computed_at < cutoff for s, _, _ in rows)
+        return [suggestion_dto(u, c, s.mutual_count, s.reason) for s, u, c in rows], stale
+
+    async def popular(self, limit: int, exclude_user_id: Optional[int] = None) -> list[dict[str, Any]]:
+        """Most-followed users; used before a user has stored suggestions and for anonymous visitors."""
+        q = (
+            select(User, UserCounters)
+            .outerjoin(UserCounters, UserCounters.user_id == User.id)
+            .where(self._not_private(User.id))
+            .order_by(UserCounters.followers.desc().nulls_last(), User.id)
+            .limit(limit)
+            .options(noload("*"))
+        )
+        if exclude_user_id is not None:
+            q = q.where(User.id != exclude_user_id, self._not_followed_by(exclude_user_id, User.id))
+        res = await self.session.execute(q)
+        return [suggestion_dto(u, c, reason="popular") for u, c in res.all()]
+
+    async def _signals(self, user_id: int, per_signal: int) -> dict[int, dict[str, int]]:
+        signals: dict[int, dict[str, int]] = {}
+
+        def add(rows, key: str) -> None:
+            for candidate_id, count in rows:
+                signals.setdefault(candidate_id, {})[key] = count
+
+        # Friends of friends: followees of my followees
+        mine, theirs = aliased(UserFollow), aliased(UserFollow)
+        n = func.count()
+        add((await self.session.execute(
+            select(theirs.following_id, n)
+            .select_from(mine)
+            .join(theirs, theirs.follower_id == mine.following_id)
+            .where(mine.follower_id == user_id, theirs.following_id != user_id)
+            .group_by(theirs.following_id)
+            .order_by(n.desc())
+            .limit(per_signal)
+        )).all(), "mutual")
+
+        # Co-reviewers: distinct movies we both reviewed
+        me, other = aliased(Review), aliased(Review)
+        shared = func.count(func.distinct(other.movie_id))
+        add((await self.session.execute(
+            select(other.user_id, shared)
+            .select_from(me)
+            .join(other, other.movie_id == me.movie_id)
+            .where(me.user_id == user_id, other.user_id != user_id)
+            .group_by(other.user_id)
+            .order_by(shared.desc())
+            .limit(per_signal)
+        )).all(), "co_review")
+
+        # Genre affinity: reviewers of my top genres (from reviews + watchlist)
+        my_movies = union_all(
+            select(Review.movie_id.label("movie_id")).where(Review.user_id == user_id),
+            select(Watchlist.movie_id.label("movie_id")).where(Watchlist.user_id == user_id),
+        ).subquery()
+        top_genres = (
+            select(movie_genres.c.genre_id)
+            .join(my_movies, my_movies.c.movie_id == movie_genres.c.movie_id)
+            .group_by(movie_genres.c.genre_id)
+            .order_by(func.count().desc())
+            .limit(TOP_GENRES)
+        )
+        add((await self.session.execute(
+            select(Review.user_id, n)
+            .join(movie_genres, movie_genres.c.movie_id == Review.movie_id)
+            .where(movie_genres.c.genre_id.in_(top_genres), Review.user_id != user_id)
+            .group_by(Review.user_id)
+            .order_by(n.desc())
+            .limit(per_signal)
+        )).all(), "genre")
+
+        return signals
+
+    async def refresh(self, user_id: int) -> int:
+        """Recompute and store `user_id`'s ranked candidates. Returns how many were stored. The caller commits."""
+        limit = settings.user_suggestions_max_candidates
+        signals = await self._signals(user_id, per_signal=limit * 4)
+
+        followed = await self.session.execute(select(UserFollow.following_id).where(UserFollow.follower_id == user_id))
+        for candidate_id in followed.scalars().all():
+            signals.pop(candidate_id, None)
+        ranked = rank_candidates(signals, limit)
+
+        now = datetime.utcnow()
+        await self.session.execute(delete(UserSuggestion).where(UserSuggestion.user_id == user_id))
+        if ranked:
+            await self.session.execute(
+                UserSuggestion.__table__.insert(),
+                [{"user_id": user_id, "computed_at": now, **c} for c in ranked],
+            )
+        await self.session.flush()
+        return len(ranked)
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Iterable, Optional
+
+from sqlalchemy import select, delete, case, func, literal
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import UserCounters, Review, UserFollow, Watchlist, Favorite, Collection, Pulse
+
+COUNTER_FIELDS = ("reviews", "followers", "following", "watchlist", "favorites", "collections", "pulses")
+
+
+def counters_dto(row: UserCounters | None) -> dict[str, int]:
+    if row is None:
+        return {f: 0 for f in COUNTER_FIELDS}
+    return {f: getattr(row, f) or 0 for f in COUNTER_FIELDS}
+
+
+class UserCountersRepository:
+    """
+    Maintains `user_counters`, one row of profile counts per user.
+
+    Write paths call `bump` before they commit so the counter moves in the same
+    transaction as the row it counts. `bump` is a single upsert with relative
+    deltas, so concurrent writers never overwrite each other. `recompute`
+    rebuilds rows from the source tables for backfills and repairs.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def bump(self, user_id: int, **deltas: int) -> None:
+        """Add `deltas` (e.g. `reviews=1`, `followers=-1`) to a user's counters, floored at 0."""
+        deltas = {k: v for k, v in deltas.items() if v}
+        unknown = set(deltas) - set(COUNTER_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown counter(s): {', '.join(sorted(unknown))}")
+        if not deltas:
+            return
+        now = datetime.utcnow()
+        table = UserCounters.__table__
+        stmt = pg_insert(table).values(
+            user_id=user_id,
+            updated_at=now,
+            **{f: max(deltas.get(f, 0), 0) for f in COUNTER_FIELDS},
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.user_id],
+            set_={
+                **{
+                    f: case((table.c[f] + d < 0, literal(0)), else_=table.c[f] + d)
+                    for f, d in deltas.items()
+                },
+                "updated_at": now,
+            },
+        )
+        await self.session.execute(stmt)
+
+    async def get(self, user_id: int) -> dict[str, int]:
+        res = await self.session.execute(select(UserCounters).where(UserCounters.user_id == user_id))
+        return counters_dto(res.scalar_one_or_none())
+
+    async def get_many(self, user_ids: Iterable[int]) -> dict[int, dict[str, int]]:
+        user_ids = list(user_ids)
+        if not user_ids:
+            return {}
+        res = await self.session.execute(select(UserCounters).where(UserCounters.user_id.in_(user_ids)))
+        found = {row.user_id: row for row in res.scalars().all()}
+        return {uid: counters_dto(found.get(uid)) for uid in user_ids}
+
+    async def recompute(self, user_ids: Optional[Iterable[int]] = None) -> int:
+        """
+        Rebuild counter rows from the source tables for `user_ids`, or for
+        every user with at least one counted row. Returns the number of rows
+        written. The caller commits.
+        """
+        scope = list(user_ids) if user_ids is not None else None
+
+        sources: list[tuple[str, Any, Any]] = [
+            ("reviews", Review.user_id, None),
+            ("followers", UserFollow.following_id, None),
+            ("following", UserFollow.follower_id, None),
+            ("watchlist", Watchlist.user_id, None),
+            ("favorites", Favorite.user_id, Favorite.type == "movie"),
+            ("collections", Collection.user_id, None),
+            ("pulses", Pulse.user_id, None),
+        ]
+        rows: dict[int, dict[str, Any]] = {}
+        for field, user_col, condition in sources:
+            q = select(user_col, func.count()).group_by(user_col)
+            if condition is not None:
+                q = q.where(condition)
+            if scope is not None:
+                q = q.where(user_col.in_(scope))
+            for uid, count in (await self.session.execute(q)).all():
+                row = rows.setdefault(uid, {"user_id": uid, **{f: 0 for f in COUNTER_FIELDS}})
+                row[field] = count
+
+        now = datetime.utcnow()
+        for row in rows.values():
+            row["updated_at"] = now
+
+        clear = delete(UserCounters)
+        if scope is not None:
+            clear = clear.where(UserCounters.user_id.in_(scope))
+        await self.session.execute(clear)
+        if rows:
+            await self.session.execute(UserCounters.__table__.insert(), list(rows.values()))
+        await self.session.flush()
+        return len(rows)
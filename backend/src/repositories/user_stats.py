@@ -2,10 +2,20 @@ from __future__ import annotations
 
 from datetime import datetime, date, timedelta
 from typing import Any, Dict, List
-from sqlalchemy import select, func, and_
+from sqlalchemy import select, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..models import UserDailyStats, User
+from ..models import UserDailyStats
+from ..services.daily_stats import (
+    STAT_FIELDS,
+    daily_stats_buffer,
+    load_rolling_stats,
+    merge_pending,
+    record_stat_increment,
+    rolling_window,
+)
+
+_ZERO = (0,) * len(STAT_FIELDS)
 
 
 class UserStatsRepository:
@@ -17,24 +27,8 @@ class UserStatsRepository:
     async def get_todays_stats(self, user_id: int) -> Dict[str, Any]:
         """Get today's activity stats for a user"""
         today = date.today()
-        
-        stmt = select(UserDailyStats).where(
-            UserDailyStats.user_id == user_id,
-            UserDailyStats.date == today
-        )
-        stats = (await self.session.execute(stmt)).scalar_one_or_none()
-        
-        if not stats:
-            # Return zeros if no stats exist yet
-            return {
-                "date": today.isoformat(),
-                "pulsesPosted": 0,
-                "likesReceived": 0,
-                "newFollowers": 0,
-                "commentsReceived": 0
-            }
-        
-        return self._stats_to_dto(stats)
+        days = await self._days(user_id, today, today)
+        return _day_to_dto(today, days.get(today, _ZERO))
 
     async def get_weekly_stats(self, user_id: int) -> Dict[str, Any]:
         """Get last 7 days of activity stats"""
@@ -57,43 +51,32 @@ class UserStatsRepository:
         end_date: date
     ) -> Dict[str, Any]:
         """Get aggregated stats for a date range"""
-        stmt = select(
-            func.sum(UserDailyStats.pulses_posted).label('total_pulses'),
-            func.sum(UserDailyStats.likes_received).label('total_likes'),
-            func.sum(UserDailyStats.new_followers).label('total_followers'),
-            func.sum(UserDailyStats.comments_received).label('total_comments')
-        ).where(
-            and_(
-                UserDailyStats.user_id == user_id,
-                UserDailyStats.date >= start_date,
-                UserDailyStats.date <= end_date
+        days = await self._days(user_id, start_date, end_date)
+        return stats_range_dto(start_date, end_date, days)
+
+    async def _days(self, user_id: int, start_date: date, end_date: date) -> Dict[date, tuple]:
+        """
+        Daily counts in [start_date, end_date] including increments not yet
+        flushed by this process. Ranges inside the rolling window are served
+        from the per-user cache; older ranges go to the table.
+        """
+        window_start, window_end = rolling_window()
+        if window_start <= start_date and end_date <= window_end:
+            days = await load_rolling_stats(self.session, user_id)
+        else:
+            res = await self.session.execute(
+                select(UserDailyStats.date, *[getattr(UserDailyStats, f) for f in STAT_FIELDS])
+                .where(
+                    and_(
+                        UserDailyStats.user_id == user_id,
+                        UserDailyStats.date >= start_date,
+                        UserDailyStats.date <= end_date
+                    )
+                )
             )
-        )
-        
-        result = (await self.session.execute(stmt)).first()
-        
-        # Get daily breakdown
-        daily_stmt = select(UserDailyStats).where(
-            and_(
-                UserDailyStats.user_id == user_id,
-                UserDailyStats.date >= start_date,
-                UserDailyStats.date <= end_date
-            )
-        ).order_by(UserDailyStats.date)
-        
-        daily_stats = (await self.session.execute(daily_stmt)).scalars().all()
-        
-        return {
-            "startDate": start_date.isoformat(),
-            "endDate": end_date.isoformat(),
-            "totals": {
-                "pulsesPosted": int(result.total_pulses or 0),
-                "likesReceived": int(result.total_likes or 0),
-                "newFollowers": int(result.total_followers or 0),
-                "commentsReceived": int(result.total_comments or 0)
-            },
-            "daily": [self._stats_to_dto(s) for s in daily_stats]
-        }
+            days = {row[0]: tuple(int(v or 0) for v in row[1:]) for row in res.all()}
+        days = merge_pending(days, daily_stats_buffer.pending(user_id))
+        return {d: v for d, v in days.items() if start_date <= d <= end_date}
 
     # ==================== UPDATE STATS ====================
 
@@ -114,43 +97,36 @@ class UserStatsRepository:
         await self._increment_stat(user_id, "comments_received", increment)
 
     async def _increment_stat(self, user_id: int, field: str, increment: int = 1) -> None:
-        """Helper to increment a specific stat field"""
-        today = date.today()
-        
-        # Try to find existing stats for today
-        stmt = select(UserDailyStats).where(
-            UserDailyStats.user_id == user_id,
-            UserDailyStats.date == today
-        )
-        stats = (await self.session.execute(stmt)).scalar_one_or_none()
-        
-        if not stats:
-            # Create new stats entry for today
-            stats = UserDailyStats(
-                user_id=user_id,
-                date=today,
-                pulses_posted=0,
-                likes_received=0,
-                new_followers=0,
-                comments_received=0
-            )
-            self.session.add(stats)
-            await self.session.flush()
-        
-        # Increment the specified field
-        current_value = getattr(stats, field)
-        setattr(stats, field, current_value + increment)
-        
-        await self.session.flush()
-
-    # ==================== HELPERS ====================
-
-    def _stats_to_dto(self, stats: UserDailyStats) -> Dict[str, Any]:
-        """Convert stats to DTO"""
-        return {
-            "date": stats.date.isoformat(),
-            "pulsesPosted": stats.pulses_posted,
-            "likesReceived": stats.likes_received,
-            "newFollowers": stats.new_followers,
-            "commentsReceived": stats.comments_received
-        }
+        """
+        Buffer an increment for today. Nothing is written here: the delta joins
+        the write-behind buffer when the caller's transaction commits and is
+        flushed in batches by services.daily_stats.
+        """
+        record_stat_increment(self.session, user_id, field, increment)
+
+
+def _day_to_dto(day: date, counts: tuple) -> Dict[str, Any]:
+    """Convert one day's counts (STAT_FIELDS order) to DTO"""
+    pulses, likes, followers, comments = counts
+    return {
+        "date": day.isoformat(),
+        "pulsesPosted": pulses,
+        "likesReceived": likes,
+        "newFollowers": followers,
+        "commentsReceived": comments
+    }
+
+
+def stats_range_dto(start_date: date, end_date: date, days: Dict[date, tuple]) -> Dict[str, Any]:
+    """Totals plus the daily breakdown (days with activity only, oldest first)"""
+    totals = _ZERO
+    for counts in days.values():
+        totals = tuple(a + b for a, b in zip(totals, counts))
+    total = _day_to_dto(start_date, totals)
+    del total["date"]
+    return {
+        "startDate": start_date.isoformat(),
+        "endDate": end_date.isoformat(),
+        "totals": total,
+        "daily": [_day_to_dto(d, days[d]) for d in sorted(days)]
+    }
@@ -3,11 +3,45 @@ from __future__ import annotations
 from typing import Any, Iterable, List, Sequence
 import json
 
-from sqlalchemy import Select, select, desc, asc
-from sqlalchemy.orm import selectinload
+from sqlalchemy import Select, String, cast, exists, false, func, literal, or_, select, desc, asc, union_all
+from sqlalchemy.orm import noload, selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..models import VisualTreat, VisualTreatTagLookup, Movie, Scene
+from ..models import MOVIE_YEAR_NUMBER, VisualTreat, VisualTreatTagLookup, Movie, Scene, visual_treat_tags
+
+# Release year of the linked film, read through the movies join so it follows
+# movie edits; served by ix_movies_year_number
+FILM_YEAR = MOVIE_YEAR_NUMBER
+
+_SORTS = {
+    "popular": (desc(VisualTreat.likes),),
+    "recent": (FILM_YEAR.desc().nulls_last(),),
+    "oldest": (FILM_YEAR.asc().nulls_last(),),
+    "title_asc": (asc(VisualTreat.title),),
+    "title_desc": (desc(VisualTreat.title),),
+    "director_asc": (asc(VisualTreat.director),),
+    "director_desc": (desc(VisualTreat.director),),
+    "film_asc": (asc(Movie.title),),
+    "film_desc": (desc(Movie.title),),
+    "views_desc": (desc(VisualTreat.views),),
+    "views_asc": (asc(VisualTreat.views),),
+}
+
+
+def decade_start(label: str) -> int | None:
+    """ "1990s" -> 1990; None for anything that is not a decade label."""
+    digits = label.strip().rstrip("sS")
+    if not digits.isdigit():
+        return None
+    return (int(digits) // 10) * 10
+
+
+def _has_tag(condition: Any) -> Any:
+    return exists().where(
+        visual_treat_tags.c.treat_id == VisualTreat.id,
+        visual_treat_tags.c.tag_id == VisualTreatTagLookup.id,
+        condition,
+    )
 
 
 class VisualTreatsRepository:
@@ -15,11 +49,14 @@ class VisualTreatsRepository:
         self.session = session
 
     def _base_query(self) -> Select[Any]:
+        # Only the film title and year are needed from Movie; loading the
+        # relationship would pull its genre/people selectin cascade for every treat.
         return (
-            select(VisualTreat)
+            select(VisualTreat, Movie.title.label("film"), FILM_YEAR.label("year"))
+            .outerjoin(Movie, Movie.id == VisualTreat.movie_id)
             .options(
-                selectinload(VisualTreat.movie),
-                selectinload(VisualTreat.scene),
+                noload(VisualTreat.movie),
+                noload(VisualTreat.scene),
                 selectinload(VisualTreat.tags),
             )
         )
@@ -37,14 +74,10 @@ class VisualTreatsRepository:
         return None
 
     @staticmethod
-    def _to_dto(items: Sequence[VisualTreat]) -> List[dict[str, Any]]:
+    def _to_dto(rows: Sequence[tuple[VisualTreat, str | None, int | None]]) -> List[dict[str, Any]]:
         out: List[dict[str, Any]] = []
-        for t in items:
-            mv = t.movie
+        for t, film, year in rows:
             tags = [tg.name for tg in (t.tags or [])]
-            year_num = None
-            if mv and mv.year and mv.year.isdigit():
-                year_num = int(mv.year)
             out.append(
                 {
                     "id": t.external_id,
@@ -55,8 +88,8 @@ class VisualTreatsRepository:
                     "tags": tags,
                     "director": t.director or "",
                     "cinematographer": t.cinematographer or "",
-                    "film": mv.title if mv else "",
-                    "year": year_num or 0,
+                    "film": film or "",
+                    "year": year or 0,
                     "colorPalette": VisualTreatsRepository._parse_palette(t.color_palette) or [],
                     "likes": t.likes,
                     "views": t.views,
@@ -68,8 +101,8 @@ class VisualTreatsRepository:
             )
         return out
 
-    async def list_treats(
-        self,
+    @staticmethod
+    def _filters(
         *,
         categories: Iterable[str] | None = None,
         tags: Iterable[str] | None = None,
@@ -79,81 +112,102 @@ class VisualTreatsRepository:
         search: str | None = None,
         movie_external_id: str | None = None,
         scene_external_id: str | None = None,
-        sort_by: str | None = None,
-        page: int | None = None,
-        page_size: int | None = None,
-    ) -> List[dict[str, Any]]:
-        q = self._base_query()
-
+    ) -> List[Any]:
+        """WHERE clauses for a treat query that outer-joins Movie."""
+        where: List[Any] = []
         if movie_external_id:
-            q = q.join(VisualTreat.movie).where(Movie.external_id == movie_external_id)
+            where.append(Movie.external_id == movie_external_id)
         if scene_external_id:
-            q = q.join(VisualTreat.scene).where(Scene.external_id == scene_external_id)
+            where.append(VisualTreat.scene_id == select(Scene.id).where(Scene.external_id == scene_external_id).scalar_subquery())
 
         if categories:
-            q = q.where(VisualTreat.category.in_(list(categories)))
+            where.append(VisualTreat.category.in_(list(categories)))
         if directors:
-            q = q.where(VisualTreat.director.in_(list(directors)))
+            where.append(VisualTreat.director.in_(list(directors)))
         if cinematographers:
-            q = q.where(VisualTreat.cinematographer.in_(list(cinematographers)))
+            where.append(VisualTreat.cinematographer.in_(list(cinematographers)))
         if tags:
-            q = q.join(VisualTreat.tags).where(VisualTreatTagLookup.name.in_(list(tags)))
-
-        # Sorting
-        if sort_by in {"popular", None}:
-            q = q.order_by(desc(VisualTreat.likes))
-        elif sort_by == "recent":
-            q = q.join(VisualTreat.movie).order_by(desc(Movie.year))
-        elif sort_by == "oldest":
-            q = q.join(VisualTreat.movie).order_by(asc(Movie.year))
-        elif sort_by == "title_asc":
-            q = q.order_by(asc(VisualTreat.title))
-        elif sort_by == "title_desc":
-            q = q.order_by(desc(VisualTreat.title))
-        elif sort_by == "director_asc":
-            q = q.order_by(asc(VisualTreat.director))
-        elif sort_by == "director_desc":
-            q = q.order_by(desc(VisualTreat.director))
-        elif sort_by == "film_asc":
-            q = q.join(VisualTreat.movie).order_by(asc(Movie.title))
-        elif sort_by == "film_desc":
-            q = q.join(VisualTreat.movie).order_by(desc(Movie.title))
-        elif sort_by == "views_desc":
-            q = q.order_by(desc(VisualTreat.views))
-        elif sort_by == "views_asc":
-            q = q.order_by(asc(VisualTreat.views))
-        else:
-            q = q.order_by(desc(VisualTreat.likes))
+            where.append(_has_tag(VisualTreatTagLookup.name.in_(list(tags))))
 
-        # Simple page
-        if page and page_size:
-            q = q.limit(page_size).offset((page - 1) * page_size)
-
-        rows = (await self.session.execute(q)).scalars().unique().all()
-        items = self._to_dto(rows)
+        if decades:
+            ranges = [(d, d + 10) for d in (decade_start(x) for x in decades) if d is not None]
+            where.append(or_(*[FILM_YEAR.between(lo, hi - 1) for lo, hi in ranges]) if ranges else false())
 
-        # Post-filter: search and decades
         if search:
-            s = search.lower()
-            items = [
-                it
-                for it in items
-                if (s in it["title"].lower())
-                or (s in it["description"].lower())
-                or (s in it["film"].lower())
-                or (s in it["director"].lower())
-                or any(s in tag.lower() for tag in it["tags"])
-            ]
+            # Substring match (% and _ taken literally), served by the pg_trgm GIN indexes
+            term = search.strip()
+            where.append(
+                or_(
+                    VisualTreat.title.icontains(term, autoescape=True),
+                    VisualTreat.description.icontains(term, autoescape=True),
+                    VisualTreat.director.icontains(term, autoescape=True),
+                    Movie.title.icontains(term, autoescape=True),
+                    _has_tag(VisualTreatTagLookup.name.icontains(term, autoescape=True)),
+                )
+            )
+        return where
 
-        if decades:
-            wanted: set[str] = set(decades)
-            def as_decade(y: int) -> str:
-                d = (y // 10) * 10
-                return f"{d}s"
-            items = [it for it in items if it["year"] and as_decade(it["year"]) in wanted]
+    async def list_page(self, *, sort_by: str | None = None, page: int | None = None, page_size: int | None = None, **filters: Any) -> tuple[List[dict[str, Any]], int]:
+        """One page of treats plus the total number of matches, in one query."""
+        total_col = func.count().over().label("total")
+        q = self._base_query().add_columns(total_col).where(*self._filters(**filters))
+        q = q.order_by(*_SORTS.get(sort_by or "popular", _SORTS["popular"]), VisualTreat.id)
+
+        if page and page_size:
+            q = q.limit(page_size).offset((page - 1) * page_size)
+
+        rows = (await self.session.execute(q)).all()
+        if not rows and page and page > 1:
+            # Past the last page: the window count has nothing to ride on
+            total = (await self.session.execute(
+                select(func.count()).select_from(VisualTreat).outerjoin(Movie, Movie.id == VisualTreat.movie_id)
+                .where(*self._filters(**filters))
+            )).scalar_one()
+        else:
+            total = rows[0].total if rows else 0
+        return self._to_dto([(r[0], r[1], r[2]) for r in rows]), total
 
+    async def list_treats(self, **kwargs: Any) -> List[dict[str, Any]]:
+        items, _ = await self.list_page(**kwargs)
         return items
 
+    async def facets(self, **filters: Any) -> dict[str, Any]:
+        """
+        Total and per-category/tag/director/decade counts for everything
+        matching `filters`, as one UNION ALL over a CTE of the matching treats.
+        """
+        matched = (
+            select(VisualTreat.id, VisualTreat.category, VisualTreat.director, FILM_YEAR.label("year"))
+            .outerjoin(Movie, Movie.id == VisualTreat.movie_id)
+            .where(*self._filters(**filters))
+            .cte("matched")
+        )
+        n = func.count()
+        decade = (matched.c.year // 10) * 10
+        q = union_all(
+            select(literal("total").label("facet"), literal(None, String).label("value"), n).select_from(matched),
+            select(literal("category"), matched.c.category, n).group_by(matched.c.category),
+            select(literal("director"), matched.c.director, n).where(matched.c.director.isnot(None)).group_by(matched.c.director),
+            select(literal("decade"), cast(decade, String), n).where(matched.c.year.isnot(None)).group_by(decade),
+            select(literal("tag"), VisualTreatTagLookup.name, n)
+            .select_from(matched)
+            .join(visual_treat_tags, visual_treat_tags.c.treat_id == matched.c.id)
+            .join(VisualTreatTagLookup, VisualTreatTagLookup.id == visual_treat_tags.c.tag_id)
+            .group_by(VisualTreatTagLookup.name),
+        )
+        out: dict[str, Any] = {"total": 0, "categories": {}, "tags": {}, "directors": {}, "decades": {}}
+        keys = {"category": "categories", "tag": "tags", "director": "directors", "decade": "decades"}
+        for facet, value, count in (await self.session.execute(q)).all():
+            if facet == "total":
+                out["total"] = count
+            elif facet == "decade":
+                out["decades"][f"{value}s"] = count
+            else:
+                out[keys[facet]][value] = count
+        for key in keys.values():
+            out[key] = dict(sorted(out[key].items(), key=lambda kv: (-kv[1], kv[0])))
+        return out
+
     async def list_by_movie(self, *, movie_external_id: str, **kwargs: Any) -> List[dict[str, Any]]:
         return await self.list_treats(movie_external_id=movie_external_id, **kwargs)
 
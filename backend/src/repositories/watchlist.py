@@ -3,10 +3,56 @@ from __future__ import annotations
 from typing import Any, List, Optional
 from sqlalchemy import select, desc, delete
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defaultload, noload, selectinload
 from datetime import datetime
 import uuid
 
-from ..models import Watchlist, User, Movie
+from ..models import Watchlist, User, Movie, Genre
+from .fieldsets import FieldSet
+from .user_counters import UserCountersRepository
+
+# Keys of the list DTO that are read from the watchlist row's movie
+_MOVIE_KEYS = ("movieId", "title", "posterUrl", "releaseDate", "rating", "genres", "runtime")
+
+_LIST_COLUMNS = {
+    "dateAdded": [Watchlist.date_added],
+    "status": [Watchlist.status],
+    "priority": [Watchlist.priority],
+    "progress": [Watchlist.progress],
+}
+
+_LIST_FIELDS = {
+    "id": lambda w: w.external_id,
+    "movieId": lambda w: w.movie.external_id,
+    "title": lambda w: w.movie.title,
+    "posterUrl": lambda w: w.movie.poster_url,
+    "dateAdded": lambda w: w.date_added.isoformat(),
+    "releaseDate": lambda w: w.movie.year,
+    "status": lambda w: w.status,
+    "priority": lambda w: w.priority,
+    "progress": lambda w: w.progress,
+    "rating": lambda w: w.movie.siddu_score,
+    "genres": lambda w: [g.name for g in w.movie.genres],
+    "runtime": lambda w: w.movie.runtime,
+}
+
+
+def _list_options(fields: FieldSet) -> list:
+    """Loader options for the list DTO: the owning user is never needed, the movie only for movie keys."""
+    options: list = [noload(Watchlist.user)]
+    if fields.wants_any(*_MOVIE_KEYS):
+        options += [
+            selectinload(Watchlist.movie).noload(Movie.people),
+            defaultload(Watchlist.movie).noload(Movie.curated_by),
+        ]
+        if fields.wants("genres"):
+            options.append(defaultload(Watchlist.movie).selectinload(Movie.genres).noload(Genre.movies))
+        else:
+            options.append(defaultload(Watchlist.movie).noload(Movie.genres))
+    else:
+        options.append(noload(Watchlist.movie))
+    options += fields.load_only([Watchlist.id, Watchlist.external_id, Watchlist.movie_id], _LIST_COLUMNS)
+    return options
 
 
 class WatchlistRepository:
@@ -20,11 +66,13 @@ class WatchlistRepository:
         limit: int = 20,
         user_id: str | None = None,
         status: str | None = None,
+        fields: FieldSet | None = None,
     ) -> List[dict[str, Any]]:
         if not self.session:
             return []
+        fields = fields or FieldSet()
         # Prefer DISTINCT ON (movie_id) to avoid duplicates per movie for a user (PostgreSQL)
-        q = select(Watchlist)
+        q = select(Watchlist).options(*_list_options(fields))
         if user_id:
             q = q.join(Watchlist.user).where(User.external_id == user_id)
         if status:
@@ -35,30 +83,14 @@ class WatchlistRepository:
         q = q.limit(limit).offset((page - 1) * limit)
         res = await self.session.execute(q)
         items = res.scalars().all()
-        # Deduplicate by movie external_id to avoid duplicates for same user/movie
+        # Deduplicate by movie to avoid duplicates for same user/movie
         result: list[dict[str, Any]] = []
-        seen_movies: set[str] = set()
+        seen_movies: set[int] = set()
         for w in items:
-            movie_ext_id = w.movie.external_id
-            if movie_ext_id in seen_movies:
+            if w.movie_id in seen_movies:
                 continue
-            seen_movies.add(movie_ext_id)
-            result.append(
-                {
-                    "id": w.external_id,
-                    "movieId": movie_ext_id,
-                    "title": w.movie.title,
-                    "posterUrl": w.movie.poster_url,
-                    "dateAdded": w.date_added.isoformat(),
-                    "releaseDate": w.movie.year,
-                    "status": w.status,
-                    "priority": w.priority,
-                    "progress": w.progress,
-                    "rating": w.movie.siddu_score,
-                    "genres": [g.name for g in w.movie.genres],
-                    "runtime": w.movie.runtime,
-                }
-            )
+            seen_movies.add(w.movie_id)
+            result.append(fields.build(w, _LIST_FIELDS))
         return result
 
     async def get(self, external_id: str) -> dict[str, Any] | None:
@@ -176,6 +208,7 @@ class WatchlistRepository:
             except Exception:
                 pass
             raise
+        await UserCountersRepository(self.session).bump(user.id, watchlist=1)
 
         return {
             "id": watchlist_item.external_id,
@@ -232,5 +265,6 @@ class WatchlistRepository:
 
         await self.session.delete(w)
         await self.session.flush()
+        await UserCountersRepository(self.session).bump(w.user_id, watchlist=-1)
         return True
 
@@ -1,16 +1,29 @@
 from __future__ import annotations
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
 from pydantic import BaseModel, Field
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, insert
 from ..db import get_session
 from ..repositories.admin import AdminRepository, calculate_quality_score
+from ..repositories.award_ceremonies import award_ceremony_cache
+from ..repositories.collections import CollectionRepository
+from ..repositories.movies import movie_detail_cache
+from ..repositories.people import person_summary_cache
+from ..repositories.movie_content import MovieContentRepository
+from ..repositories.rating_stats import RatingStatsRepository
+from ..repositories.releases import release_calendar_cache
+from ..repositories.streaming import StreamingRepository
+from ..repositories.user_counters import UserCountersRepository
+from ..repositories.page_snapshots import AWARD_KINDS, FESTIVAL_KINDS, PageSnapshotRepository
+from ..services.page_snapshots import schedule_ceremony_snapshot_rebuild, schedule_festival_snapshot_rebuild
+from ..services.genre_stats import schedule_genre_stats_refresh
 from ..services.enrichment import enrich_movie_from_query
 from ..models import (
-    Movie, Genre, Person, StreamingPlatform, MovieStreamingOption, movie_genres, movie_people, User
+    Movie, Genre, Person, movie_genres, movie_people, User,
+    AwardCeremony, Festival,
 )
 from ..dependencies.admin import require_admin
 from ..schemas.curation import (
@@ -254,6 +267,8 @@ async def enrich_via_query(
     try:
         result = await enrich_movie_from_query(session, body.query, provider_preference=(body.provider or None))
         await session.commit()
+        movie_detail_cache.invalidate(result["external_id"])
+        release_calendar_cache.clear()
         return EnrichResultOut(**result)
     except EnrichmentProviderError as e:
         await session.rollback()
@@ -274,6 +289,10 @@ async def enrich_bulk(
             # skip but continue; in UI show failures separately if needed later
             out.append(EnrichResultOut(external_id=f"error:{q}", updated=False))
     await session.commit()
+    for r in out:
+        if r.updated:
+            movie_detail_cache.invalidate(r.external_id)
+    release_calendar_cache.clear()
     return out
 
 class EnrichExistingIn(BaseModel):
@@ -298,12 +317,97 @@ async def enrich_existing(
             session, query, override_external_id=body.external_id, provider_preference=None
         )
         await session.commit()
+        movie_detail_cache.invalidate(body.external_id)
+        release_calendar_cache.clear()
         return EnrichResultOut(**result)
     except EnrichmentProviderError as e:
         await session.rollback()
         raise HTTPException(status_code=502, detail={"provider": e.provider, "error": e.message})
 
 
+class RatingStatsRecomputeIn(BaseModel):
+    external_ids: Optional[List[str]] = None  # None = every movie
+
+
+class RatingStatsRecomputeOut(BaseModel):
+    movies: int
+
+
+@router.post("/movies/rating-stats/recompute", response_model=RatingStatsRecomputeOut)
+async def recompute_rating_stats(
+    body: RatingStatsRecomputeIn,
+    session: AsyncSession = Depends(get_session),
+    admin_user: User = Depends(require_admin),
+):
+    """Rebuild movie_rating_stats and siddu/critics scores from reviews (backfill or repair)."""
+    movie_ids = None
+    if body.external_ids is not None:
+        res = await session.execute(select(Movie.id).where(Movie.external_id.in_(body.external_ids)))
+        movie_ids = list(res.scalars().all())
+    written = await RatingStatsRepository(session).recompute(movie_ids)
+    await session.commit()
+    if body.external_ids is not None:
+        for external_id in body.external_ids:
+            movie_detail_cache.invalidate(external_id)
+    else:
+        movie_detail_cache.clear()
+    return RatingStatsRecomputeOut(movies=written)
+
+
+class UserCountersRecomputeIn(BaseModel):
+    external_ids: Optional[List[str]] = None  # None = every user
+
+
+class UserCountersRecomputeOut(BaseModel):
+    users: int
+
+
+@router.post("/users/counters/recompute", response_model=UserCountersRecomputeOut)
+async def recompute_user_counters(
+    body: UserCountersRecomputeIn,
+    session: AsyncSession = Depends(get_session),
+    admin_user: User = Depends(require_admin),
+):
+    """Rebuild user_counters from reviews, follows, watchlist, favorites, collections and pulses."""
+    user_ids = None
+    if body.external_ids is not None:
+        res = await session.execute(select(User.id).where(User.external_id.in_(body.external_ids)))
+        user_ids = list(res.scalars().all())
+    written = await UserCountersRepository(session).recompute(user_ids)
+    await session.commit()
+    return UserCountersRecomputeOut(users=written)
+
+
+class PageSnapshotRebuildIn(BaseModel):
+    kind: Literal["awards", "festivals"]
+    external_ids: Optional[List[str]] = None  # ceremony/festival ids; None = all of that kind
+
+
+class PageSnapshotRebuildOut(BaseModel):
+    invalidated: int
+
+
+@router.post("/page-snapshots/rebuild", response_model=PageSnapshotRebuildOut)
+async def rebuild_page_snapshots(
+    body: PageSnapshotRebuildIn,
+    background_tasks: BackgroundTasks,
+    session: AsyncSession = Depends(get_session),
+    admin_user: User = Depends(require_admin),
+):
+    """Drop award/festival page snapshots and rebuild them in the background (e.g. after seeding or SQL edits)."""
+    if body.kind == "awards":
+        kinds, model, schedule = AWARD_KINDS, AwardCeremony, schedule_ceremony_snapshot_rebuild
+    else:
+        kinds, model, schedule = FESTIVAL_KINDS, Festival, schedule_festival_snapshot_rebuild
+    ids = body.external_ids
+    if ids is None:
+        ids = list((await session.execute(select(model.external_id))).scalars().all())
+    invalidated = await PageSnapshotRepository(session).invalidate(kinds, ids)
+    await session.commit()
+    schedule(background_tasks, ids)
+    return PageSnapshotRebuildOut(invalidated=invalidated)
+
+
 class ImportReportOut(BaseModel):
     imported: int
     updated: int
@@ -313,12 +417,17 @@ class ImportReportOut(BaseModel):
 @router.post("/movies/import", response_model=ImportReportOut)
 async def import_movies_json(
     movies: List[MovieImportIn],
+    background_tasks: BackgroundTasks,
     session: AsyncSession = Depends(get_session),
     admin_user: User = Depends(require_admin),
 ):
     imported = 0
     updated = 0
     errors: List[str] = []
+    touched_ceremonies: set[str] = set()
+    touched_genres: set[int] = set()
+    people_relinked = False
+    ceremonies_created = False
 
     async def get_or_create_genre(name: str) -> Genre:
         q = select(Genre).where(Genre.name.ilike(name))
@@ -344,17 +453,6 @@ async def import_movies_json(
         await session.flush()
         return p
 
-    async def get_or_create_platform(key: str) -> StreamingPlatform:
-        q = select(StreamingPlatform).where(StreamingPlatform.name.ilike(key))
-        res = await session.execute(q)
-        plat = res.scalar_one_or_none()
-        if plat:
-            return plat
-        plat = StreamingPlatform(external_id=key.lower(), name=key, logo_url=None, website_url=None)
-        session.add(plat)
-        await session.flush()
-        return plat
-
     # Awards helpers
     from ..models import AwardCeremony, AwardCeremonyYear, AwardCategory, AwardNomination
 
@@ -363,6 +461,7 @@ async def import_movies_json(
         return re.sub(r"[^a-z0-9-]", "", re.sub(r"\s+", "-", s.strip().lower()))
 
     async def get_or_create_ceremony(name: str) -> AwardCeremony:
+        nonlocal ceremonies_created
         q = select(AwardCeremony).where(AwardCeremony.name.ilike(name))
         res = await session.execute(q)
         c = res.scalar_one_or_none()
@@ -371,6 +470,7 @@ async def import_movies_json(
         c = AwardCeremony(external_id=_slug(name), name=name, short_name=name)
         session.add(c)
         await session.flush()
+        ceremonies_created = True
         return c
 
     async def get_or_create_ceremony_year(ceremony: AwardCeremony, year: int) -> AwardCeremonyYear:
@@ -420,6 +520,7 @@ async def import_movies_json(
             movie.language = m.language
             movie.country = m.country
             movie.overview = m.overview
+            poster_changed = is_update and movie.poster_url != m.poster_url
             movie.poster_url = m.poster_url
             movie.backdrop_url = m.backdrop_url
             movie.budget = m.budget
@@ -443,23 +544,35 @@ async def import_movies_json(
             # Ensure movie.id is available before linking associations
             await session.flush()
 
-            # Genres - operate on association table directly to avoid async lazy-load issues
+            # Genres - operate on association table directly to avoid async lazy-load issues.
+            # Both the old and the new genres of the movie need their stats refreshed.
+            movie_genre_ids: set[int] = set()
             if m.genres is not None:
                 try:
-                    await session.execute(
-                        movie_genres.delete().where(movie_genres.c.movie_id == movie.id)
+                    removed = await session.execute(
+                        movie_genres.delete()
+                        .where(movie_genres.c.movie_id == movie.id)
+                        .returning(movie_genres.c.genre_id)
                     )
+                    movie_genre_ids.update(removed.scalars().all())
                     await session.flush()
                     for gname in m.genres:
                         g = await get_or_create_genre(gname)
                         await session.execute(
                             movie_genres.insert().values(movie_id=movie.id, genre_id=g.id)
                         )
+                        movie_genre_ids.add(g.id)
                 except Exception as ge:
                     errors.append(f"genres for {movie.external_id}: {ge}")
+            elif is_update:
+                current = await session.execute(
+                    select(movie_genres.c.genre_id).where(movie_genres.c.movie_id == movie.id)
+                )
+                movie_genre_ids.update(current.scalars().all())
 
             # People (clear and re-link)
             if any([m.directors, m.writers, m.producers, m.cast]):
+                people_relinked = True
                 await session.execute(
                     movie_people.delete().where(movie_people.c.movie_id == movie.id)
                 )
@@ -496,37 +609,17 @@ async def import_movies_json(
                     for per in m.cast:
                         await link_person(per, "actor", per.character)
 
-            # Streaming options
+            # Streaming options (diffed so unchanged offers keep their added_at)
             if m.streaming is not None:
-                await session.execute(
-                    select(MovieStreamingOption).where(MovieStreamingOption.movie_id == movie.id)
-                )
-                # delete existing
-                await session.execute(
-                    MovieStreamingOption.__table__.delete().where(MovieStreamingOption.movie_id == movie.id)
-                )
-                await session.flush()
-                for i, s in enumerate(m.streaming):
-                    plat = await get_or_create_platform(s.platform)
-                    ext_id = f"{movie.external_id}-{plat.external_id}-{s.region}-{i}"
-                    opt = MovieStreamingOption(
-                        external_id=ext_id,
-                        movie_id=movie.id,
-                        platform_id=plat.id,
-                        region=s.region,
-                        type=s.type,
-                        price=s.price,
-                        quality=s.quality,
-                        url=s.url,
-                        verified=True,
-                    )
-                    session.add(opt)
+                await StreamingRepository(session).replace_options(movie, [opt.model_dump() for opt in m.streaming])
 
             # Awards import (optional)
+            movie_ceremonies: set[str] = set()
             if m.awards:
                 for a in m.awards:
                     try:
                         ceremony = await get_or_create_ceremony(a.name)
+                        movie_ceremonies.add(ceremony.external_id)
                         cyear = await get_or_create_ceremony_year(ceremony, int(a.year))
                         cat = await get_or_create_category(cyear, a.category)
                         nom_ext = f"{cyear.external_id}-{_slug(a.category)}-{movie.external_id}"
@@ -546,11 +639,13 @@ async def import_movies_json(
                         session.add(nomination)
                     except Exception as _awde:
                         errors.append(f"award for {movie.external_id}: {_awde}")
+                await PageSnapshotRepository(session).invalidate(AWARD_KINDS, movie_ceremonies)
 
-            # Trivia & Timeline JSONB (optional)
+            # Trivia & Timeline (optional), published as new content versions
+            content = MovieContentRepository(session)
             if m.trivia is not None:
                 # store as list of dicts
-                movie.trivia = [
+                await content.publish_payload(movie.id, "trivia", [
                     {
                         "question": t.question,
                         "category": t.category,
@@ -558,9 +653,9 @@ async def import_movies_json(
                         "explanation": getattr(t, "explanation", None),
                     }
                     for t in m.trivia
-                ]
+                ], admin_user.id)
             if m.timeline is not None:
-                movie.timeline = [
+                await content.publish_payload(movie.id, "timeline", [
                     {
                         "date": tl.date,
                         "title": tl.title,
@@ -568,7 +663,11 @@ async def import_movies_json(
                         "type": tl.type,
                     }
                     for tl in m.timeline
-                ]
+                ], admin_user.id)
+
+            # Collections store their first posters
+            if poster_changed:
+                await CollectionRepository(session).refresh_previews(movie.id)
 
             if is_update:
                 updated += 1
@@ -577,11 +676,22 @@ async def import_movies_json(
 
             # Commit after each movie to avoid transaction rollback issues
             await session.commit()
+            movie_detail_cache.invalidate(m.external_id)
+            touched_ceremonies |= movie_ceremonies
+            touched_genres |= movie_genre_ids
         except Exception as e:
             # Rollback this movie's transaction and continue with next
             await session.rollback()
             errors.append(f"{m.external_id}: {e}")
 
+    schedule_ceremony_snapshot_rebuild(background_tasks, touched_ceremonies)
+    schedule_genre_stats_refresh(background_tasks, touched_genres)
+    if people_relinked:
+        person_summary_cache.clear()
+    if ceremonies_created:
+        award_ceremony_cache.clear()
+    if imported or updated:
+        release_calendar_cache.clear()
     return ImportReportOut(imported=imported, updated=updated, failed=len(errors), errors=errors)
 
 
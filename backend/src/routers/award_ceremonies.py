@@ -22,12 +22,14 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional
 from datetime import datetime
-from fastapi import APIRouter, HTTPException, Depends, Query, status
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends, Query, status
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..db import get_session
 from ..repositories.award_ceremonies import AwardCeremoniesRepository
+from ..repositories.page_snapshots import AWARD_KINDS, PageSnapshotRepository
+from ..services.page_snapshots import schedule_ceremony_snapshot_rebuild
 from ..dependencies.admin import require_admin
 from ..models import User
 
@@ -116,6 +118,15 @@ class AwardCeremoniesStatsResponse(BaseModel):
     by_prestige_level: Dict[str, int]
 
 
+class AwardCeremoniesDashboardResponse(BaseModel):
+    """Model for the admin dashboard: statistics plus one page of ceremonies."""
+    stats: AwardCeremoniesStatsResponse
+    ceremonies: List[AwardCeremonyResponse]
+    total: int
+    limit: int
+    offset: int
+
+
 class SuccessResponse(BaseModel):
     """Generic success response."""
     success: bool
@@ -154,7 +165,7 @@ async def list_award_ceremonies(
     """
     repo = AwardCeremoniesRepository(session)
     
-    ceremonies = await repo.list(
+    ceremonies, total = await repo.list_page(
         country=country,
         language=language,
         category_type=category_type,
@@ -164,14 +175,6 @@ async def list_award_ceremonies(
         offset=offset,
     )
     
-    total = await repo.count(
-        country=country,
-        language=language,
-        category_type=category_type,
-        prestige_level=prestige_level,
-        is_active=is_active,
-    )
-    
     return {
         "ceremonies": ceremonies,
         "total": total,
@@ -233,6 +236,22 @@ async def get_award_ceremony(
 admin_router = APIRouter(prefix="/admin", tags=["award-ceremonies-admin"])
 
 
+@admin_router.get("/dashboard", response_model=AwardCeremoniesDashboardResponse)
+async def get_award_ceremonies_dashboard(
+    limit: int = Query(50, ge=1, le=100, description="Maximum number of results"),
+    offset: int = Query(0, ge=0, description="Number of results to skip"),
+    session: AsyncSession = Depends(get_session),
+    admin_user: User = Depends(require_admin),
+) -> Any:
+    """
+    Admin dashboard data in one request: ceremony statistics and a page of ceremonies.
+    
+    Requires admin role.
+    """
+    repo = AwardCeremoniesRepository(session)
+    return await repo.dashboard(limit=limit, offset=offset)
+
+
 @admin_router.post("", response_model=AwardCeremonyResponse, status_code=status.HTTP_201_CREATED)
 async def create_award_ceremony(
     ceremony_data: AwardCeremonyCreate,
@@ -278,6 +297,7 @@ async def create_award_ceremony(
 async def update_award_ceremony(
     external_id: str,
     ceremony_data: AwardCeremonyUpdate,
+    background_tasks: BackgroundTasks,
     session: AsyncSession = Depends(get_session),
     admin_user: User = Depends(require_admin),
 ) -> Any:
@@ -318,6 +338,10 @@ async def update_award_ceremony(
                 detail=f"Award ceremony with external_id '{external_id}' not found"
             )
         
+        # Ceremony-year pages embed the ceremony name and logo
+        await PageSnapshotRepository(session).invalidate(AWARD_KINDS, [external_id])
+        await session.commit()
+        schedule_ceremony_snapshot_rebuild(background_tasks, [external_id])
         return ceremony
     except HTTPException:
         raise
@@ -359,6 +383,9 @@ async def delete_award_ceremony(
             detail=f"Award ceremony with external_id '{external_id}' not found"
         )
     
+    await PageSnapshotRepository(session).invalidate(AWARD_KINDS, [external_id])
+    await session.commit()
+    
     return {
         "success": True,
         "message": f"Award ceremony '{external_id}' deleted successfully"
@@ -22,5 +22,6 @@ async def get_award_details(ceremony_year_id: str, session: AsyncSession = Depen
     data = await repo.get_award_details(ceremony_year_id)
     if not data:
         raise HTTPException(status_code=404, detail="Award details not found")
+    await session.commit()  # keeps a snapshot built on this request
     return data
 
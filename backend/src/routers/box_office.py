@@ -1,15 +1,32 @@
 from __future__ import annotations
 
-from typing import Any
-from fastapi import APIRouter, Depends
+import io
+from datetime import date, timedelta
+from typing import Any, List, Literal, Optional
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
+from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..db import get_session
-from ..repositories.box_office import BoxOfficeRepository
+from ..dependencies.admin import require_admin
+from ..models import User
+from ..repositories.box_office import DEFAULT_MAX_POINTS, BoxOfficeRepository
+from ..services.box_office_ingest import ingest_box_office
 
 router = APIRouter(prefix="/boxoffice", tags=["boxoffice"])
 
 
+class DailyGrossIn(BaseModel):
+    movie_external_id: str = Field(alias="movieId")
+    region: str = "global"
+    date: date
+    gross_usd: float = Field(alias="grossUsd", ge=0)
+    studio: Optional[str] = None
+
+    class Config:
+        populate_by_name = True
+
+
 @router.get("/weekend")
 async def get_weekend(region: str = "global", limit: int = 10, session: AsyncSession = Depends(get_session)) -> Any:
     repo = BoxOfficeRepository(session)
@@ -22,6 +39,24 @@ async def get_trends(region: str = "global", session: AsyncSession = Depends(get
     return await repo.trends(region=region)
 
 
+@router.get("/series")
+async def get_series(
+    region: str = "global",
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    bucket: Optional[Literal["day", "week", "month"]] = None,
+    max_points: int = Query(DEFAULT_MAX_POINTS, alias="maxPoints", ge=2, le=1000),
+    session: AsyncSession = Depends(get_session),
+) -> Any:
+    """Total gross per day, week or month over a date range (default: the last 90 days)."""
+    end = end or date.today()
+    start = start or end - timedelta(days=89)
+    if start > end:
+        raise HTTPException(status_code=400, detail="start must not be after end")
+    repo = BoxOfficeRepository(session)
+    return await repo.series(region, start, end, bucket=bucket, max_points=max_points)
+
+
 @router.get("/ytd")
 async def get_ytd(region: str = "global", year: int | None = None, session: AsyncSession = Depends(get_session)) -> Any:
     repo = BoxOfficeRepository(session)
@@ -29,9 +64,9 @@ async def get_ytd(region: str = "global", year: int | None = None, session: Asyn
 
 
 @router.get("/performance")
-async def get_performance(region: str = "global", session: AsyncSession = Depends(get_session)) -> Any:
+async def get_performance(region: str = "global", year: int | None = None, session: AsyncSession = Depends(get_session)) -> Any:
     repo = BoxOfficeRepository(session)
-    return await repo.performance(region=region)
+    return await repo.performance(region=region, year=year)
 
 
 @router.get("/records")
@@ -46,3 +81,49 @@ async def get_top_films(region: str = "global", limit: int = 10, session: AsyncS
     repo = BoxOfficeRepository(session)
     return await repo.weekend(region=region, limit=limit)
 
+
+
+@router.post("/admin/daily")
+async def ingest_daily_grosses(
+    rows: List[DailyGrossIn],
+    session: AsyncSession = Depends(get_session),
+    admin_user: User = Depends(require_admin),
+) -> Any:
+    """Upsert daily grosses and update every rollup they count towards (admin only)."""
+    repo = BoxOfficeRepository(session)
+    result = await repo.ingest_daily(r.model_dump() for r in rows)
+    await session.commit()
+    return result
+
+
+@router.post("/admin/import")
+async def import_daily_grosses(
+    file: UploadFile = File(...),
+    format: Optional[Literal["csv", "ndjson"]] = Query(None, description="Defaults to the file extension"),
+    session: AsyncSession = Depends(get_session),
+    admin_user: User = Depends(require_admin),
+) -> Any:
+    """
+    Stream a CSV or NDJSON file of daily grosses into the store (admin only).
+
+    Rows identify the movie by tmdb_id, external_id or title (+ year) and are
+    loaded in committed batches; the report lists invalid and unmatched rows.
+    Year-scale backfills are better run with `python -m src.ingest_box_office`.
+    """
+    fmt = format or ("ndjson" if (file.filename or "").endswith((".ndjson", ".jsonl")) else "csv")
+    lines = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    report = await ingest_box_office(session, lines, fmt)
+    return report.to_dict()
+
+
+@router.post("/admin/rollups/rebuild")
+async def rebuild_rollups(
+    region: str = "global",
+    session: AsyncSession = Depends(get_session),
+    admin_user: User = Depends(require_admin),
+) -> Any:
+    """Recompute a region's rollups from the daily grosses (admin only)."""
+    repo = BoxOfficeRepository(session)
+    rollups = await repo.rebuild_rollups(region)
+    await session.commit()
+    return {"region": region, "rollups": rollups}
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 from typing import Any
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel, Field
 
 from ..db import get_session
-from ..repositories.collections import CollectionRepository
+from ..repositories.collections import MOVIES_PAGE_SIZE, CollectionRepository
+from ..repositories.fieldsets import FieldSet
 from ..dependencies.auth import get_current_user
 from ..models import User
 
@@ -35,6 +36,7 @@ async def list_collections(
     limit: int = 20,
     userId: str | None = None,
     isPublic: bool | None = None,
+    fields: str | None = Query(None, description="Comma-separated DTO fields, e.g. id,title,movieCount"),
     session: AsyncSession = Depends(get_session),
 ) -> Any:
     """
@@ -44,20 +46,45 @@ async def list_collections(
     - limit: results per page
     - userId: filter by user external_id
     - isPublic: filter by public/private status
+    - fields: optional sparse fieldset
     """
     repo = CollectionRepository(session)
-    return await repo.list(page=page, limit=limit, user_id=userId, is_public=isPublic)
+    return await repo.list(
+        page=page, limit=limit, user_id=userId, is_public=isPublic, fields=FieldSet.parse(fields)
+    )
 
 
 @router.get("/{collection_id}")
-async def get_collection(collection_id: str, session: AsyncSession = Depends(get_session)) -> Any:
+async def get_collection(
+    collection_id: str,
+    limit: int = Query(MOVIES_PAGE_SIZE, ge=1, le=200, description="Movies included in the first page"),
+    session: AsyncSession = Depends(get_session),
+) -> Any:
     repo = CollectionRepository(session)
-    data = await repo.get(collection_id)
+    data = await repo.get(collection_id, limit=limit)
     if not data:
         raise HTTPException(status_code=404, detail="Collection not found")
     return data
 
 
+@router.get("/{collection_id}/movies")
+async def list_collection_movies(
+    collection_id: str,
+    cursor: str | None = None,
+    limit: int = Query(MOVIES_PAGE_SIZE, ge=1, le=200),
+    session: AsyncSession = Depends(get_session),
+) -> Any:
+    """Page through a collection's movies in collection order; pass the previous `nextCursor`."""
+    repo = CollectionRepository(session)
+    try:
+        data = await repo.movies(collection_id, cursor=cursor, limit=limit)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    if data is None:
+        raise HTTPException(status_code=404, detail="Collection not found")
+    return data
+
+
 @router.post("")
 async def create_collection(
     body: CollectionCreateBody,
@@ -6,6 +6,7 @@ from typing import List, Optional
 
 from ..db import get_session
 from ..repositories.critics import CriticRepository
+from ..repositories.user_counters import UserCountersRepository
 from ..dependencies.auth import get_current_user
 from ..dependencies.admin import require_admin
 from ..models import User
@@ -33,6 +34,16 @@ class SocialLinkResponse(BaseModel):
         from_attributes = True
 
 
+class CriticUserStatsResponse(BaseModel):
+    reviews: int = 0
+    followers: int = 0
+    following: int = 0
+    watchlist: int = 0
+    favorites: int = 0
+    collections: int = 0
+    pulses: int = 0
+
+
 class CriticProfileResponse(BaseModel):
     id: int
     external_id: str
@@ -54,11 +65,23 @@ class CriticProfileResponse(BaseModel):
     background_info: Optional[str]
     created_at: str
     social_links: List[SocialLinkResponse] = []
+    user_stats: Optional[CriticUserStatsResponse] = None  # counters of the critic's user account
 
     class Config:
         from_attributes = True
 
 
+def _to_response(critic, user_stats: Optional[dict] = None) -> CriticProfileResponse:
+    return CriticProfileResponse(
+        **{
+            **critic.__dict__,
+            "created_at": critic.created_at.isoformat(),
+            "social_links": [SocialLinkResponse.from_orm(link) for link in critic.social_links],
+            "user_stats": user_stats,
+        }
+    )
+
+
 class CriticProfileUpdate(BaseModel):
     display_name: Optional[str] = Field(None, max_length=200)
     bio: Optional[str] = None
@@ -97,13 +120,8 @@ async def get_my_critic_profile(
             detail="User does not have a critic profile"
         )
 
-    return CriticProfileResponse(
-        **{
-            **critic.__dict__,
-            "created_at": critic.created_at.isoformat(),
-            "social_links": [SocialLinkResponse.from_orm(link) for link in critic.social_links]
-        }
-    )
+    counters = await UserCountersRepository(db).get(critic.user_id)
+    return _to_response(critic, counters)
 
 
 @router.get("/me/stats")
@@ -131,6 +149,7 @@ async def get_my_critic_stats(
         "reviews_this_month": 0,  # TODO: Calculate from reviews
         "views_this_month": 0,  # TODO: Calculate from analytics
         "growth_rate": 0.0,  # TODO: Calculate from historical data
+        "user_stats": await UserCountersRepository(db).get(current_user.id),
     }
 
 
@@ -151,16 +170,8 @@ async def list_critics(
         sort_by=sort_by
     )
 
-    return [
-        CriticProfileResponse(
-            **{
-                **critic.__dict__,
-                "created_at": critic.created_at.isoformat(),
-                "social_links": [SocialLinkResponse.from_orm(link) for link in critic.social_links]
-            }
-        )
-        for critic in critics
-    ]
+    counters = await UserCountersRepository(db).get_many(c.user_id for c in critics)
+    return [_to_response(critic, counters[critic.user_id]) for critic in critics]
 
 
 @router.get("/search", response_model=List[CriticProfileResponse])
@@ -173,16 +184,8 @@ async def search_critics(
     repo = CriticRepository(db)
     critics = await repo.search_critics(q, limit=limit)
 
-    return [
-        CriticProfileResponse(
-            **{
-                **critic.__dict__,
-                "created_at": critic.created_at.isoformat(),
-                "social_links": [SocialLinkResponse.from_orm(link) for link in critic.social_links]
-            }
-        )
-        for critic in critics
-    ]
+    counters = await UserCountersRepository(db).get_many(c.user_id for c in critics)
+    return [_to_response(critic, counters[critic.user_id]) for critic in critics]
 
 
 @router.get("/{username}", response_model=CriticProfileResponse)
@@ -200,13 +203,8 @@ async def get_critic_by_username(
             detail="Critic not found"
         )
     
-    return CriticProfileResponse(
-        **{
-            **critic.__dict__,
-            "created_at": critic.created_at.isoformat(),
-            "social_links": [SocialLinkResponse.from_orm(link) for link in critic.social_links]
-        }
-    )
+    counters = await UserCountersRepository(db).get(critic.user_id)
+    return _to_response(critic, counters)
 
 
 @router.put("/{username}", response_model=CriticProfileResponse)
@@ -237,13 +235,8 @@ async def update_critic_profile(
     update_dict = update_data.dict(exclude_unset=True)
     updated_critic = await repo.update_critic_profile(critic.id, **update_dict)
     
-    return CriticProfileResponse(
-        **{
-            **updated_critic.__dict__,
-            "created_at": updated_critic.created_at.isoformat(),
-            "social_links": [SocialLinkResponse.from_orm(link) for link in updated_critic.social_links]
-        }
-    )
+    counters = await UserCountersRepository(db).get(updated_critic.user_id)
+    return _to_response(updated_critic, counters)
 
 
 @router.post("/{username}/follow")
@@ -262,16 +255,12 @@ async def follow_critic(
             detail="Critic not found"
         )
 
-    # Check if already following
-    is_following = await repo.is_following(critic.id, current_user.id)
-    if is_following:
+    if not await repo.follow_critic(critic.id, current_user.id):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Already following this critic"
         )
 
-    await repo.follow_critic(critic.id, current_user.id)
-
     return {"message": "Successfully followed critic", "username": username}
 
 
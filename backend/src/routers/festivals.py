@@ -31,6 +31,7 @@ async def get_program(festival_id: str, year: int, session: AsyncSession = Depen
     data = await repo.get_program(festival_id, year)
     if data is None:
         raise HTTPException(status_code=404, detail="Program not found")
+    await session.commit()  # keeps a snapshot built on this request
     return data
 
 
@@ -40,5 +41,6 @@ async def get_winners(festival_id: str, year: int, session: AsyncSession = Depen
     data = await repo.get_winners(festival_id, year)
     if data is None:
         raise HTTPException(status_code=404, detail="Winners not found")
+    await session.commit()  # keeps a snapshot built on this request
     return data
 
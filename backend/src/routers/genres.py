@@ -30,6 +30,7 @@ async def get_genre_details(genre_id: str, session: AsyncSession = Depends(get_s
     data = await repo.get_details(genre_id)
     if not data:
         raise HTTPException(status_code=404, detail="Genre not found")
+    await session.commit()  # keeps stats built on a first read
     return data
 
 
@@ -35,6 +35,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from ..db import get_session
 from ..models import Movie, Genre, Person, StreamingPlatform, MovieStreamingOption, AwardNomination, movie_people, movie_genres, User
 from ..dependencies.admin import require_admin
+from ..repositories.movies import movie_detail_cache
+from ..repositories.movie_content import MovieContentRepository
+from ..repositories.releases import release_calendar_cache
 
 logger = logging.getLogger(__name__)
 
@@ -102,6 +105,12 @@ async def get_movie_by_external_id(session: AsyncSession, external_id: str) -> M
     return movie
 
 
+async def get_published_content(session: AsyncSession, movie: Movie, category: str) -> Any:
+    """Published payload of a content category, or None"""
+    published = await MovieContentRepository(session).published([movie.id], [category])
+    return published.get(movie.id, {}).get(category)
+
+
 def determine_data_source(movie: Movie, field_name: str) -> str:
     """Determine the source of data for a field"""
     # Check if field has data
@@ -245,12 +254,12 @@ async def export_timeline(
     """
     Export production timeline events.
     
-    Timeline is stored as JSONB array in the database.
+    Exports the published version from movie_content_versions.
     """
     movie = await get_movie_by_external_id(session, external_id)
     
     data = {
-        "events": movie.timeline or []
+        "events": await get_published_content(session, movie, "timeline") or []
     }
     
     return ExportResponse(
@@ -275,12 +284,12 @@ async def export_trivia(
     """
     Export trivia items.
 
-    Trivia is stored as JSONB array in the database.
+    Exports the published version from movie_content_versions.
     """
     movie = await get_movie_by_external_id(session, external_id)
 
     data = {
-        "items": movie.trivia or []
+        "items": await get_published_content(session, movie, "trivia") or []
     }
 
     return ExportResponse(
@@ -589,11 +598,14 @@ async def import_basic_info(
         updated_fields.append("genres")
 
     # Save basic_info as DRAFT
-    movie.basic_info_draft = data
-    movie.basic_info_status = "draft"
+    await MovieContentRepository(session).save_draft(movie.id, "basic_info", data, admin_user.id)
 
     await session.commit()
 
+    movie_detail_cache.invalidate(external_id)
+    if "release_date" in updated_fields:
+        release_calendar_cache.clear()
+
     return ImportResponse(
         success=True,
         message=f"Successfully imported basic info as DRAFT for movie '{external_id}'. Click 'Publish' to make live.",
@@ -611,7 +623,7 @@ async def import_timeline(
     """
     Import production timeline events as DRAFT.
 
-    Saves to timeline_draft field. Admin must click "Publish" to make live.
+    Appends a timeline draft version. Admin must click "Publish" to make live.
     """
     # Validate category
     if import_data.category != "timeline":
@@ -632,9 +644,9 @@ async def import_timeline(
 
     # Update timeline as DRAFT
     if "events" in data and isinstance(data["events"], list):
-        movie.timeline_draft = data["events"]
-        movie.timeline_status = "draft"
+        await MovieContentRepository(session).save_draft(movie.id, "timeline", data["events"], admin_user.id)
         await session.commit()
+        movie_detail_cache.invalidate(external_id)
 
         return ImportResponse(
             success=True,
@@ -658,7 +670,7 @@ async def import_trivia(
     """
     Import trivia items as DRAFT.
 
-    Saves to trivia_draft field. Admin must click "Publish" to make live.
+    Appends a trivia draft version. Admin must click "Publish" to make live.
     """
     # Validate category
     if import_data.category != "trivia":
@@ -679,9 +691,9 @@ async def import_trivia(
 
     # Update trivia as DRAFT
     if "items" in data and isinstance(data["items"], list):
-        movie.trivia_draft = data["items"]
-        movie.trivia_status = "draft"
+        await MovieContentRepository(session).save_draft(movie.id, "trivia", data["items"], admin_user.id)
         await session.commit()
+        movie_detail_cache.invalidate(external_id)
 
         return ImportResponse(
             success=True,
@@ -725,9 +737,9 @@ async def import_media(
     data = import_data.data
 
     # Save media as DRAFT
-    movie.media_draft = data
-    movie.media_status = "draft"
+    await MovieContentRepository(session).save_draft(movie.id, "media", data, admin_user.id)
     await session.commit()
+    movie_detail_cache.invalidate(external_id)
 
     return ImportResponse(
         success=True,
@@ -776,9 +788,9 @@ async def import_awards(
         )
 
     # Save awards as DRAFT
-    movie.awards_draft = data["awards"]
-    movie.awards_status = "draft"
+    await MovieContentRepository(session).save_draft(movie.id, "awards", data["awards"], admin_user.id)
     await session.commit()
+    movie_detail_cache.invalidate(external_id)
 
     return ImportResponse(
         success=True,
@@ -827,9 +839,9 @@ async def import_streaming(
         )
 
     # Save streaming as DRAFT
-    movie.streaming_draft = data
-    movie.streaming_status = "draft"
+    await MovieContentRepository(session).save_draft(movie.id, "streaming", data, admin_user.id)
     await session.commit()
+    movie_detail_cache.invalidate(external_id)
 
     return ImportResponse(
         success=True,
@@ -881,9 +893,9 @@ async def import_cast_crew(
             )
 
     # Save cast-crew as DRAFT
-    movie.cast_crew_draft = data
-    movie.cast_crew_status = "draft"
+    await MovieContentRepository(session).save_draft(movie.id, "cast_crew", data, admin_user.id)
     await session.commit()
+    movie_detail_cache.invalidate(external_id)
 
     return ImportResponse(
         success=True,
@@ -906,7 +918,7 @@ async def publish_draft(
     """
     Publish draft data to make it live on the public website.
 
-    Copies data from {category}_draft to {category} field.
+    Promotes the latest {category} draft version to published.
     """
     # Validate category
     valid_categories = ["trivia", "timeline", "awards", "cast_crew", "media", "streaming", "basic_info"]
@@ -918,31 +930,29 @@ async def publish_draft(
 
     movie = await get_movie_by_external_id(session, external_id)
 
-    # Get draft field name
-    draft_field = f"{category}_draft"
-    published_field = category
-    status_field = f"{category}_status"
-
     # Check if draft exists
-    draft_data = getattr(movie, draft_field, None)
-    if not draft_data:
+    content = MovieContentRepository(session)
+    draft = await content.latest_draft(movie.id, category)
+    if draft is None or not draft.payload:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"No draft data for {category} to publish"
         )
 
-    # Copy draft to published
-    setattr(movie, published_field, draft_data)
-    setattr(movie, status_field, "published")
+    # Flip the published pointer to the draft version
+    await content.publish(draft)
+
     movie.curated_at = datetime.now(timezone.utc)
     movie.curated_by_id = admin_user.id
 
     await session.commit()
 
+    movie_detail_cache.invalidate(external_id)
+
     return ImportResponse(
         success=True,
         message=f"Successfully published {category} for movie '{external_id}'",
-        updated_fields=[published_field]
+        updated_fields=[category]
     )
 
 
@@ -956,7 +966,7 @@ async def discard_draft(
     """
     Discard draft data without publishing.
 
-    Deletes the {category}_draft field.
+    Marks the pending {category} draft versions as discarded.
     """
     # Validate category
     valid_categories = ["trivia", "timeline", "awards", "cast_crew", "media", "streaming", "basic_info"]
@@ -968,28 +978,22 @@ async def discard_draft(
 
     movie = await get_movie_by_external_id(session, external_id)
 
-    # Get draft field name
-    draft_field = f"{category}_draft"
-    status_field = f"{category}_status"
-
-    # Check if draft exists
-    draft_data = getattr(movie, draft_field, None)
-    if not draft_data:
+    # Mark pending draft versions as discarded
+    discarded = await MovieContentRepository(session).discard(movie.id, category)
+    if not discarded:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"No draft data for {category} to discard"
         )
 
-    # Clear draft
-    setattr(movie, draft_field, None)
-    setattr(movie, status_field, "draft")
-
     await session.commit()
 
+    movie_detail_cache.invalidate(external_id)
+
     return ImportResponse(
         success=True,
         message=f"Successfully discarded draft {category} for movie '{external_id}'",
-        updated_fields=[draft_field]
+        updated_fields=[f"{category}_draft"]
     )
 
 
@@ -1005,24 +1009,7 @@ async def get_draft_status(
     Returns which categories have draft data and their status.
     """
     movie = await get_movie_by_external_id(session, external_id)
-
-    categories = ["trivia", "timeline", "awards", "cast_crew", "media", "streaming", "basic_info"]
-    draft_status = {}
-
-    for category in categories:
-        draft_field = f"{category}_draft"
-        published_field = category
-        status_field = f"{category}_status"
-
-        has_draft = getattr(movie, draft_field, None) is not None
-        has_published = getattr(movie, published_field, None) is not None
-        status = getattr(movie, status_field, "draft")
-
-        draft_status[category] = {
-            "status": status,
-            "has_draft": has_draft,
-            "has_published": has_published
-        }
+    draft_status = await MovieContentRepository(session).status(movie.id)
 
     return {
         "movie_id": external_id,
@@ -1,16 +1,24 @@
 from __future__ import annotations
 
 from typing import Any
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..config import settings
 from ..db import get_session
 from ..repositories.movies import MovieRepository
-from ..models import User, Watchlist, Movie
+from ..repositories.fieldsets import FieldSet
+from ..repositories.releases import CALENDAR_MAX_DAYS, ReleaseRepository
+from ..models import User
+from ..services.watch_progress import (
+    FLUSH_ON_STATUS,
+    resolve_movie_id,
+    schedule_watch_progress_flush,
+    watch_progress_buffer,
+)
 from ..dependencies.auth import get_current_user
-from pydantic import BaseModel
-from datetime import datetime
-from sqlalchemy import select
+from pydantic import BaseModel, Field
+from datetime import date, timedelta
 
 router = APIRouter(prefix="/movies", tags=["movies"])
 
@@ -27,6 +35,7 @@ async def list_movies(
     ratingMax: float | None = None,
     status: str | None = None,  # accepted but not used currently
     sortBy: str | None = None,
+    fields: str | None = Query(None, description="Comma-separated DTO fields, e.g. id,title,posterUrl"),
     session: AsyncSession = Depends(get_session),
 ) -> Any:
     repo = MovieRepository(session)
@@ -43,6 +52,7 @@ async def list_movies(
         rating_min=ratingMin,
         rating_max=ratingMax,
         sort_by=sortBy,
+        fields=FieldSet.parse(fields),
     )
 
 
@@ -61,15 +71,113 @@ async def search_movies(
     return {"results": results, "total": len(results)}
 
 
+class MovieBatchRequest(BaseModel):
+    ids: list[str] = Field(..., min_length=1)
+    view: str = Field(default="card", pattern="^(card|detail)$")
+    fields: str | None = None
+
+
+async def _get_movies_batch(ids: list[str], view: str, fields: str | None, session: AsyncSession) -> Any:
+    ids = [i.strip() for i in ids if i and i.strip()]
+    if not ids:
+        raise HTTPException(status_code=400, detail="At least one movie id is required")
+    if len(ids) > settings.movie_batch_max_ids:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many ids; at most {settings.movie_batch_max_ids} per request",
+        )
+    repo = MovieRepository(session)
+    movies = await repo.get_many(ids, view=view, fields=FieldSet.parse(fields))
+    found = {m["id"] for m in movies}
+    return {
+        "movies": movies,
+        "missing": [i for i in dict.fromkeys(ids) if i not in found],
+    }
+
+
+@router.get("/batch")
+async def get_movies_batch(
+    ids: str = Query(..., min_length=1, description="Comma-separated movie external ids"),
+    view: str = Query("card", pattern="^(card|detail)$"),
+    fields: str | None = Query(None, description="Comma-separated DTO fields"),
+    session: AsyncSession = Depends(get_session),
+) -> Any:
+    """
+    Fetch many movies in one request (compare page, collections, client caches).
+    Use POST for id lists too long for a query string.
+    """
+    return await _get_movies_batch(ids.split(","), view, fields, session)
+
+
+@router.post("/batch")
+async def post_movies_batch(
+    body: MovieBatchRequest,
+    session: AsyncSession = Depends(get_session),
+) -> Any:
+    """Same as GET /movies/batch with the ids in the request body."""
+    return await _get_movies_batch(body.ids, body.view, body.fields, session)
+
+
+@router.get("/calendar")
+async def get_release_calendar(
+    from_: date | None = Query(None, alias="from", description="First day (YYYY-MM-DD); defaults to today"),
+    to: date | None = Query(None, description="Last day (YYYY-MM-DD); defaults to 30 days after `from`"),
+    region: str | None = Query(None, description="Country code for regional release dates, e.g. US or IN"),
+    bucket: str = Query("day", pattern="^(day|week)$"),
+    types: str | None = Query(None, description="Comma-separated release types with a region, e.g. theatrical,digital"),
+    session: AsyncSession = Depends(get_session),
+) -> Any:
+    """Releases between `from` and `to`, grouped by day or by week (Monday first)."""
+    start = from_ or date.today()
+    end = to or start + timedelta(days=30)
+    if end < start:
+        raise HTTPException(status_code=400, detail="`to` must not be before `from`")
+    if (end - start).days >= CALENDAR_MAX_DAYS:
+        raise HTTPException(status_code=400, detail=f"At most {CALENDAR_MAX_DAYS} days per request")
+    type_list = [t.strip() for t in types.split(",") if t.strip()] if types else None
+    repo = ReleaseRepository(session)
+    return await repo.calendar(start, end, region=region, bucket=bucket, types=type_list)
+
+
 @router.get("/{movie_id}")
-async def get_movie(movie_id: str, session: AsyncSession = Depends(get_session)) -> Any:
+async def get_movie(
+    movie_id: str,
+    fields: str | None = Query(None, description="Comma-separated DTO fields, e.g. id,title,cast"),
+    session: AsyncSession = Depends(get_session),
+) -> Any:
     repo = MovieRepository(session)
-    data = await repo.get(movie_id)
+    data = await repo.get(movie_id, fields=FieldSet.parse(fields))
     if not data:
         raise HTTPException(status_code=404, detail="Movie not found")
     return data
 
 
+async def _get_movie_content(movie_id: str, key: str, session: AsyncSession) -> Any:
+    repo = MovieRepository(session)
+    found, value = await repo.get_content(movie_id, key)
+    if not found:
+        raise HTTPException(status_code=404, detail="Movie not found")
+    return {"id": movie_id, key: value}
+
+
+@router.get("/{movie_id}/trivia")
+async def get_movie_trivia(movie_id: str, session: AsyncSession = Depends(get_session)) -> Any:
+    """Trivia section of the detail payload, for loading after first paint."""
+    return await _get_movie_content(movie_id, "trivia", session)
+
+
+@router.get("/{movie_id}/timeline")
+async def get_movie_timeline(movie_id: str, session: AsyncSession = Depends(get_session)) -> Any:
+    """Timeline section of the detail payload, for loading after first paint."""
+    return await _get_movie_content(movie_id, "timeline", session)
+
+
+@router.get("/{movie_id}/awards")
+async def get_movie_awards(movie_id: str, session: AsyncSession = Depends(get_session)) -> Any:
+    """Awards section of the detail payload, for loading after first paint."""
+    return await _get_movie_content(movie_id, "awards", session)
+
+
 class MovieProgressUpdate(BaseModel):
     progress_seconds: int
     total_duration_seconds: int
@@ -80,80 +188,26 @@ class MovieProgressUpdate(BaseModel):
 async def update_movie_progress(
     movie_id: str,
     body: MovieProgressUpdate,
+    background_tasks: BackgroundTasks,
     session: AsyncSession = Depends(get_session),
     current_user: User = Depends(get_current_user),
 ) -> Any:
     """
-    Update movie progress and watchlist status.
-    Automatically adds to watchlist if not present.
+    Record a player heartbeat. The latest progress per user and movie is
+    buffered and written to the watchlist (adding the movie if needed) in
+    batches; pause and end transitions are written right after the response.
+
+    The returned `status` is the one this heartbeat moves towards. A stored
+    "watched" is never downgraded, so rewatching a watched movie reports
+    "watching" while the watchlist keeps "watched".
     """
-    # 1. Verify movie exists
-    repo = MovieRepository(session)
-    movie = await repo.get(movie_id)
-    if not movie:
+    internal_id = await resolve_movie_id(session, movie_id)
+    if internal_id is None:
         raise HTTPException(status_code=404, detail="Movie not found")
 
-    # 2. Find or create watchlist item
-    # We need the internal ID for the foreign key
-    stmt = select(Watchlist).where(
-        Watchlist.user_id == current_user.id,
-        Watchlist.movie_id == movie["id"] # repo.get returns dict, need to check if it returns dict or model
+    entry = watch_progress_buffer.add(
+        current_user.id, internal_id, body.progress_seconds, body.total_duration_seconds, body.status
     )
-    # Wait, repo.get returns a dict or object? 
-    # Looking at movies.py: data = await repo.get(movie_id) -> returns data.
-    # I should check MovieRepository.get implementation to be sure.
-    # Assuming it returns a dict-like object or model. 
-    # If it returns a dict, I might need to fetch the model to get the ID if it's not in the dict.
-    # Actually, let's just fetch the movie model directly to be safe and get the ID.
-    
-    movie_stmt = select(Movie).where(Movie.external_id == movie_id)
-    movie_res = await session.execute(movie_stmt)
-    movie_model = movie_res.scalar_one_or_none()
-    
-    if not movie_model:
-         raise HTTPException(status_code=404, detail="Movie not found")
-
-    stmt = select(Watchlist).where(
-        Watchlist.user_id == current_user.id,
-        Watchlist.movie_id == movie_model.id
-    )
-    result = await session.execute(stmt)
-    watchlist_item = result.scalar_one_or_none()
-
-    if not watchlist_item:
-        # Create new watchlist item
-        import uuid
-        watchlist_item = Watchlist(
-            external_id=str(uuid.uuid4()),
-            user_id=current_user.id,
-            movie_id=movie_model.id,
-            status="watching", # Default to watching since they are updating progress
-            progress=0,
-            progress_seconds=0,
-            total_duration_seconds=body.total_duration_seconds,
-            last_watched_at=datetime.utcnow()
-        )
-        session.add(watchlist_item)
-    
-    # 3. Update fields
-    watchlist_item.progress_seconds = body.progress_seconds
-    watchlist_item.total_duration_seconds = body.total_duration_seconds
-    watchlist_item.last_watched_at = datetime.utcnow()
-    
-    # Calculate percentage
-    percent = 0
-    if body.total_duration_seconds > 0:
-        percent = int((body.progress_seconds / body.total_duration_seconds) * 100)
-    watchlist_item.progress = percent
-
-    # 4. Update status logic
-    if body.status == "playing":
-        if watchlist_item.status != "watching" and watchlist_item.status != "watched":
-            watchlist_item.status = "watching"
-    
-    if body.status == "ended" or percent >= 95:
-        watchlist_item.status = "watched"
-
-    await session.commit()
-    
-    return {"ok": True, "status": watchlist_item.status, "progress": percent}
+    if body.status in FLUSH_ON_STATUS:
+        schedule_watch_progress_flush(background_tasks)
+    return {"ok": True, "status": entry["status"] or "watching", "progress": entry["progress"]}
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 from typing import Any
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..db import get_session
-from ..repositories.people import PeopleRepository
+from ..repositories.people import FILMOGRAPHY_PAGE_SIZE, PeopleRepository
 
 router = APIRouter(prefix="/people", tags=["people"])
 
@@ -20,10 +20,29 @@ async def list_people(
 
 
 @router.get("/{person_id}")
-async def get_person(person_id: str, session: AsyncSession = Depends(get_session)) -> Any:
+async def get_person(
+    person_id: str,
+    limit: int = Query(FILMOGRAPHY_PAGE_SIZE, ge=1, le=100),
+    session: AsyncSession = Depends(get_session),
+) -> Any:
     repo = PeopleRepository(session)
-    data = await repo.get(person_id)
+    data = await repo.get(person_id, limit=limit)
     if not data:
         raise HTTPException(status_code=404, detail="Person not found")
     return data
 
+
+@router.get("/{person_id}/filmography")
+async def get_person_filmography(
+    person_id: str,
+    role: str = "actor",
+    cursor: str | None = None,
+    limit: int = Query(FILMOGRAPHY_PAGE_SIZE, ge=1, le=100),
+    session: AsyncSession = Depends(get_session),
+) -> Any:
+    repo = PeopleRepository(session)
+    data = await repo.filmography(person_id, role, cursor=cursor, limit=limit)
+    if data is None:
+        raise HTTPException(status_code=404, detail="Person not found")
+    return data
+
@@ -8,6 +8,7 @@ from sqlalchemy import select
 from ..db import get_session
 from sqlalchemy.ext.asyncio import AsyncSession
 from ..repositories.pulse import PulseRepository
+from ..repositories.fieldsets import FieldSet
 from ..dependencies.auth import get_current_user, get_current_user_optional
 from ..models import User, UserRoleProfile
 
@@ -59,6 +60,7 @@ async def get_feed(
     linkedMovieId: Optional[str] = Query(None),
     linkedType: Optional[str] = Query(None),
     userId: Optional[str] = Query(None),
+    fields: Optional[str] = Query(None, description="Comma-separated DTO fields, e.g. id,content.text,userInfo"),
     session: AsyncSession = Depends(get_session),
     current_user: Optional[User] = Depends(get_current_user_optional),
 ):
@@ -76,7 +78,8 @@ async def get_feed(
         hashtag=hashtag,
         linked_movie_id=linkedMovieId,
         linked_type=linkedType,
-        target_user_external_id=userId
+        target_user_external_id=userId,
+        fields=FieldSet.parse(fields),
     )
 
 
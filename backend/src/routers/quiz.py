@@ -107,3 +107,17 @@ async def quiz_leaderboard(
     return await repo.leaderboard(quiz_external_id=quizId, limit=limit)
 
 
+
+
+@router.get("/{quizId}/leaderboard/rank")
+async def quiz_leaderboard_rank(
+    quizId: str,
+    userId: str = Query(...),
+    window: int = Query(5, ge=0, le=50, description="Entries to include either side of the user"),
+    session: AsyncSession = Depends(get_session),
+):
+    repo = QuizRepository(session)
+    result = await repo.user_rank(quiz_external_id=quizId, user_external_id=userId, window=window)
+    if result is None:
+        raise HTTPException(status_code=404, detail="quiz_not_found")
+    return result
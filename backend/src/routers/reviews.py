@@ -2,13 +2,15 @@ from __future__ import annotations
 
 from typing import Any, Optional
 from pydantic import BaseModel
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..db import get_session
 from ..repositories.reviews import ReviewRepository
+from ..repositories.fieldsets import FieldSet
 from ..dependencies.auth import get_current_user
 from ..models import User
+from ..services.vote_reconciliation import schedule_review_reconcile
 
 router = APIRouter(prefix="/reviews", tags=["reviews"])
 
@@ -38,6 +40,7 @@ async def list_reviews(
     movieId: str | None = None,
     userId: str | None = None,
     sortBy: str = "date_desc",
+    fields: str | None = Query(None, description="Comma-separated DTO fields, e.g. id,rating,author.name"),
     session: AsyncSession = Depends(get_session),
 ) -> Any:
     """
@@ -48,17 +51,23 @@ async def list_reviews(
     - movieId: filter by movie external_id
     - userId: filter by user external_id
     - sortBy: date_desc, date_asc, rating_desc, rating_asc, helpful_desc
+    - fields: optional sparse fieldset; nested keys use dots (movie.title)
     """
     repo = ReviewRepository(session)
     return await repo.list(
-        page=page, limit=limit, movie_id=movieId, user_id=userId, sort_by=sortBy
+        page=page, limit=limit, movie_id=movieId, user_id=userId, sort_by=sortBy,
+        fields=FieldSet.parse(fields),
     )
 
 
 @router.get("/{review_id}")
-async def get_review(review_id: str, session: AsyncSession = Depends(get_session)) -> Any:
+async def get_review(
+    review_id: str,
+    fields: str | None = Query(None, description="Comma-separated DTO fields"),
+    session: AsyncSession = Depends(get_session),
+) -> Any:
     repo = ReviewRepository(session)
-    data = await repo.get(review_id)
+    data = await repo.get(review_id, fields=FieldSet.parse(fields))
     if not data:
         raise HTTPException(status_code=404, detail="Review not found")
     return data
@@ -149,6 +158,7 @@ async def delete_review(
 async def vote_on_review(
     review_id: str,
     vote_type: str,  # Query parameter: "helpful" or "unhelpful"
+    background_tasks: BackgroundTasks,
     session: AsyncSession = Depends(get_session),
     current_user: User = Depends(get_current_user),
 ) -> Any:
@@ -165,6 +175,8 @@ async def vote_on_review(
     try:
         result = await repo.create_or_update_vote(review_id, current_user.id, vote_type)
         await session.commit()
+        if result["changed"]:
+            schedule_review_reconcile(background_tasks, review_id)
         return result
     except ValueError as e:
         await session.rollback()
@@ -177,6 +189,7 @@ async def vote_on_review(
 @router.delete("/{review_id}/vote")
 async def remove_vote_from_review(
     review_id: str,
+    background_tasks: BackgroundTasks,
     session: AsyncSession = Depends(get_session),
     current_user: User = Depends(get_current_user),
 ) -> Any:
@@ -189,6 +202,7 @@ async def remove_vote_from_review(
         if not result:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Vote not found")
         await session.commit()
+        schedule_review_reconcile(background_tasks, review_id)
         return {"deleted": True}
     except Exception as e:
         await session.rollback()
@@ -255,28 +269,23 @@ async def list_comments(
     parentId: Optional[str] = None,
     page: int = 1,
     limit: int = 50,
+    cursor: Optional[str] = None,  # id of the last comment shown ("load more")
     session: AsyncSession = Depends(get_session),
     current_user: Optional[User] = Depends(get_current_user),
 ) -> Any:
-    """List comments for a review."""
+    """List comment threads for a review, or more replies to `parentId`."""
     from ..repositories.review_comments import ReviewCommentRepository
     
     repo = ReviewCommentRepository(session)
     try:
-        result = await repo.list_comments(
+        return await repo.list_comments(
             review_id=review_id,
             parent_id=parentId,
             page=page,
             limit=limit,
+            cursor=cursor,
+            viewer_id=current_user.id if current_user else None,
         )
-        
-        # If user is authenticated, populate userHasLiked for each comment
-        if current_user:
-            for comment in result["comments"]:
-                has_liked = await repo.get_user_like(comment["id"], current_user.id)
-                comment["userHasLiked"] = has_liked or False
-        
-        return result
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
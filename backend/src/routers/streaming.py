@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from typing import Any, List, Literal, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..db import get_session
+from ..repositories.streaming import BROWSE_PAGE_SIZE, StreamingRepository
+
+router = APIRouter(prefix="/streaming", tags=["streaming"])
+
+
+@router.get("/{platform_id}/{region}")
+async def browse_platform(
+    platform_id: str,
+    region: str,
+    type: Optional[List[str]] = Query(None, description="subscription, rent, buy or free; repeatable"),
+    genre: Optional[str] = None,
+    language: Optional[str] = None,
+    sort: Literal["new", "title"] = "new",
+    cursor: Optional[str] = None,
+    limit: int = Query(BROWSE_PAGE_SIZE, ge=1, le=100),
+    session: AsyncSession = Depends(get_session),
+) -> Any:
+    """Movies on a platform in a region, e.g. /streaming/netflix/IN?type=free or ?sort=new."""
+    repo = StreamingRepository(session)
+    data = await repo.browse(
+        platform_id, region, types=type, genre=genre, language=language, sort=sort, cursor=cursor, limit=limit
+    )
+    if data is None:
+        raise HTTPException(status_code=404, detail="Streaming platform not found")
+    return data
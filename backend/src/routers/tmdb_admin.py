@@ -10,16 +10,20 @@ import logging
 from typing import Any, Dict, List, Optional
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, insert
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from ..db import get_session
-from ..models import Movie, Genre, Person, StreamingPlatform, MovieStreamingOption, movie_genres, movie_people, User
+from ..models import Movie, Genre, Person, movie_genres, movie_people, User
 from ..dependencies.admin import require_admin
 from ..integrations.tmdb_client import search_movie, fetch_movie_by_id, TMDBError, TMDBNotFoundError
+from ..repositories.people import person_summary_cache
+from ..repositories.releases import ReleaseRepository
+from ..repositories.streaming import StreamingRepository
+from ..services.genre_stats import schedule_genre_stats_refresh
 
 logger = logging.getLogger(__name__)
 
@@ -160,6 +164,11 @@ async def create_movie_from_tmdb_data(
             character_name=actor.get("character"),
         ).on_conflict_do_nothing()
         await session.execute(stmt)
+
+    # Watch providers
+    await StreamingRepository(session).replace_options(movie, tmdb_data.get("streaming") or [])
+    # Regional release dates for the calendar
+    await ReleaseRepository(session).replace_release_dates(movie.id, tmdb_data.get("release_dates") or [])
     
     await session.commit()
     return movie
@@ -371,6 +380,7 @@ async def search_tmdb_movies(
 @router.post("/import/{tmdb_id}", response_model=TMDBImportResponse, status_code=status.HTTP_201_CREATED)
 async def import_tmdb_movie(
     tmdb_id: int,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(require_admin),
     session: AsyncSession = Depends(get_session),
 ) -> TMDBImportResponse:
@@ -394,6 +404,11 @@ async def import_tmdb_movie(
         
         # Create movie
         movie = await create_movie_from_tmdb_data(session, tmdb_data, current_user)
+        genre_ids = await session.execute(
+            select(movie_genres.c.genre_id).where(movie_genres.c.movie_id == movie.id)
+        )
+        schedule_genre_stats_refresh(background_tasks, genre_ids.scalars().all())
+        person_summary_cache.clear()  # the new credits change existing people's summaries
         
         logger.info(f"Imported movie from TMDB: {movie.title} (ID: {movie.id})")
         
@@ -2,13 +2,16 @@ from __future__ import annotations
 
 from typing import Any, Optional, List
 from pydantic import BaseModel
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select
 
 from ..db import get_session
-from ..models import User, Review, Watchlist, Favorite, Collection, UserSettings, UserFollow
+from ..models import User, UserSettings
 from ..dependencies.auth import get_current_user_optional
+from ..repositories.user_counters import UserCountersRepository
+from ..repositories.suggestions import UserSuggestionRepository
+from ..services.suggestions import schedule_suggestion_refresh
 
 router = APIRouter(prefix="/users", tags=["users"])
 
@@ -52,43 +55,47 @@ class UserProfileResponse(BaseModel):
 class SuggestedUser(BaseModel):
     id: str
     username: str
-    displayName: str
+    name: str
+    bio: str | None
     avatarUrl: str | None
+    bannerUrl: str | None
+    joinedDate: str
+    location: str | None
+    website: str | None
+    stats: UserStatsResponse
     isVerified: bool
     mutualCount: int = 0
+    reason: str | None = None  # mutual_follows, co_reviewer, genre_affinity, popular
 
 
 @router.get("/suggested", response_model=List[SuggestedUser])
 async def get_suggested_users(
+    background_tasks: BackgroundTasks,
     limit: int = Query(5, ge=1, le=20),
     session: AsyncSession = Depends(get_session),
     current_user: User | None = Depends(get_current_user_optional),
 ) -> Any:
     """
     Get suggested users to follow.
-    For now, returns random users.
+    Reads the stored ranking for the current user (refreshed in the
+    background when missing or stale) and falls back to the most-followed
+    users for anonymous visitors and users without candidates yet.
     """
-    # Simple implementation: get random users
-    query = select(User).order_by(func.random()).limit(limit)
-    
-    # If logged in, exclude self
-    if current_user:
-        query = query.where(User.id != current_user.id)
-        
-    result = await session.execute(query)
-    users = result.scalars().all()
-    
-    return [
-        {
-            "id": str(user.id),  # Use internal ID for now as frontend expects string
-            "username": user.username or user.email.split("@")[0],
-            "displayName": user.name or "User",
-            "avatarUrl": user.avatar_url,
-            "isVerified": False,  # TODO: Add verification logic
-            "mutualCount": 0,
-        }
-        for user in users
-    ]
+    repo = UserSuggestionRepository(session)
+    if not current_user:
+        return await repo.popular(limit)
+
+    suggestions, stale = await repo.list(current_user.id, limit)
+    if stale:
+        schedule_suggestion_refresh(background_tasks, current_user.id)
+    if len(suggestions) < limit:
+        seen = {s["id"] for s in suggestions}
+        for extra in await repo.popular(limit * 2, exclude_user_id=current_user.id):
+            if len(suggestions) >= limit:
+                break
+            if extra["id"] not in seen:
+                suggestions.append(extra)
+    return suggestions
 
 
 @router.get("/{username}", response_model=UserProfileResponse)
@@ -265,48 +272,15 @@ async def get_user_stats(
 
 
 async def get_user_stats_internal(user_id: int, session: AsyncSession) -> UserStatsResponse:
-    """Internal function to get user stats by user ID"""
-    # Count reviews
-    reviews_query = select(func.count(Review.id)).where(Review.user_id == user_id)
-    reviews_result = await session.execute(reviews_query)
-    reviews_count = reviews_result.scalar() or 0
-    
-    # Count watchlist items
-    watchlist_query = select(func.count(Watchlist.id)).where(Watchlist.user_id == user_id)
-    watchlist_result = await session.execute(watchlist_query)
-    watchlist_count = watchlist_result.scalar() or 0
-    
-    # Count favorites
-    favorites_query = select(func.count(Favorite.id)).where(
-        Favorite.user_id == user_id,
-        Favorite.type == "movie"
-    )
-    favorites_result = await session.execute(favorites_query)
-    favorites_count = favorites_result.scalar() or 0
-    
-    
-    # Count collections
-    collections_query = select(func.count(Collection.id)).where(Collection.user_id == user_id)
-    collections_result = await session.execute(collections_query)
-    collections_count = collections_result.scalar() or 0
-    
-    # Get follow stats using PulseRepository
-    # We need to import PulseRepository inside function to avoid circular import if it was at top level
-    # But since we are in a function, it's fine. 
-    # Actually, let's just use the queries directly here or import PulseRepository.
-    # Since PulseRepository is in a different module, we should import it at top level or locally.
-    from ..repositories.pulse import PulseRepository
-    repo = PulseRepository(session)
-    following_count = await repo.get_following_count(user_id)
-    followers_count = await repo.get_follower_count(user_id)
-    
+    """Internal function to get user stats by user ID (one read of the counters row)"""
+    counters = await UserCountersRepository(session).get(user_id)
     return UserStatsResponse(
-        reviews=reviews_count,
-        watchlist=watchlist_count,
-        favorites=favorites_count,
-        collections=collections_count,
-        following=following_count,
-        followers=followers_count,
+        reviews=counters["reviews"],
+        watchlist=counters["watchlist"],
+        favorites=counters["favorites"],
+        collections=counters["collections"],
+        following=counters["following"],
+        followers=counters["followers"],
     )
 
 
@@ -385,62 +359,3 @@ async def unfollow_user(
     await repo.unfollow_user(current_user.id, target_user.id)
     await session.commit()
     return {"following": False}
-
-@router.get("/suggested", response_model=List[UserProfileResponse])
-async def get_suggested_users(
-    limit: int = Query(5, ge=1, le=20),
-    session: AsyncSession = Depends(get_session),
-    current_user: User | None = Depends(get_current_user_optional),
-) -> Any:
-    """
-    Get suggested users to follow.
-    For now, returns random users.
-    """
-    # Get IDs of users currently followed by the user
-    followed_ids = []
-    if current_user:
-        followed_stmt = select(UserFollow.following_id).where(UserFollow.follower_id == current_user.id)
-        followed_result = await session.execute(followed_stmt)
-        followed_ids = followed_result.scalars().all()
-
-    query = select(User).limit(limit)
-    
-    if current_user:
-        # Exclude self
-        query = query.where(User.id != current_user.id)
-        # Exclude already followed users
-        if followed_ids:
-            query = query.where(User.id.not_in(followed_ids))
-    
-    # Randomize (PostgreSQL specific)
-    query = query.order_by(func.random())
-    
-    result = await session.execute(query)
-    users = result.scalars().all()
-    
-    response = []
-    for user in users:
-        # Get stats for each user
-        stats = await get_user_stats_internal(user.id, session)
-        
-        # Determine display username
-        display_username = user.username
-        if not display_username:
-            display_username = user.email.split('@')[0] if '@' in user.email else user.email
-            
-        response.append(UserProfileResponse(
-            id=user.external_id,
-            username=display_username,
-            name=user.name,
-            email=user.email,
-            bio=user.bio,
-            avatarUrl=user.avatar_url,
-            bannerUrl=user.banner_url,
-            joinedDate=user.created_at.strftime("%B %Y"),
-            location=user.location,
-            website=user.website,
-            stats=stats,
-            isVerified=False,
-        ))
-        
-    return response
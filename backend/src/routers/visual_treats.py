@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from typing import Any, List, Optional
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..db import get_session
@@ -12,6 +12,7 @@ router = APIRouter(prefix="/visual-treats", tags=["visual-treats"])
 
 @router.get("")
 async def list_visual_treats(
+    response: Response,
     categories: Optional[List[str]] = Query(None),
     tags: Optional[List[str]] = Query(None),
     directors: Optional[List[str]] = Query(None),
@@ -26,7 +27,7 @@ async def list_visual_treats(
     session: AsyncSession = Depends(get_session),
 ) -> Any:
     repo = VisualTreatsRepository(session)
-    return await repo.list_treats(
+    items, total = await repo.list_page(
         categories=categories,
         tags=tags,
         directors=directors,
@@ -39,6 +40,34 @@ async def list_visual_treats(
         page=page,
         page_size=pageSize,
     )
+    response.headers["X-Total-Count"] = str(total)
+    return items
+
+
+@router.get("/facets")
+async def visual_treat_facets(
+    categories: Optional[List[str]] = Query(None),
+    tags: Optional[List[str]] = Query(None),
+    directors: Optional[List[str]] = Query(None),
+    cinematographers: Optional[List[str]] = Query(None),
+    decades: Optional[List[str]] = Query(None),
+    search: Optional[str] = Query(None),
+    movieId: Optional[str] = Query(None),
+    sceneId: Optional[str] = Query(None),
+    session: AsyncSession = Depends(get_session),
+) -> Any:
+    """Total matches and counts per category, tag, director and decade for the same filters as the list."""
+    repo = VisualTreatsRepository(session)
+    return await repo.facets(
+        categories=categories,
+        tags=tags,
+        directors=directors,
+        cinematographers=cinematographers,
+        decades=decades,
+        search=search,
+        movie_external_id=movieId,
+        scene_external_id=sceneId,
+    )
 
 
 @router.get("/by-movie/{movie_id}")
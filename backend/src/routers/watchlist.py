@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Any, Optional
 from pydantic import BaseModel
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy import select
@@ -11,6 +11,7 @@ from ..db import get_session
 from ..dependencies.auth import get_current_user
 from ..models import User, Watchlist, Movie
 from ..repositories.watchlist import WatchlistRepository
+from ..repositories.fieldsets import FieldSet
 
 router = APIRouter(prefix="/watchlist", tags=["watchlist"])
 
@@ -36,6 +37,7 @@ async def list_watchlist(
     limit: int = 20,
     userId: str | None = None,
     status: str | None = None,
+    fields: str | None = Query(None, description="Comma-separated DTO fields, e.g. id,movieId,status"),
     session: AsyncSession = Depends(get_session),
 ) -> Any:
     """
@@ -45,9 +47,12 @@ async def list_watchlist(
     - limit: results per page
     - userId: filter by user external_id
     - status: filter by status (want-to-watch, watching, watched)
+    - fields: optional sparse fieldset
     """
     repo = WatchlistRepository(session)
-    return await repo.list(page=page, limit=limit, user_id=userId, status=status)
+    return await repo.list(
+        page=page, limit=limit, user_id=userId, status=status, fields=FieldSet.parse(fields)
+    )
 
 
 @router.get("/{watchlist_id}")
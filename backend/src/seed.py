@@ -19,14 +19,8 @@ try:
         AwardCeremonyYear,
         AwardCategory,
         AwardNomination,
-        BoxOfficeWeekendEntry,
-        BoxOfficeTrendPoint,
-        BoxOfficeYTD,
-        BoxOfficeYTDTopMovie,
+        BoxOfficeDailyGross,
         BoxOfficeRecord,
-        BoxOfficePerformanceGenre,
-        BoxOfficePerformanceStudio,
-        BoxOfficePerformanceMonthly,
         Scene,
         Festival,
         FestivalEdition,
@@ -39,6 +33,8 @@ try:
     )
     from .config import settings
     from .security.password import hash_password
+    from .repositories.box_office import BoxOfficeRepository
+    from .repositories.collections import CollectionRepository
 except ImportError:
     import db as dbmod  # type: ignore
     from models import Genre, Movie  # type: ignore
@@ -187,12 +183,11 @@ async def seed() -> None:
             )
             session.add(col1)
             await session.flush()
-            # Refresh to load relationships
-            await session.refresh(col1, ["movies"])
-            if m_inception and m_inception not in col1.movies:
-                col1.movies.append(m_inception)
-            if m_matrix and m_matrix not in col1.movies:
-                col1.movies.append(m_matrix)
+            # Through the repository so movie_count and preview_posters stay in step
+            collections_repo = CollectionRepository(session)
+            for m in (m_inception, m_matrix):
+                if m:
+                    await collections_repo.add_movie(col1.external_id, m.external_id, u1.id)
         await session.commit()
 
         # Upsert watchlist and favorites
@@ -322,75 +317,31 @@ async def seed() -> None:
 
         await session.commit()
 
-        # Box Office seed (global)
-        existing_we = (await session.execute(_select(BoxOfficeWeekendEntry))).scalars().all()
-        if not existing_we:
-            if m_inception:
-                session.add(
-                    BoxOfficeWeekendEntry(
-                        region="global",
-                        rank=1,
-                        movie_id=m_inception.id,
-                        weekend_gross_usd=82_400_000,
-                        total_gross_usd=174_200_000,
-                        change_percent=15.2,
-                        is_positive=True,
-                        weeks_in_release=2,
-                    )
-                )
-            if m_matrix:
-                session.add(
-                    BoxOfficeWeekendEntry(
-                        region="global",
-                        rank=2,
-                        movie_id=m_matrix.id,
-                        weekend_gross_usd=54_200_000,
-                        total_gross_usd=126_300_000,
-                        change_percent=12.4,
-                        is_positive=False,
-                        weeks_in_release=3,
-                    )
-                )
-        existing_tr = (await session.execute(_select(BoxOfficeTrendPoint))).scalars().all()
-        if not existing_tr:
-            from datetime import datetime as _dt
-
-            for d, g in [
-                ("2024-07-01", 145.2),
-                ("2024-07-08", 167.8),
-                ("2024-07-15", 189.4),
-                ("2024-07-22", 234.7),
-                ("2024-07-29", 198.3),
-                ("2024-08-05", 176.9),
-                ("2024-08-12", 203.1),
+        # Box Office seed (global): six weeks of daily grosses; the rollups
+        # behind every box office page are derived from these on ingest.
+        existing_daily = (await session.execute(_select(BoxOfficeDailyGross).limit(1))).scalars().first()
+        if not existing_daily:
+            from datetime import date as _date, timedelta as _td
+
+            today = _date.today()
+            daily = []
+            for movie, studio, opening in [
+                (m_inception, "Warner Bros", 9_800_000),
+                (m_matrix, "Warner Bros", 6_300_000),
             ]:
-                session.add(
-                    BoxOfficeTrendPoint(region="global", date=_dt.fromisoformat(d), gross_millions_usd=g)
-                )
-        existing_ytd = (
-            await session.execute(
-                _select(BoxOfficeYTD).where(BoxOfficeYTD.region == "global", BoxOfficeYTD.year == 2023)
-            )
-        ).scalars().first()
-        if not existing_ytd:
-            y = BoxOfficeYTD(
-                region="global",
-                year=2023,
-                total_gross_usd=4_870_000_000,
-                change_percent=12.4,
-                is_positive=True,
-                previous_year=2022,
-                previous_total_gross_usd=4_330_000_000,
-            )
-            session.add(y)
-            await session.flush()
-            for title, amount in [
-                ("Guardians of the Galaxy Vol. 3", 358_900_000),
-                ("Spider-Man: Across the Spider-Verse", 381_400_000),
-                ("The Little Mermaid", 298_200_000),
-                ("Fast X", 146_100_000),
-            ]:
-                session.add(BoxOfficeYTDTopMovie(ytd_id=y.id, title=title, gross_usd=amount))
+                if not movie:
+                    continue
+                for i in range(42):
+                    day = today - _td(days=41 - i)
+                    weekend_boost = 2.4 if day.weekday() >= 4 else 1.0
+                    daily.append({
+                        "movie_external_id": movie.external_id,
+                        "region": "global",
+                        "date": day,
+                        "gross_usd": round(opening * weekend_boost * 0.96 ** i),
+                        "studio": studio,
+                    })
+            await BoxOfficeRepository(session).ingest_daily(daily)
         existing_rec = (await session.execute(_select(BoxOfficeRecord))).scalars().all()
         if not existing_rec:
             session.add_all(
@@ -429,42 +380,6 @@ async def seed() -> None:
                     ),
                 ]
             )
-        existing_pg = (await session.execute(_select(BoxOfficePerformanceGenre))).scalars().all()
-        if not existing_pg:
-            session.add_all(
-                [
-                    BoxOfficePerformanceGenre(region="global", name="Action", percent=35, color="#00BFFF"),
-                    BoxOfficePerformanceGenre(region="global", name="Drama", percent=22, color="#FF6B6B"),
-                    BoxOfficePerformanceGenre(region="global", name="Comedy", percent=18, color="#4ECDC4"),
-                    BoxOfficePerformanceGenre(region="global", name="Sci-Fi", percent=15, color="#45B7D1"),
-                    BoxOfficePerformanceGenre(region="global", name="Horror", percent=10, color="#96CEB4"),
-                ]
-            )
-        existing_ps = (await session.execute(_select(BoxOfficePerformanceStudio))).scalars().all()
-        if not existing_ps:
-            session.add_all(
-                [
-                    BoxOfficePerformanceStudio(region="global", studio="Disney", gross_millions_usd=1240),
-                    BoxOfficePerformanceStudio(region="global", studio="Warner Bros", gross_millions_usd=980),
-                    BoxOfficePerformanceStudio(region="global", studio="Universal", gross_millions_usd=850),
-                    BoxOfficePerformanceStudio(region="global", studio="Sony", gross_millions_usd=720),
-                    BoxOfficePerformanceStudio(region="global", studio="Paramount", gross_millions_usd=650),
-                    BoxOfficePerformanceStudio(region="global", studio="20th Century", gross_millions_usd=480),
-                ]
-            )
-        existing_pm = (await session.execute(_select(BoxOfficePerformanceMonthly))).scalars().all()
-        if not existing_pm:
-            session.add_all(
-                [
-                    BoxOfficePerformanceMonthly(region="global", month="Jan", gross_millions_usd=890),
-                    BoxOfficePerformanceMonthly(region="global", month="Feb", gross_millions_usd=750),
-                    BoxOfficePerformanceMonthly(region="global", month="Mar", gross_millions_usd=1200),
-                    BoxOfficePerformanceMonthly(region="global", month="Apr", gross_millions_usd=980),
-                    BoxOfficePerformanceMonthly(region="global", month="May", gross_millions_usd=1450),
-                    BoxOfficePerformanceMonthly(region="global", month="Jun", gross_millions_usd=1680),
-                    BoxOfficePerformanceMonthly(region="global", month="Jul", gross_millions_usd=1890),
-                ]
-            )
         await session.commit()
 
         # Festivals seed
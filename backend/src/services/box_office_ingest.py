@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+import asyncio
+import csv
+import json
+import logging
+from datetime import date
+from itertools import islice
+from typing import Any, Iterable, Iterator, Optional
+
+from sqlalchemy import func, select, text
+
+from ..models import Movie
+from ..repositories.box_office import BoxOfficeRepository
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 5000
+MAX_REPORTED_ERRORS = 100
+MAX_REPORTED_UNRESOLVED = 100
+FORMATS = ("csv", "ndjson")
+
+# Header/field spellings accepted in files, normalised to lowercase without "_"
+_FIELDS = {
+    "tmdbid": "tmdb_id",
+    "externalid": "external_id",
+    "movieid": "external_id",
+    "title": "title",
+    "year": "year",
+    "region": "region",
+    "date": "date",
+    "grossusd": "gross_usd",
+    "gross": "gross_usd",
+    "studio": "studio",
+}
+
+# Best trigram match per title (served by ix_movies_title_trgm); a match on
+# the release year wins over a closer title.
+_FUZZY_TITLES = text("""
+    SELECT q.title, q.year, m.external_id
+    FROM unnest(CAST(:titles AS text[]), CAST(:years AS text[])) AS q(title, year)
+    CROSS JOIN LATERAL (
+        SELECT movies.external_id
+        FROM movies
+        WHERE movies.title % q.title
+        ORDER BY (movies.year IS NOT DISTINCT FROM q.year) DESC, similarity(movies.title, q.title) DESC
+        LIMIT 1
+    ) m
+""")
+
+
+class IngestReport:
+    def __init__(self) -> None:
+        self.rows_read = 0
+        self.ingested = 0
+        self.invalid = 0
+        self.unresolved = 0
+        self.errors: list[dict[str, Any]] = []
+        self.unresolved_refs: set[str] = set()
+
+    def error(self, line: int, message: str) -> None:
+        self.invalid += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"line": line, "error": message})
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "rowsRead": self.rows_read,
+            "ingested": self.ingested,
+            "invalid": self.invalid,
+            "unresolved": self.unresolved,
+            "errors": self.errors,
+            "unresolvedMovies": sorted(self.unresolved_refs),
+        }
+
+
+def read_records(lines: Iterable[str], fmt: str) -> Iterator[tuple[int, Any]]:
+    """(line number, raw record) pairs from CSV (with a header) or NDJSON, one line at a time."""
+    if fmt == "csv":
+        reader = csv.DictReader(lines)
+        for record in reader:
+            yield reader.line_num, record
+    elif fmt == "ndjson":
+        for n, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield n, json.loads(line)
+            except ValueError as e:
+                yield n, ValueError(f"invalid JSON: {e}")
+    else:
+        raise ValueError(f"unknown format {fmt!r}, expected one of {FORMATS}")
+
+
+def movie_ref(row: dict[str, Any]) -> tuple:
+    """How a row identifies its movie: by tmdb id, external id, or title (and year)."""
+    if row.get("tmdb_id") is not None:
+        return ("tmdb", row["tmdb_id"])
+    if row.get("external_id"):
+        return ("ext", row["external_id"])
+    return ("title", row["title"].casefold(), row.get("year"))
+
+
+def validate_record(record: Any) -> dict[str, Any]:
+    """Normalise one raw record; raises ValueError with a readable message."""
+    if isinstance(record, Exception):
+        raise record
+    if not isinstance(record, dict):
+        raise ValueError("expected an object")
+    row: dict[str, Any] = {}
+    for name, value in record.items():
+        field = _FIELDS.get(str(name).replace("_", "").replace(" ", "").lower())
+        if field is not None and value not in (None, ""):
+            row[field] = value.strip() if isinstance(value, str) else value
+
+    if "tmdb_id" in row:
+        try:
+            row["tmdb_id"] = int(row["tmdb_id"])
+        except (TypeError, ValueError):
+            raise ValueError(f"tmdb_id {row['tmdb_id']!r} is not an integer")
+    if not any(k in row for k in ("tmdb_id", "external_id", "title")):
+        raise ValueError("one of tmdb_id, external_id or title is required")
+    if "year" in row:
+        row["year"] = str(row["year"])[:4]
+    if "date" not in row:
+        raise ValueError("date is required")
+    try:
+        row["date"] = date.fromisoformat(str(row["date"])[:10])
+    except ValueError:
+        raise ValueError(f"date {row['date']!r} is not YYYY-MM-DD")
+    if "gross_usd" not in row:
+        raise ValueError("gross_usd is required")
+    try:
+        gross = float(str(row["gross_usd"]).replace(",", "").lstrip("$"))
+    except ValueError:
+        raise ValueError(f"gross_usd {row['gross_usd']!r} is not a number")
+    if gross < 0:
+        raise ValueError("gross_usd must not be negative")
+    row["gross_usd"] = gross
+    row["region"] = str(row.get("region") or "global").lower()
+    return row
+
+
+class MovieResolver:
+    """
+    Maps movie references to external ids a batch at a time: tmdb ids and
+    external ids in one query each, titles by exact (case-insensitive) match
+    and then by trigram similarity. Answers, including misses, are kept for
+    the rest of the import.
+    """
+
+    def __init__(self, session) -> None:
+        self.session = session
+        self._known: dict[tuple, Optional[str]] = {}
+
+    async def resolve(self, refs: Iterable[tuple]) -> dict[tuple, Optional[str]]:
+        refs = set(refs)
+        missing = [r for r in refs if r not in self._known]
+        if missing:
+            await self._lookup(missing)
+        return {r: self._known[r] for r in refs}
+
+    async def _lookup(self, refs: list[tuple]) -> None:
+        found: dict[tuple, str] = {}
+        tmdb_ids = [r[1] for r in refs if r[0] == "tmdb"]
+        if tmdb_ids:
+            res = await self.session.execute(
+                select(Movie.tmdb_id, Movie.external_id).where(Movie.tmdb_id.in_(tmdb_ids))
+            )
+            found.update((("tmdb", t), ext) for t, ext in res.tuples())
+        ext_ids = [r[1] for r in refs if r[0] == "ext"]
+        if ext_ids:
+            res = await self.session.execute(select(Movie.external_id).where(Movie.external_id.in_(ext_ids)))
+            found.update((("ext", ext), ext) for ext in res.scalars())
+
+        titles = [r for r in refs if r[0] == "title"]
+        if titles:
+            res = await self.session.execute(
+                select(func.lower(Movie.title), Movie.year, Movie.external_id)
+                .where(func.lower(Movie.title).in_({r[1] for r in titles}))
+            )
+            exact: dict[str, dict[Optional[str], str]] = {}
+            for title, year, ext in res.tuples():
+                exact.setdefault(title, {}).setdefault(year, ext)
+            for ref in titles:
+                by_year = exact.get(ref[1])
+                if by_year:
+                    found[ref] = by_year.get(ref[2]) or next(iter(by_year.values()))
+            fuzzy = [r for r in titles if r not in found]
+            if fuzzy:
+                res = await self.session.execute(
+                    _FUZZY_TITLES,
+                    {"titles": [r[1] for r in fuzzy], "years": [r[2] for r in fuzzy]},
+                )
+                for title, year, ext in res.tuples():
+                    found[("title", title, year)] = ext
+
+        for ref in refs:
+            self._known[ref] = found.get(ref)
+
+
+def _describe(ref: tuple) -> str:
+    if ref[0] == "title":
+        return f"{ref[1]} ({ref[2]})" if ref[2] else ref[1]
+    return f"{ref[0]}:{ref[1]}"
+
+
+async def ingest_box_office(
+    session, lines: Iterable[str], fmt: str, *, batch_size: int = BATCH_SIZE
+) -> IngestReport:
+    """
+    Stream daily grosses from CSV/NDJSON `lines` into the daily-gross store.
+    Rows are validated, resolved and upserted `batch_size` at a time and each
+    batch is committed with its rollup changes, so memory stays bounded by
+    the batch and a failure keeps the batches already loaded. `lines` is read
+    in a worker thread, so a blocking file (e.g. an upload) does not stall
+    the event loop.
+    """
+    report = IngestReport()
+    resolver = MovieResolver(session)
+    repo = BoxOfficeRepository(session)
+    records = read_records(lines, fmt)
+    loop = asyncio.get_running_loop()
+    while True:
+        chunk = await loop.run_in_executor(None, list, islice(records, batch_size))
+        if not chunk:
+            break
+        report.rows_read += len(chunk)
+        rows = []
+        for line, record in chunk:
+            try:
+                row = validate_record(record)
+            except ValueError as e:
+                report.error(line, str(e))
+                continue
+            row["ref"] = movie_ref(row)
+            rows.append(row)
+
+        resolved = await resolver.resolve(r["ref"] for r in rows)
+        daily = []
+        for row in rows:
+            ext = resolved[row["ref"]]
+            if ext is None:
+                report.unresolved += 1
+                if len(report.unresolved_refs) < MAX_REPORTED_UNRESOLVED:
+                    report.unresolved_refs.add(_describe(row["ref"]))
+                continue
+            daily.append({
+                "movie_external_id": ext,
+                "region": row["region"],
+                "date": row["date"],
+                "gross_usd": row["gross_usd"],
+                "studio": row.get("studio"),
+            })
+        if daily:
+            result = await repo.ingest_daily(daily)
+            report.ingested += result["ingested"]
+        await session.commit()
+        logger.info("box office ingest: %d rows read, %d ingested", report.rows_read, report.ingested)
+    return report
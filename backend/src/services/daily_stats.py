@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import date, timedelta
+from typing import Iterable, Optional
+
+from sqlalchemy import event, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from .. import db
+from ..config import settings
+from ..models import UserDailyStats
+from .cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+STAT_FIELDS = ("pulses_posted", "likes_received", "new_followers", "comments_received")
+ROLLING_DAYS = 30
+FLUSH_BATCH_SIZE = 1000
+
+_ZERO = (0,) * len(STAT_FIELDS)
+
+
+def _add(a: tuple, b: tuple) -> tuple:
+    return tuple(x + y for x, y in zip(a, b))
+
+
+class DailyStatsBuffer:
+    """
+    Write-behind buffer for `user_daily_stats` increments.
+
+    Deltas are coalesced per (user, day) as one tuple in STAT_FIELDS order, so
+    a burst of likes on one user's pulses becomes a single row in the next
+    flush. The buffer is per process and only holds committed increments
+    (see `record_stat_increment`); `drain` hands them to the flusher, which
+    puts them back with `restore` if the write fails.
+    """
+
+    def __init__(self) -> None:
+        self._deltas: dict[tuple[int, date], tuple] = {}
+
+    def add(self, user_id: int, day: date, field: str, n: int = 1) -> None:
+        i = STAT_FIELDS.index(field)
+        row = list(self._deltas.get((user_id, day), _ZERO))
+        row[i] += n
+        self._deltas[(user_id, day)] = tuple(row)
+
+    def pending(self, user_id: int) -> dict[date, tuple]:
+        """Unflushed deltas for one user, by day."""
+        return {day: v for (uid, day), v in self._deltas.items() if uid == user_id}
+
+    def drain(self) -> list[dict]:
+        """Take everything buffered as upsert rows, ordered by (user_id, date)."""
+        deltas, self._deltas = self._deltas, {}
+        return [
+            {"user_id": uid, "date": day, **dict(zip(STAT_FIELDS, v))}
+            for (uid, day), v in sorted(deltas.items())
+        ]
+
+    def restore(self, rows: Iterable[dict]) -> None:
+        for r in rows:
+            key = (r["user_id"], r["date"])
+            self._deltas[key] = _add(self._deltas.get(key, _ZERO), tuple(r[f] for f in STAT_FIELDS))
+
+    def __len__(self) -> int:
+        return len(self._deltas)
+
+
+class RollingStatsCache:
+    """
+    Last `ROLLING_DAYS` of daily rows per user as {date: counts tuple}.
+
+    Entries are filled by `UserStatsRepository` with one query and dropped for
+    every user a flush writes to. `generation` moves on each flush so a load
+    that raced a flush is not stored (it may or may not include the flushed
+    deltas).
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 10000) -> None:
+        self._cache = TTLCache(ttl_seconds=ttl_seconds, max_entries=max_entries)
+        self.generation = 0
+
+    def get(self, user_id: int) -> Optional[dict[date, tuple]]:
+        return self._cache.get(user_id)
+
+    def set(self, user_id: int, days: dict[date, tuple], generation: int) -> None:
+        if generation == self.generation:
+            self._cache.set(user_id, days)
+
+    def flushed(self, user_ids: Iterable[int]) -> None:
+        self.generation += 1
+        for user_id in user_ids:
+            self._cache.invalidate(user_id)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+
+daily_stats_buffer = DailyStatsBuffer()
+rolling_stats_cache = RollingStatsCache(ttl_seconds=settings.user_stats_cache_ttl_seconds)
+
+
+def rolling_window(today: Optional[date] = None) -> tuple[date, date]:
+    today = today or date.today()
+    return today - timedelta(days=ROLLING_DAYS - 1), today
+
+
+def merge_pending(days: dict[date, tuple], pending: dict[date, tuple]) -> dict[date, tuple]:
+    merged = dict(days)
+    for day, v in pending.items():
+        merged[day] = _add(merged.get(day, _ZERO), v)
+    return merged
+
+
+_PENDING_KEY = "daily_stats_increments"
+
+
+def record_stat_increment(session, user_id: int, field: str, n: int = 1) -> None:
+    """Queue an increment for today; it reaches the buffer only if the session commits."""
+    if field not in STAT_FIELDS:
+        raise ValueError(f"Unknown daily stat: {field}")
+    session.info.setdefault(_PENDING_KEY, []).append((user_id, date.today(), field, n))
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_stat_increments(session: Session) -> None:
+    for user_id, day, field, n in session.info.pop(_PENDING_KEY, ()):
+        daily_stats_buffer.add(user_id, day, field, n)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_stat_increments(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+def upsert_statement(rows: list[dict]):
+    """One multi-row INSERT ... ON CONFLICT that adds each row onto the stored counts."""
+    stmt = pg_insert(UserDailyStats).values(rows)
+    return stmt.on_conflict_do_update(
+        constraint="uq_user_daily_stats",
+        set_={f: getattr(UserDailyStats, f) + getattr(stmt.excluded, f) for f in STAT_FIELDS},
+    )
+
+
+async def flush_daily_stats() -> int:
+    """Write buffered increments. Returns the number of (user, day) rows written."""
+    if db.SessionLocal is None or not len(daily_stats_buffer):
+        return 0
+    rows = daily_stats_buffer.drain()
+    try:
+        async with db.SessionLocal() as session:
+            for i in range(0, len(rows), FLUSH_BATCH_SIZE):
+                await session.execute(upsert_statement(rows[i:i + FLUSH_BATCH_SIZE]))
+            await session.commit()
+    except BaseException:
+        # Including cancellation at shutdown, so the final drain still writes these
+        daily_stats_buffer.restore(rows)
+        raise
+    rolling_stats_cache.flushed({r["user_id"] for r in rows})
+    return len(rows)
+
+
+async def flush_daily_stats_forever() -> None:
+    while True:
+        await asyncio.sleep(settings.user_stats_flush_seconds)
+        try:
+            await flush_daily_stats()
+        except Exception as e:
+            logger.warning("Daily stats flush failed: %s", e)
+
+
+async def load_rolling_stats(session, user_id: int) -> dict[date, tuple]:
+    """Rolling-window rows for `user_id` (cached), not including unflushed deltas."""
+    days = rolling_stats_cache.get(user_id)
+    if days is not None:
+        return days
+    generation = rolling_stats_cache.generation
+    start, end = rolling_window()
+    res = await session.execute(
+        select(UserDailyStats.date, *[getattr(UserDailyStats, f) for f in STAT_FIELDS])
+        .where(UserDailyStats.user_id == user_id, UserDailyStats.date >= start, UserDailyStats.date <= end)
+    )
+    days = {row[0]: tuple(int(v or 0) for v in row[1:]) for row in res.all()}
+    rolling_stats_cache.set(user_id, days, generation)
+    return days
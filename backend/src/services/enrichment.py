@@ -11,11 +11,12 @@ from ..models import (
     Movie,
     Genre,
     Person,
-    StreamingPlatform,
-    MovieStreamingOption,
     movie_people,
     movie_genres,
 )
+from ..repositories.collections import CollectionRepository
+from ..repositories.releases import ReleaseRepository
+from ..repositories.streaming import StreamingRepository
 from ..integrations.gemini_client import fetch_movie_enrichment_with_gemini
 from ..integrations.tmdb_client import search_movie as tmdb_search, TMDBError
 from ..config import settings
@@ -45,16 +46,6 @@ async def _get_or_create_person(session: AsyncSession, name: str, image: Optiona
     await session.flush()
     return p
 
-async def _get_or_create_platform(session: AsyncSession, key: str) -> StreamingPlatform:
-    res = await session.execute(select(StreamingPlatform).where(StreamingPlatform.name.ilike(key)))
-    plat = res.scalar_one_or_none()
-    if plat:
-        return plat
-    plat = StreamingPlatform(external_id=key.lower(), name=key, logo_url=None, website_url=None)
-    session.add(plat)
-    await session.flush()
-    return plat
-
 # TMDB fallback ---------------------------------------------------
 async def fetch_tmdb_enrichment(query: str) -> Optional[Dict[str, Any]]:
     """
@@ -172,6 +163,7 @@ async def enrich_movie_from_query(
     movie.language = data.get("language")
     movie.country = data.get("country")
     movie.overview = data.get("overview")
+    poster_changed = is_update and movie.poster_url != data.get("poster_url")
     movie.poster_url = data.get("poster_url")
     movie.backdrop_url = data.get("backdrop_url")
     movie.budget = data.get("budget")
@@ -216,25 +208,17 @@ async def enrich_movie_from_query(
         for per in (data.get("cast") or []):
             await link(per, "actor", per.get("character"))
 
-    # Streaming (replace)
+    # Regional release dates (replace)
+    if data.get("release_dates") is not None:
+        await ReleaseRepository(session).replace_release_dates(movie.id, data["release_dates"])
+
+    # Streaming (diffed so unchanged offers keep their added_at)
     if data.get("streaming") is not None:
-        await session.execute(MovieStreamingOption.__table__.delete().where(MovieStreamingOption.movie_id == movie.id))
-        await session.flush()
-        for i, s in enumerate(data.get("streaming") or []):
-            plat = await _get_or_create_platform(session, s.get("platform") or "unknown")
-            ext_id = f"{movie.external_id}-{plat.external_id}-{s.get('region') or 'XX'}-{i}"
-            opt = MovieStreamingOption(
-                external_id=ext_id,
-                movie_id=movie.id,
-                platform_id=plat.id,
-                region=s.get("region") or "XX",
-                type=s.get("type") or "subscription",
-                price=s.get("price"),
-                quality=s.get("quality"),
-                url=s.get("url"),
-                verified=True,
-            )
-            session.add(opt)
+        await StreamingRepository(session).replace_options(movie, data.get("streaming") or [])
+
+    # Collections store their first posters
+    if poster_changed:
+        await CollectionRepository(session).refresh_previews(movie.id)
 
     await session.flush()
     return {"external_id": movie.external_id, "updated": is_update, "provider_used": provider_used}
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from array import array
+from bisect import bisect_left
+from typing import Any, Iterable, Optional
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from .. import db
+from ..config import settings
+from ..models import UserFollow
+
+logger = logging.getLogger(__name__)
+
+_EMPTY = array("i")
+
+
+def _contains(values: array, x: int) -> bool:
+    i = bisect_left(values, x)
+    return i < len(values) and values[i] == x
+
+
+def _insert(index: dict[int, array], key: int, x: int) -> bool:
+    values = index.setdefault(key, array("i"))
+    i = bisect_left(values, x)
+    if i < len(values) and values[i] == x:
+        return False
+    values.insert(i, x)
+    return True
+
+
+def _remove(index: dict[int, array], key: int, x: int) -> bool:
+    values = index.get(key)
+    if not values:
+        return False
+    i = bisect_left(values, x)
+    if i == len(values) or values[i] != x:
+        return False
+    del values[i]
+    if not values:
+        del index[key]
+    return True
+
+
+def intersect(a: array, b: array) -> list[int]:
+    """Sorted intersection; probes the larger array from the smaller one."""
+    small, large = (a, b) if len(a) <= len(b) else (b, a)
+    return [x for x in small if _contains(large, x)]
+
+
+class FollowGraph:
+    """
+    In-memory adjacency for one "source follows target" relation.
+
+    Each side keeps a sorted `array('i')` per node (4 bytes per edge), so
+    membership is a binary search and mutuals are a sorted intersection.
+    The graph is per process: it is loaded at startup, kept current by the
+    commit hook below for writes made in this process, and reloaded every
+    `follow_graph_reload_seconds` to pick up writes from other workers. It
+    can therefore lag the database, so it only serves feed hydration (the
+    following feed and `isFollowing` on pulses). Write guards and follower
+    counts read the database and `user_counters`. Callers fall back to the
+    database while `loaded` is False.
+    """
+
+    def __init__(self) -> None:
+        self._out: dict[int, array] = {}
+        self._in: dict[int, array] = {}
+        self.loaded = False
+
+    def load(self, edges: Iterable[tuple[int, int]]) -> None:
+        out: dict[int, list[int]] = {}
+        inc: dict[int, list[int]] = {}
+        for source, target in edges:
+            out.setdefault(source, []).append(target)
+            inc.setdefault(target, []).append(source)
+        self._out = {k: array("i", sorted(set(v))) for k, v in out.items()}
+        self._in = {k: array("i", sorted(set(v))) for k, v in inc.items()}
+        self.loaded = True
+
+    def add(self, source: int, target: int) -> None:
+        _insert(self._out, source, target)
+        _insert(self._in, target, source)
+
+    def remove(self, source: int, target: int) -> None:
+        _remove(self._out, source, target)
+        _remove(self._in, target, source)
+
+    def follows(self, source: int, target: int) -> bool:
+        return _contains(self._out.get(source, _EMPTY), target)
+
+    def following(self, source: int) -> array:
+        return self._out.get(source, _EMPTY)
+
+    def followers(self, target: int) -> array:
+        return self._in.get(target, _EMPTY)
+
+    def following_count(self, source: int) -> int:
+        return len(self._out.get(source, _EMPTY))
+
+    def follower_count(self, target: int) -> int:
+        return len(self._in.get(target, _EMPTY))
+
+    def mutuals(self, viewer: int, target: int) -> list[int]:
+        """Nodes `viewer` follows that also follow `target`."""
+        return intersect(self.following(viewer), self.followers(target))
+
+    def relations(self, viewer: Optional[int], targets: Iterable[int]) -> dict[int, dict[str, Any]]:
+        """Batched counts and viewer relationship for feed/profile hydration."""
+        out: dict[int, dict[str, Any]] = {}
+        for t in targets:
+            out[t] = {
+                "followers": self.follower_count(t),
+                "following": self.following_count(t),
+                "isFollowing": viewer is not None and self.follows(viewer, t),
+                "followsYou": viewer is not None and self.follows(t, viewer),
+                "mutualCount": len(self.mutuals(viewer, t)) if viewer is not None else 0,
+            }
+        return out
+
+
+# users -> users (user_follows)
+user_follow_graph = FollowGraph()
+
+_PENDING_KEY = "follow_graph_changes"
+
+
+def record_follow_change(session, graph: FollowGraph, source: int, target: int, followed: bool) -> None:
+    """Queue an edge change; it is applied to `graph` only if the session commits."""
+    session.info.setdefault(_PENDING_KEY, []).append((graph, source, target, followed))
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_follow_changes(session: Session) -> None:
+    for graph, source, target, followed in session.info.pop(_PENDING_KEY, ()):
+        if graph.loaded:
+            (graph.add if followed else graph.remove)(source, target)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_follow_changes(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+async def load_follow_graphs() -> None:
+    if db.SessionLocal is None or not settings.follow_graph_enabled:
+        return
+    async with db.SessionLocal() as session:
+        users = await session.execute(select(UserFollow.follower_id, UserFollow.following_id))
+        user_follow_graph.load(users.tuples())
+    logger.info("Follow graphs loaded")
+
+
+async def reload_follow_graphs_forever() -> None:
+    """Periodic reload so each worker sees follows written by the others."""
+    while True:
+        await asyncio.sleep(settings.follow_graph_reload_seconds)
+        try:
+            await load_follow_graphs()
+        except Exception as e:
+            logger.warning("Follow graph reload failed: %s", e)
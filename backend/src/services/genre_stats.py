@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Iterable, Optional
+
+from .. import db
+from ..config import settings
+from ..repositories.genres import GenreRepository
+
+logger = logging.getLogger(__name__)
+
+
+def schedule_genre_stats_refresh(background_tasks, genre_ids: Iterable[int]) -> None:
+    """Refresh the stats of these genres after the response is sent."""
+    ids = sorted(set(genre_ids))
+    if ids:
+        background_tasks.add_task(refresh_genre_stats, ids)
+
+
+async def refresh_genre_stats(genre_ids: Optional[list[int]] = None) -> int:
+    """Recompute genre_stats for `genre_ids` (all genres if None). Returns how many were written."""
+    if db.SessionLocal is None:
+        return 0
+    try:
+        async with db.SessionLocal() as session:
+            built = await GenreRepository(session).refresh_stats(genre_ids)
+            await session.commit()
+            return len(built)
+    except Exception as e:  # background work must never surface to the client
+        logger.warning("Genre stats refresh failed for %s: %s", genre_ids or "all genres", e)
+        return 0
+
+
+async def refresh_genre_stats_forever() -> None:
+    # Ratings and scores change outside catalog imports; a periodic full pass picks those up
+    while True:
+        await asyncio.sleep(settings.genre_stats_refresh_seconds)
+        await refresh_genre_stats()
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import logging
+from typing import Iterable
+
+from sqlalchemy import select
+
+from .. import db
+from ..models import AwardCeremony, AwardCeremonyYear, Festival, FestivalEdition
+from ..repositories.awards import AwardsRepository
+from ..repositories.festivals import FestivalsRepository
+from ..repositories.page_snapshots import (
+    AWARD_YEAR,
+    FESTIVAL_PROGRAM,
+    FESTIVAL_WINNERS,
+    PageSnapshotRepository,
+    festival_key,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def schedule_ceremony_snapshot_rebuild(background_tasks, ceremony_external_ids: Iterable[str]) -> None:
+    """Rebuild the award-year snapshots of these ceremonies after the response is sent."""
+    ids = sorted(set(ceremony_external_ids))
+    if ids:
+        background_tasks.add_task(rebuild_ceremony_snapshots, ids)
+
+
+def schedule_festival_snapshot_rebuild(background_tasks, festival_external_ids: Iterable[str]) -> None:
+    """Rebuild the program/winners snapshots of these festivals after the response is sent."""
+    ids = sorted(set(festival_external_ids))
+    if ids:
+        background_tasks.add_task(rebuild_festival_snapshots, ids)
+
+
+async def rebuild_ceremony_snapshots(ceremony_external_ids: list[str]) -> int:
+    if db.SessionLocal is None:
+        return 0
+    built = 0
+    try:
+        async with db.SessionLocal() as session:
+            years = await session.execute(
+                select(AwardCeremonyYear.external_id)
+                .join(AwardCeremony, AwardCeremony.id == AwardCeremonyYear.ceremony_id)
+                .where(AwardCeremony.external_id.in_(ceremony_external_ids))
+            )
+            awards, snapshots = AwardsRepository(session), PageSnapshotRepository(session)
+            for year_ext in years.scalars().all():
+                result = await awards.build_award_details(year_ext)
+                if result is not None:
+                    scope, payload = result
+                    await snapshots.put(AWARD_YEAR, year_ext, scope, payload)
+                    built += 1
+            await session.commit()
+    except Exception as e:  # background work must never surface to the client
+        logger.warning("Award snapshot rebuild failed for %s: %s", ceremony_external_ids, e)
+    return built
+
+
+async def rebuild_festival_snapshots(festival_external_ids: list[str]) -> int:
+    if db.SessionLocal is None:
+        return 0
+    built = 0
+    try:
+        async with db.SessionLocal() as session:
+            editions = await session.execute(
+                select(Festival.external_id, FestivalEdition.year)
+                .join(FestivalEdition, FestivalEdition.festival_id == Festival.id)
+                .where(Festival.external_id.in_(festival_external_ids))
+            )
+            festivals, snapshots = FestivalsRepository(session), PageSnapshotRepository(session)
+            for festival_ext, year in editions.all():
+                key = festival_key(festival_ext, year)
+                for kind, build in ((FESTIVAL_PROGRAM, festivals.build_program), (FESTIVAL_WINNERS, festivals.build_winners)):
+                    payload = await build(festival_ext, year)
+                    if payload is not None:
+                        await snapshots.put(kind, key, festival_ext, payload)
+                        built += 1
+            await session.commit()
+    except Exception as e:  # background work must never surface to the client
+        logger.warning("Festival snapshot rebuild failed for %s: %s", festival_external_ids, e)
+    return built
@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from bisect import bisect_left, insort
+from datetime import datetime
+from typing import Iterable, Optional
+
+from sqlalchemy import event, func, or_, and_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from .. import db
+from ..config import settings
+from ..models import QuizLeaderboardEntry
+from .cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Attempts without a completion time sort after every timed attempt with the same score
+NO_TIME = 2**31 - 1
+FLUSH_BATCH_SIZE = 1000
+
+
+def rank_key(user_id: int, score: int, time_seconds: Optional[int]) -> tuple[int, int, int]:
+    return (-score, NO_TIME if time_seconds is None else time_seconds, user_id)
+
+
+def is_better(score: int, time_seconds: Optional[int], than: Optional[tuple[int, Optional[int]]]) -> bool:
+    if than is None:
+        return True
+    return rank_key(0, score, time_seconds)[:2] < rank_key(0, *than)[:2]
+
+
+class Leaderboard:
+    """
+    Best result per user for one quiz, kept as a sorted list of
+    (-score, time, user_id) keys: higher score first, then faster, then the
+    lower user id. Rank lookups are a binary search; top-N and the window
+    around a user are slices.
+    """
+
+    def __init__(self, entries: Iterable[tuple[int, int, Optional[int]]] = ()) -> None:
+        self._best: dict[int, tuple[int, int, int]] = {}
+        for user_id, score, time_seconds in entries:
+            key = rank_key(user_id, score, time_seconds)
+            if user_id not in self._best or key < self._best[user_id]:
+                self._best[user_id] = key
+        self._keys = sorted(self._best.values())
+
+    def record(self, user_id: int, score: int, time_seconds: Optional[int]) -> bool:
+        """Keep the result if it beats the user's best. Returns True if it did."""
+        key = rank_key(user_id, score, time_seconds)
+        old = self._best.get(user_id)
+        if old is not None:
+            if key >= old:
+                return False
+            del self._keys[bisect_left(self._keys, old)]
+        self._best[user_id] = key
+        insort(self._keys, key)
+        return True
+
+    def rank(self, user_id: int) -> Optional[int]:
+        key = self._best.get(user_id)
+        return None if key is None else bisect_left(self._keys, key) + 1
+
+    def _entries(self, start: int, stop: int) -> list[dict]:
+        return [
+            {
+                "rank": start + i + 1,
+                "userId": user_id,
+                "score": -neg_score,
+                "completionTime": None if t == NO_TIME else t,
+            }
+            for i, (neg_score, t, user_id) in enumerate(self._keys[start:stop])
+        ]
+
+    def top(self, n: int) -> list[dict]:
+        return self._entries(0, n)
+
+    def around(self, user_id: int, window: int) -> list[dict]:
+        """The user's entry with up to `window` neighbours on each side."""
+        rank = self.rank(user_id)
+        if rank is None:
+            return []
+        return self._entries(max(rank - 1 - window, 0), rank + window)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+class LeaderboardStore:
+    """
+    Per-process boards for recently read ("hot") quizzes plus the results not
+    yet persisted. Submissions update the hot board directly and leave the
+    user's best in `_dirty`; `flush_quiz_leaderboards` writes those with a
+    keep-the-better upsert. Keeping the best is idempotent, so a board loaded
+    while a flush is in flight cannot double count.
+    """
+
+    def __init__(self, ttl_seconds: float, max_boards: int) -> None:
+        self._boards = TTLCache(ttl_seconds=ttl_seconds, max_entries=max_boards)
+        self._dirty: dict[tuple[int, int], tuple[int, Optional[int]]] = {}
+
+    def record(self, quiz_id: int, user_id: int, score: int, time_seconds: Optional[int]) -> None:
+        if is_better(score, time_seconds, self._dirty.get((quiz_id, user_id))):
+            self._dirty[(quiz_id, user_id)] = (score, time_seconds)
+        board = self._boards.get(quiz_id)
+        if board is not None:
+            board.record(user_id, score, time_seconds)
+
+    def hot(self, quiz_id: int) -> Optional[Leaderboard]:
+        return self._boards.get(quiz_id)
+
+    def keep(self, quiz_id: int, board: Leaderboard) -> None:
+        for (qid, user_id), (score, time_seconds) in list(self._dirty.items()):
+            if qid == quiz_id:
+                board.record(user_id, score, time_seconds)
+        self._boards.set(quiz_id, board)
+
+    def drain(self) -> list[dict]:
+        dirty, self._dirty = self._dirty, {}
+        now = datetime.utcnow()
+        return [
+            {"quiz_id": qid, "user_id": uid, "score_percent": score,
+             "completion_time_seconds": t, "created_at": now}
+            for (qid, uid), (score, t) in sorted(dirty.items())
+        ]
+
+    def restore(self, rows: Iterable[dict]) -> None:
+        for r in rows:
+            key = (r["quiz_id"], r["user_id"])
+            if is_better(r["score_percent"], r["completion_time_seconds"], self._dirty.get(key)):
+                self._dirty[key] = (r["score_percent"], r["completion_time_seconds"])
+
+    def __len__(self) -> int:
+        return len(self._dirty)
+
+
+leaderboards = LeaderboardStore(
+    ttl_seconds=settings.quiz_leaderboard_cache_ttl_seconds,
+    max_boards=settings.quiz_leaderboard_max_boards,
+)
+
+_PENDING_KEY = "quiz_leaderboard_results"
+
+
+def record_quiz_result(session, quiz_id: int, user_id: int, score: int, time_seconds: Optional[int]) -> None:
+    """Queue a finished attempt; it reaches the leaderboards only if the session commits."""
+    session.info.setdefault(_PENDING_KEY, []).append((quiz_id, user_id, score, time_seconds))
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_quiz_results(session: Session) -> None:
+    for result in session.info.pop(_PENDING_KEY, ()):
+        leaderboards.record(*result)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_quiz_results(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+async def load_leaderboard(session, quiz_id: int) -> Leaderboard:
+    """The hot board for `quiz_id`, loaded from the best-per-user table on a miss."""
+    board = leaderboards.hot(quiz_id)
+    if board is not None:
+        return board
+    res = await session.execute(
+        select(
+            QuizLeaderboardEntry.user_id,
+            QuizLeaderboardEntry.score_percent,
+            QuizLeaderboardEntry.completion_time_seconds,
+        ).where(QuizLeaderboardEntry.quiz_id == quiz_id)
+    )
+    board = Leaderboard(res.tuples())
+    leaderboards.keep(quiz_id, board)
+    return board
+
+
+def upsert_statement(rows: list[dict]):
+    """Multi-row upsert that only replaces a stored entry with a better one."""
+    stmt = pg_insert(QuizLeaderboardEntry).values(rows)
+    table, new = QuizLeaderboardEntry, stmt.excluded
+    return stmt.on_conflict_do_update(
+        constraint="uq_quiz_leaderboard_user",
+        set_={
+            "score_percent": new.score_percent,
+            "completion_time_seconds": new.completion_time_seconds,
+            "created_at": new.created_at,
+        },
+        where=or_(
+            new.score_percent > table.score_percent,
+            and_(
+                new.score_percent == table.score_percent,
+                func.coalesce(new.completion_time_seconds, NO_TIME)
+                < func.coalesce(table.completion_time_seconds, NO_TIME),
+            ),
+        ),
+    )
+
+
+async def flush_quiz_leaderboards() -> int:
+    """Persist pending best results. Returns the number of rows written."""
+    if db.SessionLocal is None or not len(leaderboards):
+        return 0
+    rows = leaderboards.drain()
+    try:
+        async with db.SessionLocal() as session:
+            for i in range(0, len(rows), FLUSH_BATCH_SIZE):
+                await session.execute(upsert_statement(rows[i:i + FLUSH_BATCH_SIZE]))
+            await session.commit()
+    except BaseException:
+        # Including cancellation at shutdown, so the final drain still writes these
+        leaderboards.restore(rows)
+        raise
+    return len(rows)
+
+
+async def flush_quiz_leaderboards_forever() -> None:
+    while True:
+        await asyncio.sleep(settings.quiz_leaderboard_flush_seconds)
+        try:
+            await flush_quiz_leaderboards()
+        except Exception as e:
+            logger.warning("Quiz leaderboard flush failed: %s", e)
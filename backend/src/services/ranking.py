@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import math
+from datetime import datetime
+from typing import Optional
+
+# 95% confidence for the Wilson lower bound
+WILSON_Z = 1.96
+
+# Blend weights. Recency is an additive offset that grows with creation time,
+# so stored scores never need to decay: a review written a year later ranks
+# as if it had 0.1 more helpful-ratio.
+COMMENT_WEIGHT = 0.05
+RECENCY_WEIGHT_PER_YEAR = 0.1
+RECENCY_EPOCH = datetime(2020, 1, 1)
+
+
+def wilson_lower_bound(positive: int, total: int, z: float = WILSON_Z) -> float:
+    """Lower bound of the Wilson score interval for `positive` out of `total` votes."""
+    if total <= 0:
+        return 0.0
+    p = positive / total
+    z2 = z * z
+    centre = p + z2 / (2 * total)
+    margin = z * math.sqrt((p * (1 - p) + z2 / (4 * total)) / total)
+    return (centre - margin) / (1 + z2 / total)
+
+
+def review_rank_score(
+    helpful: int, unhelpful: int, comment_count: int, created_at: Optional[datetime]
+) -> float:
+    """Ranking score for "helpful" ordering: Wilson bound + comment activity + recency."""
+    years = ((created_at or RECENCY_EPOCH) - RECENCY_EPOCH).total_seconds() / (365 * 86400)
+    score = (
+        wilson_lower_bound(helpful, helpful + unhelpful)
+        + COMMENT_WEIGHT * math.log1p(max(0, comment_count))
+        + RECENCY_WEIGHT_PER_YEAR * years
+    )
+    return round(score, 6)
+
+
+def refresh_review_rank(review) -> None:
+    """Recompute a Review's stored `rank_score` and `engagement_score` after a vote or comment write."""
+    helpful = review.helpful_votes or 0
+    unhelpful = review.unhelpful_votes or 0
+    comments = review.comment_count or 0
+    review.rank_score = review_rank_score(helpful, unhelpful, comments, review.date)
+    review.engagement_score = helpful + unhelpful + comments
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import logging
+
+from .. import db
+from ..config import settings
+from ..repositories.suggestions import UserSuggestionRepository
+from .cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Users refreshed (or queued) recently in this process. Keeps users with no
+# candidates from triggering a recompute on every request.
+_recent = TTLCache(ttl_seconds=settings.user_suggestions_ttl_seconds, max_entries=10000)
+
+
+def schedule_suggestion_refresh(background_tasks, user_id: int) -> None:
+    """Queue a recompute of `user_id`'s follow suggestions after the response is sent."""
+    if _recent.get(user_id) is not None:
+        return
+    _recent.set(user_id, True)
+    background_tasks.add_task(refresh_user_suggestions, user_id)
+
+
+async def refresh_user_suggestions(user_id: int) -> None:
+    if db.SessionLocal is None:
+        return
+    try:
+        async with db.SessionLocal() as session:
+            await UserSuggestionRepository(session).refresh(user_id)
+            await session.commit()
+    except Exception as e:  # background work must never surface to the client
+        _recent.invalidate(user_id)
+        logger.warning("Suggestion refresh failed for user %s: %s", user_id, e)
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import logging
+
+from .. import db
+from ..repositories.review_votes import ReviewVoteRepository
+
+logger = logging.getLogger(__name__)
+
+# Reviews with a reconciliation already queued in this process. A burst of
+# votes on one review schedules a single pass; votes landing after the pass
+# has started queue the next one.
+_pending: set[str] = set()
+
+
+def schedule_review_reconcile(background_tasks, review_id: str) -> None:
+    """Queue a vote-count/rank reconciliation for `review_id` after the response is sent."""
+    if review_id in _pending:
+        return
+    _pending.add(review_id)
+    background_tasks.add_task(reconcile_review_votes, review_id)
+
+
+async def reconcile_review_votes(review_id: str) -> None:
+    _pending.discard(review_id)
+    if db.SessionLocal is None:
+        return
+    try:
+        async with db.SessionLocal() as session:
+            await ReviewVoteRepository(session).reconcile([review_id])
+            await session.commit()
+    except Exception as e:  # background work must never surface to the client
+        logger.warning("Review vote reconciliation failed for %s: %s", review_id, e)
@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import uuid
+from collections import Counter
+from datetime import datetime
+from typing import Iterable, Optional
+
+from sqlalchemy import and_, case, literal_column, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import DBAPIError, IntegrityError, InterfaceError, OperationalError
+
+from .. import db
+from ..config import settings
+from ..models import Movie, Watchlist
+from ..repositories.user_counters import UserCountersRepository
+from .cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+WATCHED_PERCENT = 95
+FLUSH_BATCH_SIZE = 1000
+# A row whose flush keeps failing is dropped after this many attempts; connection
+# errors don't count, and rows the watchlist rejects outright are dropped at once
+MAX_FLUSH_ATTEMPTS = 3
+# Player transitions that are written right away instead of on the next periodic flush
+FLUSH_ON_STATUS = ("paused", "ended")
+
+# Watchlist status a heartbeat moves towards; None leaves the stored status alone
+_STATUS_RANK = {None: 0, "watching": 1, "watched": 2}
+
+
+def progress_percent(progress_seconds: int, total_duration_seconds: int) -> int:
+    if total_duration_seconds <= 0:
+        return 0
+    return int(progress_seconds / total_duration_seconds * 100)
+
+
+def target_status(player_status: str, percent: int) -> Optional[str]:
+    """"watched" once the movie ended (or nearly), "watching" while playing, else no change."""
+    if player_status == "ended" or percent >= WATCHED_PERCENT:
+        return "watched"
+    if player_status == "playing":
+        return "watching"
+    return None
+
+
+def _stronger(a: Optional[str], b: Optional[str]) -> Optional[str]:
+    return a if _STATUS_RANK[a] >= _STATUS_RANK[b] else b
+
+
+class WatchProgressBuffer:
+    """
+    Latest player heartbeat per (user, movie), waiting to be written to the
+    watchlist.
+
+    A newer heartbeat replaces the position of an older one but never
+    weakens its status, so "ended" followed by a stray "playing" in the same
+    window still marks the movie watched. Per process, like the other
+    write-behind buffers; `drain` hands rows to the flusher, which puts them
+    back with `restore` if the write fails.
+    """
+
+    def __init__(self) -> None:
+        self._latest: dict[tuple[int, int], dict] = {}
+
+    def add(
+        self,
+        user_id: int,
+        movie_id: int,
+        progress_seconds: int,
+        total_duration_seconds: int,
+        player_status: str,
+        at: Optional[datetime] = None,
+    ) -> dict:
+        key = (user_id, movie_id)
+        percent = progress_percent(progress_seconds, total_duration_seconds)
+        status = target_status(player_status, percent)
+        prev = self._latest.get(key)
+        if prev is not None:
+            status = _stronger(prev["status"], status)
+        entry = {
+            "user_id": user_id,
+            "movie_id": movie_id,
+            "progress_seconds": progress_seconds,
+            "total_duration_seconds": total_duration_seconds,
+            "progress": percent,
+            "last_watched_at": at or datetime.utcnow(),
+            "status": status,
+            "attempts": 0,
+        }
+        self._latest[key] = entry
+        return entry
+
+    def drain(self) -> list[dict]:
+        """Take everything buffered, ordered by (user_id, movie_id)."""
+        latest, self._latest = self._latest, {}
+        return [latest[k] for k in sorted(latest)]
+
+    def restore(self, rows: Iterable[dict], count_attempt: bool = True) -> int:
+        """
+        Put back rows whose flush failed; newer heartbeats win. Without
+        `count_attempt` (e.g. the database was unreachable) the failure does
+        not count towards MAX_FLUSH_ATTEMPTS. Returns how many were dropped.
+        """
+        dropped = 0
+        step = 1 if count_attempt else 0
+        for r in rows:
+            if r["attempts"] + step >= MAX_FLUSH_ATTEMPTS:
+                dropped += 1
+                continue
+            key = (r["user_id"], r["movie_id"])
+            newer = self._latest.get(key)
+            if newer is None:
+                self._latest[key] = {**r, "attempts": r["attempts"] + step}
+            else:
+                newer["status"] = _stronger(r["status"], newer["status"])
+        return dropped
+
+    def __len__(self) -> int:
+        return len(self._latest)
+
+
+watch_progress_buffer = WatchProgressBuffer()
+
+# Movie external_id -> movies.id for heartbeats; ids never change, deletes are rare
+movie_id_cache = TTLCache(
+    ttl_seconds=settings.movie_id_cache_ttl_seconds,
+    max_entries=settings.movie_id_cache_max_entries,
+)
+
+_flush_lock = asyncio.Lock()
+
+
+async def resolve_movie_id(session, external_id: str) -> Optional[int]:
+    movie_id = movie_id_cache.get(external_id)
+    if movie_id is None:
+        res = await session.execute(select(Movie.id).where(Movie.external_id == external_id))
+        movie_id = res.scalar_one_or_none()
+        if movie_id is not None:
+            movie_id_cache.set(external_id, movie_id)
+    return movie_id
+
+
+def upsert_statement(rows: list[dict], set_status: bool):
+    """
+    One multi-row INSERT ... ON CONFLICT into the watchlist. New rows start
+    as "watching" unless already watched; `set_status` rows also move the
+    stored status (a watched movie stays watched). Returns each row's user id
+    and whether it was inserted.
+    """
+    table = Watchlist.__table__
+    stmt = pg_insert(table).values([
+        {
+            "external_id": str(uuid.uuid4()),
+            "user_id": r["user_id"],
+            "movie_id": r["movie_id"],
+            "date_added": r["last_watched_at"],
+            "status": r["status"] or "watching",
+            "priority": "medium",
+            "progress": r["progress"],
+            "progress_seconds": r["progress_seconds"],
+            "total_duration_seconds": r["total_duration_seconds"],
+            "last_watched_at": r["last_watched_at"],
+        }
+        for r in rows
+    ])
+    set_ = {
+        "progress": stmt.excluded.progress,
+        "progress_seconds": stmt.excluded.progress_seconds,
+        "total_duration_seconds": stmt.excluded.total_duration_seconds,
+        "last_watched_at": stmt.excluded.last_watched_at,
+    }
+    if set_status:
+        set_["status"] = case(
+            (and_(stmt.excluded.status == "watching", table.c.status == "watched"), table.c.status),
+            else_=stmt.excluded.status,
+        )
+    return stmt.on_conflict_do_update(constraint="uq_watchlist_user_movie", set_=set_).returning(
+        table.c.user_id, literal_column("xmax = 0").label("inserted")
+    )
+
+
+def is_transient(exc: BaseException) -> bool:
+    """Failures of the connection rather than of the rows being written."""
+    if isinstance(exc, DBAPIError):
+        return exc.connection_invalidated or isinstance(exc, (OperationalError, InterfaceError))
+    return isinstance(exc, (OSError, asyncio.TimeoutError))
+
+
+async def _write_part(session, part: list[dict], set_status: bool, added: Counter, rejected: list[dict]) -> None:
+    """
+    Upsert `part` under a savepoint. If the watchlist rejects it (e.g. a
+    movie was deleted meanwhile), write its rows one by one so only the
+    offending rows end up in `rejected`.
+    """
+    try:
+        async with session.begin_nested():
+            res = await session.execute(upsert_statement(part, set_status))
+            added.update(user_id for user_id, inserted in res.tuples() if inserted)
+        return
+    except IntegrityError:
+        if len(part) == 1:
+            rejected.extend(part)
+            return
+    for r in part:
+        await _write_part(session, [r], set_status, added, rejected)
+
+
+async def flush_watch_progress() -> int:
+    """Write buffered heartbeats. Returns the number of watchlist rows written."""
+    if db.SessionLocal is None or not len(watch_progress_buffer):
+        return 0
+    # One flush at a time, so an older drain can never land after a newer one
+    async with _flush_lock:
+        rows = watch_progress_buffer.drain()
+        if not rows:
+            return 0
+        rejected: list[dict] = []
+        try:
+            async with db.SessionLocal() as session:
+                added: Counter[int] = Counter()
+                for i in range(0, len(rows), FLUSH_BATCH_SIZE):
+                    batch = rows[i:i + FLUSH_BATCH_SIZE]
+                    for set_status in (True, False):
+                        part = [r for r in batch if (r["status"] is not None) == set_status]
+                        if part:
+                            await _write_part(session, part, set_status, added, rejected)
+                counters = UserCountersRepository(session)
+                for user_id, n in added.items():
+                    await counters.bump(user_id, watchlist=n)
+                await session.commit()
+        except BaseException as e:
+            # Cancellation at shutdown puts rows back too (without counting an
+            # attempt), so the final drain still writes them
+            rejected_ids = {id(r) for r in rejected}
+            failed = [r for r in rows if id(r) not in rejected_ids]
+            count_attempt = isinstance(e, Exception) and not is_transient(e)
+            dropped = watch_progress_buffer.restore(failed, count_attempt=count_attempt)
+            if dropped:
+                logger.warning("Dropped %d watch progress rows after %d failed flushes", dropped, MAX_FLUSH_ATTEMPTS)
+            raise
+        finally:
+            if rejected:
+                logger.warning("Dropped %d watch progress rows the watchlist rejected", len(rejected))
+    return len(rows) - len(rejected)
+
+
+async def _flush_now() -> None:
+    try:
+        await flush_watch_progress()
+    except Exception as e:  # background work must never surface to the client
+        logger.warning("Watch progress flush failed: %s", e)
+
+
+def schedule_watch_progress_flush(background_tasks) -> None:
+    """Flush the buffer after the response is sent (pause/end transitions)."""
+    background_tasks.add_task(_flush_now)
+
+
+async def flush_watch_progress_forever() -> None:
+    while True:
+        await asyncio.sleep(settings.watch_progress_flush_seconds)
+        await _flush_now()
@@ -7,6 +7,7 @@ This module provides shared fixtures for all tests including:
 - Test users (regular user, critic, admin, other critic)
 - Authentication tokens for different user types
 - Test data factories (movies, blog posts, recommendations, etc.)
+- A recording session for unit tests of repository statements
 
 Author: IWM Development Team
 Date: 2025-01-30
@@ -14,11 +15,13 @@ Date: 2025-01-30
 
 import pytest
 import pytest_asyncio
+from contextlib import asynccontextmanager
 from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.pool import StaticPool
 from datetime import datetime, timedelta
-from typing import Dict, Any
+from typing import Any, Callable, Dict, List, Optional, Union
 import sys
 from pathlib import Path
 import uuid
@@ -300,3 +303,90 @@ async def test_other_critic_profile(test_other_critic_user: User, async_db_sessi
     return result.scalar_one()
 
 
+# ============================================================================
+# RECORDING SESSION
+# ============================================================================
+
+def _scalar(row: Any) -> Any:
+    return row[0] if isinstance(row, tuple) else row
+
+
+class RecordingResult:
+    """The slice of the SQLAlchemy Result API the repositories use, over fixed rows."""
+
+    def __init__(self, rows: List[Any]):
+        self.rows = list(rows)
+        self.rowcount = len(self.rows)
+
+    def all(self) -> List[Any]:
+        return self.rows
+
+    def tuples(self) -> List[Any]:
+        return self.rows
+
+    def first(self) -> Any:
+        return self.rows[0] if self.rows else None
+
+    def one_or_none(self) -> Any:
+        return self.first()
+
+    def scalar_one(self) -> Any:
+        return _scalar(self.rows[0])
+
+    def scalar_one_or_none(self) -> Any:
+        return _scalar(self.rows[0]) if self.rows else None
+
+    def scalars(self) -> "RecordingResult":
+        return RecordingResult([_scalar(r) for r in self.rows])
+
+    def __iter__(self):
+        return iter(self.rows)
+
+
+class RecordingSession:
+    """
+    Stand-in for an AsyncSession in unit tests. Every executed statement is
+    compiled with the Postgres dialect into `statements`; results come from
+    `rows`, either a list of rows or a callable taking the compiled SQL (it
+    may raise to simulate a database error). Usable as `async with`, so a
+    test can stand it in for `db.SessionLocal()`.
+    """
+
+    def __init__(self, rows: Union[List[Any], Callable[[str], List[Any]], None] = None, literal_binds: bool = False):
+        self.rows = rows if rows is not None else []
+        self.literal_binds = literal_binds
+        self.statements: List[str] = []
+
+    def compile(self, stmt: Any) -> str:
+        kwargs = {"literal_binds": True} if self.literal_binds else {}
+        return str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs=kwargs))
+
+    async def execute(self, stmt: Any, params: Optional[Any] = None) -> RecordingResult:
+        sql = self.compile(stmt)
+        self.statements.append(sql)
+        return RecordingResult(self.rows(sql) if callable(self.rows) else self.rows)
+
+    async def __aenter__(self) -> "RecordingSession":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        pass
+
+    @asynccontextmanager
+    async def begin_nested(self):
+        yield
+
+    async def flush(self) -> None:
+        pass
+
+    async def commit(self) -> None:
+        pass
+
+    async def rollback(self) -> None:
+        pass
+
+
+@pytest.fixture
+def recording_session() -> RecordingSession:
+    """A RecordingSession returning no rows; set `.rows` or `.literal_binds` as needed."""
+    return RecordingSession()
@@ -39,8 +39,6 @@ class TestQualityScoringAlgorithm:
             backdrop_url=None,
             genres=[],
             people=[],
-            trivia=None,
-            timeline=None,
             siddu_score=None,
             critics_score=None,
             imdb_rating=None,
@@ -76,23 +74,26 @@ class TestQualityScoringAlgorithm:
             backdrop_url="https://example.com/backdrop.jpg",
             genres=genres,
             people=people,
-            trivia=[
+            siddu_score=8.5,
+            critics_score=7.8,
+            imdb_rating=8.2,
+            rotten_tomatoes_score=85,
+        )
+        
+        content = {
+            "trivia": [
                 {"question": "Q1", "answer": "A1"},
                 {"question": "Q2", "answer": "A2"},
                 {"question": "Q3", "answer": "A3"},
             ],
-            timeline=[
+            "timeline": [
                 {"date": "2024-01-01", "title": "Event 1"},
                 {"date": "2024-01-02", "title": "Event 2"},
                 {"date": "2024-01-03", "title": "Event 3"},
             ],
-            siddu_score=8.5,
-            critics_score=7.8,
-            imdb_rating=8.2,
-            rotten_tomatoes_score=85,
-        )
-        
-        score = calculate_quality_score(movie)
+        }
+
+        score = calculate_quality_score(movie, content)
         assert 0 <= score <= 100
         assert score > 80  # Should be high for complete data
 
@@ -111,8 +112,6 @@ class TestQualityScoringAlgorithm:
             backdrop_url=None,
             genres=[],
             people=[],
-            trivia=None,
-            timeline=None,
             siddu_score=None,
             critics_score=None,
             imdb_rating=None,
@@ -138,8 +137,6 @@ class TestQualityScoringAlgorithm:
             backdrop_url=None,
             genres=[],
             people=[],
-            trivia=None,
-            timeline=None,
             siddu_score=None,
             critics_score=None,
             imdb_rating=None,
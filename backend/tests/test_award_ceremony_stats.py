@@ -0,0 +1,53 @@
+"""
+Unit Tests for award ceremony statistics and caching (repositories.award_ceremonies).
+"""
+
+import asyncio
+import pytest
+
+from src.repositories.award_ceremonies import (
+    AwardCeremoniesRepository,
+    award_ceremony_cache,
+    statistics_from_rows,
+)
+
+
+ROWS = [
+    ("India", None, None, None, 0b0111, 3),
+    (None, None, None, None, 0b0111, 1),
+    (None, "Hindi", None, None, 0b1011, 2),
+    (None, None, "Film", None, 0b1101, 4),
+    (None, None, None, "national", 0b1110, 4),
+    (None, None, None, None, 0b1110, 0),
+    (None, None, None, None, 0b1111, 4),
+]
+
+
+@pytest.mark.unit
+def test_statistics_from_grouping_rows():
+    stats = statistics_from_rows(ROWS)
+    assert stats["total_ceremonies"] == 4
+    assert stats["by_country"] == {"India": 3, "Unknown": 1}
+    assert stats["by_language"] == {"Hindi": 2}
+    assert stats["by_category_type"] == {"Film": 4}
+    assert stats["by_prestige_level"] == {"national": 4, "Unknown": 0}
+
+
+@pytest.mark.unit
+def test_statistics_from_no_rows():
+    assert statistics_from_rows([])["total_ceremonies"] == 0
+
+
+@pytest.mark.unit
+def test_statistics_are_one_query_and_cached(recording_session):
+    award_ceremony_cache.clear()
+    recording_session.rows = ROWS
+    repo = AwardCeremoniesRepository(recording_session)
+    first = asyncio.run(repo.get_statistics())
+    second = asyncio.run(repo.get_statistics())
+    assert first == second
+    assert len(recording_session.statements) == 1
+    award_ceremony_cache.clear()
+    asyncio.run(repo.get_statistics())
+    assert len(recording_session.statements) == 2
+    award_ceremony_cache.clear()
@@ -0,0 +1,72 @@
+"""
+Unit Tests for box office file parsing and validation (services.box_office_ingest).
+"""
+
+import threading
+from datetime import date
+
+import pytest
+
+from src.services.box_office_ingest import ingest_box_office, movie_ref, read_records, validate_record
+
+
+@pytest.mark.unit
+def test_csv_records_carry_line_numbers():
+    lines = ["external_id,date,gross_usd\n", "m1,2026-10-16,100\n", "m2,2026-10-17,200\n"]
+    records = list(read_records(lines, "csv"))
+    assert [n for n, _ in records] == [2, 3]
+    assert records[0][1]["external_id"] == "m1"
+
+
+@pytest.mark.unit
+def test_ndjson_skips_blank_lines_and_reports_bad_json():
+    records = list(read_records(['{"title": "Inception"}\n', "\n", "{oops\n"], "ndjson"))
+    assert records[0] == (1, {"title": "Inception"})
+    assert records[1][0] == 3 and isinstance(records[1][1], ValueError)
+
+
+@pytest.mark.unit
+def test_validate_normalises_field_names_and_values():
+    row = validate_record({"tmdbId": "27205", "Gross USD": "$1,250,000", "Date": "2026-10-16", "Region": "US"})
+    assert row["tmdb_id"] == 27205
+    assert row["gross_usd"] == 1_250_000.0
+    assert row["date"] == date(2026, 10, 16)
+    assert row["region"] == "us"
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "record, message",
+    [
+        ({"date": "2026-10-16", "gross_usd": "1"}, "required"),
+        ({"title": "X", "gross_usd": "1"}, "date is required"),
+        ({"title": "X", "date": "16/10/2026", "gross_usd": "1"}, "YYYY-MM-DD"),
+        ({"title": "X", "date": "2026-10-16", "gross_usd": "-5"}, "negative"),
+        ({"tmdb_id": "abc", "date": "2026-10-16", "gross_usd": "1"}, "integer"),
+    ],
+)
+def test_validate_rejects_bad_rows(record, message):
+    with pytest.raises(ValueError, match=message):
+        validate_record(record)
+
+
+@pytest.mark.unit
+def test_movie_ref_prefers_tmdb_then_external_id_then_title():
+    base = {"date": "2026-10-16", "gross_usd": "1"}
+    assert movie_ref(validate_record({**base, "tmdb_id": "1", "external_id": "m1"})) == ("tmdb", 1)
+    assert movie_ref(validate_record({**base, "external_id": "m1", "title": "M"})) == ("ext", "m1")
+    assert movie_ref(validate_record({**base, "title": "Inception", "year": 2010})) == ("title", "inception", "2010")
+
+
+@pytest.mark.unit
+async def test_file_is_read_off_the_event_loop(recording_session):
+    readers = set()
+
+    def lines():
+        for line in ["external_id,date,gross_usd\n", "m1,not-a-date,100\n"]:
+            readers.add(threading.current_thread())
+            yield line
+
+    report = await ingest_box_office(recording_session, lines(), "csv")
+    assert report.rows_read == 1
+    assert threading.current_thread() not in readers
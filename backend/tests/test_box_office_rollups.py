@@ -0,0 +1,100 @@
+"""
+Unit Tests for box office rollup maintenance (repositories.box_office).
+"""
+
+from datetime import date
+
+import pytest
+
+from src.repositories import box_office
+from src.repositories.box_office import (
+    LIFETIME_START,
+    BoxOfficeRepository,
+    choose_bucket,
+    rollup_deltas,
+    rollup_keys,
+    weekend_start,
+)
+
+
+@pytest.mark.unit
+def test_weekend_start_maps_friday_to_sunday():
+    assert weekend_start(date(2026, 10, 16)) == date(2026, 10, 16)  # Friday
+    assert weekend_start(date(2026, 10, 18)) == date(2026, 10, 16)  # Sunday
+    assert weekend_start(date(2026, 10, 19)) is None  # Monday
+
+
+@pytest.mark.unit
+def test_rollup_keys_cover_every_grain():
+    keys = rollup_keys("m1", "global", date(2026, 10, 17), "WB", ["Drama", "Action"])
+    assert ("global", "day", "total", date(2026, 10, 17), "") in keys
+    assert ("global", "weekend", "movie", date(2026, 10, 16), "m1") in keys
+    assert ("global", "month", "total", date(2026, 10, 1), "") in keys
+    assert ("global", "year", "movie", date(2026, 1, 1), "m1") in keys
+    assert ("global", "year", "studio", date(2026, 1, 1), "WB") in keys
+    assert ("global", "year", "genre", date(2026, 1, 1), "Action") in keys
+    assert ("global", "lifetime", "movie", LIFETIME_START, "m1") in keys
+
+
+@pytest.mark.unit
+def test_weekday_gross_has_no_weekend_rollup():
+    keys = rollup_keys("m1", "global", date(2026, 10, 14), None, [])
+    assert not [k for k in keys if k[1] == "weekend"]
+    assert not [k for k in keys if k[2] == "studio"]
+
+
+@pytest.mark.unit
+def test_replacing_a_fact_moves_only_the_difference():
+    day = date(2026, 10, 14)
+    old = ("m1", "global", day, 100.0, "WB", ["Drama"])
+    new = ("m1", "global", day, 40.0, "Sony", ["Drama"])
+    deltas = rollup_deltas([(old, new)])
+    assert deltas[("global", "day", "total", day, "")] == -60.0
+    assert deltas[("global", "year", "studio", date(2026, 1, 1), "WB")] == -100.0
+    assert deltas[("global", "year", "studio", date(2026, 1, 1), "Sony")] == 40.0
+
+
+@pytest.mark.unit
+def test_unchanged_fact_produces_no_deltas():
+    fact = ("m1", "global", date(2026, 10, 14), 100.0, "WB", ["Drama"])
+    assert rollup_deltas([(fact, fact)]) == {}
+
+
+@pytest.mark.unit
+def test_choose_bucket_downsamples_long_ranges():
+    assert choose_bucket(date(2026, 10, 1), date(2026, 10, 31), 90) == "day"
+    assert choose_bucket(date(2026, 1, 1), date(2026, 12, 31), 90) == "week"
+    assert choose_bucket(date(2010, 1, 1), date(2026, 12, 31), 90) == "month"
+
+
+@pytest.mark.unit
+async def test_ingest_locks_regions_before_reading_facts(monkeypatch, recording_session):
+    async def movies(self, external_ids):
+        return {"m1": (1, ["Drama"])}
+
+    monkeypatch.setattr(BoxOfficeRepository, "_movies", movies)
+    session = recording_session
+    session.literal_binds = True
+    await BoxOfficeRepository(session).ingest_daily([
+        {"movie_external_id": "m1", "region": "US", "date": "2026-10-16", "gross_usd": 10},
+        {"movie_external_id": "m1", "region": "IN", "date": "2026-10-16", "gross_usd": 5},
+    ])
+    locks = [s for s in session.statements if "pg_advisory_xact_lock" in s]
+    assert [("'IN'" in s, "'US'" in s) for s in locks] == [(True, False), (False, True)]
+    assert session.statements.index(locks[-1]) < next(
+        i for i, s in enumerate(session.statements) if "FROM box_office_daily_gross" in s
+    )
+
+
+@pytest.mark.unit
+async def test_existing_facts_are_read_in_chunks(monkeypatch, recording_session):
+    async def movies(self, external_ids):
+        return {"m1": (1, [])}
+
+    monkeypatch.setattr(BoxOfficeRepository, "_movies", movies)
+    monkeypatch.setattr(box_office, "UPSERT_BATCH_SIZE", 2)
+    await BoxOfficeRepository(recording_session).ingest_daily([
+        {"movie_external_id": "m1", "region": "US", "date": f"2026-10-1{d}", "gross_usd": 10} for d in range(5)
+    ])
+    reads = [s for s in recording_session.statements if "FROM box_office_daily_gross" in s]
+    assert len(reads) == 3
@@ -0,0 +1,65 @@
+"""
+Unit Tests for the in-process TTLCache used by repository read paths.
+"""
+
+import pytest
+
+from src.repositories.movies import MovieRepository, movie_detail_cache
+from src.services import cache as cache_module
+from src.services.cache import TTLCache
+
+
+@pytest.mark.unit
+def test_get_set_and_invalidate():
+    cache = TTLCache(ttl_seconds=60)
+    cache.set("m1", {"id": "m1"})
+
+    assert cache.get("m1") == {"id": "m1"}
+    cache.invalidate("m1")
+    assert cache.get("m1") is None
+
+
+@pytest.mark.unit
+def test_entries_expire(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    cache = TTLCache(ttl_seconds=10)
+    cache.set("m1", 1)
+
+    now[0] += 9
+    assert cache.get("m1") == 1
+    now[0] += 2
+    assert cache.get("m1") is None
+    assert len(cache) == 0
+
+
+@pytest.mark.unit
+def test_lru_eviction_and_get_many():
+    cache = TTLCache(ttl_seconds=60, max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # "b" becomes least recently used
+    cache.set("c", 3)
+
+    assert cache.get_many(["a", "b", "c", "d"]) == {"a": 1, "c": 3}
+
+
+@pytest.mark.unit
+def test_zero_ttl_disables_caching():
+    cache = TTLCache(ttl_seconds=0)
+    cache.set("a", 1)
+    assert cache.get("a") is None
+
+
+@pytest.mark.unit
+async def test_cached_movie_detail_reads_reviews_fresh(monkeypatch):
+    async def live_details(self, external_ids, fields=None):
+        return {"m1": {"sidduScore": 8.1, "reviews": [{"id": "r1"}]}}
+
+    monkeypatch.setattr(MovieRepository, "_live_details", live_details)
+    movie_detail_cache.set("m1", {"id": "m1", "title": "Heat"})
+    try:
+        detail = await MovieRepository(object()).get("m1")
+    finally:
+        movie_detail_cache.invalidate("m1")
+    assert detail == {"id": "m1", "title": "Heat", "sidduScore": 8.1, "reviews": [{"id": "r1"}]}
@@ -0,0 +1,85 @@
+"""
+Unit Tests for denormalized collection previews in repositories.collections.
+"""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from src.models import Collection
+from src.repositories.collections import (
+    _LIST_FIELDS,
+    CollectionRepository,
+    _list_options,
+    movie_page_cursor,
+    parse_movie_page_cursor,
+    refresh_previews_statement,
+)
+from src.repositories.fieldsets import FieldSet
+
+
+@pytest.mark.unit
+def test_list_dto_reads_stored_count_and_posters():
+    c = Collection(
+        external_id="col-1",
+        title="Noir",
+        movie_count=120,
+        preview_posters=["a.jpg", "b.jpg"],
+        created_at=datetime(2026, 1, 1),
+    )
+    dto = FieldSet.parse("id,movieCount,posterImages").build(c, _LIST_FIELDS)
+    assert dto == {"id": "col-1", "movieCount": 120, "posterImages": ["a.jpg", "b.jpg"]}
+
+
+@pytest.mark.unit
+def test_list_query_never_loads_member_movies():
+    q = select(Collection).options(*_list_options(FieldSet.parse("id,movieCount,posterImages")))
+    sql = str(q.compile())
+    assert "movie_count" in sql and "preview_posters" in sql
+    assert "collection_movies" not in sql
+
+
+@pytest.mark.unit
+def test_poster_change_recomputes_previews_of_its_collections():
+    sql = str(
+        refresh_previews_statement(7).compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    )
+    assert sql.startswith("UPDATE collections SET")
+    assert "jsonb_agg(anon_1.poster_url ORDER BY anon_1.position, anon_1.movie_id)" in sql
+    assert "collection_movies.collection_id = collections.id" in sql
+    assert "LIMIT 4" in sql
+    assert "updated_at=collections.updated_at" in sql
+    assert sql.endswith("WHERE collection_movies.movie_id = 7)")
+
+
+@pytest.mark.unit
+def test_movie_page_cursor_round_trips_position_and_movie():
+    assert parse_movie_page_cursor(movie_page_cursor(12, 345)) == (12, 345)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("cursor", ["", "m-123", "12", "a.b"])
+def test_malformed_movie_page_cursor_is_rejected(cursor):
+    with pytest.raises(ValueError):
+        parse_movie_page_cursor(cursor)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("method", ["add_movie", "remove_movie"])
+async def test_membership_changes_lock_the_collection_row(recording_session, method):
+    collection = Collection(id=1, user_id=5, movie_count=1, preview_posters=["a.jpg"])
+    movie = SimpleNamespace(id=9, poster_url="b.jpg")
+
+    def rows(sql):
+        if sql.startswith("SELECT collections."):
+            return [collection]
+        if sql.startswith("SELECT movies."):
+            return [movie]
+        return []
+
+    recording_session.rows = rows
+    await getattr(CollectionRepository(recording_session), method)("col-1", "m-9", 5)
+    assert recording_session.statements[0].endswith("FOR UPDATE")
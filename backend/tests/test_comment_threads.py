@@ -0,0 +1,55 @@
+"""
+Unit Tests for assembling review comment threads from flat CTE rows.
+"""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from src.repositories.review_comments import build_comment_tree
+
+
+def _row(id, parent_id, depth, reply_count=0):
+    return SimpleNamespace(
+        id=id,
+        external_id=f"c{id}",
+        parent_id=parent_id,
+        depth=depth,
+        content="text",
+        created_at=datetime(2024, 1, 1),
+        edited_at=None,
+        likes_count=0,
+        author_id="u1",
+        author_username=None,
+        author_name="Alice",
+        author_avatar_url=None,
+        reply_count=reply_count,
+    )
+
+
+@pytest.mark.unit
+def test_rows_are_nested_under_their_parents():
+    rows = [_row(1, None, 0, reply_count=2), _row(2, None, 0), _row(3, 1, 1, reply_count=1), _row(4, 3, 2)]
+    tree = build_comment_tree(rows, limit=10)
+    assert [c["id"] for c in tree] == ["c1", "c2"]
+    assert tree[0]["replies"][0]["id"] == "c3"
+    assert tree[0]["replies"][0]["replies"][0]["id"] == "c4"
+    assert tree[0]["author"]["username"] == "Alice"
+
+
+@pytest.mark.unit
+def test_capped_replies_report_more_with_cursor():
+    rows = [_row(1, None, 0, reply_count=5), _row(2, 1, 1), _row(3, 1, 1)]
+    root = build_comment_tree(rows, limit=10)[0]
+    assert root["hasMoreReplies"] is True
+    assert root["nextReplyCursor"] == "c3"
+    assert root["replies"][0]["hasMoreReplies"] is False
+
+
+@pytest.mark.unit
+def test_extra_lookahead_root_and_its_replies_are_dropped():
+    rows = [_row(1, None, 0), _row(2, None, 0), _row(3, 2, 1)]
+    tree = build_comment_tree(rows, limit=1)
+    assert [c["id"] for c in tree] == ["c1"]
+    assert tree[0]["replies"] == []
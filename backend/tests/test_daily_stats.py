@@ -0,0 +1,93 @@
+"""
+Unit Tests for the write-behind daily stats buffer in services.daily_stats.
+"""
+
+import asyncio
+
+import pytest
+from datetime import date
+
+from src import db
+from src.repositories.user_stats import stats_range_dto
+from src.services import daily_stats
+from src.services.daily_stats import DailyStatsBuffer, RollingStatsCache, flush_daily_stats, merge_pending
+
+D1 = date(2026, 1, 1)
+D2 = date(2026, 1, 2)
+
+
+@pytest.mark.unit
+def test_buffer_coalesces_per_user_and_day():
+    buf = DailyStatsBuffer()
+    for _ in range(3):
+        buf.add(1, D1, "likes_received")
+    buf.add(1, D1, "new_followers")
+    buf.add(1, D2, "pulses_posted", 2)
+    buf.add(2, D1, "comments_received")
+    assert len(buf) == 3
+    assert buf.pending(1) == {D1: (0, 3, 1, 0), D2: (2, 0, 0, 0)}
+
+
+@pytest.mark.unit
+def test_drain_returns_sorted_full_rows_and_restore_merges():
+    buf = DailyStatsBuffer()
+    buf.add(2, D1, "likes_received")
+    buf.add(1, D2, "pulses_posted")
+    rows = buf.drain()
+    assert len(buf) == 0
+    assert [(r["user_id"], r["date"]) for r in rows] == [(1, D2), (2, D1)]
+    assert rows[0] == {"user_id": 1, "date": D2, "pulses_posted": 1, "likes_received": 0,
+                       "new_followers": 0, "comments_received": 0}
+    buf.add(2, D1, "likes_received")
+    buf.restore(rows)
+    assert buf.pending(2) == {D1: (0, 2, 0, 0)}
+
+
+@pytest.mark.unit
+def test_unknown_field_rejected():
+    with pytest.raises(ValueError):
+        DailyStatsBuffer().add(1, D1, "views")
+
+
+@pytest.mark.unit
+def test_rolling_cache_skips_loads_that_raced_a_flush():
+    cache = RollingStatsCache(ttl_seconds=60)
+    gen = cache.generation
+    cache.flushed([1])
+    cache.set(1, {D1: (1, 0, 0, 0)}, gen)
+    assert cache.get(1) is None
+    cache.set(1, {D1: (1, 0, 0, 0)}, cache.generation)
+    assert cache.get(1) == {D1: (1, 0, 0, 0)}
+    cache.flushed([1])
+    assert cache.get(1) is None
+
+
+@pytest.mark.unit
+def test_range_dto_merges_pending_deltas():
+    days = merge_pending({D1: (1, 2, 0, 0)}, {D1: (0, 1, 0, 0), D2: (0, 0, 1, 0)})
+    dto = stats_range_dto(D1, D2, days)
+    assert dto["totals"] == {"pulsesPosted": 1, "likesReceived": 3, "newFollowers": 1, "commentsReceived": 0}
+    assert [d["date"] for d in dto["daily"]] == ["2026-01-01", "2026-01-02"]
+
+
+@pytest.mark.unit
+async def test_flush_cancelled_mid_write_puts_rows_back(monkeypatch, recording_session):
+    writing = asyncio.Event()
+
+    async def stalled(stmt, params=None):
+        writing.set()
+        await asyncio.Event().wait()
+
+    buf = DailyStatsBuffer()
+    buf.add(1, D1, "likes_received", 2)
+    monkeypatch.setattr(daily_stats, "daily_stats_buffer", buf)
+    monkeypatch.setattr(db, "SessionLocal", lambda: recording_session)
+    monkeypatch.setattr(recording_session, "execute", stalled)
+
+    task = asyncio.create_task(flush_daily_stats())
+    await writing.wait()
+    assert len(buf) == 0
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert buf.pending(1) == {D1: (0, 2, 0, 0)}
@@ -0,0 +1,56 @@
+"""
+Unit Tests for the in-memory FollowGraph in services.follow_graph.
+"""
+
+import pytest
+
+from src.repositories import pulse
+from src.repositories.pulse import PulseRepository
+from src.services.follow_graph import FollowGraph, intersect
+from array import array
+
+
+@pytest.mark.unit
+def test_load_counts_and_membership():
+    g = FollowGraph()
+    g.load([(1, 2), (1, 3), (2, 3), (1, 2)])
+    assert g.loaded
+    assert g.follows(1, 2) and not g.follows(2, 1)
+    assert g.following_count(1) == 2
+    assert g.follower_count(3) == 2
+    assert g.follower_count(99) == 0
+
+
+@pytest.mark.unit
+def test_add_remove_keep_arrays_sorted():
+    g = FollowGraph()
+    g.load([])
+    for target in (5, 1, 3):
+        g.add(7, target)
+    g.add(7, 3)
+    assert list(g.following(7)) == [1, 3, 5]
+    g.remove(7, 3)
+    g.remove(7, 42)
+    assert list(g.following(7)) == [1, 5]
+    assert g.follower_count(3) == 0
+
+
+@pytest.mark.unit
+def test_mutuals_and_batched_relations():
+    g = FollowGraph()
+    # viewer 1 follows 2 and 3; both of them follow 4
+    g.load([(1, 2), (1, 3), (2, 4), (3, 4), (4, 1)])
+    assert g.mutuals(1, 4) == [2, 3]
+    rel = g.relations(1, [4, 2])
+    assert rel[4] == {"followers": 2, "following": 1, "isFollowing": False, "followsYou": True, "mutualCount": 2}
+    assert rel[2]["isFollowing"] is True
+    assert intersect(array("i", [1, 4, 9]), array("i", [2, 4, 9, 10])) == [4, 9]
+
+
+@pytest.mark.unit
+async def test_follow_checks_read_the_database_not_the_graph(monkeypatch, recording_session):
+    # A graph loaded on another worker can lag the database
+    stale = FollowGraph()
+    stale.load([(1, 2)])
+    monkeypatch.setattr(pulse, "user_follow_graph", stale)
+    assert await PulseRepository(recording_session).is_following(1, 2) is False
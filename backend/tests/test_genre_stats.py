@@ -0,0 +1,55 @@
+"""
+Unit Tests for genre statistics assembly (repositories.genres).
+"""
+
+import pytest
+
+from src.repositories.genres import assemble_genre_stats, empty_statistics, peak_decade
+
+
+@pytest.mark.unit
+def test_peak_decade_sums_years_per_decade():
+    assert peak_decade({"1994": 2, "1999": 2, "2010": 3}) == "1990s"
+    assert peak_decade({"": 4, None: 1}) == ""
+
+
+@pytest.mark.unit
+def test_genre_without_movies_gets_empty_statistics():
+    built = assemble_genre_stats([7], [], [], [], [], [], [])
+    assert built[7]["total_movies"] == 0
+    assert built[7]["statistics"] == empty_statistics()
+    assert built[7]["related_genres"] == []
+
+
+@pytest.mark.unit
+def test_rows_fold_into_page_statistics():
+    built = assemble_genre_stats(
+        [1],
+        totals=[(1, 3, 7.456)],
+        facets=[
+            (1, "1999", None, None, 0b011, 2),
+            (1, "2010", None, None, 0b011, 1),
+            (1, None, "USA", None, 0b101, 2),
+            (1, None, "UK", None, 0b101, 1),
+            (1, None, None, None, 0b110, 3),  # movies without a language
+        ],
+        histogram=[(1, 9, 4), (1, 1, 0)],
+        people=[
+            (1, "director", "nm1", "Lana", None, 2),
+            (1, "actor", "nm2", "Keanu", "k.jpg", 3),
+        ],
+        top_movies=[(1, "tt1", "The Matrix", 8.7, "/m.jpg", "1999")],
+        related=[(1, "action"), (1, "thriller")],
+    )
+    stats = built[1]["statistics"]
+    assert built[1]["average_rating"] == 7.46
+    assert stats["totalMovies"] == 3
+    assert stats["peakDecade"] == "1990s"
+    assert stats["releaseFrequencyByYear"] == [{"year": "1999", "count": 2}, {"year": "2010", "count": 1}]
+    assert stats["availableCountries"] == ["USA", "UK"]
+    assert stats["availableLanguages"] == []
+    assert stats["ratingDistribution"] == [{"rating": 0, "count": 0}, {"rating": 8, "count": 4}]
+    assert stats["topDirectors"][0]["name"] == "Lana"
+    assert stats["topActorsInGenre"][0]["movieCount"] == 3
+    assert stats["top3MoviesBySidduScoreInGenre"][0]["id"] == "tt1"
+    assert built[1]["related_genres"] == ["action", "thriller"]
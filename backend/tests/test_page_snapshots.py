@@ -0,0 +1,36 @@
+"""
+Unit Tests for PageSnapshotRepository statements (repositories.page_snapshots).
+"""
+
+import asyncio
+import pytest
+
+from src.repositories.page_snapshots import (
+    AWARD_KINDS,
+    AWARD_YEAR,
+    PageSnapshotRepository,
+    festival_key,
+)
+
+
+@pytest.mark.unit
+def test_put_upserts_and_bumps_version(recording_session):
+    session = recording_session
+    asyncio.run(PageSnapshotRepository(session).put(AWARD_YEAR, "oscars-2024", "oscars", {"id": "oscars-2024"}))
+    (sql,) = session.statements
+    assert "ON CONFLICT (kind, key) DO UPDATE" in sql
+    assert "version = (page_snapshots.version +" in sql
+
+
+@pytest.mark.unit
+def test_invalidate_with_no_scopes_is_a_noop(recording_session):
+    session = recording_session
+    assert asyncio.run(PageSnapshotRepository(session).invalidate(AWARD_KINDS, [])) == 0
+    assert session.statements == []
+    asyncio.run(PageSnapshotRepository(session).invalidate(AWARD_KINDS, ["oscars"]))
+    assert "page_snapshots.scope IN" in session.statements[0]
+
+
+@pytest.mark.unit
+def test_festival_key():
+    assert festival_key("cannes", 2024) == "cannes:2024"
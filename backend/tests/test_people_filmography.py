@@ -0,0 +1,24 @@
+"""
+Unit Tests for person filmography ordering and summary caching (repositories.people).
+"""
+
+import pytest
+
+from src.repositories.people import PeopleRepository, _role_rank, person_summary_cache
+
+
+@pytest.mark.unit
+def test_known_roles_come_first_then_alphabetical():
+    roles = ["writer", "composer", "actor", "cinematographer", "director"]
+    assert sorted(roles, key=_role_rank) == ["actor", "director", "writer", "cinematographer", "composer"]
+
+
+@pytest.mark.unit
+async def test_summary_is_served_from_cache():
+    person_summary_cache.clear()
+    summary = {"creditCount": 1, "creditsByRole": {"actor": 1}, "yearsActive": {}, "topGenres": []}
+    person_summary_cache.set(42, summary)
+    # No session queries are needed once the summary is cached
+    repo = PeopleRepository(session=None)
+    assert await repo._summary(42) is summary
+    person_summary_cache.clear()
@@ -0,0 +1,79 @@
+"""
+Unit Tests for in-memory quiz grading (repositories.quiz.grade_answers) and
+the versioned quiz definition cache.
+"""
+
+import json
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from src.repositories.quiz import QuizRepository, grade_answers, quiz_definition_cache
+
+DEFINITION = {
+    "id": 1,
+    "passScore": 60,
+    "total": 3,
+    "questions": {
+        "q1": (11, frozenset({"a"})),
+        "q2": (12, frozenset({"b", "c"})),
+        "q3": (13, frozenset({"d"})),
+    },
+}
+
+
+@pytest.mark.unit
+def test_exact_option_set_required():
+    graded = grade_answers(DEFINITION, [
+        {"questionId": "q1", "selectedOptionIds": ["a"]},
+        {"questionId": "q2", "selectedOptionIds": ["b"]},
+        {"questionId": "q3", "selectedOptionIds": ["d"], "timeSpent": 4},
+    ])
+    assert [a["isCorrect"] for a in graded["answers"]] == [True, False, True]
+    assert graded["score"] == 67
+    assert graded["passed"] is True
+    assert graded["answers"][2]["timeSpent"] == 4
+    assert "timeSpent" not in graded["answers"][0]
+
+
+@pytest.mark.unit
+def test_rows_only_for_known_questions():
+    graded = grade_answers(DEFINITION, [
+        {"questionId": "q2", "selectedOptionIds": ["c", "b"]},
+        {"questionId": "missing", "selectedOptionIds": ["x"]},
+    ])
+    assert graded["rows"] == [{
+        "question_id": 12,
+        "selected_option_ids": json.dumps(["c", "b"]),
+        "is_correct": True,
+        "time_spent_seconds": None,
+    }]
+    assert graded["score"] == 33
+    assert graded["passed"] is False
+
+
+@pytest.mark.unit
+async def test_definition_is_recompiled_when_the_quiz_changes(recording_session):
+    quiz = SimpleNamespace(id=1, pass_score=60, number_of_questions=2, created_at=datetime(2024, 1, 1), updated_at=None)
+    key = [(11, "q1", "a"), (12, "q2", "b")]
+    # The quiz row query, then the answer key query
+    recording_session.rows = lambda sql: key if "quiz_questions" in sql else [quiz]
+
+    def key_reads():
+        return sum("quiz_questions" in sql for sql in recording_session.statements)
+
+    repo = QuizRepository(recording_session)
+    try:
+        await repo._compiled_definition("quiz-1")
+        definition = await repo._compiled_definition("quiz-1")
+        assert key_reads() == 1
+        assert definition["correctOptionIds"]["q1"] == ["a"]
+
+        quiz.updated_at = datetime(2024, 2, 1)
+        key = [(11, "q1", "z"), (12, "q2", "b")]
+        definition = await repo._compiled_definition("quiz-1")
+        assert key_reads() == 2
+        assert definition["correctOptionIds"]["q1"] == ["z"]
+    finally:
+        quiz_definition_cache.invalidate("quiz-1")
@@ -0,0 +1,77 @@
+"""
+Unit Tests for the in-memory quiz Leaderboard in services.quiz_leaderboard.
+"""
+
+import asyncio
+
+import pytest
+
+from src import db
+from src.services import quiz_leaderboard
+from src.services.quiz_leaderboard import Leaderboard, LeaderboardStore, flush_quiz_leaderboards
+
+
+@pytest.mark.unit
+def test_orders_by_score_then_time_then_user():
+    board = Leaderboard([(3, 80, 40), (1, 90, 60), (2, 80, 30), (4, 80, None), (5, 80, 30)])
+    assert [e["userId"] for e in board.top(10)] == [1, 2, 5, 3, 4]
+    assert board.top(2)[1] == {"rank": 2, "userId": 2, "score": 80, "completionTime": 30}
+    assert board.top(10)[-1]["completionTime"] is None
+
+
+@pytest.mark.unit
+def test_keeps_only_best_per_user():
+    board = Leaderboard([(1, 50, 10), (1, 70, 90)])
+    assert len(board) == 1
+    assert board.record(1, 60, 5) is False
+    assert board.record(1, 70, 80) is True
+    assert board.record(2, 100, 100) is True
+    assert len(board) == 2
+    assert board.rank(1) == 2
+    assert board.top(1)[0]["userId"] == 2
+
+
+@pytest.mark.unit
+def test_rank_and_window():
+    board = Leaderboard([(u, 100 - u, None) for u in range(1, 11)])
+    assert board.rank(4) == 4
+    assert board.rank(99) is None
+    assert [e["rank"] for e in board.around(4, 2)] == [2, 3, 4, 5, 6]
+    assert [e["rank"] for e in board.around(1, 2)] == [1, 2, 3]
+    assert board.around(99, 2) == []
+
+
+@pytest.mark.unit
+def test_store_coalesces_pending_best_and_restores():
+    store = LeaderboardStore(ttl_seconds=60, max_boards=10)
+    store.record(1, 7, 50, 20)
+    store.record(1, 7, 40, 5)
+    store.record(1, 7, 50, 10)
+    rows = store.drain()
+    assert [(r["score_percent"], r["completion_time_seconds"]) for r in rows] == [(50, 10)]
+    store.record(1, 7, 30, 1)
+    store.restore(rows)
+    assert [(r["score_percent"], r["completion_time_seconds"]) for r in store.drain()] == [(50, 10)]
+
+
+@pytest.mark.unit
+async def test_flush_cancelled_mid_write_puts_results_back(monkeypatch, recording_session):
+    writing = asyncio.Event()
+
+    async def stalled(stmt, params=None):
+        writing.set()
+        await asyncio.Event().wait()
+
+    store = LeaderboardStore(ttl_seconds=60, max_boards=10)
+    store.record(1, 7, 50, 20)
+    monkeypatch.setattr(quiz_leaderboard, "leaderboards", store)
+    monkeypatch.setattr(db, "SessionLocal", lambda: recording_session)
+    monkeypatch.setattr(recording_session, "execute", stalled)
+
+    task = asyncio.create_task(flush_quiz_leaderboards())
+    await writing.wait()
+    assert len(store) == 0
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert [(r["score_percent"], r["completion_time_seconds"]) for r in store.drain()] == [(50, 20)]
@@ -0,0 +1,35 @@
+"""
+Unit Tests for review ranking scores (services.ranking).
+"""
+
+from datetime import datetime
+
+import pytest
+
+from src.models import Review
+from src.services.ranking import refresh_review_rank, review_rank_score, wilson_lower_bound
+
+
+@pytest.mark.unit
+def test_wilson_lower_bound_prefers_confident_ratios():
+    assert wilson_lower_bound(0, 0) == 0.0
+    # 40/400 helpful is worse than 3/3, which is worse than 300/310
+    assert wilson_lower_bound(3, 3) > wilson_lower_bound(40, 400)
+    assert wilson_lower_bound(300, 310) > wilson_lower_bound(3, 3)
+    assert 0.0 <= wilson_lower_bound(5, 10) <= 0.5
+
+
+@pytest.mark.unit
+def test_rank_score_blends_comments_and_recency():
+    created = datetime(2024, 1, 1)
+    base = review_rank_score(3, 0, 0, created)
+    assert review_rank_score(3, 0, 10, created) > base
+    assert review_rank_score(3, 0, 0, datetime(2025, 1, 1)) > base
+
+
+@pytest.mark.unit
+def test_refresh_review_rank_sets_stored_scores():
+    review = Review(helpful_votes=3, unhelpful_votes=1, comment_count=2, date=datetime(2024, 6, 1))
+    refresh_review_rank(review)
+    assert review.engagement_score == 6
+    assert review.rank_score == review_rank_score(3, 1, 2, datetime(2024, 6, 1))
@@ -0,0 +1,85 @@
+"""
+Unit Tests for the rating aggregate helpers in repositories.rating_stats.
+"""
+
+import pytest
+
+from src.models import MovieRatingStats
+from src.repositories.rating_stats import HISTOGRAM_BUCKETS, RatingStatsRepository, rating_bucket, stats_dto
+
+
+@pytest.mark.unit
+def test_rating_bucket_rounds_and_clamps():
+    assert rating_bucket(0) == 0
+    assert rating_bucket(7.4) == 7
+    assert rating_bucket(7.5) == 8
+    assert rating_bucket(10) == 10
+    assert rating_bucket(12) == HISTOGRAM_BUCKETS - 1
+    assert rating_bucket(-1) == 0
+
+
+@pytest.mark.unit
+def test_stats_dto_without_row():
+    dto = stats_dto(None)
+    assert dto["reviewCount"] == 0
+    assert dto["averageRating"] is None
+    assert dto["ratingDistribution"] == [0] * HISTOGRAM_BUCKETS
+
+
+@pytest.mark.unit
+def test_stats_dto_critic_average():
+    stats = MovieRatingStats(
+        movie_id=1,
+        review_count=2,
+        rating_sum=15.0,
+        average_rating=7.5,
+        histogram=[0, 0, 0, 0, 0, 0, 0, 1, 1, 0, 0],
+        critic_review_count=3,
+        critic_rating_sum=20.0,
+    )
+    dto = stats_dto(stats)
+    assert dto["averageRating"] == 7.5
+    assert dto["criticReviewCount"] == 3
+    assert dto["criticAverageRating"] == 6.67
+
+
+@pytest.mark.unit
+async def test_locked_creates_the_row_before_locking_it(recording_session):
+    session = recording_session
+    session.rows = [MovieRatingStats(movie_id=1)]
+    await RatingStatsRepository(session)._locked(1)
+    insert_sql, lock_sql = session.statements
+    assert insert_sql.startswith("INSERT INTO movie_rating_stats")
+    assert "ON CONFLICT (movie_id) DO NOTHING" in insert_sql
+    assert lock_sql.endswith("FOR UPDATE")
+
+
+@pytest.mark.unit
+async def test_deleting_the_last_review_clears_siddu_score(recording_session):
+    recording_session.literal_binds = True
+    recording_session.rows = [
+        MovieRatingStats(
+            movie_id=1,
+            review_count=1,
+            rating_sum=8.0,
+            histogram=[0] * 8 + [1, 0, 0],
+            critic_review_count=2,
+            critic_rating_sum=14.0,
+        )
+    ]
+    await RatingStatsRepository(recording_session).apply_review(1, old=8.0)
+    update_sql = recording_session.statements[-1]
+    assert update_sql.startswith("UPDATE movies SET siddu_score=NULL")
+    assert "critics_score" not in update_sql
+
+
+@pytest.mark.unit
+async def test_critic_review_leaves_the_user_score_alone(recording_session):
+    recording_session.literal_binds = True
+    recording_session.rows = [
+        MovieRatingStats(movie_id=1, review_count=0, rating_sum=0.0, critic_review_count=0, critic_rating_sum=0.0)
+    ]
+    await RatingStatsRepository(recording_session).apply_critic_review(1, new=7.0)
+    update_sql = recording_session.statements[-1]
+    assert update_sql.startswith("UPDATE movies SET critics_score=7.0")
+    assert "siddu_score" not in update_sql
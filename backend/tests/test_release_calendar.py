@@ -0,0 +1,60 @@
+"""
+Unit Tests for release calendar bucketing (repositories.releases) and TMDB release dates.
+"""
+
+from datetime import date
+
+import pytest
+
+from src.integrations.tmdb_client import _transform_tmdb_response
+from src.repositories.releases import bucket_releases, months_between
+
+
+def _entry(movie_id, day, release_type=None):
+    return {"id": movie_id, "title": movie_id, "posterUrl": None, "releaseDate": day, "releaseType": release_type}
+
+
+@pytest.mark.unit
+def test_months_between_covers_partial_months():
+    assert months_between(date(2026, 1, 20), date(2026, 3, 2)) == [date(2026, 1, 1), date(2026, 2, 1), date(2026, 3, 1)]
+    assert months_between(date(2026, 12, 5), date(2027, 1, 5)) == [date(2026, 12, 1), date(2027, 1, 1)]
+
+
+@pytest.mark.unit
+def test_week_buckets_start_on_monday_and_trim_range():
+    entries = [
+        _entry("a", date(2026, 10, 18)),  # before the range
+        _entry("b", date(2026, 10, 19)),  # Monday
+        _entry("c", date(2026, 10, 25)),  # Sunday of the same week
+        _entry("d", date(2026, 10, 27)),
+    ]
+    buckets = bucket_releases(entries, date(2026, 10, 19), date(2026, 10, 31), "week")
+    assert [b["date"] for b in buckets] == ["2026-10-19", "2026-10-26"]
+    assert [r["id"] for r in buckets[0]["releases"]] == ["b", "c"]
+    assert buckets[1]["releases"][0]["releaseDate"] == "2026-10-27"
+
+
+@pytest.mark.unit
+def test_release_types_filter():
+    entries = [_entry("a", date(2026, 5, 1), "theatrical"), _entry("a", date(2026, 6, 1), "digital")]
+    buckets = bucket_releases(entries, date(2026, 5, 1), date(2026, 6, 30), "day", ["digital"])
+    assert [b["date"] for b in buckets] == ["2026-06-01"]
+
+
+@pytest.mark.unit
+def test_tmdb_release_dates_keep_earliest_per_region_and_type():
+    data = {
+        "id": 1,
+        "title": "x",
+        "release_dates": {"results": [{"iso_3166_1": "IN", "release_dates": [
+            {"type": 3, "release_date": "2024-03-08T00:00:00.000Z", "certification": "UA"},
+            {"type": 3, "release_date": "2024-03-01T00:00:00.000Z", "certification": ""},
+            {"type": 4, "release_date": "2024-05-01T00:00:00.000Z"},
+            {"type": 9, "release_date": "2024-05-01T00:00:00.000Z"},
+        ]}]},
+    }
+    rows = _transform_tmdb_response(data)["release_dates"]
+    assert sorted((r["type"], r["date"].isoformat()) for r in rows) == [
+        ("digital", "2024-05-01"),
+        ("theatrical", "2024-03-01"),
+    ]
@@ -0,0 +1,36 @@
+"""
+Unit Tests for streaming option diffing (repositories.streaming).
+"""
+
+import pytest
+
+from src.repositories.streaming import plan_option_changes
+
+
+@pytest.mark.unit
+def test_unchanged_offers_are_updated_in_place():
+    existing = [(1, (7, "IN", "subscription", "HD")), (2, (7, "IN", "rent", "HD"))]
+    wanted = {(7, "IN", "subscription", "HD"): {"url": "u"}, (8, "IN", "free", None): {}}
+    stale, kept, new = plan_option_changes(existing, wanted)
+    assert stale == [2]
+    assert kept == [(1, (7, "IN", "subscription", "HD"))]
+    assert new == [(8, "IN", "free", None)]
+
+
+@pytest.mark.unit
+def test_offers_differing_in_quality_are_kept_apart():
+    existing = [(1, (7, "US", "buy", "HD"))]
+    wanted = {(7, "US", "buy", "HD"): {"price": "9.99"}, (7, "US", "buy", "4K"): {"price": "14.99"}}
+    assert plan_option_changes(existing, wanted) == ([], [(1, (7, "US", "buy", "HD"))], [(7, "US", "buy", "4K")])
+
+
+@pytest.mark.unit
+def test_duplicate_stored_offers_are_collapsed():
+    existing = [(1, (7, "US", "buy", "HD")), (2, (7, "US", "buy", "HD"))]
+    stale, kept, new = plan_option_changes(existing, {(7, "US", "buy", "HD"): {}})
+    assert (stale, kept, new) == ([2], [(1, (7, "US", "buy", "HD"))], [])
+
+
+@pytest.mark.unit
+def test_empty_listing_removes_everything():
+    assert plan_option_changes([(1, (7, "US", "buy", None))], {}) == ([1], [], [])
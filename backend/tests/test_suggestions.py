@@ -0,0 +1,52 @@
+"""
+Unit Tests for follow-suggestion ranking in repositories.suggestions.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from src.models import User
+from src.repositories.suggestions import UserSuggestionRepository, rank_candidates, suggestion_dto
+
+
+@pytest.mark.unit
+def test_rank_candidates_orders_by_weighted_signals():
+    ranked = rank_candidates(
+        {
+            1: {"genre": 3},
+            2: {"mutual": 2, "co_review": 1},
+            3: {"co_review": 4},
+        },
+        limit=10,
+    )
+    assert [c["candidate_id"] for c in ranked] == [2, 3, 1]
+    assert ranked[0]["mutual_count"] == 2
+    assert ranked[0]["reason"] == "mutual_follows"
+    assert ranked[1]["reason"] == "co_reviewer"
+    assert ranked[2]["reason"] == "genre_affinity"
+
+
+@pytest.mark.unit
+def test_rank_candidates_limits_and_skips_empty_signals():
+    ranked = rank_candidates({1: {"mutual": 1}, 2: {"mutual": 0}, 3: {"genre": 1}}, limit=1)
+    assert [c["candidate_id"] for c in ranked] == [1]
+
+
+@pytest.mark.unit
+def test_suggestion_dto_leaves_out_email():
+    user = User(external_id="u1", email="ana@example.com", name="Ana", created_at=datetime(2024, 3, 1))
+    dto = suggestion_dto(user, None)
+    assert "email" not in dto
+    assert dto["username"] == "ana"
+
+
+@pytest.mark.unit
+async def test_suggestion_queries_skip_private_profiles(recording_session):
+    session = recording_session
+    repo = UserSuggestionRepository(session)
+    await repo.popular(5)
+    await repo.list(1, 5)
+    for sql in session.statements:
+        assert "NOT (EXISTS (SELECT * \nFROM user_settings \nWHERE user_settings.user_id = " in sql
+        assert "jsonb_extract_path_text(user_settings.privacy" in sql
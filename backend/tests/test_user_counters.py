@@ -0,0 +1,33 @@
+"""
+Unit Tests for the profile counter helpers in repositories.user_counters.
+"""
+
+import asyncio
+
+import pytest
+
+from src.models import UserCounters
+from src.repositories.user_counters import COUNTER_FIELDS, UserCountersRepository, counters_dto
+
+
+@pytest.mark.unit
+def test_counters_dto_without_row():
+    assert counters_dto(None) == {f: 0 for f in COUNTER_FIELDS}
+
+
+@pytest.mark.unit
+def test_counters_dto_reads_row():
+    row = UserCounters(user_id=1, reviews=3, followers=2, following=1, watchlist=0, favorites=4, collections=1, pulses=5)
+    dto = counters_dto(row)
+    assert dto["reviews"] == 3
+    assert dto["followers"] == 2
+    assert dto["pulses"] == 5
+
+
+@pytest.mark.unit
+def test_bump_rejects_unknown_counter():
+    repo = UserCountersRepository(session=None)
+    with pytest.raises(ValueError):
+        asyncio.run(repo.bump(1, likes=1))
+    # No-op deltas never touch the session
+    asyncio.run(repo.bump(1, reviews=0))
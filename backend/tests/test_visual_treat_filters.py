@@ -0,0 +1,47 @@
+"""
+Unit Tests for visual treat filter helpers (repositories.visual_treats).
+"""
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.repositories.visual_treats import FILM_YEAR, VisualTreatsRepository, decade_start
+
+
+@pytest.mark.unit
+def test_decade_start():
+    assert decade_start("1990s") == 1990
+    assert decade_start("1994") == 1990
+    assert decade_start(" 2000S ") == 2000
+    assert decade_start("nineties") is None
+
+
+@pytest.mark.unit
+def test_filters_are_pushed_into_sql():
+    where = VisualTreatsRepository._filters(search="noir", decades=["1980s", "bogus"], tags=["dreams"])
+    sql = " ".join(str(w.compile(dialect=postgresql.dialect())) for w in where)
+    assert "CASE WHEN (movies.year ~ " in sql
+    assert "movies.title ILIKE" in sql
+    assert "EXISTS" in sql
+
+
+@pytest.mark.unit
+def test_search_wildcards_are_literal():
+    (where,) = VisualTreatsRepository._filters(search=" 100%_real ")
+    compiled = where.compile(dialect=postgresql.dialect())
+    assert "visual_treats.title ILIKE '%%' || %(title_1)s || '%%' ESCAPE '/'" in str(compiled)
+    assert compiled.params["title_1"] == "100/%/_real"
+
+
+@pytest.mark.unit
+def test_unknown_decades_match_nothing():
+    (where,) = VisualTreatsRepository._filters(decades=["bogus"])
+    assert str(where.compile(dialect=postgresql.dialect())) == "false"
+
+
+@pytest.mark.unit
+def test_film_year_matches_its_index_expression():
+    compiled = FILM_YEAR.compile(dialect=postgresql.dialect())
+    # A bound pattern would keep ix_movies_year_number from serving the query
+    assert str(compiled) == "CASE WHEN (movies.year ~ '^[0-9]{4}$') THEN CAST(movies.year AS INTEGER) END"
+    assert compiled.params == {}
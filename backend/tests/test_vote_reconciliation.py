@@ -0,0 +1,91 @@
+"""
+Unit Tests for single-statement review votes and the coalescing of
+background review vote reconciliation.
+"""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+from fastapi import BackgroundTasks
+from sqlalchemy import create_engine, literal, select
+from sqlalchemy.dialects import postgresql
+
+from src.repositories.review_votes import retract_delta, retract_statement, vote_delta, vote_statement
+from src.services import vote_reconciliation
+from src.services.vote_reconciliation import reconcile_review_votes, schedule_review_reconcile
+
+
+@pytest.mark.unit
+def test_burst_of_votes_schedules_one_reconcile():
+    tasks = BackgroundTasks()
+    schedule_review_reconcile(tasks, "review-1")
+    schedule_review_reconcile(tasks, "review-1")
+    schedule_review_reconcile(tasks, "review-2")
+    assert len(tasks.tasks) == 2
+
+    # Once a pass starts, the next vote queues a fresh one
+    asyncio.run(reconcile_review_votes("review-1"))
+    schedule_review_reconcile(tasks, "review-1")
+    assert len(tasks.tasks) == 3
+    vote_reconciliation._pending.clear()
+
+
+def _deltas(*expressions):
+    with create_engine("sqlite://").connect() as conn:
+        return tuple(conn.execute(select(*expressions)).one())
+
+
+def _pg(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "vote_type, inserted, expected",
+    [
+        ("helpful", True, (1, 0)),  # new upvote
+        ("unhelpful", True, (0, 1)),  # new downvote
+        ("unhelpful", False, (-1, 1)),  # up -> down
+        ("helpful", False, (1, -1)),  # down -> up
+    ],
+)
+def test_vote_delta(vote_type, inserted, expected):
+    args = (literal(vote_type), literal(inserted))
+    assert _deltas(vote_delta("helpful", *args), vote_delta("unhelpful", *args)) == expected
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("vote_type, expected", [("helpful", (-1, 0)), ("unhelpful", (0, -1))])
+def test_retract_delta(vote_type, expected):
+    assert _deltas(retract_delta("helpful", literal(vote_type)), retract_delta("unhelpful", literal(vote_type))) == expected
+
+
+@pytest.mark.unit
+def test_vote_statement_sql():
+    sql = _pg(vote_statement("review-1", 7, "unhelpful", datetime(2024, 1, 1)))
+    assert sql.startswith("WITH vote AS \n(INSERT INTO review_votes")
+    assert (
+        "ON CONFLICT ON CONSTRAINT uq_review_vote_user_review DO UPDATE SET vote_type = excluded.vote_type"
+        in sql
+    )
+    # Re-sending the same vote updates nothing, so the counters do not move
+    assert "WHERE review_votes.vote_type != excluded.vote_type" in sql
+    assert "xmax = 0 AS inserted" in sql
+    assert (
+        "UPDATE reviews SET helpful_votes=greatest(reviews.helpful_votes + CASE WHEN (vote.vote_type = 'helpful') "
+        "THEN 1 WHEN vote.inserted THEN 0 ELSE -1 END, 0)" in sql
+    )
+    assert "FROM vote WHERE reviews.id = vote.review_id" in sql
+
+
+@pytest.mark.unit
+def test_retract_statement_sql():
+    sql = _pg(retract_statement("review-1", 7))
+    assert sql.startswith("WITH gone AS \n(DELETE FROM review_votes USING reviews")
+    assert "review_votes.user_id = 7 RETURNING review_votes.review_id, review_votes.vote_type" in sql
+    assert (
+        "unhelpful_votes=greatest(reviews.unhelpful_votes + CASE WHEN (gone.vote_type = 'unhelpful') "
+        "THEN -1 ELSE 0 END, 0)" in sql
+    )
+    assert "FROM gone WHERE reviews.id = gone.review_id" in sql
@@ -0,0 +1,128 @@
+"""
+Unit Tests for the watch progress heartbeat buffer (services.watch_progress).
+"""
+
+import asyncio
+import re
+from collections import Counter
+
+import pytest
+from sqlalchemy.exc import IntegrityError, OperationalError
+
+from src import db
+from src.services import watch_progress
+from src.services.watch_progress import MAX_FLUSH_ATTEMPTS, WatchProgressBuffer, is_transient, target_status
+
+
+@pytest.mark.unit
+def test_target_status():
+    assert target_status("playing", 10) == "watching"
+    assert target_status("paused", 10) is None
+    assert target_status("paused", 96) == "watched"
+    assert target_status("ended", 40) == "watched"
+
+
+@pytest.mark.unit
+def test_heartbeats_coalesce_to_latest_position():
+    buf = WatchProgressBuffer()
+    for second in (5, 10, 15):
+        buf.add(1, 7, second, 100, "playing")
+    buf.add(2, 7, 50, 100, "paused")
+    assert len(buf) == 2
+    rows = buf.drain()
+    assert [(r["user_id"], r["progress_seconds"], r["status"]) for r in rows] == [(1, 15, "watching"), (2, 50, None)]
+    assert len(buf) == 0
+
+
+@pytest.mark.unit
+def test_later_heartbeat_never_weakens_status():
+    buf = WatchProgressBuffer()
+    buf.add(1, 7, 100, 100, "ended")
+    entry = buf.add(1, 7, 3, 100, "playing")
+    assert entry["status"] == "watched"
+    assert entry["progress_seconds"] == 3
+
+
+@pytest.mark.unit
+def test_restore_keeps_newer_heartbeats_and_drops_repeated_failures():
+    buf = WatchProgressBuffer()
+    buf.add(1, 7, 100, 100, "ended")
+    buf.add(1, 8, 20, 100, "playing")
+    failed = buf.drain()
+    buf.add(1, 7, 5, 100, "paused")  # arrived while the flush was failing
+    assert buf.restore(failed) == 0
+    rows = {r["movie_id"]: r for r in buf.drain()}
+    assert rows[7]["progress_seconds"] == 5 and rows[7]["status"] == "watched"
+    assert rows[8]["attempts"] == 1
+
+    row = rows[8]
+    for _ in range(MAX_FLUSH_ATTEMPTS - 2):  # the first failure was above
+        assert buf.restore([row]) == 0
+        row = buf.drain()[0]
+    assert buf.restore([row]) == 1
+    assert len(buf) == 0
+
+
+@pytest.mark.unit
+def test_connection_failures_do_not_count_as_attempts():
+    buf = WatchProgressBuffer()
+    buf.add(1, 7, 20, 100, "playing")
+    rows = buf.drain()
+    for _ in range(MAX_FLUSH_ATTEMPTS + 1):
+        assert buf.restore(rows, count_attempt=False) == 0
+        rows = buf.drain()
+    assert rows[0]["attempts"] == 0
+
+
+@pytest.mark.unit
+def test_is_transient():
+    assert is_transient(OperationalError("SELECT 1", {}, Exception("server closed the connection")))
+    assert is_transient(ConnectionResetError())
+    assert not is_transient(IntegrityError("INSERT", {}, Exception("violates foreign key")))
+    assert not is_transient(ValueError())
+
+
+def _upsert_rows(sql):
+    """Inserts every (user_id, movie_id) of the upsert, rejecting movie 99 like a deleted movie's foreign key."""
+    pairs = [(int(u), int(m)) for u, m in re.findall(r", (\d+), (\d+)\)", sql)]
+    if any(m == 99 for _, m in pairs):
+        raise IntegrityError("INSERT", {}, Exception("violates foreign key"))
+    return [(u, True) for u, _ in pairs]
+
+
+@pytest.mark.unit
+async def test_rejected_batch_is_retried_row_by_row(recording_session):
+    recording_session.rows = _upsert_rows
+    recording_session.literal_binds = True
+    buf = WatchProgressBuffer()
+    for user_id, movie_id in ((1, 7), (2, 99), (3, 8)):
+        buf.add(user_id, movie_id, 20, 100, "playing")
+    added, rejected = Counter(), []
+    await watch_progress._write_part(recording_session, buf.drain(), True, added, rejected)
+    assert [r["movie_id"] for r in rejected] == [99]
+    assert added == Counter({1: 1, 3: 1})
+    assert len(recording_session.statements) == 4
+
+
+@pytest.mark.unit
+async def test_flush_cancelled_mid_write_puts_heartbeats_back(monkeypatch, recording_session):
+    writing = asyncio.Event()
+
+    async def stalled(stmt, params=None):
+        writing.set()
+        await asyncio.Event().wait()
+
+    buf = WatchProgressBuffer()
+    buf.add(1, 7, 100, 100, "ended")
+    monkeypatch.setattr(watch_progress, "watch_progress_buffer", buf)
+    monkeypatch.setattr(db, "SessionLocal", lambda: recording_session)
+    monkeypatch.setattr(recording_session, "execute", stalled)
+
+    task = asyncio.create_task(watch_progress.flush_watch_progress())
+    await writing.wait()
+    assert len(buf) == 0
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    (row,) = buf.drain()
+    assert (row["status"], row["attempts"]) == ("watched", 0)
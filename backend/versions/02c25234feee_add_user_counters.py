@@ -0,0 +1,51 @@
+"""Add user_counters profile counts
+
+Revision ID: 02c25234feee
+Revises: 72e16783d933
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '02c25234feee'
+down_revision: Union[str, Sequence[str], None] = '72e16783d933'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COUNTERS = ('reviews', 'followers', 'following', 'watchlist', 'favorites', 'collections', 'pulses')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'user_counters',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        *[sa.Column(c, sa.Integer(), nullable=False, server_default='0') for c in COUNTERS],
+        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id'),
+    )
+
+    # Backfill with the same sources as UserCountersRepository.recompute
+    op.execute("""
+        INSERT INTO user_counters (user_id, reviews, followers, following, watchlist, favorites, collections, pulses)
+        SELECT u.id,
+               (SELECT count(*) FROM reviews r WHERE r.user_id = u.id),
+               (SELECT count(*) FROM user_follows f WHERE f.following_id = u.id),
+               (SELECT count(*) FROM user_follows f WHERE f.follower_id = u.id),
+               (SELECT count(*) FROM watchlist w WHERE w.user_id = u.id),
+               (SELECT count(*) FROM favorites fav WHERE fav.user_id = u.id AND fav.type = 'movie'),
+               (SELECT count(*) FROM collections c WHERE c.user_id = u.id),
+               (SELECT count(*) FROM pulses p WHERE p.user_id = u.id)
+        FROM users u
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('user_counters')
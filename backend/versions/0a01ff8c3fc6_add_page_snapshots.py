@@ -0,0 +1,41 @@
+"""Add page_snapshots for award and festival pages
+
+Revision ID: 0a01ff8c3fc6
+Revises: 3751e8351993
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0a01ff8c3fc6'
+down_revision: Union[str, Sequence[str], None] = '3751e8351993'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Snapshots are built on first read (or by POST /admin/page-snapshots/rebuild)
+    op.create_table(
+        'page_snapshots',
+        sa.Column('kind', sa.String(length=30), nullable=False),
+        sa.Column('key', sa.String(length=120), nullable=False),
+        sa.Column('scope', sa.String(length=80), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False, server_default='1'),
+        sa.Column('payload', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('built_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
+        sa.PrimaryKeyConstraint('kind', 'key'),
+    )
+    op.create_index('ix_page_snapshots_scope', 'page_snapshots', ['kind', 'scope'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_page_snapshots_scope', table_name='page_snapshots')
+    op.drop_table('page_snapshots')
@@ -0,0 +1,37 @@
+"""Add review comment thread indexes
+
+Revision ID: 14acdc07272d
+Revises: 02c25234feee
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '14acdc07272d'
+down_revision: Union[str, Sequence[str], None] = '02c25234feee'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_review_comments_review_parent_created',
+        'review_comments',
+        ['review_id', 'parent_id', 'created_at', 'id'],
+    )
+    op.create_index(
+        'ix_review_comments_parent_created',
+        'review_comments',
+        ['parent_id', 'created_at', 'id'],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_review_comments_parent_created', table_name='review_comments')
+    op.drop_index('ix_review_comments_review_parent_created', table_name='review_comments')
@@ -0,0 +1,62 @@
+"""Add box office daily grosses and rollups alongside the hand-seeded tables
+
+Revision ID: 1bdfae00f710
+Revises: 0a01ff8c3fc6
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1bdfae00f710'
+down_revision: Union[str, Sequence[str], None] = '0a01ff8c3fc6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'box_office_daily_gross',
+        sa.Column('movie_id', sa.Integer(), nullable=False),
+        sa.Column('region', sa.String(length=50), nullable=False),
+        sa.Column('date', sa.Date(), nullable=False),
+        sa.Column('gross_usd', sa.Float(), nullable=False),
+        sa.Column('studio', sa.String(length=100), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
+        sa.ForeignKeyConstraint(['movie_id'], ['movies.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('movie_id', 'region', 'date'),
+    )
+    op.create_index('ix_box_office_daily_gross_region_date', 'box_office_daily_gross', ['region', 'date'])
+
+    op.create_table(
+        'box_office_rollups',
+        sa.Column('region', sa.String(length=50), nullable=False),
+        sa.Column('grain', sa.String(length=10), nullable=False),
+        sa.Column('dimension', sa.String(length=10), nullable=False),
+        sa.Column('period_start', sa.Date(), nullable=False),
+        sa.Column('key', sa.String(length=100), nullable=False),
+        sa.Column('gross_usd', sa.Float(), nullable=False, server_default='0'),
+        sa.PrimaryKeyConstraint('region', 'grain', 'dimension', 'period_start', 'key'),
+    )
+    op.create_index(
+        'ix_box_office_rollups_rank', 'box_office_rollups',
+        ['region', 'grain', 'dimension', 'period_start', sa.text('gross_usd DESC')],
+    )
+
+    # The old box_office_weekend_entries/trends/ytd/ytd_top_movies/perf_*
+    # tables hold hand-entered aggregates that cannot be turned back into
+    # daily grosses. Nothing reads them any more, but they are kept (with
+    # their data) and left for a later migration to drop.
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_box_office_rollups_rank', table_name='box_office_rollups')
+    op.drop_table('box_office_rollups')
+    op.drop_index('ix_box_office_daily_gross_region_date', table_name='box_office_daily_gross')
+    op.drop_table('box_office_daily_gross')
@@ -0,0 +1,40 @@
+"""Add genre_stats for genre pages
+
+Revision ID: 2bcda1d1883e
+Revises: 1bdfae00f710
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2bcda1d1883e'
+down_revision: Union[str, Sequence[str], None] = '1bdfae00f710'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Rows are built on a genre's first read and by the periodic refresh
+    op.create_table(
+        'genre_stats',
+        sa.Column('genre_id', sa.Integer(), nullable=False),
+        sa.Column('total_movies', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('average_rating', sa.Float(), nullable=True),
+        sa.Column('statistics', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('related_genres', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('refreshed_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
+        sa.ForeignKeyConstraint(['genre_id'], ['genres.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('genre_id'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('genre_stats')
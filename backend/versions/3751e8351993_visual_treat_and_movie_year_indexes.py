@@ -0,0 +1,53 @@
+"""Add visual treat browse/search indexes and an index on the numeric movie year
+
+Revision ID: 3751e8351993
+Revises: 3a39ca243fc0
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3751e8351993'
+down_revision: Union[str, Sequence[str], None] = '3a39ca243fc0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TRGM_INDEXES = (
+    ('ix_visual_treats_title_trgm', 'visual_treats', 'title'),
+    ('ix_visual_treats_description_trgm', 'visual_treats', 'description'),
+    ('ix_visual_treats_director_trgm', 'visual_treats', 'director'),
+    ('ix_movies_title_trgm', 'movies', 'title'),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Must match models.MOVIE_YEAR_NUMBER, which decade filters and year sorts use
+    op.create_index(
+        'ix_movies_year_number', 'movies',
+        [sa.text("(CASE WHEN (year ~ '^[0-9]{4}$') THEN CAST(year AS INTEGER) END)")],
+    )
+    op.create_index('ix_visual_treats_category', 'visual_treats', ['category'])
+    op.create_index('ix_visual_treats_likes', 'visual_treats', [sa.text('likes DESC')])
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, table, column in TRGM_INDEXES:
+        op.create_index(
+            name, table, [column],
+            postgresql_using='gin',
+            postgresql_ops={column: 'gin_trgm_ops'},
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, _ in TRGM_INDEXES:
+        op.drop_index(name, table_name=table)
+    op.drop_index('ix_visual_treats_likes', table_name='visual_treats')
+    op.drop_index('ix_visual_treats_category', table_name='visual_treats')
+    op.drop_index('ix_movies_year_number', table_name='movies')
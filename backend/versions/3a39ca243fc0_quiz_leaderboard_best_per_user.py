@@ -0,0 +1,46 @@
+"""Keep one best entry per user in quiz_leaderboard_entries
+
+Revision ID: 3a39ca243fc0
+Revises: 96c8fb731764
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3a39ca243fc0'
+down_revision: Union[str, Sequence[str], None] = '96c8fb731764'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Drop everything but each user's best attempt (highest score, then fastest)
+    op.execute("""
+        DELETE FROM quiz_leaderboard_entries e
+        USING (
+            SELECT id, row_number() OVER (
+                PARTITION BY quiz_id, user_id
+                ORDER BY score_percent DESC, completion_time_seconds ASC NULLS LAST, id
+            ) AS rn
+            FROM quiz_leaderboard_entries
+        ) ranked
+        WHERE e.id = ranked.id AND ranked.rn > 1
+    """)
+    op.create_unique_constraint('uq_quiz_leaderboard_user', 'quiz_leaderboard_entries', ['quiz_id', 'user_id'])
+    op.create_index(
+        'ix_quiz_leaderboard_rank',
+        'quiz_leaderboard_entries',
+        ['quiz_id', sa.text('score_percent DESC'), 'completion_time_seconds', 'user_id'],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_quiz_leaderboard_rank', table_name='quiz_leaderboard_entries')
+    op.drop_constraint('uq_quiz_leaderboard_user', 'quiz_leaderboard_entries', type_='unique')
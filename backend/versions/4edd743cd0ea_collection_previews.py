@@ -0,0 +1,65 @@
+"""Store collection movie counts and preview posters; order members by position
+
+Revision ID: 4edd743cd0ea
+Revises: 9a67961ccfcc
+Create Date: 2026-10-19 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4edd743cd0ea'
+down_revision: Union[str, Sequence[str], None] = '9a67961ccfcc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('collection_movies', sa.Column('position', sa.Integer(), server_default='0', nullable=False))
+    # Existing members keep their old (movie id) order
+    op.execute("""
+        UPDATE collection_movies cm
+        SET position = ranked.rn - 1
+        FROM (
+            SELECT collection_id, movie_id,
+                   row_number() OVER (PARTITION BY collection_id ORDER BY movie_id) AS rn
+            FROM collection_movies
+        ) ranked
+        WHERE cm.collection_id = ranked.collection_id AND cm.movie_id = ranked.movie_id
+    """)
+    op.create_index('ix_collection_movies_collection_position', 'collection_movies', ['collection_id', 'position'])
+
+    op.add_column('collections', sa.Column('movie_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column(
+        'collections',
+        sa.Column('preview_posters', postgresql.JSONB(astext_type=sa.Text()), server_default='[]', nullable=False),
+    )
+    op.execute("""
+        UPDATE collections c
+        SET movie_count = (SELECT count(*) FROM collection_movies cm WHERE cm.collection_id = c.id),
+            preview_posters = COALESCE((
+                SELECT jsonb_agg(p.poster_url ORDER BY p.position, p.movie_id)
+                FROM (
+                    SELECT m.poster_url, cm.position, cm.movie_id
+                    FROM collection_movies cm
+                    JOIN movies m ON m.id = cm.movie_id
+                    WHERE cm.collection_id = c.id AND m.poster_url IS NOT NULL
+                    ORDER BY cm.position, cm.movie_id
+                    LIMIT 4
+                ) p
+            ), '[]'::jsonb)
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('collections', 'preview_posters')
+    op.drop_column('collections', 'movie_count')
+    op.drop_index('ix_collection_movies_collection_position', table_name='collection_movies')
+    op.drop_column('collection_movies', 'position')
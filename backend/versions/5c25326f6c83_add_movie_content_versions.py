@@ -0,0 +1,116 @@
+"""Move draft/publish content into movie_content_versions
+
+Revision ID: 5c25326f6c83
+Revises: 093aa7e00a60
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c25326f6c83'
+down_revision: Union[str, Sequence[str], None] = '093aa7e00a60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Categories that also had a published JSONB column on movies
+PUBLISHED_COLUMNS = ("trivia", "timeline", "awards")
+DRAFT_ONLY = ("cast_crew", "media", "streaming", "basic_info")
+CATEGORIES = PUBLISHED_COLUMNS + DRAFT_ONLY
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'movie_content_versions',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('movie_id', sa.Integer(), nullable=False),
+        sa.Column('category', sa.String(length=20), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.Column('payload', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column('status', sa.String(length=20), nullable=False, server_default='draft'),
+        sa.Column('created_by_id', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
+        sa.Column('published_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['movie_id'], ['movies.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['created_by_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('movie_id', 'category', 'version', name='uq_movie_content_version'),
+    )
+    op.create_index('ix_movie_content_versions_movie_id', 'movie_content_versions', ['movie_id'])
+    op.create_index(
+        'uq_movie_content_published',
+        'movie_content_versions',
+        ['movie_id', 'category'],
+        unique=True,
+        postgresql_where=sa.text("status = 'published'"),
+    )
+
+    # Backfill: published JSONB columns become version 1, pending drafts the next version.
+    for c in PUBLISHED_COLUMNS:
+        op.execute(f"""
+            INSERT INTO movie_content_versions (movie_id, category, version, payload, status, created_at, published_at)
+            SELECT id, '{c}', 1, {c}, 'published', now(), now()
+            FROM movies WHERE {c} IS NOT NULL
+        """)
+        op.execute(f"""
+            INSERT INTO movie_content_versions (movie_id, category, version, payload, status, created_at)
+            SELECT id, '{c}', CASE WHEN {c} IS NOT NULL THEN 2 ELSE 1 END, {c}_draft, 'draft', now()
+            FROM movies
+            WHERE {c}_draft IS NOT NULL AND COALESCE({c}_status, 'draft') <> 'published'
+        """)
+    # Draft-only categories kept their published payload in the draft column.
+    for c in DRAFT_ONLY:
+        op.execute(f"""
+            INSERT INTO movie_content_versions (movie_id, category, version, payload, status, created_at, published_at)
+            SELECT id, '{c}', 1, {c}_draft,
+                   CASE WHEN {c}_status = 'published' THEN 'published' ELSE 'draft' END,
+                   now(),
+                   CASE WHEN {c}_status = 'published' THEN now() END
+            FROM movies WHERE {c}_draft IS NOT NULL
+        """)
+
+    for c in CATEGORIES:
+        op.drop_index(f'ix_movies_{c}_status', table_name='movies', if_exists=True)
+        op.drop_column('movies', f'{c}_status')
+        op.drop_column('movies', f'{c}_draft')
+    for c in PUBLISHED_COLUMNS:
+        op.drop_column('movies', c)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for c in PUBLISHED_COLUMNS:
+        op.add_column('movies', sa.Column(c, postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+    for c in CATEGORIES:
+        op.add_column('movies', sa.Column(f'{c}_draft', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+        op.add_column('movies', sa.Column(f'{c}_status', sa.String(20), nullable=True, server_default='draft'))
+        op.create_index(f'ix_movies_{c}_status', 'movies', [f'{c}_status'])
+
+    for c in PUBLISHED_COLUMNS:
+        op.execute(f"""
+            UPDATE movies m SET {c} = v.payload, {c}_status = 'published'
+            FROM movie_content_versions v
+            WHERE v.movie_id = m.id AND v.category = '{c}' AND v.status = 'published'
+        """)
+    for c in CATEGORIES:
+        # Latest draft wins; otherwise the published payload, as the old publish step left it in place.
+        op.execute(f"""
+            UPDATE movies m SET {c}_draft = v.payload, {c}_status = v.status
+            FROM (
+                SELECT DISTINCT ON (movie_id) movie_id, payload, status
+                FROM movie_content_versions
+                WHERE category = '{c}' AND status IN ('draft', 'published')
+                ORDER BY movie_id, (status = 'draft') DESC, version DESC
+            ) v
+            WHERE v.movie_id = m.id
+        """)
+
+    op.drop_index('uq_movie_content_published', table_name='movie_content_versions')
+    op.drop_index('ix_movie_content_versions_movie_id', table_name='movie_content_versions')
+    op.drop_table('movie_content_versions')
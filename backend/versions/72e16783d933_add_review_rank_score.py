@@ -0,0 +1,55 @@
+"""Add review rank_score with (movie_id, rank_score DESC) index
+
+Revision ID: 72e16783d933
+Revises: f46b0d659662
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '72e16783d933'
+down_revision: Union[str, Sequence[str], None] = 'f46b0d659662'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('reviews', sa.Column('rank_score', sa.Float(), nullable=False, server_default='0'))
+
+    # Backfill with the same formula as services.ranking.review_rank_score
+    # (Wilson lower bound, z = 1.96, + 0.05 * ln(1 + comments) + 0.1 per year since 2020-01-01).
+    op.execute("""
+        UPDATE reviews SET
+            engagement_score = COALESCE(helpful_votes, 0) + COALESCE(unhelpful_votes, 0) + COALESCE(comment_count, 0),
+            rank_score = ROUND((
+                CASE WHEN COALESCE(helpful_votes, 0) + COALESCE(unhelpful_votes, 0) = 0 THEN 0
+                ELSE (
+                    p + 3.8416 / (2 * n)
+                    - 1.96 * sqrt((p * (1 - p) + 3.8416 / (4 * n)) / n)
+                ) / (1 + 3.8416 / n)
+                END
+                + 0.05 * ln(1 + GREATEST(COALESCE(comment_count, 0), 0))
+                + 0.1 * EXTRACT(EPOCH FROM (COALESCE(date, TIMESTAMP '2020-01-01') - TIMESTAMP '2020-01-01')) / (365 * 86400)
+            )::numeric, 6)
+        FROM (
+            SELECT id AS vid,
+                   COALESCE(helpful_votes, 0)::float / NULLIF(COALESCE(helpful_votes, 0) + COALESCE(unhelpful_votes, 0), 0) AS p,
+                   (COALESCE(helpful_votes, 0) + COALESCE(unhelpful_votes, 0))::float AS n
+            FROM reviews
+        ) v
+        WHERE v.vid = reviews.id
+    """)
+
+    op.create_index('ix_reviews_movie_rank_score', 'reviews', ['movie_id', sa.text('rank_score DESC')])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_reviews_movie_rank_score', table_name='reviews')
+    op.drop_column('reviews', 'rank_score')
@@ -0,0 +1,42 @@
+"""Add user_suggestions follow candidates
+
+Revision ID: 96c8fb731764
+Revises: 14acdc07272d
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '96c8fb731764'
+down_revision: Union[str, Sequence[str], None] = '14acdc07272d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Rows are filled lazily by the background refresh on first request
+    op.create_table(
+        'user_suggestions',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('candidate_id', sa.Integer(), nullable=False),
+        sa.Column('score', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('mutual_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('reason', sa.String(length=30), nullable=False),
+        sa.Column('computed_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['candidate_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id', 'candidate_id'),
+    )
+    op.create_index('ix_user_suggestions_user_score', 'user_suggestions', ['user_id', 'score'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_user_suggestions_user_score', table_name='user_suggestions')
+    op.drop_table('user_suggestions')
@@ -0,0 +1,41 @@
+"""Index movies.release_date and add regional release dates for the calendar
+
+Revision ID: 9a67961ccfcc
+Revises: de958a829654
+Create Date: 2026-10-19 19:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a67961ccfcc'
+down_revision: Union[str, Sequence[str], None] = 'de958a829654'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_movies_release_date'), 'movies', ['release_date'], unique=False)
+    op.create_table(
+        'movie_release_dates',
+        sa.Column('movie_id', sa.Integer(), nullable=False),
+        sa.Column('region', sa.String(length=10), nullable=False),
+        sa.Column('type', sa.String(length=20), nullable=False),
+        sa.Column('release_date', sa.Date(), nullable=False),
+        sa.Column('certification', sa.String(length=20), nullable=True),
+        sa.ForeignKeyConstraint(['movie_id'], ['movies.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('movie_id', 'region', 'type'),
+    )
+    op.create_index('ix_movie_release_dates_region_date', 'movie_release_dates', ['region', 'release_date'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_movie_release_dates_region_date', table_name='movie_release_dates')
+    op.drop_table('movie_release_dates')
+    op.drop_index(op.f('ix_movies_release_date'), table_name='movies')
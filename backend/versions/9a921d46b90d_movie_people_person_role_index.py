@@ -0,0 +1,27 @@
+"""Index movie_people by person and role for filmography pages
+
+Revision ID: 9a921d46b90d
+Revises: 2bcda1d1883e
+Create Date: 2026-10-19 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a921d46b90d'
+down_revision: Union[str, Sequence[str], None] = '2bcda1d1883e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_movie_people_person_role', 'movie_people', ['person_id', 'role'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_movie_people_person_role', table_name='movie_people')
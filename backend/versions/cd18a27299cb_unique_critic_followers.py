@@ -0,0 +1,40 @@
+"""Make critic follows unique per (critic, user)
+
+Revision ID: cd18a27299cb
+Revises: 4edd743cd0ea
+Create Date: 2026-10-19 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'cd18a27299cb'
+down_revision: Union[str, Sequence[str], None] = '4edd743cd0ea'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Keep the earliest follow of each duplicate pair
+    op.execute("""
+        DELETE FROM critic_followers cf
+        USING critic_followers older
+        WHERE older.critic_id = cf.critic_id
+          AND older.user_id = cf.user_id
+          AND older.id < cf.id
+    """)
+    # Duplicates were counted twice as well
+    op.execute("""
+        UPDATE critic_profiles cp
+        SET follower_count = (SELECT count(*) FROM critic_followers cf WHERE cf.critic_id = cp.id)
+    """)
+    op.create_unique_constraint('uq_critic_follower_critic_user', 'critic_followers', ['critic_id', 'user_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('uq_critic_follower_critic_user', 'critic_followers', type_='unique')
@@ -0,0 +1,45 @@
+"""Index streaming options for platform/region availability browsing
+
+Revision ID: de958a829654
+Revises: 9a921d46b90d
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'de958a829654'
+down_revision: Union[str, Sequence[str], None] = '9a921d46b90d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'movie_streaming_options',
+        sa.Column('added_at', sa.DateTime(), server_default=sa.func.now(), nullable=False),
+    )
+    op.create_index(
+        'ix_movie_streaming_options_platform_region_type',
+        'movie_streaming_options',
+        ['platform_id', 'region', 'type', 'movie_id'],
+    )
+    op.create_index(
+        'ix_movie_streaming_options_platform_region_added',
+        'movie_streaming_options',
+        ['platform_id', 'region', 'added_at'],
+    )
+    op.create_index(op.f('ix_movie_streaming_options_movie_id'), 'movie_streaming_options', ['movie_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_movie_streaming_options_movie_id'), table_name='movie_streaming_options')
+    op.drop_index('ix_movie_streaming_options_platform_region_added', table_name='movie_streaming_options')
+    op.drop_index('ix_movie_streaming_options_platform_region_type', table_name='movie_streaming_options')
+    op.drop_column('movie_streaming_options', 'added_at')
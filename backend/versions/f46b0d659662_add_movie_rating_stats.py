@@ -0,0 +1,71 @@
+"""Add movie_rating_stats aggregates
+
+Revision ID: f46b0d659662
+Revises: 5c25326f6c83
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f46b0d659662'
+down_revision: Union[str, Sequence[str], None] = '5c25326f6c83'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+HISTOGRAM_BUCKETS = 11
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'movie_rating_stats',
+        sa.Column('movie_id', sa.Integer(), nullable=False),
+        sa.Column('review_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('rating_sum', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('average_rating', sa.Float(), nullable=True),
+        sa.Column('histogram', postgresql.ARRAY(sa.Integer()), nullable=False, server_default='{}'),
+        sa.Column('critic_review_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('critic_rating_sum', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
+        sa.ForeignKeyConstraint(['movie_id'], ['movies.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('movie_id'),
+    )
+    op.create_index('ix_movie_rating_stats_average_rating', 'movie_rating_stats', ['average_rating'])
+    op.create_index('ix_movies_siddu_score', 'movies', ['siddu_score'])
+
+    # Backfill aggregates; siddu/critics scores are left to
+    # POST /admin/movies/rating-stats/recompute so imported scores are not
+    # overwritten silently during deploy.
+    buckets = ", ".join(
+        f"count(*) FILTER (WHERE LEAST(10, GREATEST(0, floor(rating + 0.5))) = {b})"
+        for b in range(HISTOGRAM_BUCKETS)
+    )
+    op.execute(f"""
+        INSERT INTO movie_rating_stats (movie_id, review_count, rating_sum, average_rating, histogram)
+        SELECT movie_id, count(*), sum(rating), round((sum(rating) / count(*))::numeric, 2), ARRAY[{buckets}]::integer[]
+        FROM reviews
+        GROUP BY movie_id
+    """)
+    op.execute("""
+        INSERT INTO movie_rating_stats (movie_id, histogram, critic_review_count, critic_rating_sum)
+        SELECT movie_id, ARRAY[0,0,0,0,0,0,0,0,0,0,0]::integer[], count(*), sum(numeric_rating)
+        FROM critic_reviews
+        WHERE is_draft = false AND numeric_rating IS NOT NULL
+        GROUP BY movie_id
+        ON CONFLICT (movie_id) DO UPDATE
+        SET critic_review_count = EXCLUDED.critic_review_count,
+            critic_rating_sum = EXCLUDED.critic_rating_sum
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_movies_siddu_score', table_name='movies')
+    op.drop_index('ix_movie_rating_stats_average_rating', table_name='movie_rating_stats')
+    op.drop_table('movie_rating_stats')